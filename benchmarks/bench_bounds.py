@@ -0,0 +1,47 @@
+"""
+Compare implicit variable bounds in the bounded simplex with the same bounds written as constraint rows.
+
+Usage: ``python -m benchmarks.bench_bounds``
+"""
+
+import time
+
+from benchmarks.models import bounded_benchmark_problems
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex
+
+
+def _solve(arrays: LpArrays) -> tuple[str, float | None, int, int, float]:
+    simplex = RevisedSimplex(arrays)
+    start = time.perf_counter()
+    result = simplex.solve()
+    elapsed = time.perf_counter() - start
+    return result.status, result.objective_value, result.iterations, simplex.bound_flips, elapsed
+
+
+def main():
+    print(
+        f"{'problem':<16} {'basis':>6} {'rows':>6} {'iters':>7} {'rows':>7} {'flips':>6} "
+        f"{'time':>8} {'rows':>8} {'|Δobj|':>10}"
+    )
+    for name, problem in bounded_benchmark_problems():
+        arrays = LpArrays.from_problem(problem)
+        expanded, _, _ = arrays.with_bound_rows()
+
+        status, objective, iterations, flips, elapsed = _solve(arrays)
+        row_status, row_objective, row_iterations, _, row_elapsed = _solve(expanded)
+        if status != row_status:
+            print(f"{name}: status mismatch ({status} vs {row_status})")
+            continue
+
+        print(
+            f"{name:<16} "
+            f"{arrays.shape[0]:>6} {expanded.shape[0]:>6} "
+            f"{iterations:>7} {row_iterations:>7} {flips:>6} "
+            f"{elapsed:>8.3f} {row_elapsed:>8.3f} "
+            f"{abs(objective - row_objective):>10.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Measure column generation on cutting stock problems.
+
+Each instance (random item widths and demands for a fixed roll width) is solved with the knapsack pricing
+oracle twice: with the default pool settings, and with a small master and pool, to show that aging and
+deletion keep the master bounded while reaching the same LP bound.
+
+Usage: ``python -m benchmarks.bench_column_generation``
+"""
+
+import time
+
+import numpy as np
+
+from methods.column_generation import ColumnGeneration, ColumnGenerationOptions, KnapsackPricing, cutting_stock_master
+
+
+ROLL_WIDTH = 10_000
+INSTANCES = {"items-20": (20, 1), "items-50": (50, 2), "items-100": (100, 3)}
+SETTINGS = {
+    "default": ColumnGenerationOptions(),
+    "bounded": ColumnGenerationOptions(max_age=3, max_columns=150, pool_size=100),
+}
+
+
+def main():
+    print(
+        f"{'instance':<10} {'settings':<8} {'rolls (LP)':>11} {'rounds':>7} {'patterns':>8} "
+        f"{'from pool':>9} {'largest':>8} {'deleted':>8} {'time':>8}"
+    )
+    for name, (items, seed) in INSTANCES.items():
+        rng = np.random.default_rng(seed)
+        widths = rng.integers(ROLL_WIDTH // 20, ROLL_WIDTH // 2, size=items)
+        demands = rng.integers(5, 100, size=items)
+        for label, options in SETTINGS.items():
+            start = time.perf_counter()
+            solver = ColumnGeneration(cutting_stock_master(widths, demands, ROLL_WIDTH), KnapsackPricing(widths, ROLL_WIDTH), options)
+            result = solver.solve()
+            elapsed = time.perf_counter() - start
+            statistics = solver.statistics
+            print(
+                f"{name:<10} {label:<8} {result.objective_value:>11.3f} {statistics.rounds:>7} "
+                f"{statistics.columns_generated:>8} {statistics.columns_from_pool:>9} {statistics.largest_master:>8} "
+                f"{statistics.columns_deleted:>8} {elapsed:>7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
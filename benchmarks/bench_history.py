@@ -0,0 +1,61 @@
+"""
+Measure the cost of recording the pivot history of the native simplex.
+
+Compares the memory of the compact records with one full tableau copy per step, the solve time with
+and without recording, and the time to rebuild tableaus when paging forward and jumping at random.
+
+Usage: ``python -m benchmarks.bench_history``
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.models import benchmark_problems
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex
+
+
+def _timed_solve(arrays: LpArrays, record_history: bool):
+    start = time.perf_counter()
+    result = RevisedSimplex(arrays, record_history=record_history).solve()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'problem':<16} {'steps':>6} {'compact':>10} {'full':>10} "
+        f"{'solve':>8} {'+record':>8} {'page':>8} {'random':>8}"
+    )
+    rng = np.random.default_rng(0)
+    for name, problem in benchmark_problems():
+        arrays = LpArrays.from_problem(problem)
+        _, plain_elapsed = _timed_solve(arrays, False)
+        result, recorded_elapsed = _timed_solve(arrays, True)
+        history = result.history
+
+        m, n = arrays.shape
+        full_bytes = len(history) * m * (n + 2 * m) * 8
+
+        start = time.perf_counter()
+        for step in range(len(history)):
+            history.tableau(step)
+        page_elapsed = (time.perf_counter() - start) / len(history)
+
+        history.clear_cache()
+        steps = rng.integers(0, len(history), size=min(20, len(history)))
+        start = time.perf_counter()
+        for step in steps:
+            history.tableau(int(step))
+        random_elapsed = (time.perf_counter() - start) / steps.size
+
+        print(
+            f"{name:<16} {len(history) - 1:>6} "
+            f"{history.nbytes / 1024:>8.0f}KB {full_bytes / 1024:>8.0f}KB "
+            f"{plain_elapsed:>8.3f} {recorded_elapsed:>8.3f} "
+            f"{page_elapsed * 1000:>6.1f}ms {random_elapsed * 1000:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
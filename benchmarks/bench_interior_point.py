@@ -0,0 +1,79 @@
+"""
+Measure the sparse normal equations of the interior-point engine against the dense ones.
+
+Each instance is a random sparse packing problem. Its barrier is run once with the normal equations
+factorized as sparse matrices (only with SciPy installed: ``pip install .[sparse]``) and once with the
+dense Cholesky, checking that both reach the same objective.
+
+Usage: ``python -m benchmarks.bench_interior_point``
+"""
+
+import time
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods import interior_point as engine
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import OPTIMAL, StandardForm
+
+
+INSTANCES = {"rows-200": (200, 400, 1), "rows-400": (400, 800, 2), "rows-800": (800, 1600, 3)}
+DENSITY = 0.01
+
+
+def packing_problem(rows: int, columns: int, seed: int) -> LpArrays:
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1, 5, (rows, columns)) * (rng.random((rows, columns)) < DENSITY)
+    # Every variable is capped by at least one row, so the problem is bounded.
+    A[rng.integers(0, rows, columns), np.arange(columns)] = rng.uniform(1, 5, columns)
+    return LpArrays(
+        c=rng.uniform(1, 10, columns),
+        A=A,
+        b=rng.uniform(10, 20, rows),
+        senses=(ConstraintSymbol.LESS_THAN_OR_EQUAL,) * rows,
+        maximize=True,
+        variable_names=tuple(f"x{j + 1}" for j in range(columns)),
+        constraint_names=tuple(f"r{i + 1}" for i in range(rows)),
+        lower=np.zeros(columns),
+        upper=np.full(columns, np.inf),
+    )
+
+
+def _barrier(form: StandardForm, dense: bool):
+    threshold = engine.SPARSE_DENSITY_THRESHOLD
+    if dense:
+        engine.SPARSE_DENSITY_THRESHOLD = 0.0
+    try:
+        start = time.perf_counter()
+        with np.errstate(all="ignore"):
+            result = engine.interior_point(form)
+        return result, time.perf_counter() - start
+    finally:
+        engine.SPARSE_DENSITY_THRESHOLD = threshold
+
+
+def main():
+    if engine.sparse is None:
+        print("SciPy is not installed: only the dense normal equations are available.")
+        return
+
+    print(f"{'instance':<10} {'nnz':>6} {'dense':>8} {'its':>4} {'sparse':>8} {'its':>4} {'speedup':>8} {'same':>5}")
+    for name, (rows, columns, seed) in INSTANCES.items():
+        form = StandardForm.from_arrays(packing_problem(rows, columns, seed))
+        dense, dense_elapsed = _barrier(form, dense=True)
+        sparse, sparse_elapsed = _barrier(form, dense=False)
+
+        dense_objective, sparse_objective = form.cost @ dense.x, form.cost @ sparse.x
+        same = dense.status == sparse.status == OPTIMAL and (
+            abs(dense_objective - sparse_objective) <= 1e-6 * (1 + abs(dense_objective))
+        )
+        print(
+            f"{name:<10} {np.count_nonzero(form.A) / form.A.size:>5.1%} "
+            f"{dense_elapsed:>7.2f}s {dense.iterations:>4} {sparse_elapsed:>7.2f}s {sparse.iterations:>4} "
+            f"{dense_elapsed / sparse_elapsed:>7.1f}x {'yes' if same else 'NO':>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
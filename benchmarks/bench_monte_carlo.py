@@ -0,0 +1,65 @@
+"""
+Measure the basis-reuse fast path of the Monte Carlo analysis.
+
+Perturbs a few objective coefficients and right-hand sides by about 5% and compares the time per sample
+of the Monte Carlo run (in-process and with worker processes) with solving every sample from scratch,
+together with the share of samples the known bases answered.
+
+Usage: ``python -m benchmarks.bench_monte_carlo``
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.models import bounded_benchmark_problems
+from methods.lp_arrays import LpArrays
+from methods.monte_carlo import DistributionKind, UncertainTarget, Uncertainty, monte_carlo, _sample
+from methods.native_simplex import RevisedSimplex
+
+
+SAMPLES = 1000
+REFERENCE_SAMPLES = 100
+
+
+def _uncertainties(arrays: LpArrays) -> list[Uncertainty]:
+    m, n = arrays.shape
+    objective = [
+        Uncertainty(UncertainTarget.OBJECTIVE, j, DistributionKind.NORMAL, (arrays.c[j], 0.05 * abs(arrays.c[j])))
+        for j in range(min(5, n))
+    ]
+    rhs = [
+        Uncertainty(UncertainTarget.RHS, i, DistributionKind.TRIANGULAR, (0.95 * arrays.b[i], arrays.b[i], 1.05 * arrays.b[i]))
+        for i in range(min(3, m))
+    ]
+    return objective + rhs
+
+
+def main():
+    print(f"{'problem':<16} {'fast':>6} {'bases':>6} {'serial':>9} {'4 procs':>9} {'re-solve':>9}")
+    for name, problem in bounded_benchmark_problems():
+        arrays = LpArrays.from_problem(problem)
+        uncertainties = _uncertainties(arrays)
+
+        start = time.perf_counter()
+        result = monte_carlo(arrays, uncertainties, samples=SAMPLES, seed=0)
+        serial_elapsed = (time.perf_counter() - start) / SAMPLES
+
+        start = time.perf_counter()
+        monte_carlo(arrays, uncertainties, samples=SAMPLES, seed=0, workers=4)
+        parallel_elapsed = (time.perf_counter() - start) / SAMPLES
+
+        samples = _sample(arrays, uncertainties, REFERENCE_SAMPLES, np.random.default_rng(0))
+        start = time.perf_counter()
+        for k in range(REFERENCE_SAMPLES):
+            RevisedSimplex(samples.arrays(arrays, k)).solve()
+        resolve_elapsed = (time.perf_counter() - start) / REFERENCE_SAMPLES
+
+        print(
+            f"{name:<16} {result.fast_path / SAMPLES:>6.0%} {len(result.basis_counts):>6} "
+            f"{serial_elapsed * 1000:>7.2f}ms {parallel_elapsed * 1000:>7.2f}ms {resolve_elapsed * 1000:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measure the effect of matrix scaling on CBC iteration counts and solve time.
+
+Before that, sparse models whose scaling factors are not determined by the matrix alone (the free common
+factor of each block) are solved with and without scaling by every float engine; any disagreement in
+status or optimal value is reported and fails the run.
+
+Usage: ``python -m benchmarks.bench_scaling``
+"""
+
+import os
+import re
+import tempfile
+import time
+
+import numpy as np
+import pulp as plp
+
+from benchmarks.models import benchmark_problems, problem_from_arrays
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.scaling import compute_scaling, magnitude_ratio
+from methods.simplex_tableu import SimplexTableau
+from methods.solver_engine import SolverEngine
+
+
+DRIFT_MATRIX = np.array([[400.0, 900.0], [500.0, 0.0]])
+DRIFT_CASES = {
+    "drift-optimal": (np.array([22.0, 16.0]), [ConstraintSymbol.LESS_THAN_OR_EQUAL, ConstraintSymbol.LESS_THAN_OR_EQUAL]),
+    "drift-infeasible": (np.array([1.0, 16.0]), [ConstraintSymbol.LESS_THAN_OR_EQUAL, ConstraintSymbol.GREATER_THAN_OR_EQUAL]),
+}
+RANDOM_DRIFT_CASES = 300
+ENGINES = (SolverEngine.PULP, SolverEngine.SIMPLEX, SolverEngine.INTERIOR_POINT)
+
+
+def _solve(problem, scaling: bool) -> tuple[str, float, int | None, float]:
+    tableau = SimplexTableau(scaling=scaling)
+    tableau.build(problem)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "cbc.log")
+        start = time.perf_counter()
+        status = tableau.solve(plp.PULP_CBC_CMD(msg=False, logPath=log_path))
+        elapsed = time.perf_counter() - start
+        with open(log_path) as log:
+            match = re.search(r"(\d+) iterations", log.read())
+
+    iterations = int(match.group(1)) if match else None
+    return status, tableau.get_objective_value(), iterations, elapsed
+
+
+def _drift_problems():
+    for name, (b, senses) in DRIFT_CASES.items():
+        yield name, problem_from_arrays(np.array([2.0, 7.0]), DRIFT_MATRIX, b, senses)
+    rng = np.random.default_rng(0)
+    symbols = [ConstraintSymbol.LESS_THAN_OR_EQUAL, ConstraintSymbol.GREATER_THAN_OR_EQUAL]
+    for k in range(RANDOM_DRIFT_CASES):
+        A = rng.integers(1, 1000, (2, 2)).astype(float)
+        A[rng.integers(2), rng.integers(2)] = 0.0
+        senses = [symbols[i] for i in rng.integers(2, size=2)]
+        yield f"random-{k}", problem_from_arrays(rng.integers(1, 10, 2).astype(float), A, rng.integers(1, 50, 2).astype(float), senses)
+
+
+def _solve_with(problem, engine: SolverEngine, scaling: bool) -> tuple[str, float | None]:
+    tableau = SimplexTableau(engine=engine, scaling=scaling)
+    tableau.build(problem)
+    status = tableau.solve(plp.PULP_CBC_CMD(msg=False))
+    return status, tableau.get_objective_value() if status == "Optimal" else None
+
+
+def check_scaled_matches_unscaled() -> int:
+    """Solve the drift-prone models scaled and unscaled with every float engine; return the number of mismatches."""
+    mismatches = 0
+    for name, problem in _drift_problems():
+        for engine in ENGINES:
+            scaled = _solve_with(problem, engine, scaling=True)
+            unscaled = _solve_with(problem, engine, scaling=False)
+            same_value = scaled[1] is None or abs(scaled[1] - unscaled[1]) <= 1e-6 * max(1.0, abs(unscaled[1]))
+            if scaled[0] != unscaled[0] or not same_value:
+                mismatches += 1
+                print(f"{name} ({engine.value}): scaled {scaled} vs unscaled {unscaled}")
+    return mismatches
+
+
+def main():
+    mismatches = check_scaled_matches_unscaled()
+    print(f"scaled vs unscaled: {mismatches} mismatches on {len(DRIFT_CASES) + RANDOM_DRIFT_CASES} sparse models")
+    if mismatches:
+        raise SystemExit(1)
+
+    print(f"{'problem':<16} {'ratio':>10} {'scaled':>10} {'iters':>7} {'scaled':>7} {'time':>8} {'scaled':>8} {'|Δobj|':>10}")
+    for name, problem in benchmark_problems():
+        arrays = LpArrays.from_problem(problem)
+        factors = compute_scaling(arrays.A)
+
+        status, objective, iterations, elapsed = _solve(problem, scaling=False)
+        scaled_status, scaled_objective, scaled_iterations, scaled_elapsed = _solve(problem, scaling=True)
+        if status != scaled_status:
+            print(f"{name}: status mismatch ({status} vs {scaled_status})")
+            continue
+
+        print(
+            f"{name:<16} "
+            f"{magnitude_ratio(arrays.A):>10.2e} {magnitude_ratio(factors.apply(arrays).A):>10.2e} "
+            f"{iterations or '-':>7} {scaled_iterations or '-':>7} "
+            f"{elapsed:>8.3f} {scaled_elapsed:>8.3f} "
+            f"{abs(objective - scaled_objective):>10.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measure the start-up of the application.
+
+Each run starts a fresh interpreter and times ``import main``, then time-to-first-frame: the import plus
+``main.main`` building the page, up to the ``page.update`` after ``page.add``. The page is a mock, so this
+is the Python side of the first frame, without the Flet client drawing it. It also lists which of the heavy
+modules were already loaded at that point, and times the background ``prewarm`` that follows.
+
+Usage: ``python -m benchmarks.bench_startup``
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 5
+HEAVY_MODULES = ("numpy", "pandas", "pulp", "PIL", "methods.simplex_tableu")
+
+_RUN = """
+import json, sys, time
+start = time.perf_counter()
+from unittest.mock import MagicMock
+import flet as ft
+import main
+imported = time.perf_counter()
+ft.Control.update = lambda self: None
+page = MagicMock()
+page.update.side_effect = lambda *args: times.setdefault("frame", time.perf_counter())
+times = {}
+main.main(page)
+loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+prewarm_start = time.perf_counter()
+main.prewarm()
+print(json.dumps({
+    "import": imported - start,
+    "frame": times["frame"] - start,
+    "prewarm": time.perf_counter() - prewarm_start,
+    "loaded": loaded,
+}))
+"""
+
+
+def _run() -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n{_RUN}"
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=root, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = [_run() for _ in range(RUNS)]
+    print(f"{'stage':<22} {'median':>8} {'min':>8}")
+    for stage, label in (("import", "import main"), ("frame", "time to first frame"), ("prewarm", "prewarm (background)")):
+        values = [run[stage] * 1000 for run in runs]
+        print(f"{label:<22} {statistics.median(values):>6.0f}ms {min(values):>6.0f}ms")
+    loaded = runs[-1]["loaded"]
+    print(f"heavy modules loaded before the first frame: {', '.join(loaded) if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
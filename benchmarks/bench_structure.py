@@ -0,0 +1,48 @@
+"""
+Measure the network solvers against the general native simplex.
+
+Every problem of the network benchmark set is solved by the revised simplex and by the solver for its
+detected structure (Vogel + MODI, Hungarian, network simplex), checking that both reach the same objective.
+Detection time is included in the network time.
+
+Usage: ``python -m benchmarks.bench_structure``
+"""
+
+import time
+
+from benchmarks.models import network_benchmark_problems
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex
+from methods.network import NetworkForm, solve_network
+
+
+def main():
+    print(
+        f"{'problem':<16} {'structure':<15} {'rows':>5} {'cols':>6} "
+        f"{'general':>9} {'pivots':>7} {'network':>9} {'pivots':>7} {'speedup':>8} {'same':>5}"
+    )
+    for name, problem in network_benchmark_problems():
+        arrays = LpArrays.from_problem(problem)
+        m, n = arrays.shape
+
+        start = time.perf_counter()
+        general = RevisedSimplex(arrays).solve()
+        general_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        form = NetworkForm.from_arrays(arrays)
+        network = solve_network(arrays, form)
+        network_elapsed = time.perf_counter() - start
+
+        same = general.status == network.status and (
+            not general.is_optimal or abs(general.objective_value - network.objective_value) <= 1e-6 * (1 + abs(general.objective_value))
+        )
+        print(
+            f"{name:<16} {form.structure.value:<15} {m:>5} {n:>6} "
+            f"{general_elapsed:>8.3f}s {general.iterations:>7} {network_elapsed:>8.3f}s {network.iterations:>7} "
+            f"{general_elapsed / network_elapsed:>7.1f}x {'yes' if same else 'NO':>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Benchmark set of generated linear programming problems.
+
+Run the benchmarks from the repository root, e.g. ``python -m benchmarks.bench_scaling``.
+"""
+
+import numpy as np
+
+from data.app_state import ObjectiveFunctionState, ObjectiveFunctionType, ConstraintSymbol, Constraint, Variable
+
+
+def problem_from_arrays(
+    c: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    senses: list[ConstraintSymbol],
+    objective_function: ObjectiveFunctionType = ObjectiveFunctionType.MAXIMIZE,
+    lower: np.ndarray | None = None,
+    upper: np.ndarray | None = None,
+) -> ObjectiveFunctionState:
+    """Build an ObjectiveFunctionState from dense arrays (infinite bounds mean no bound)."""
+    m, n = A.shape
+    problem = ObjectiveFunctionState(
+        quantity_of_variables=max(n, 2),
+        quantity_of_constraints=max(m, 2),
+        objective_function=objective_function,
+    )
+    names = [f"x{j + 1}" for j in range(n)]
+    problem.quantity_of_variables = n
+    problem.quantity_of_constraints = m
+    lower = np.zeros(n) if lower is None else lower
+    upper = np.full(n, np.inf) if upper is None else upper
+    problem.variables = [
+        Variable(
+            name=name,
+            value=float(value),
+            lower_bound=float(low) if np.isfinite(low) else None,
+            upper_bound=float(up) if np.isfinite(up) else None,
+        )
+        for name, value, low, up in zip(names, c, lower, upper)
+    ]
+    problem.constraints = [
+        Constraint(
+            name=f"Constraint {i + 1}",
+            symbol=senses[i],
+            variables=[Variable(name=name, value=float(value)) for name, value in zip(names, A[i])],
+            value=float(b[i]),
+        )
+        for i in range(m)
+    ]
+    return problem
+
+
+def badly_scaled_problem(m: int, n: int, seed: int = 0, decades: float = 3.0, density: float = 0.6) -> ObjectiveFunctionState:
+    """
+    Feasible and bounded maximization problem whose rows and columns span ``2 * decades``
+    orders of magnitude, like costs in cents next to capacities in tons.
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1.0, 10.0, size=(m, n)) * (rng.random((m, n)) < density)
+    A[np.arange(m), rng.integers(0, n, size=m)] = rng.uniform(1.0, 10.0, size=m)
+    row_magnitude = 10.0 ** rng.uniform(-decades, decades, size=m)
+    col_magnitude = 10.0 ** rng.uniform(-decades, decades, size=n)
+    A = row_magnitude[:, None] * A * col_magnitude[None, :]
+
+    x0 = rng.uniform(0.0, 10.0, size=n) / col_magnitude
+    activity = A @ x0
+    senses = [ConstraintSymbol.LESS_THAN_OR_EQUAL] * m
+    b = activity + rng.uniform(0.0, 1.0, size=m) * np.abs(activity)
+
+    # Every column must be bounded by at least one <= row with a positive coefficient.
+    A[0, :] = np.maximum(np.abs(A[0, :]), 1e-3 * row_magnitude[0])
+    b[0] = A[0, :] @ x0 * 1.5
+
+    for i in rng.choice(np.arange(1, m), size=max(1, m // 5), replace=False):
+        senses[i] = ConstraintSymbol.GREATER_THAN_OR_EQUAL
+        b[i] = activity[i] * 0.5
+
+    c = rng.uniform(1.0, 10.0, size=n) * col_magnitude
+    return problem_from_arrays(c, A, b, senses)
+
+
+def bound_heavy_problem(m: int, n: int, seed: int = 0) -> ObjectiveFunctionState:
+    """
+    Production planning problem with a few shared resource rows and bounds on every variable:
+    capacities, minimum production levels, some fixed quantities and some free adjustments.
+    Written with bounds as rows it would have ``m`` plus about ``1.5 * n`` constraints.
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1.0, 10.0, size=(m, n)) * (rng.random((m, n)) < 0.5)
+    upper = rng.uniform(5.0, 20.0, size=n)
+    lower = np.where(rng.random(n) < 0.5, rng.uniform(0.0, 3.0, size=n), 0.0)
+
+    fixed = rng.random(n) < 0.1
+    lower[fixed] = upper[fixed] = np.round(rng.uniform(1.0, 4.0, size=fixed.sum()))
+    free = ~fixed & (rng.random(n) < 0.05)
+    lower[free], upper[free] = -np.inf, np.inf
+    # A free adjustment uses every resource.
+    A[:, free] = rng.uniform(1.0, 10.0, size=(m, free.sum()))
+
+    x0 = np.where(free, 0.0, lower)
+    b = A @ x0 + rng.uniform(0.3, 0.6) * A @ np.where(np.isfinite(upper), upper - x0, 10.0)
+    c = rng.uniform(1.0, 10.0, size=n)
+    # Free adjustments earn in proportion to the first resource they use, so no combination of
+    # them is an unbounded direction.
+    c[free] = 0.5 * A[0, free]
+    return problem_from_arrays(c, A, b, [ConstraintSymbol.LESS_THAN_OR_EQUAL] * m, lower=lower, upper=upper)
+
+
+BOUNDED_BENCHMARK_SET: dict[str, tuple[int, int, int]] = {
+    "bounded-10x100": (10, 100, 1),
+    "bounded-20x300": (20, 300, 2),
+    "bounded-40x600": (40, 600, 3),
+    "bounded-60x1000": (60, 1000, 4),
+}
+
+
+def bounded_benchmark_problems():
+    """Yield ``(name, problem)`` for every problem of the bound-heavy benchmark set."""
+    for name, (m, n, seed) in BOUNDED_BENCHMARK_SET.items():
+        yield name, bound_heavy_problem(m, n, seed)
+
+
+BENCHMARK_SET: dict[str, tuple[int, int, int]] = {
+    "small-20x30": (20, 30, 1),
+    "medium-60x80": (60, 80, 2),
+    "medium-100x120": (100, 120, 3),
+    "large-200x250": (200, 250, 4),
+}
+
+
+def benchmark_problems():
+    """Yield ``(name, problem)`` for every problem of the benchmark set."""
+    for name, (m, n, seed) in BENCHMARK_SET.items():
+        yield name, badly_scaled_problem(m, n, seed)
+
+
+def transportation_problem(sources: int, destinations: int, seed: int = 0) -> ObjectiveFunctionState:
+    """Minimum-cost transportation problem: ``<=`` supplies, ``>=`` demands, 20% more supply than demand."""
+    rng = np.random.default_rng(seed)
+    A = np.zeros((sources + destinations, sources * destinations))
+    for i in range(sources):
+        A[i, i * destinations:(i + 1) * destinations] = 1.0
+        A[sources + np.arange(destinations), i * destinations + np.arange(destinations)] = 1.0
+    demand = rng.integers(10, 60, size=destinations).astype(float)
+    supply = rng.uniform(0.5, 1.5, size=sources)
+    supply = np.ceil(supply / supply.sum() * demand.sum() * 1.2)
+    senses = [ConstraintSymbol.LESS_THAN_OR_EQUAL] * sources + [ConstraintSymbol.GREATER_THAN_OR_EQUAL] * destinations
+    c = rng.integers(1, 100, size=sources * destinations).astype(float)
+    return problem_from_arrays(c, A, np.concatenate([supply, demand]), senses, ObjectiveFunctionType.MINIMIZE)
+
+
+def assignment_problem(size: int, seed: int = 0) -> ObjectiveFunctionState:
+    """Maximum-profit assignment of ``size`` workers to ``size`` jobs."""
+    rng = np.random.default_rng(seed)
+    A = np.zeros((2 * size, size * size))
+    for i in range(size):
+        A[i, i * size:(i + 1) * size] = 1.0
+        A[size + np.arange(size), i * size + np.arange(size)] = 1.0
+    c = rng.integers(1, 1000, size=size * size).astype(float)
+    return problem_from_arrays(c, A, np.ones(2 * size), [ConstraintSymbol.EQUAL] * (2 * size))
+
+
+def min_cost_flow_problem(nodes: int, arcs: int, seed: int = 0) -> ObjectiveFunctionState:
+    """
+    Minimum-cost flow on a random connected graph, with supply and demand nodes; the other nodes are
+    transshipment nodes (``=``) and some of them may keep flow (``>=``). Arcs run both ways along a ring,
+    so every demand can be reached.
+    """
+    rng = np.random.default_rng(seed)
+    tails = np.concatenate([np.arange(nodes), (np.arange(nodes) + 1) % nodes, rng.integers(0, nodes, size=arcs)])
+    heads = np.concatenate([(np.arange(nodes) + 1) % nodes, np.arange(nodes), rng.integers(0, nodes, size=arcs)])
+    keep = tails != heads
+    tails, heads = tails[keep], heads[keep]
+    A = np.zeros((nodes, tails.size))
+    A[tails, np.arange(tails.size)] = 1.0
+    A[heads, np.arange(tails.size)] = -1.0
+
+    b = np.zeros(nodes)
+    terminals = rng.choice(nodes, size=max(nodes // 5, 2), replace=False)
+    sources, sinks = terminals[: terminals.size // 2], terminals[terminals.size // 2:]
+    b[sources] = rng.integers(10, 50, size=sources.size)
+    b[sinks] = -np.diff(np.linspace(0, b.sum(), sinks.size + 1).round())
+    senses = [ConstraintSymbol.EQUAL] * nodes
+    for i in rng.choice(nodes, size=nodes // 10, replace=False):
+        if b[i] == 0:
+            senses[i] = ConstraintSymbol.GREATER_THAN_OR_EQUAL
+    c = rng.integers(1, 50, size=tails.size).astype(float)
+    return problem_from_arrays(c, A, b, senses, ObjectiveFunctionType.MINIMIZE)
+
+
+NETWORK_BENCHMARK_SET = {
+    "transport-20x30": (transportation_problem, (20, 30, 1)),
+    "transport-50x60": (transportation_problem, (50, 60, 2)),
+    "assignment-30": (assignment_problem, (30, 3)),
+    "assignment-70": (assignment_problem, (70, 4)),
+    "flow-100x600": (min_cost_flow_problem, (100, 600, 5)),
+    "flow-200x1500": (min_cost_flow_problem, (200, 1500, 6)),
+}
+
+
+def network_benchmark_problems():
+    """Yield ``(name, problem)`` for every problem of the network benchmark set."""
+    for name, (generator, arguments) in NETWORK_BENCHMARK_SET.items():
+        yield name, generator(*arguments)
+
+
+def multi_plant_problem(plants: int, machines: int, products: int, shared: int, seed: int = 0) -> ObjectiveFunctionState:
+    """
+    Maximum-profit production plan of several plants, block-angular: each plant has its own machine
+    capacities (``<=``) over its own products, and ``shared`` raw-material rows (``<=``) link all plants.
+    """
+    rng = np.random.default_rng(seed)
+    n = plants * products
+    A = np.zeros((shared + plants * machines, n))
+    A[:shared] = rng.uniform(0.5, 3.0, size=(shared, n))
+    for k in range(plants):
+        rows = shared + k * machines + np.arange(machines)
+        A[np.ix_(rows, k * products + np.arange(products))] = rng.uniform(1.0, 10.0, size=(machines, products)) * (
+            rng.random((machines, products)) < 0.7
+        )
+    b = np.concatenate([
+        rng.uniform(0.15, 0.3, size=shared) * A[:shared].sum(axis=1) * 2,
+        rng.uniform(50, 150, size=plants * machines),
+    ])
+    senses = [ConstraintSymbol.LESS_THAN_OR_EQUAL] * A.shape[0]
+    c = rng.uniform(5, 50, size=n)
+    return problem_from_arrays(c, A, b, senses)
+
+
+DECOMPOSITION_BENCHMARK_SET = {
+    "plants-4x20x30": (4, 20, 30, 3, 1),
+    "plants-8x30x40": (8, 30, 40, 4, 2),
+    "plants-12x40x50": (12, 40, 50, 5, 3),
+}
+
+
+def decomposition_benchmark_problems():
+    """Yield ``(name, problem)`` for every problem of the decomposition benchmark set."""
+    for name, arguments in DECOMPOSITION_BENCHMARK_SET.items():
+        yield name, multi_plant_problem(*arguments)
@@ -0,0 +1,70 @@
+import flet as ft
+import numpy as np
+
+from components.paged_table import BLUE_TABLE, PagedTable, TableColumn
+
+
+class AlternativeOptimaPanel(ft.Column):
+    """
+    Alternative optimal solutions of SimplexTableau.get_alternative_optima.
+
+    One table column per optimal vertex (the current solution first, at most ``limit``), then the directions
+    along which the optimal value is kept without limit, when the optimal face is unbounded; a unique
+    optimum is just stated.
+    """
+
+    def __init__(self, optima: dict, limit: int = 8, *args, **kwargs) -> None:
+        if optima["unique"]:
+            super(AlternativeOptimaPanel, self).__init__(
+                controls=[ft.Text(
+                    "A solução ótima é única: nenhuma outra combinação das variáveis atinge o valor ótimo "
+                    f"{optima['objective_value']:.3f}."
+                    + ("" if optima["complete"] else " (Verificação interrompida pelo limite de tempo.)"),
+                    color=ft.Colors.GREY_800,
+                    size=14,
+                )],
+                *args,
+                **kwargs,
+            )
+            return
+
+        names = np.array(optima["variables"])
+        vertices = optima["vertices"][:limit]
+        columns = [TableColumn("Variável", names, bold=True)]
+        columns += [
+            TableColumn(
+                "Atual" if k == 0 else f"Vértice {k + 1}",
+                np.array(vertex, dtype=float),
+                decimals=3,
+                color=ft.Colors.GREEN_800 if k == 0 else ft.Colors.BLUE_800,
+                bold=k == 0,
+            )
+            for k, vertex in enumerate(vertices)
+        ]
+        columns += [
+            TableColumn(f"Direção {k + 1}", np.array(ray, dtype=float), decimals=3, color=ft.Colors.ORANGE_800)
+            for k, ray in enumerate(optima["rays"])
+        ]
+
+        zero = optima["zero_reduced_costs"] + optima["zero_shadow_prices"]
+        count = len(optima["vertices"])
+        summary = (
+            f"O valor ótimo {optima['objective_value']:.3f} também é atingido em outros planos: "
+            f"{count} {'vértice ótimo encontrado' if count == 1 else 'vértices ótimos encontrados'}"
+            + (f" e {len(optima['rays'])} {'direção ilimitada' if len(optima['rays']) == 1 else 'direções ilimitadas'}" if optima["rays"] else "")
+            + f". Custo reduzido ou preço-sombra zero: {', '.join(zero)}."
+        )
+        controls: list[ft.Control] = [
+            ft.Text(summary, color=ft.Colors.GREY_800, size=14),
+            PagedTable(columns, BLUE_TABLE, page_size=15),
+        ]
+        notes = []
+        if len(optima["vertices"]) > limit:
+            notes.append(f"Mostrando {limit} de {count} vértices.")
+        if not optima["complete"]:
+            notes.append("Enumeração interrompida pelo limite de vértices ou de tempo; pode haver outros.")
+        if optima["rays"]:
+            notes.append("Qualquer vértice somado a um múltiplo positivo de uma direção também é ótimo.")
+        controls.extend(ft.Text(note, size=12, italic=True, color=ft.Colors.GREY_700) for note in notes)
+
+        super(AlternativeOptimaPanel, self).__init__(controls=controls, spacing=10, *args, **kwargs)
@@ -0,0 +1,114 @@
+from typing import Union
+
+import flet as ft
+import numpy as np
+
+from components.paged_table import ORANGE_TABLE, RED_TABLE, PagedTable, TableColumn
+
+
+BOUND_SYMBOLS = {"lower": ">=", "upper": "<="}
+
+
+class DiagnosisPanel(ft.Column):
+    """
+    Explanation of a problem without an optimal solution.
+
+    An infeasible problem shows the conflict of SimplexTableau.get_infeasibility_diagnosis (constraints and
+    bounds that cannot hold together), an unbounded one the direction of SimplexTableau.get_unbounded_ray.
+    """
+
+    def __init__(
+        self,
+        conflict: Union[dict, None] = None,
+        ray: Union[dict, None] = None,
+        infeasible: bool = True,
+        *args,
+        **kwargs,
+    ) -> None:
+        if infeasible:
+            controls = self._build_conflict(conflict)
+        else:
+            controls = self._build_ray(ray)
+        super(DiagnosisPanel, self).__init__(controls=controls, spacing=10, *args, **kwargs)
+
+    @staticmethod
+    def _build_title(icon: str, text: str, color: str) -> ft.Control:
+        return ft.Row(
+            controls=[
+                ft.Icon(icon, color=color),
+                ft.Text(text, size=16, weight=ft.FontWeight.BOLD, color=color),
+            ],
+            spacing=8,
+        )
+
+    def _build_conflict(self, conflict: Union[dict, None]) -> list[ft.Control]:
+        title = self._build_title(ft.Icons.REPORT_PROBLEM, "Por que o problema é inviável", ft.Colors.RED_800)
+        if conflict is None:
+            return [title, ft.Text(
+                "A relaxação linear tem solução: a inviabilidade vem das variáveis inteiras ou binárias.",
+                color=ft.Colors.GREY_800,
+            )]
+
+        constraints, bounds = conflict["constraints"], conflict["bounds"]
+        kinds = ["Restrição"] * len(constraints) + ["Limite"] * len(bounds)
+        names = [c["name"] for c in constraints] + [b["name"] for b in bounds]
+        conditions = [f"{c['symbol']} {c['rhs']:g}" for c in constraints]
+        conditions += [f"{BOUND_SYMBOLS[b['side']]} {b['value']:g}" for b in bounds]
+        table = PagedTable(
+            columns=[
+                TableColumn("Nome", np.array(names), bold=True),
+                TableColumn("Tipo", np.array(kinds)),
+                TableColumn("Condição", np.array(conditions), color=ft.Colors.RED_700),
+            ],
+            colors=RED_TABLE,
+            page_size=10,
+        )
+        return [
+            title,
+            ft.Text(
+                f"Estas {len(names)} condições não podem ser satisfeitas ao mesmo tempo; "
+                "retirando ou relaxando qualquer uma delas, as demais passam a ter solução.",
+                color=ft.Colors.GREY_800,
+            ),
+            table,
+            ft.Text(
+                f"Subsistema irredutível encontrado em {conflict['tests']} testes ({conflict['elapsed']:.2f} s).",
+                size=12,
+                italic=True,
+                color=ft.Colors.GREY_700,
+            ),
+        ]
+
+    def _build_ray(self, ray: Union[dict, None]) -> list[ft.Control]:
+        title = self._build_title(ft.Icons.ALL_INCLUSIVE, "Por que o problema é ilimitado", ft.Colors.ORANGE_800)
+        if ray is None:
+            return [title, ft.Text(
+                "A relaxação linear não é ilimitada: a ilimitação vem das variáveis inteiras.",
+                color=ft.Colors.GREY_800,
+            )]
+
+        names = np.array(list(ray["direction"].keys()))
+        direction = np.array(list(ray["direction"].values()), dtype=float)
+        table = PagedTable(
+            columns=[
+                TableColumn("Variável", names, bold=True),
+                TableColumn(
+                    "Direção",
+                    direction,
+                    decimals=4,
+                    color=lambda row: ft.Colors.GREEN_700 if direction[row] > 0 else ft.Colors.RED_700,
+                ),
+            ],
+            colors=ORANGE_TABLE,
+            page_size=10,
+            nonzero_column=1,
+        )
+        return [
+            title,
+            ft.Text(
+                "Partindo de qualquer solução viável e avançando na direção abaixo, todas as restrições "
+                f"continuam satisfeitas e o objetivo varia {ray['objective_rate']:+.4g} por passo, sem limite.",
+                color=ft.Colors.GREY_800,
+            ),
+            table,
+        ]
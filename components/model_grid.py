@@ -0,0 +1,278 @@
+from typing import Callable, Union
+
+import flet as ft
+
+from data.app_state import ConstraintSymbol, ObjectiveFunctionState, VariableCategory
+from components.variable_options import CATEGORY_DESCRIPTIONS, CATEGORY_LABELS, format_bounds, open_bounds_dialog
+from utilities.string import extract_number_from_string
+
+
+CELL_WIDTH = 84
+CELL_HEIGHT = 40
+SPACING = 4
+ROW_HEIGHT = CELL_HEIGHT + SPACING
+LABEL_WIDTH = 110
+SENSE_WIDTH = 84
+RHS_WIDTH = 96
+OVERSCAN_ROWS = 2
+
+
+def _format(value: float) -> str:
+    return f"{value:.10g}"
+
+
+class ModelGrid(ft.Container):
+    """
+    Spreadsheet-style editor of the objective and constraint coefficients.
+
+    Only the cells on screen exist as controls: a fixed pool of rows (the visible ones plus a small margin)
+    is rebound to other constraints while scrolling, with spacers above and below so the scrollbar still
+    spans the whole model. Columns are windowed the same way and moved with the slider above the grid.
+    Cells read the model straight from the state and write through the same callbacks as the other editors.
+    """
+
+    def __init__(
+        self,
+        page: ft.Page,
+        model: Callable[[], ObjectiveFunctionState],
+        on_change_objective_value: Union[Callable[[float, str], None], None] = None,
+        on_change_category: Union[Callable[[VariableCategory, str], None], None] = None,
+        on_change_bounds: Union[Callable[[Union[float, None], Union[float, None], str], None], None] = None,
+        on_change_variable_value: Union[Callable[[float, str, str], None], None] = None,
+        on_change_constraint_value: Union[Callable[[float, str], None], None] = None,
+        on_change_constraint_symbol: Union[Callable[[ConstraintSymbol, str], None], None] = None,
+        visible_rows: int = 10,
+        visible_columns: int = 8,
+        *args,
+        **kwargs,
+    ) -> None:
+        self._page = page
+        self._model = model
+        self._on_change_objective_value = on_change_objective_value
+        self._on_change_category = on_change_category
+        self._on_change_bounds = on_change_bounds
+        self._on_change_variable_value = on_change_variable_value
+        self._on_change_constraint_value = on_change_constraint_value
+        self._on_change_constraint_symbol = on_change_constraint_symbol
+        self._visible_rows = visible_rows
+        self._visible_columns = visible_columns
+        self._first_row = 0
+        self._first_column = 0
+
+        self._header_menus = [self._build_header_menu() for _ in range(visible_columns)]
+        self._objective_cells = [self._build_cell() for _ in range(visible_columns)]
+        self._rows = [self._build_row() for _ in range(visible_rows + OVERSCAN_ROWS)]
+        self._top_spacer = ft.Container(height=0)
+        self._bottom_spacer = ft.Container(height=0)
+        self._body = ft.Column(
+            controls=[self._top_spacer, *(row for row, *_ in self._rows), self._bottom_spacer],
+            spacing=SPACING,
+            scroll=ft.ScrollMode.AUTO,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=30,
+        )
+        self._range_text = ft.Text(size=12, color=ft.Colors.GREY_700)
+        self._column_slider = ft.Slider(min=0, max=1, value=0, on_change=self._on_column_slider, expand=True)
+
+        super(ModelGrid, self).__init__(
+            content=ft.Column(
+                controls=[
+                    ft.Row(controls=[self._range_text, self._column_slider]),
+                    ft.Row(
+                        controls=[
+                            ft.Container(width=LABEL_WIDTH),
+                            *self._header_menus,
+                            ft.Text("símbolo", width=SENSE_WIDTH, size=13, color=ft.Colors.GREY_700, text_align=ft.TextAlign.CENTER),
+                            ft.Text("lado direito", width=RHS_WIDTH, size=13, color=ft.Colors.GREY_700, text_align=ft.TextAlign.CENTER),
+                        ],
+                        spacing=SPACING,
+                    ),
+                    ft.Row(
+                        controls=[
+                            ft.Text("Z", width=LABEL_WIDTH, size=16, weight=ft.FontWeight.BOLD, color=ft.Colors.BLACK),
+                            *self._objective_cells,
+                        ],
+                        spacing=SPACING,
+                        height=CELL_HEIGHT,
+                    ),
+                    ft.Divider(color=ft.Colors.GREY_300, height=1),
+                    self._body,
+                ],
+                spacing=SPACING,
+            ),
+            bgcolor=ft.Colors.GREY_100,
+            border_radius=ft.border_radius.all(8),
+            padding=ft.padding.symmetric(horizontal=20, vertical=10),
+            margin=ft.margin.only(top=10),
+            *args,
+            **kwargs,
+        )
+        self._bind()
+
+    def _build_cell(self) -> ft.TextField:
+        return ft.TextField(
+            width=CELL_WIDTH,
+            height=CELL_HEIGHT,
+            text_size=15,
+            text_align=ft.TextAlign.RIGHT,
+            dense=True,
+            content_padding=ft.padding.symmetric(horizontal=8, vertical=8),
+            border_color=ft.Colors.GREY_300,
+            bgcolor="#FAFCFF",
+            color=ft.Colors.BLACK,
+            keyboard_type=ft.KeyboardType.NUMBER,
+            on_change=self._on_cell_change,
+        )
+
+    def _build_header_menu(self) -> ft.PopupMenuButton:
+        """Builds a column header: the variable name and a menu for its type and bounds."""
+        label = ft.Text(size=14, color="#1E65F2", text_align=ft.TextAlign.CENTER, width=CELL_WIDTH)
+        menu = ft.PopupMenuButton(content=label, width=CELL_WIDTH)
+        menu.items = [
+            ft.PopupMenuItem(
+                text=f"{CATEGORY_LABELS[category]}  {CATEGORY_DESCRIPTIONS[category]}",
+                on_click=lambda _, menu=menu, category=category: self._on_category(menu.data, category),
+            )
+            for category in VariableCategory
+        ]
+        menu.items += [
+            ft.PopupMenuItem(),  # divider
+            ft.PopupMenuItem(text="Limites…", icon=ft.Icons.STRAIGHTEN, on_click=lambda _, menu=menu: self._open_bounds(menu.data)),
+        ]
+        return menu
+
+    def _build_row(self) -> tuple[ft.Row, ft.Text, list[ft.TextField], ft.Dropdown, ft.TextField]:
+        """Builds one recyclable constraint row: its label, coefficient cells, symbol and right-hand side."""
+        label = ft.Text(width=LABEL_WIDTH, size=14, color=ft.Colors.BLACK, no_wrap=True)
+        cells = [self._build_cell() for _ in range(self._visible_columns)]
+        symbol = ft.Dropdown(
+            options=[ft.DropdownOption(key=symbol.value, text=symbol.value) for symbol in ConstraintSymbol],
+            width=SENSE_WIDTH,
+            dense=True,
+            filled=True,
+            fill_color=ft.Colors.WHITE,
+            border_width=0,
+            text_size=15,
+            content_padding=ft.padding.symmetric(horizontal=8, vertical=4),
+            on_change=self._on_symbol_change,
+        )
+        rhs = self._build_cell()
+        rhs.width = RHS_WIDTH
+        rhs.on_change = self._on_rhs_change
+        row = ft.Row(controls=[label, *cells, symbol, rhs], spacing=SPACING, height=CELL_HEIGHT)
+        return row, label, cells, symbol, rhs
+
+    @property
+    def _pool_size(self) -> int:
+        return len(self._rows)
+
+    def _bind(self) -> None:
+        """Points the pooled controls at the rows and columns of the current window."""
+        model = self._model()
+        m, n = model.quantity_of_constraints, model.quantity_of_variables
+        self._first_row = max(0, min(self._first_row, m - self._pool_size))
+        self._first_column = max(0, min(self._first_column, n - self._visible_columns))
+        columns = [self._first_column + k for k in range(self._visible_columns)]
+
+        for j, menu, cell in zip(columns, self._header_menus, self._objective_cells):
+            menu.visible = cell.visible = j < n
+            if j >= n:
+                continue
+            variable = model.variables[j]
+            menu.data = cell.data = (None, j)
+            menu.content.value = f"{variable.name} {CATEGORY_LABELS[variable.category]}"
+            menu.tooltip = f"{CATEGORY_DESCRIPTIONS[variable.category]}, {format_bounds(variable.lower_bound, variable.upper_bound)}"
+            cell.value = _format(variable.value)
+
+        for offset, (row, label, cells, symbol, rhs) in enumerate(self._rows):
+            i = self._first_row + offset
+            row.visible = i < m
+            if i >= m:
+                continue
+            constraint = model.constraints[i]
+            label.value = constraint.name
+            for j, cell in zip(columns, cells):
+                cell.visible = j < n
+                if j < n:
+                    cell.data = (i, j)
+                    cell.value = _format(constraint.variables[j].value)
+            symbol.data = rhs.data = (i, None)
+            symbol.value = constraint.symbol.value
+            rhs.value = _format(constraint.value)
+
+        shown = min(m, self._pool_size)
+        # A visible spacer also adds the spacing between controls, hence the ``- SPACING``.
+        self._top_spacer.height = max(self._first_row * ROW_HEIGHT - SPACING, 0)
+        self._bottom_spacer.height = max((m - self._first_row - shown) * ROW_HEIGHT - SPACING, 0)
+        self._top_spacer.visible = self._first_row > 0
+        self._bottom_spacer.visible = self._bottom_spacer.height > 0
+        self._body.height = min(m, self._visible_rows) * ROW_HEIGHT
+
+        hidden_columns = max(n - self._visible_columns, 0)
+        self._column_slider.visible = hidden_columns > 0
+        self._column_slider.max = max(hidden_columns, 1)
+        self._column_slider.divisions = max(hidden_columns, 1)
+        self._column_slider.value = self._first_column
+        last_column = min(self._first_column + self._visible_columns, n)
+        self._range_text.value = (
+            f"Variáveis {self._first_column + 1}–{last_column} de {n} · {m} restrições"
+            if hidden_columns or m > self._visible_rows else f"{n} variáveis · {m} restrições"
+        )
+
+    def refresh(self) -> None:
+        """Rereads the model (after a change of size, an undo or an import) and redraws the window."""
+        self._bind()
+        self.update()
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        first_row = max(int(e.pixels // ROW_HEIGHT) - OVERSCAN_ROWS // 2, 0)
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._bind()
+            self.update()
+
+    def _on_column_slider(self, e: ft.ControlEvent):
+        first_column = int(round(float(e.control.value)))
+        if first_column != self._first_column:
+            self._first_column = first_column
+            self._bind()
+            self.update()
+
+    def _on_cell_change(self, e: ft.ControlEvent):
+        """Writes a coefficient; the text is left as typed, so partial numbers like ``-`` can be completed."""
+        i, j = e.control.data
+        model = self._model()
+        value = extract_number_from_string(e.control.value or "")
+        name = model.variables[j].name
+        if i is None:
+            if self._on_change_objective_value is not None:
+                self._on_change_objective_value(value, name)
+        elif self._on_change_variable_value is not None:
+            self._on_change_variable_value(value, name, model.constraints[i].name)
+
+    def _on_rhs_change(self, e: ft.ControlEvent):
+        i, _ = e.control.data
+        if self._on_change_constraint_value is not None:
+            self._on_change_constraint_value(extract_number_from_string(e.control.value or ""), self._model().constraints[i].name)
+
+    def _on_symbol_change(self, e: ft.ControlEvent):
+        i, _ = e.control.data
+        if self._on_change_constraint_symbol is not None:
+            self._on_change_constraint_symbol(ConstraintSymbol(e.control.value), self._model().constraints[i].name)
+
+    def _on_category(self, data: tuple[None, int], category: VariableCategory):
+        _, j = data
+        if self._on_change_category is not None:
+            self._on_change_category(category, self._model().variables[j].name)
+        self.refresh()
+
+    def _open_bounds(self, data: tuple[None, int]):
+        _, j = data
+        variable = self._model().variables[j]
+
+        def on_apply(lower: Union[float, None], upper: Union[float, None]):
+            if self._on_change_bounds is not None:
+                self._on_change_bounds(lower, upper, variable.name)
+            self.refresh()
+
+        open_bounds_dialog(self._page, variable.name, (variable.lower_bound, variable.upper_bound), on_apply)
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import Callable, Union
+
+import flet as ft
+import numpy as np
+
+
+ZERO_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class TableColors:
+    """Colors of a table: border, heading background, alternate rows and heading text."""
+    border: str
+    heading: str
+    stripe: str
+    title: str
+
+
+GREEN_TABLE = TableColors(ft.Colors.GREEN_300, ft.Colors.GREEN_200, ft.Colors.GREEN_50, ft.Colors.GREEN_900)
+BLUE_TABLE = TableColors(ft.Colors.BLUE_300, ft.Colors.BLUE_200, ft.Colors.BLUE_50, ft.Colors.BLUE_900)
+PURPLE_TABLE = TableColors(ft.Colors.PURPLE_300, ft.Colors.PURPLE_200, ft.Colors.PURPLE_50, ft.Colors.PURPLE_900)
+RED_TABLE = TableColors(ft.Colors.RED_300, ft.Colors.RED_200, ft.Colors.RED_50, ft.Colors.RED_900)
+ORANGE_TABLE = TableColors(ft.Colors.ORANGE_300, ft.Colors.ORANGE_200, ft.Colors.ORANGE_50, ft.Colors.ORANGE_900)
+
+
+@dataclass(frozen=True)
+class TableColumn:
+    """
+    One column of a PagedTable.
+
+    ``values`` holds one entry per row and is what sorting and the "nonzero only" switch look at. The cell
+    shows ``text(row)`` when given, else the value with ``decimals`` places, in ``color`` (a color or a function
+    of the row); ``build(row)`` replaces the text with any control (e.g. an input field), created only while
+    its row is on the current page.
+    """
+    label: str
+    values: np.ndarray
+    text: Union[Callable[[int], str], None] = None
+    decimals: int = 2
+    color: Union[str, Callable[[int], str]] = ft.Colors.BLACK
+    bold: bool = False
+    tooltip: Union[str, None] = None
+    build: Union[Callable[[int], ft.Control], None] = None
+
+    @property
+    def numeric(self) -> bool:
+        return self.values.dtype.kind in "iuf"
+
+    def cell(self, row: int) -> ft.Control:
+        if self.build is not None:
+            return self.build(row)
+        if self.text is not None:
+            text = self.text(row)
+        elif self.numeric:
+            text = f"{self.values[row]:.{self.decimals}f}"
+        else:
+            text = str(self.values[row])
+        color = self.color(row) if callable(self.color) else self.color
+        return ft.Text(text, color=color, weight=ft.FontWeight.BOLD if self.bold else None)
+
+
+class PagedTable(ft.Container):
+    """
+    Table that only builds the rows of the current page.
+
+    Rows are taken on demand from the column arrays: clicking a heading sorts, the filter keeps the rows whose
+    first column contains the typed text, and "nonzero only" hides rows whose ``nonzero_column`` is zero.
+    All of them reorder an array of row indices; no control exists for rows off the page.
+    """
+
+    def __init__(
+        self,
+        columns: list[TableColumn],
+        colors: TableColors = GREEN_TABLE,
+        page_size: int = 20,
+        nonzero_column: Union[int, None] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        lengths = {len(column.values) for column in columns}
+        if len(lengths) != 1:
+            raise ValueError("All columns of a table must have the same number of rows.")
+        self._columns = columns
+        self._colors = colors
+        self._page_size = page_size
+        self._nonzero_column = nonzero_column
+        self._rows = lengths.pop()
+        self._names = np.char.lower(np.asarray(columns[0].values, dtype=str))
+        self._query = ""
+        self._nonzero_only = False
+        self._sort_column: Union[int, None] = None
+        self._ascending = True
+        self._page = 0
+        self._order = np.arange(self._rows)
+
+        self._table = ft.DataTable(
+            columns=[
+                ft.DataColumn(
+                    label=ft.Text(column.label, weight=ft.FontWeight.BOLD, color=colors.title, tooltip=column.tooltip),
+                    numeric=column.numeric and column.build is None,
+                    on_sort=self._on_sort if column.build is None else None,
+                )
+                for column in columns
+            ],
+            border=ft.border.all(1, colors.border),
+            heading_row_color=colors.heading,
+            data_row_color=lambda i: (ft.Colors.WHITE if i % 2 == 0 else colors.stripe),
+            border_radius=ft.border_radius.all(8),
+        )
+        self._range_text = ft.Text(size=13, color=ft.Colors.GREY_700)
+        self._previous_button = ft.IconButton(icon=ft.Icons.CHEVRON_LEFT, tooltip="Página anterior", on_click=lambda _: self._go(-1))
+        self._next_button = ft.IconButton(icon=ft.Icons.CHEVRON_RIGHT, tooltip="Próxima página", on_click=lambda _: self._go(1))
+
+        toolbar: list[ft.Control] = []
+        if self._rows > page_size:
+            toolbar.append(ft.TextField(
+                label=f"Filtrar por {columns[0].label.lower()}",
+                width=220,
+                height=44,
+                dense=True,
+                text_style=ft.TextStyle(size=14, color=ft.Colors.BLACK),
+                on_change=self._on_filter,
+            ))
+        if nonzero_column is not None:
+            toolbar.append(ft.Switch(label="Somente não nulos", value=False, on_change=self._on_nonzero))
+        toolbar += [self._previous_button, self._range_text, self._next_button]
+
+        super(PagedTable, self).__init__(
+            content=ft.Column(
+                controls=[ft.Row(controls=toolbar, wrap=True, vertical_alignment=ft.CrossAxisAlignment.CENTER), self._table],
+                spacing=8,
+            ),
+            *args,
+            **kwargs,
+        )
+        self._render()
+
+    @property
+    def visible_rows(self) -> np.ndarray:
+        """Indices of the rows that pass the filters, in display order."""
+        return self._order
+
+    def _reorder(self) -> None:
+        """Recomputes the filtered and sorted row indices."""
+        mask = np.ones(self._rows, dtype=bool)
+        if self._query:
+            mask &= np.char.find(self._names, self._query) >= 0
+        if self._nonzero_only:
+            mask &= np.abs(self._columns[self._nonzero_column].values.astype(float)) > ZERO_TOLERANCE
+        order = np.flatnonzero(mask)
+        if self._sort_column is not None:
+            keys = self._columns[self._sort_column].values[order]
+            order = order[np.argsort(keys, kind="stable")]
+            if not self._ascending:
+                order = order[::-1]
+        self._order = order
+        self._page = 0
+
+    def _render(self) -> None:
+        """Builds the DataRows of the current page only."""
+        total = len(self._order)
+        pages = max((total - 1) // self._page_size + 1, 1)
+        self._page = min(self._page, pages - 1)
+        start = self._page * self._page_size
+        page_rows = self._order[start:start + self._page_size]
+
+        self._table.rows = [
+            ft.DataRow(cells=[ft.DataCell(column.cell(row)) for column in self._columns])
+            for row in page_rows
+        ]
+        self._table.sort_column_index = self._sort_column
+        self._table.sort_ascending = self._ascending
+        self._range_text.value = f"{start + 1}–{start + len(page_rows)} de {total}" if total else "Nenhuma linha"
+        self._previous_button.disabled = self._page == 0
+        self._next_button.disabled = self._page >= pages - 1
+
+    def _refresh(self) -> None:
+        self._render()
+        if self.page:
+            self.update()
+
+    def _go(self, step: int) -> None:
+        self._page += step
+        self._refresh()
+
+    def _on_sort(self, e: ft.DataColumnSortEvent):
+        self._sort_column = e.column_index
+        self._ascending = e.ascending
+        self._reorder()
+        self._refresh()
+
+    def _on_filter(self, e: ft.ControlEvent):
+        self._query = (e.control.value or "").strip().lower()
+        self._reorder()
+        self._refresh()
+
+    def _on_nonzero(self, e: ft.ControlEvent):
+        self._nonzero_only = bool(e.control.value)
+        self._reorder()
+        self._refresh()
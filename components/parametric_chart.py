@@ -0,0 +1,144 @@
+import flet as ft
+import numpy as np
+
+from components.paged_table import BLUE_TABLE, PagedTable, TableColumn
+
+
+STATUS_DESCRIPTIONS = {
+    "Infeasible": "inviável",
+    "Unbounded": "ilimitado",
+    "Not Solved": "não resolvido",
+    "Optimal": "ótimo",
+}
+
+
+class ParametricChart(ft.Container):
+    """
+    Plots a piecewise-linear curve from SimplexTableau.get_parametric_rhs/get_parametric_objective.
+
+    The breakpoints are the points of the line, so the plot is exact however many segments there are;
+    the table below it lists the slope of each segment.
+    """
+
+    def __init__(self, curve: dict, parameter_label: str, slope_key: str, slope_label: str, *args, **kwargs) -> None:
+        segments = curve["segments"]
+        controls: list[ft.Control] = []
+        if segments:
+            controls.append(self._build_chart(curve, parameter_label))
+        controls.extend(self._build_notes(curve))
+        if segments:
+            controls.append(self._build_table(segments, parameter_label, slope_key, slope_label))
+
+        super(ParametricChart, self).__init__(
+            content=ft.Column(controls=controls, spacing=12),
+            *args,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _build_chart(curve: dict, parameter_label: str) -> ft.LineChart:
+        segments = curve["segments"]
+        points = [(segments[0]["start"], segments[0]["objective_start"])]
+        points.extend((segment["end"], segment["objective_end"]) for segment in segments)
+        values = [y for _, y in points]
+        low, high = min(values), max(values)
+        margin = 0.05 * (high - low) if high > low else max(1.0, abs(high) * 0.05)
+
+        current_value = next(
+            (
+                segment["objective_start"] + (segment["objective_end"] - segment["objective_start"])
+                * ((curve["current"] - segment["start"]) / (segment["end"] - segment["start"]))
+                for segment in segments
+                if segment["start"] <= curve["current"] <= segment["end"]
+            ),
+            None,
+        )
+
+        series = [
+            ft.LineChartData(
+                data_points=[
+                    ft.LineChartDataPoint(x, y, tooltip=f"{x:.3f} → {y:.3f}")
+                    for x, y in points
+                ],
+                color=ft.Colors.BLUE_700,
+                stroke_width=3,
+                curved=False,
+            )
+        ]
+        if current_value is not None:
+            series.append(ft.LineChartData(
+                data_points=[ft.LineChartDataPoint(
+                    curve["current"], current_value, tooltip=f"Atual: {curve['current']:.3f} → {current_value:.3f}",
+                )],
+                color=ft.Colors.ORANGE_700,
+                stroke_width=0,
+                point=True,
+            ))
+
+        return ft.LineChart(
+            data_series=series,
+            min_x=curve["start"],
+            max_x=curve["end"],
+            min_y=low - margin,
+            max_y=high + margin,
+            left_axis=ft.ChartAxis(title=ft.Text("Valor ótimo", size=12), labels_size=56),
+            bottom_axis=ft.ChartAxis(title=ft.Text(parameter_label, size=12), labels_size=32),
+            horizontal_grid_lines=ft.ChartGridLines(color=ft.Colors.GREY_300, width=1),
+            vertical_grid_lines=ft.ChartGridLines(color=ft.Colors.GREY_300, width=1),
+            border=ft.border.all(1, ft.Colors.GREY_400),
+            tooltip_bgcolor=ft.Colors.with_opacity(0.9, ft.Colors.WHITE),
+            height=280,
+            expand=True,
+        )
+
+    @staticmethod
+    def _build_notes(curve: dict) -> list[ft.Control]:
+        """Explains the parts of the range where the problem has no optimal solution."""
+        segments = curve["segments"]
+        notes = []
+        if not segments and curve["status_below"] == "Optimal":
+            # A range of a single value has no segment, but the problem is solved there.
+            return [ft.Text(
+                f"O intervalo se reduz ao valor {curve['start']:.3f}; não há curva a mostrar.",
+                color=ft.Colors.GREY_700,
+                size=14,
+                italic=True,
+            )]
+        if not segments:
+            notes.append(f"O problema é {STATUS_DESCRIPTIONS.get(curve['status_below'], curve['status_below'])} em todo o intervalo.")
+        else:
+            if segments[0]["start"] > curve["start"]:
+                status = STATUS_DESCRIPTIONS.get(curve["status_below"], curve["status_below"])
+                notes.append(f"Abaixo de {segments[0]['start']:.3f} o problema é {status}.")
+            if segments[-1]["end"] < curve["end"]:
+                status = STATUS_DESCRIPTIONS.get(curve["status_above"], curve["status_above"])
+                notes.append(f"Acima de {segments[-1]['end']:.3f} o problema é {status}.")
+        return [ft.Text(note, color=ft.Colors.RED_700, size=14, italic=True) for note in notes]
+
+    @staticmethod
+    def _build_table(segments: list[dict], parameter_label: str, slope_key: str, slope_label: str) -> PagedTable:
+        """Segments table; curves with many breakpoints are paged instead of built at once."""
+        starts = np.array([segment["start"] for segment in segments], dtype=float)
+        return PagedTable(
+            [
+                TableColumn(
+                    f"Intervalo de {parameter_label}",
+                    starts,
+                    text=lambda i: f"[{segments[i]['start']:.3f}, {segments[i]['end']:.3f}]",
+                ),
+                TableColumn(
+                    "Valor ótimo",
+                    np.array([segment["objective_start"] for segment in segments], dtype=float),
+                    text=lambda i: f"{segments[i]['objective_start']:.3f} → {segments[i]['objective_end']:.3f}",
+                    color=ft.Colors.GREY_800,
+                ),
+                TableColumn(
+                    slope_label,
+                    np.array([segment[slope_key] for segment in segments], dtype=float),
+                    decimals=3,
+                    color=ft.Colors.BLUE_800,
+                    bold=True,
+                ),
+            ],
+            BLUE_TABLE,
+        )
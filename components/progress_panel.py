@@ -0,0 +1,61 @@
+import flet as ft
+
+from methods.progress import ProgressEvent, SolvePhase
+
+
+PHASE_LABELS = {
+    SolvePhase.PHASE_ONE: "Fase 1 (busca de solução viável)",
+    SolvePhase.PHASE_TWO: "Fase 2 (otimização)",
+    SolvePhase.DUAL_SIMPLEX: "Simplex dual",
+    SolvePhase.INTERIOR_POINT: "Pontos interiores",
+    SolvePhase.BRANCH_AND_BOUND: "Branch-and-bound",
+    SolvePhase.DECOMPOSITION: "Decomposição (Dantzig–Wolfe)",
+    SolvePhase.COLUMN_GENERATION: "Geração de colunas",
+    SolvePhase.FINISHED: "Concluído",
+}
+
+
+def _format_optional(value: float | None, spec: str) -> str:
+    """Formats a value that an engine may not report."""
+    return "—" if value is None else format(value, spec)
+
+
+class ProgressPanel(ft.Container):
+    """Live view of the progress events of a running solve."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._phase_text = ft.Text("Resolvendo o problema...", size=16, color=ft.Colors.GREY_800)
+        self._details_text = ft.Text("", size=14, color=ft.Colors.GREY_700)
+
+        super(ProgressPanel, self).__init__(
+            content=ft.Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    ft.ProgressRing(color=ft.Colors.BLUE_700),
+                    ft.Column(
+                        controls=[self._phase_text, self._details_text],
+                        spacing=4,
+                    ),
+                ],
+            ),
+            *args,
+            **kwargs,
+        )
+
+    def show(self, event: ProgressEvent):
+        """Displays a progress event."""
+        self._phase_text.value = f"Resolvendo o problema... {PHASE_LABELS[event.phase]}"
+
+        details = [f"iteração {event.iteration}"]
+        if event.nodes:
+            details.append(f"{event.nodes} nós")
+        details.append(f"objetivo {_format_optional(event.objective_value, '.4f')}")
+        if event.primal_infeasibility is not None:
+            details.append(f"inviabilidade primal {event.primal_infeasibility:.2e}")
+        if event.dual_infeasibility is not None:
+            details.append(f"inviabilidade dual {event.dual_infeasibility:.2e}")
+        details.append(f"{event.elapsed:.1f} s")
+        self._details_text.value = " · ".join(details)
+
+        if self.page:
+            self.update()
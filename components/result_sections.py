@@ -0,0 +1,67 @@
+from typing import Union
+
+import flet as ft
+
+
+class ResultSections(ft.Column):
+    """
+    Results panel made of named sections (summary, variables, shadow prices, each analysis...).
+
+    Every section lives in its own holder column, indexed by key, so replacing or removing one touches only
+    that holder: the rest of the panel is neither searched nor rebuilt. Sections keep the order in which
+    their keys were first shown; a removed section keeps its place, hidden, for when it comes back.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._sections: dict[str, ft.Column] = {}
+        super(ResultSections, self).__init__(controls=[], *args, **kwargs)
+
+    def show(self, key: str, controls: Union[ft.Control, list[ft.Control]], update: bool = True) -> ft.Column:
+        """
+        Shows a section, replacing its previous controls in place, or adds it at the end.
+
+        :param key: Name of the section.
+        :param controls: New content of the section.
+        :param update: Send the change to the page now; False when building several sections before one update.
+        :return: The holder of the section.
+        """
+        controls = controls if isinstance(controls, list) else [controls]
+        holder = self._sections.get(key)
+        if holder is None:
+            holder = ft.Column(controls=controls, horizontal_alignment=self.horizontal_alignment)
+            self._sections[key] = holder
+            self.controls.append(holder)
+            if update and self.page:
+                self.update()
+            return holder
+
+        holder.controls = controls
+        holder.visible = True
+        if update and holder.page:
+            holder.update()
+        return holder
+
+    def remove(self, key: str, update: bool = True) -> bool:
+        """Hides a section and drops its controls; returns False when it was not shown."""
+        holder = self._sections.get(key)
+        if holder is None or not holder.visible:
+            return False
+        holder.controls = []
+        holder.visible = False
+        if update and holder.page:
+            holder.update()
+        return True
+
+    def clear(self, update: bool = True) -> None:
+        """Removes every section (e.g. before a new solve)."""
+        self._sections.clear()
+        self.controls = []
+        if update and self.page:
+            self.update()
+
+    def get(self, key: str) -> Union[ft.Column, None]:
+        holder = self._sections.get(key)
+        return holder if holder is not None and holder.visible else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
@@ -0,0 +1,154 @@
+import flet as ft
+
+from components.parametric_chart import STATUS_DESCRIPTIONS
+
+
+LOW_COLOR = (255, 247, 188)
+HIGH_COLOR = (37, 52, 148)
+BOUNDARY_COLOR = ft.Colors.BLACK
+CELL_SIZE = 22
+
+
+def _interpolate(t: float) -> str:
+    """Color of a normalized value between LOW_COLOR (0) and HIGH_COLOR (1)."""
+    channels = (round(low + (high - low) * t) for low, high in zip(LOW_COLOR, HIGH_COLOR))
+    return "#" + "".join(f"{channel:02x}" for channel in channels)
+
+
+class RhsHeatmap(ft.Container):
+    """
+    Heatmap of SimplexTableau.get_rhs_heatmap: the first constraint runs along the horizontal axis,
+    the second along the vertical one.
+
+    Cell color is the optimal value; thick lines separate the regions of different optimal bases,
+    and the cell closest to the current right-hand sides is marked.
+    """
+
+    def __init__(self, heatmap: dict, first_label: str, second_label: str, *args, **kwargs) -> None:
+        super(RhsHeatmap, self).__init__(
+            content=ft.Column(
+                controls=[
+                    ft.Row(
+                        controls=[
+                            ft.Container(
+                                content=ft.Text(second_label, size=12, color=ft.Colors.GREY_800),
+                                rotate=ft.Rotate(angle=-1.5708),
+                                width=24,
+                            ),
+                            self._build_axis(heatmap["second_values"], vertical=True),
+                            self._build_grid(heatmap),
+                        ],
+                        spacing=4,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(
+                        content=self._build_axis(heatmap["first_values"], vertical=False),
+                        padding=ft.padding.only(left=88),
+                    ),
+                    ft.Container(
+                        content=ft.Text(first_label, size=12, color=ft.Colors.GREY_800),
+                        padding=ft.padding.only(left=88),
+                    ),
+                    self._build_legend(heatmap),
+                ],
+                spacing=6,
+                scroll=ft.ScrollMode.AUTO,
+            ),
+            *args,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _build_grid(heatmap: dict) -> ft.Column:
+        first_values, second_values = heatmap["first_values"], heatmap["second_values"]
+        objective, status, region = heatmap["objective"], heatmap["status"], heatmap["region"]
+        values = [value for row in objective for value in row if value is not None]
+        low, high = (min(values), max(values)) if values else (0.0, 0.0)
+
+        def closest(axis: list[float], value: float) -> int:
+            return min(range(len(axis)), key=lambda k: abs(axis[k] - value))
+
+        current = (closest(first_values, heatmap["current"][0]), closest(second_values, heatmap["current"][1]))
+
+        def cell(i: int, j: int) -> ft.Container:
+            value = objective[i][j]
+            if value is None:
+                color = ft.Colors.GREY_300
+                tooltip = STATUS_DESCRIPTIONS.get(status[i][j], status[i][j])
+            else:
+                color = _interpolate((value - low) / (high - low) if high > low else 0.5)
+                tooltip = f"Valor ótimo {value:.3f} · região {region[i][j] + 1}"
+
+            def side(other: tuple[int, int]) -> ft.BorderSide | None:
+                k, l = other
+                inside = 0 <= k < len(first_values) and 0 <= l < len(second_values)
+                return ft.BorderSide(2, BOUNDARY_COLOR) if inside and region[k][l] != region[i][j] else None
+
+            return ft.Container(
+                width=CELL_SIZE,
+                height=CELL_SIZE,
+                bgcolor=color,
+                border=ft.Border(right=side((i + 1, j)), top=side((i, j + 1))),
+                content=ft.Text("●", size=10, color=ft.Colors.ORANGE_700) if (i, j) == current else None,
+                alignment=ft.alignment.center,
+                tooltip=f"({first_values[i]:.3f}, {second_values[j]:.3f}): {tooltip}",
+            )
+
+        # The highest value of the second constraint is on top.
+        return ft.Column(
+            controls=[
+                ft.Row(controls=[cell(i, j) for i in range(len(first_values))], spacing=0)
+                for j in reversed(range(len(second_values)))
+            ],
+            spacing=0,
+        )
+
+    @staticmethod
+    def _build_axis(values: list[float], vertical: bool) -> ft.Control:
+        """Labels of the first, middle and last values of an axis."""
+        middle = len(values) // 2
+        labels = [
+            ft.Container(
+                content=ft.Text(f"{value:.1f}" if k in (0, middle, len(values) - 1) else "", size=10, color=ft.Colors.GREY_700),
+                width=56 if vertical else CELL_SIZE,
+                height=CELL_SIZE,
+                alignment=ft.alignment.center_right if vertical else ft.alignment.center,
+            )
+            for k, value in enumerate(values)
+        ]
+        if vertical:
+            return ft.Column(controls=list(reversed(labels)), spacing=0)
+        return ft.Row(controls=labels, spacing=0)
+
+    @staticmethod
+    def _build_legend(heatmap: dict) -> ft.Control:
+        values = [value for row in heatmap["objective"] for value in row if value is not None]
+        if not values:
+            return ft.Text("O problema não tem solução ótima em nenhum ponto da grade.", color=ft.Colors.RED_700, size=14, italic=True)
+
+        return ft.Column(
+            controls=[
+                ft.Row(
+                    controls=[
+                        ft.Text(f"{min(values):.3f}", size=12, color=ft.Colors.GREY_800),
+                        ft.Container(
+                            width=200,
+                            height=12,
+                            gradient=ft.LinearGradient(colors=[_interpolate(0.0), _interpolate(1.0)]),
+                            border_radius=ft.border_radius.all(4),
+                        ),
+                        ft.Text(f"{max(values):.3f}", size=12, color=ft.Colors.GREY_800),
+                    ],
+                    spacing=8,
+                ),
+                ft.Text(
+                    f"{heatmap['regions']} regiões de base ótima · {heatmap['solves']} resoluções para "
+                    f"{len(heatmap['first_values']) * len(heatmap['second_values'])} pontos · "
+                    "cinza: sem solução ótima · ●: valores atuais",
+                    size=12,
+                    color=ft.Colors.GREY_700,
+                    italic=True,
+                ),
+            ],
+            spacing=4,
+        )
@@ -0,0 +1,130 @@
+import flet as ft
+
+from methods.pivot_history import PivotHistory, StepKind, Tableau
+
+
+def _format(value: float) -> str:
+    """Formats a tableau entry, without printing ``-0.000``."""
+    text = f"{value:.3f}"
+    return "0.000" if text == "-0.000" else text
+
+
+class TableauViewer(ft.Container):
+    """
+    Pages through the tableaus of a PivotHistory one iteration at a time.
+
+    Only the tableau on screen is rebuilt and rendered; the history keeps a few recent ones cached,
+    so moving back and forth between neighbouring iterations is cheap.
+    """
+
+    def __init__(self, history: PivotHistory, *args, **kwargs) -> None:
+        self._history = history
+        self._step = 0
+        self._position_text = ft.Text(size=14, color=ft.Colors.INDIGO_900, weight=ft.FontWeight.BOLD)
+        self._description_text = ft.Text(size=14, color=ft.Colors.GREY_700, italic=True)
+        self._table_container = ft.Row(scroll=ft.ScrollMode.AUTO)
+        self._first_button = ft.IconButton(icon=ft.Icons.FIRST_PAGE, tooltip="Primeira iteração", on_click=lambda e: self._show(0))
+        self._previous_button = ft.IconButton(icon=ft.Icons.CHEVRON_LEFT, tooltip="Iteração anterior", on_click=lambda e: self._show(self._step - 1))
+        self._next_button = ft.IconButton(icon=ft.Icons.CHEVRON_RIGHT, tooltip="Próxima iteração", on_click=lambda e: self._show(self._step + 1))
+        self._last_button = ft.IconButton(icon=ft.Icons.LAST_PAGE, tooltip="Tableau final", on_click=lambda e: self._show(len(self._history) - 1))
+
+        super(TableauViewer, self).__init__(
+            content=ft.Column(
+                controls=[
+                    ft.Row(
+                        controls=[
+                            self._first_button,
+                            self._previous_button,
+                            self._position_text,
+                            self._next_button,
+                            self._last_button,
+                        ],
+                        alignment=ft.MainAxisAlignment.START,
+                    ),
+                    self._description_text,
+                    self._table_container,
+                ],
+            ),
+            padding=ft.padding.all(12),
+            bgcolor=ft.Colors.INDIGO_50,
+            border_radius=ft.border_radius.all(8),
+            *args,
+            **kwargs,
+        )
+        self._show(0)
+
+    def _show(self, step: int):
+        """Rebuilds and renders the tableau after ``step`` iterations."""
+        last = len(self._history) - 1
+        self._step = max(0, min(step, last))
+        tableau = self._history.tableau(self._step)
+
+        self._position_text.value = f"Iteração {self._step} de {last} (fase {tableau.phase})"
+        self._description_text.value = self._describe(tableau)
+        self._first_button.disabled = self._previous_button.disabled = self._step == 0
+        self._next_button.disabled = self._last_button.disabled = self._step == last
+        self._table_container.controls = [self._build_table(tableau)]
+
+        if self.page:
+            self.update()
+
+    def _describe(self, tableau: Tableau) -> str:
+        """Describes what the next step does to the tableau on screen."""
+        match tableau.next_step:
+            case None:
+                return "Tableau final."
+            case StepKind.PIVOT:
+                entering = tableau.column_names[tableau.entering]
+                leaving = tableau.row_names[tableau.leaving_row]
+                pivot = tableau.body[tableau.leaving_row, tableau.entering]
+                return f"Próximo passo: {entering} entra na base, {leaving} sai (pivô {_format(pivot)})."
+            case StepKind.BOUND_FLIP:
+                return "Próximo passo: uma variável não básica passa para o seu outro limite, sem troca de base."
+            case StepKind.PHASE_CHANGE:
+                return "Próximo passo: fim da fase 1, as variáveis artificiais saem do tableau."
+            case _:
+                return ""
+
+    def _build_table(self, tableau: Tableau) -> ft.DataTable:
+        header_style = dict(weight=ft.FontWeight.BOLD, color=ft.Colors.INDIGO_900)
+        columns = [ft.DataColumn(label=ft.Text("Base", **header_style))]
+        for j, name in enumerate(tableau.column_names):
+            highlighted = j == tableau.entering
+            columns.append(ft.DataColumn(
+                label=ft.Text(name, weight=ft.FontWeight.BOLD, color=ft.Colors.RED_700 if highlighted else ft.Colors.INDIGO_900),
+                numeric=True,
+            ))
+        columns.append(ft.DataColumn(label=ft.Text("Valor", **header_style), numeric=True))
+
+        rows = []
+        for i, name in enumerate(tableau.row_names):
+            cells = [ft.DataCell(ft.Text(name, weight=ft.FontWeight.BOLD, color=ft.Colors.BLACK))]
+            for j, value in enumerate(tableau.body[i]):
+                is_pivot = i == tableau.leaving_row and j == tableau.entering
+                cells.append(ft.DataCell(ft.Text(
+                    _format(value),
+                    color=ft.Colors.RED_700 if is_pivot else ft.Colors.BLACK,
+                    weight=ft.FontWeight.BOLD if is_pivot else None,
+                )))
+            cells.append(ft.DataCell(ft.Text(_format(tableau.rhs[i]), color=ft.Colors.INDIGO_800)))
+            rows.append(ft.DataRow(
+                cells=cells,
+                color=ft.Colors.AMBER_100 if i == tableau.leaving_row else None,
+            ))
+
+        objective_cells = [ft.DataCell(ft.Text("Custo reduzido", weight=ft.FontWeight.BOLD, color=ft.Colors.INDIGO_900))]
+        objective_cells.extend(
+            ft.DataCell(ft.Text(_format(value), color=ft.Colors.INDIGO_900)) for value in tableau.reduced_costs
+        )
+        objective_cells.append(ft.DataCell(ft.Text(_format(tableau.objective_value), weight=ft.FontWeight.BOLD, color=ft.Colors.INDIGO_900)))
+        rows.append(ft.DataRow(cells=objective_cells, color=ft.Colors.INDIGO_100))
+
+        return ft.DataTable(
+            columns=columns,
+            rows=rows,
+            border=ft.border.all(1, ft.Colors.INDIGO_200),
+            heading_row_color=ft.Colors.INDIGO_100,
+            column_spacing=24,
+            data_row_min_height=32,
+            data_row_max_height=40,
+        )
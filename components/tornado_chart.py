@@ -0,0 +1,101 @@
+import math
+
+import flet as ft
+
+from components.parametric_chart import STATUS_DESCRIPTIONS
+
+
+BAR_WIDTH = 420
+BAR_HEIGHT = 18
+LOW_COLOR = ft.Colors.ORANGE_400
+HIGH_COLOR = ft.Colors.BLUE_600
+
+
+class TornadoChart(ft.Container):
+    """
+    Tornado chart of SimplexTableau.get_tornado: one row per parameter, largest swing on top.
+
+    Bars start at the current optimal value; orange is the change of the optimal value when the parameter
+    is lowered, blue when it is raised. A move that loses the optimal solution is written instead of drawn.
+    """
+
+    def __init__(self, tornado: dict, limit: int = 15, *args, **kwargs) -> None:
+        bars = tornado["bars"][:limit]
+        finite = [
+            abs(value - tornado["objective_value"])
+            for bar in bars
+            for value in (bar["objective_low"], bar["objective_high"])
+            if value is not None
+        ]
+        scale = (BAR_WIDTH / 2) / max(max(finite, default=0.0), 1e-12)
+
+        controls: list[ft.Control] = [self._build_legend(tornado)]
+        controls.extend(self._build_row(bar, tornado["objective_value"], scale) for bar in bars)
+        if len(tornado["bars"]) > limit:
+            controls.append(ft.Text(
+                f"Mostrando os {limit} parâmetros de maior impacto de {len(tornado['bars'])}.",
+                size=12,
+                color=ft.Colors.GREY_700,
+                italic=True,
+            ))
+
+        super(TornadoChart, self).__init__(
+            content=ft.Column(controls=controls, spacing=6),
+            *args,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _build_legend(tornado: dict) -> ft.Control:
+        return ft.Row(
+            controls=[
+                ft.Container(width=12, height=12, bgcolor=LOW_COLOR, border_radius=2),
+                ft.Text("parâmetro reduzido", size=12, color=ft.Colors.GREY_800),
+                ft.Container(width=12, height=12, bgcolor=HIGH_COLOR, border_radius=2),
+                ft.Text("parâmetro aumentado", size=12, color=ft.Colors.GREY_800),
+                ft.Text(f"· valor ótimo atual {tornado['objective_value']:.3f}", size=12, color=ft.Colors.GREY_800),
+            ],
+            spacing=6,
+        )
+
+    @staticmethod
+    def _build_row(bar: dict, objective_value: float, scale: float) -> ft.Control:
+        center = BAR_WIDTH / 2
+        label = ("Disponibilidade: " if bar["kind"] == "rhs" else "Coeficiente: ") + bar["name"]
+        shapes: list[ft.Control] = [
+            ft.Container(left=center, top=0, width=1, height=BAR_HEIGHT, bgcolor=ft.Colors.GREY_600),
+        ]
+        notes = []
+
+        # The longer move is drawn first so that a shorter one on the same side stays visible.
+        moves = [
+            (bar["objective_low"], bar["status_low"], LOW_COLOR, bar["low"]),
+            (bar["objective_high"], bar["status_high"], HIGH_COLOR, bar["high"]),
+        ]
+        moves.sort(key=lambda move: -abs(move[0] - objective_value) if move[0] is not None else 0.0)
+        for value, status, color, parameter in moves:
+            if value is None:
+                notes.append(f"{parameter:.3f}: {STATUS_DESCRIPTIONS.get(status, status)}")
+                continue
+            delta = value - objective_value
+            shapes.append(ft.Container(
+                left=center + min(delta, 0.0) * scale,
+                top=2,
+                width=max(abs(delta) * scale, 1.0),
+                height=BAR_HEIGHT - 4,
+                bgcolor=color,
+                border_radius=2,
+                tooltip=f"{bar['name']} = {parameter:.3f} → valor ótimo {value:.3f} ({delta:+.3f})",
+            ))
+
+        swing = "—" if math.isinf(bar["swing"]) else f"{bar['swing']:.3f}"
+        return ft.Row(
+            controls=[
+                ft.Text(label, size=12, color=ft.Colors.BLACK, width=220, no_wrap=True, tooltip=label),
+                ft.Stack(controls=shapes, width=BAR_WIDTH, height=BAR_HEIGHT),
+                ft.Text(swing, size=12, color=ft.Colors.BLUE_800, weight=ft.FontWeight.BOLD, width=80),
+                ft.Text(" · ".join(notes), size=12, color=ft.Colors.RED_700, italic=True),
+            ],
+            spacing=8,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
@@ -0,0 +1,84 @@
+from typing import Union, Callable
+
+import flet as ft
+
+from data.app_state import VariableCategory
+
+
+CATEGORY_LABELS = {
+    VariableCategory.CONTINUOUS: "ℝ",
+    VariableCategory.INTEGER: "ℤ",
+    VariableCategory.BINARY: "{0,1}",
+}
+
+CATEGORY_DESCRIPTIONS = {
+    VariableCategory.CONTINUOUS: "Contínua",
+    VariableCategory.INTEGER: "Inteira",
+    VariableCategory.BINARY: "Binária",
+}
+
+
+def format_bounds(lower: Union[float, None], upper: Union[float, None]) -> str:
+    """Formats variable bounds as an interval, e.g. ``[0, ∞)``."""
+    left = "(-∞" if lower is None else f"[{lower:g}"
+    right = "∞)" if upper is None else f"{upper:g}]"
+    return f"{left}, {right}"
+
+
+def _parse_bound(text: str) -> Union[float, None]:
+    """Parses a bound typed by the user; an empty field means no bound."""
+    text = (text or "").strip().replace(",", ".")
+    return float(text) if text else None
+
+
+def open_bounds_dialog(
+    page: ft.Page,
+    name: str,
+    bounds: tuple[Union[float, None], Union[float, None]],
+    on_apply: Callable[[Union[float, None], Union[float, None]], None],
+) -> None:
+    """Opens a dialog to edit the lower and upper bounds of a variable (an empty field means no bound)."""
+    lower, upper = bounds
+    lower_field = ft.TextField(
+        label="Limite inferior",
+        value="" if lower is None else f"{lower:g}",
+        hint_text="vazio = sem limite",
+        keyboard_type=ft.KeyboardType.NUMBER,
+    )
+    upper_field = ft.TextField(
+        label="Limite superior",
+        value="" if upper is None else f"{upper:g}",
+        hint_text="vazio = sem limite",
+        keyboard_type=ft.KeyboardType.NUMBER,
+    )
+
+    def on_click_apply(_):
+        lower_field.error_text = upper_field.error_text = None
+        try:
+            new_lower = _parse_bound(lower_field.value)
+        except ValueError:
+            lower_field.error_text = "Número inválido"
+        try:
+            new_upper = _parse_bound(upper_field.value)
+        except ValueError:
+            upper_field.error_text = "Número inválido"
+        if lower_field.error_text is None and upper_field.error_text is None:
+            if new_lower is not None and new_upper is not None and new_lower > new_upper:
+                upper_field.error_text = "Menor que o limite inferior"
+        if lower_field.error_text or upper_field.error_text:
+            dialog.update()
+            return
+
+        page.close(dialog)
+        on_apply(new_lower, new_upper)
+
+    dialog = ft.AlertDialog(
+        title=ft.Text(f"Limites de {name}"),
+        content=ft.Column([lower_field, upper_field], tight=True),
+        actions=[
+            ft.TextButton("Cancelar", on_click=lambda _: page.close(dialog)),
+            ft.TextButton("Aplicar", on_click=on_click_apply),
+        ],
+    )
+    page.open(dialog)
+
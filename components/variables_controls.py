@@ -92,6 +92,11 @@ class VariablesControls(ft.Container):
 
         return self._text
     
+    def set_value(self, value: int) -> None:
+        """Shows a count changed elsewhere (e.g. by undo), without calling back."""
+        self._value = value
+        self._text.value = f"{self._value} {self._suffix}(s)"
+
     def increment(self) -> None:
         """Increments the variable or constraint count."""
         self._value += 1
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Literal
 
+from data.model_history import ModelHistory
 from utilities.array import find_index
 
 
@@ -18,17 +19,49 @@ class ConstraintSymbol(Enum):
     GREATER_THAN_OR_EQUAL = ">="
 
 
+class VariableCategory(Enum):
+    """Domínio de uma variável de decisão."""
+    CONTINUOUS = "CONTINUOUS"
+    INTEGER = "INTEGER"
+    BINARY = "BINARY"
+
+
 @dataclass(frozen=True)
 class Variable:
-    """Representa uma variável na função objetivo."""
+    """
+    Representa uma variável na função objetivo.
+
+    ``lower_bound`` e ``upper_bound`` iguais a None significam sem limite; uma variável sem
+    nenhum dos dois é livre e uma com os dois iguais é fixa.
+    """
     name: str
     value: float = 0.0
+    category: VariableCategory = field(default=VariableCategory.CONTINUOUS)
+    lower_bound: float | None = 0.0
+    upper_bound: float | None = None
 
     def __post_init__(self):
         if not self.name:
             raise ValueError("Variable name cannot be empty.")
         if not isinstance(self.value, (int, float)):
             raise TypeError("Variable value must be a number.")
+        if not isinstance(self.category, VariableCategory):
+            raise ValueError("Invalid variable category.")
+        for bound in (self.lower_bound, self.upper_bound):
+            if bound is not None and not isinstance(bound, (int, float)):
+                raise TypeError("Variable bounds must be numbers or None.")
+        if self.lower_bound is not None and self.upper_bound is not None and self.lower_bound > self.upper_bound:
+            raise ValueError("Variable lower bound cannot be greater than its upper bound.")
+
+    @property
+    def is_free(self) -> bool:
+        """Variável sem limite inferior nem superior."""
+        return self.lower_bound is None and self.upper_bound is None
+
+    @property
+    def is_fixed(self) -> bool:
+        """Variável com limite inferior igual ao superior."""
+        return self.lower_bound is not None and self.lower_bound == self.upper_bound
         
 
 @dataclass(frozen=True)
@@ -60,6 +93,22 @@ class Constraint:
         self.variables[index] = variable
 
 
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """
+    Estado do modelo em um ponto do histórico de edições.
+
+    As tuplas apontam para os mesmos objetos Variable e Constraint do estado. Como as edições substituem
+    esses objetos em vez de alterá-los, snapshots vizinhos compartilham tudo o que não mudou e cada um
+    custa uma referência por variável e por restrição, não uma cópia da matriz de coeficientes.
+    """
+    quantity_of_variables: int
+    quantity_of_constraints: int
+    objective_function: ObjectiveFunctionType
+    variables: tuple[Variable, ...]
+    constraints: tuple[Constraint, ...]
+
+
 @dataclass
 class ObjectiveFunctionState:
     """Estado da função objetivo."""
@@ -97,6 +146,24 @@ class ObjectiveFunctionState:
         self.quantity_of_constraints = 2
         self.objective_function = ObjectiveFunctionType.MAXIMIZE
 
+    def snapshot(self) -> ModelSnapshot:
+        """Snapshot do estado atual, compartilhando as variáveis e restrições (ver ModelSnapshot)."""
+        return ModelSnapshot(
+            quantity_of_variables=self.quantity_of_variables,
+            quantity_of_constraints=self.quantity_of_constraints,
+            objective_function=self.objective_function,
+            variables=tuple(self.variables),
+            constraints=tuple(self.constraints),
+        )
+
+    def restore(self, snapshot: ModelSnapshot):
+        """Volta ao estado de um snapshot."""
+        self.quantity_of_variables = snapshot.quantity_of_variables
+        self.quantity_of_constraints = snapshot.quantity_of_constraints
+        self.objective_function = snapshot.objective_function
+        self.variables = list(snapshot.variables)
+        self.constraints = list(snapshot.constraints)
+
     def set_quantity_of_variables(self, quantity: int):
         """Define o número de variáveis."""
         if quantity < 2:
@@ -159,13 +226,101 @@ class ObjectiveFunctionState:
             raise ValueError("Invalid objective function type.")
         self.objective_function = objective_function
 
+    def set_coefficients(
+        self,
+        objective: list[float] | None,
+        matrix: list[list[float]],
+        values: list[float],
+        symbols: list[ConstraintSymbol],
+        objective_function: ObjectiveFunctionType | None = None,
+    ):
+        """
+        Substitui todos os coeficientes de uma vez (importação em bloco).
+
+        O tamanho do modelo passa a ser o da matriz. As variáveis que continuam existindo mantêm domínio e
+        limites; sem ``objective``, mantêm também o coeficiente na função objetivo (as novas ficam com 0).
+
+        :param objective: Coeficientes da função objetivo, ou None para manter os atuais.
+        :param matrix: Coeficientes das restrições, uma lista por restrição.
+        :param values: Lado direito de cada restrição.
+        :param symbols: Símbolo de cada restrição.
+        :param objective_function: Maximizar ou minimizar; None mantém o atual.
+        """
+        m, n = len(matrix), len(matrix[0]) if matrix else 0
+        if m < 2 or n < 2:
+            raise ValueError("The model needs at least 2 variables and 2 constraints.")
+        if any(len(row) != n for row in matrix) or len(values) != m or len(symbols) != m:
+            raise ValueError("The constraint rows, values and symbols must have matching sizes.")
+        if objective is not None and len(objective) != n:
+            raise ValueError("The objective must have one coefficient per variable.")
+
+        names = [f"x{j + 1}" for j in range(n)]
+        previous = self.variables
+        self.variables = [
+            Variable(
+                name=name,
+                value=float(objective[j]) if objective is not None else (previous[j].value if j < len(previous) else 0.0),
+                category=previous[j].category if j < len(previous) else VariableCategory.CONTINUOUS,
+                lower_bound=previous[j].lower_bound if j < len(previous) else 0.0,
+                upper_bound=previous[j].upper_bound if j < len(previous) else None,
+            )
+            for j, name in enumerate(names)
+        ]
+        self.constraints = [
+            Constraint(
+                name=f"Constraint {i + 1}",
+                symbol=symbol,
+                variables=[Variable(name=name, value=float(coefficient)) for name, coefficient in zip(names, row)],
+                value=float(value),
+            )
+            for i, (row, value, symbol) in enumerate(zip(matrix, values, symbols))
+        ]
+        self.quantity_of_variables = n
+        self.quantity_of_constraints = m
+        if objective_function is not None:
+            self.set_objective_function(objective_function)
+
     def update_variable(self, name: str, value: float):
         """Atualiza uma variável específica."""
         index_of_variable = find_index(lambda v: v.name == name, self.variables)
         if index_of_variable == -1:
             raise ValueError(f"Variable with name '{name}' not found.")
 
-        self.variables[index_of_variable] = Variable(name=name, value=value)
+        self.variables[index_of_variable] = Variable(
+            name=name,
+            value=value,
+            category=self.variables[index_of_variable].category,
+            lower_bound=self.variables[index_of_variable].lower_bound,
+            upper_bound=self.variables[index_of_variable].upper_bound,
+        )
+
+    def update_variable_category(self, name: str, category: VariableCategory):
+        """Define se uma variável é contínua, inteira ou binária."""
+        index_of_variable = find_index(lambda v: v.name == name, self.variables)
+        if index_of_variable == -1:
+            raise ValueError(f"Variable with name '{name}' not found.")
+
+        self.variables[index_of_variable] = Variable(
+            name=name,
+            value=self.variables[index_of_variable].value,
+            category=category,
+            lower_bound=self.variables[index_of_variable].lower_bound,
+            upper_bound=self.variables[index_of_variable].upper_bound,
+        )
+
+    def update_variable_bounds(self, name: str, lower_bound: float | None, upper_bound: float | None):
+        """Define os limites de uma variável (None significa sem limite)."""
+        index_of_variable = find_index(lambda v: v.name == name, self.variables)
+        if index_of_variable == -1:
+            raise ValueError(f"Variable with name '{name}' not found.")
+
+        self.variables[index_of_variable] = Variable(
+            name=name,
+            value=self.variables[index_of_variable].value,
+            category=self.variables[index_of_variable].category,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+        )
 
     def update_constraint_variable(self, constraint_name: str, variable: Variable):
         """Atualiza uma variável em uma restrição específica."""
@@ -223,37 +378,98 @@ class AppState:
     """Estado global da aplicação."""
     objective_function: ObjectiveFunctionState = field(default_factory=ObjectiveFunctionState)
     is_solving: bool = False
+    history: ModelHistory[ModelSnapshot] = field(default_factory=ModelHistory)
 
-    _listeners: dict[Literal["objective_function", "constraint"], list[Callable]] = field(default_factory=dict)
+    _listeners: dict[Literal["objective_function", "constraint", "history"], list[Callable]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.history.reset(self.objective_function.snapshot(), "Modelo inicial")
 
     def reset(self):
         """Reseta todo o estado da aplicação."""
         self.objective_function.reset()
         self.is_solving = False
+        self.history.reset(self.objective_function.snapshot(), "Modelo inicial")
+        self._notify_listeners("history")
+
+    def set_coefficients(
+        self,
+        objective: list[float] | None,
+        matrix: list[list[float]],
+        values: list[float],
+        symbols: list[ConstraintSymbol],
+        objective_function: ObjectiveFunctionType | None = None,
+    ):
+        """Importa todos os coeficientes de uma vez: um passo no histórico e uma atualização da interface."""
+        self.objective_function.set_coefficients(objective, matrix, values, symbols, objective_function)
+        self.record_edit(None, f"Importação de {len(matrix)} restrições × {len(matrix[0])} variáveis")
+        self._notify_listeners("objective_function")
+        self._notify_listeners("constraint")
+
+    def record_edit(self, key: tuple | None, label: str):
+        """
+        Registra no histórico o estado após uma edição do modelo.
+
+        :param key: Identifica o campo editado; edições seguidas do mesmo campo viram um único passo
+            (None nunca é agrupada).
+        :param label: Descrição da edição mostrada no histórico.
+        """
+        if self.history.record(self.objective_function.snapshot(), key, label):
+            self._notify_listeners("history")
+
+    def undo(self) -> bool:
+        """Desfaz a última edição; False se não há o que desfazer."""
+        snapshot = self.history.undo()
+        if snapshot is None:
+            return False
+        self._restore(snapshot)
+        return True
+
+    def redo(self) -> bool:
+        """Refaz a última edição desfeita; False se não há o que refazer."""
+        snapshot = self.history.redo()
+        if snapshot is None:
+            return False
+        self._restore(snapshot)
+        return True
+
+    def jump_to(self, position: int):
+        """Volta (ou avança) para qualquer ponto do histórico."""
+        self._restore(self.history.jump(position))
+
+    def _restore(self, snapshot: ModelSnapshot):
+        self.objective_function.restore(snapshot)
+        self._notify_listeners("objective_function")
+        self._notify_listeners("constraint")
+        self._notify_listeners("history")
 
     def set_is_solving(self, is_solving: bool):
         self.is_solving = is_solving
 
     def set_quantity_of_variables(self, quantity: int):
         self.objective_function.set_quantity_of_variables(quantity)
+        self.record_edit(("quantity_of_variables",), f"{quantity} variáveis")
         self._notify_listeners("objective_function")
         self._notify_listeners("constraint")
 
     def set_quantity_of_constraints(self, quantity: int):
         self.objective_function.set_quantity_of_constraints(quantity)
+        self.record_edit(("quantity_of_constraints",), f"{quantity} restrições")
         self._notify_listeners("constraint")
 
     def set_objective_function(self, objective_function: ObjectiveFunctionType):
         self.objective_function.set_objective_function(objective_function)
+        label = "Maximizar" if objective_function == ObjectiveFunctionType.MAXIMIZE else "Minimizar"
+        self.record_edit(("objective_function",), label)
 
-    def subscribe(self, listener: Callable, type: Literal["objective_function", "constraint"] = "objective_function"):
+    def subscribe(self, listener: Callable, type: Literal["objective_function", "constraint", "history"] = "objective_function"):
         """Adiciona um ouvinte para mudanças no estado."""
         if type not in self._listeners:
             self._listeners[type] = []
 
         self._listeners[type].append(listener)
 
-    def _notify_listeners(self, _type: Literal["objective_function", "constraint"] = "objective_function"):
+    def _notify_listeners(self, _type: Literal["objective_function", "constraint", "history"] = "objective_function"):
         """Notifica todos os ouvintes sobre mudanças no estado."""
         for listener in self._listeners.get(_type, []):
             listener()
@@ -0,0 +1,123 @@
+"""
+Undo/redo history of model edits.
+
+Entries hold immutable snapshots of the model whose unchanged parts are shared with the neighbouring
+entries (see ``ModelSnapshot``), so an edit costs the objects it replaced, not a copy of the model.
+Consecutive edits of the same field within a short time (typing a number digit by digit) are merged
+into one entry, and the oldest entries are dropped beyond ``max_entries``, which bounds the memory.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Generic, Hashable, TypeVar
+
+
+Snapshot = TypeVar("Snapshot")
+
+
+@dataclass(frozen=True)
+class HistoryEntry(Generic[Snapshot]):
+    """
+    One point of the history.
+
+    ``key`` identifies the edited field (None for the initial state) and ``label`` describes the edit.
+    """
+    snapshot: Snapshot
+    key: Hashable | None
+    label: str
+    timestamp: float
+
+
+class ModelHistory(Generic[Snapshot]):
+    """
+    Linear undo/redo history.
+
+    Recording after an undo drops the undone entries, as editors usually do.
+
+    :param max_entries: Largest number of entries kept, the current state included.
+    :param coalesce_seconds: Edits of the same field closer than this are merged into one entry.
+    """
+
+    def __init__(self, max_entries: int = 200, coalesce_seconds: float = 1.0):
+        if max_entries < 2:
+            raise ValueError("The history needs room for at least two entries.")
+        self.max_entries = max_entries
+        self.coalesce_seconds = coalesce_seconds
+        self._entries: list[HistoryEntry[Snapshot]] = []
+        self._position = -1
+
+    def reset(self, snapshot: Snapshot, label: str = "") -> None:
+        """Forget every entry and start again from ``snapshot``."""
+        self._entries = [HistoryEntry(snapshot, None, label, time.monotonic())]
+        self._position = 0
+
+    def record(self, snapshot: Snapshot, key: Hashable | None, label: str = "", now: float | None = None) -> bool:
+        """
+        Add the state after an edit.
+
+        :param snapshot: The new state.
+        :param key: Identifies the edited field, for merging consecutive edits of it.
+        :param label: Description of the edit.
+        :param now: Time of the edit (``time.monotonic()`` by default).
+        :return: False when the state did not change and nothing was recorded.
+        """
+        now = time.monotonic() if now is None else now
+        if not self._entries:
+            self.reset(snapshot)
+            return True
+        current = self._entries[self._position]
+        if snapshot == current.snapshot:
+            return False
+
+        del self._entries[self._position + 1:]
+        merge = (
+            key is not None
+            and key == current.key
+            and self._position > 0
+            and now - current.timestamp <= self.coalesce_seconds
+        )
+        entry = HistoryEntry(snapshot, key, label, now)
+        if merge:
+            self._entries[self._position] = entry
+        else:
+            self._entries.append(entry)
+        if len(self._entries) > self.max_entries:
+            del self._entries[:len(self._entries) - self.max_entries]
+        self._position = len(self._entries) - 1
+        return True
+
+    def undo(self) -> Snapshot | None:
+        """Step back; returns the state to restore, or None at the oldest entry."""
+        return self.jump(self._position - 1) if self.can_undo else None
+
+    def redo(self) -> Snapshot | None:
+        """Step forward; returns the state to restore, or None at the newest entry."""
+        return self.jump(self._position + 1) if self.can_redo else None
+
+    def jump(self, position: int) -> Snapshot:
+        """Move to any entry (undone entries included) and return its state."""
+        if not 0 <= position < len(self._entries):
+            raise IndexError("History position out of range.")
+        self._position = position
+        return self._entries[position].snapshot
+
+    @property
+    def can_undo(self) -> bool:
+        return self._position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._position < len(self._entries) - 1
+
+    @property
+    def position(self) -> int:
+        """Index of the current entry."""
+        return self._position
+
+    @property
+    def entries(self) -> tuple[HistoryEntry[Snapshot], ...]:
+        """Entries from the oldest to the newest."""
+        return tuple(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,204 @@
+"""
+Bulk import of a model from pasted text, CSV/TSV files or spreadsheets.
+
+The table holds one constraint per row: its coefficients, its sense and its right-hand side. Row labels
+in the first column and a header row are optional, and so is an objective row, recognized by its label
+(``max``/``min`` also set the direction)::
+
+            x1   x2   x3   sense   rhs
+    max     5    4    3
+    c1      2    3    1    <=      5
+    c2      4    1    2    <=      11
+
+Pasted text may be separated by tabs (as spreadsheets copy it), semicolons, commas or spaces; with tabs
+or semicolons a decimal comma is accepted. The whole block is converted to numbers at once and every
+invalid cell is reported together, with its row and column in the table.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.app_state import ConstraintSymbol, ObjectiveFunctionType
+
+
+SENSES = {
+    "<=": ConstraintSymbol.LESS_THAN_OR_EQUAL,
+    "=<": ConstraintSymbol.LESS_THAN_OR_EQUAL,
+    "≤": ConstraintSymbol.LESS_THAN_OR_EQUAL,
+    "<": ConstraintSymbol.LESS_THAN_OR_EQUAL,
+    ">=": ConstraintSymbol.GREATER_THAN_OR_EQUAL,
+    "=>": ConstraintSymbol.GREATER_THAN_OR_EQUAL,
+    "≥": ConstraintSymbol.GREATER_THAN_OR_EQUAL,
+    ">": ConstraintSymbol.GREATER_THAN_OR_EQUAL,
+    "=": ConstraintSymbol.EQUAL,
+    "==": ConstraintSymbol.EQUAL,
+}
+
+OBJECTIVE_LABELS = {
+    "max": ObjectiveFunctionType.MAXIMIZE,
+    "maximize": ObjectiveFunctionType.MAXIMIZE,
+    "maximizar": ObjectiveFunctionType.MAXIMIZE,
+    "min": ObjectiveFunctionType.MINIMIZE,
+    "minimize": ObjectiveFunctionType.MINIMIZE,
+    "minimizar": ObjectiveFunctionType.MINIMIZE,
+    "obj": None,
+    "objective": None,
+    "objetivo": None,
+    "fo": None,
+    "z": None,
+}
+
+MAX_REPORTED_ERRORS = 5
+
+
+@dataclass(frozen=True)
+class ImportedModel:
+    """
+    Coefficients read from a table.
+
+    ``objective`` is None when the table has no objective row, and ``objective_function`` when its label
+    does not give the direction.
+    """
+    A: np.ndarray
+    b: np.ndarray
+    senses: tuple[ConstraintSymbol, ...]
+    objective: np.ndarray | None
+    objective_function: ObjectiveFunctionType | None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.A.shape
+
+
+def _separator(text: str) -> str:
+    for separator in ("\t", ";", ","):
+        if separator in text:
+            return separator
+    return r"\s+"
+
+
+def read_text(text: str) -> pd.DataFrame:
+    """Split pasted text into a table of cells (as text)."""
+    separator = _separator(text)
+    lines = [line for line in text.splitlines() if line.strip()]
+    if separator == r"\s+":
+        rows = [re.split(separator, line.strip()) for line in lines]
+    else:
+        rows = [line.split(separator) for line in lines]
+    table = pd.DataFrame(rows).fillna("")
+    if separator in ("\t", ";"):
+        table = table.stack().str.replace(",", ".", regex=False).unstack()
+    return table
+
+
+def read_file(path: str | Path) -> pd.DataFrame:
+    """Read a ``.csv``, ``.tsv``/``.txt`` or ``.xlsx``/``.xls`` file into a table of cells (as text)."""
+    path = Path(path)
+    if path.suffix.lower() in (".xlsx", ".xlsm", ".xls"):
+        try:
+            table = pd.read_excel(path, header=None, dtype=str)
+        except ImportError as error:
+            raise ValueError(f"Reading {path.suffix} files needs an Excel reader for pandas ({error.name}).") from error
+        return table.fillna("")
+    return read_text(path.read_text(encoding="utf-8-sig"))
+
+
+def parse_table(table: pd.DataFrame) -> ImportedModel:
+    """
+    Read the coefficients of a model from a table of cells.
+
+    :param table: Cells as text, as returned by ``read_text`` or ``read_file``.
+    :return: The model.
+    :raises ValueError: Listing the invalid cells, or when the table has no constraints.
+    """
+    cells = pd.DataFrame(np.char.strip(table.to_numpy(dtype=str)), index=table.index, columns=table.columns)
+    cells = cells.loc[(cells != "").any(axis=1), (cells != "").any(axis=0)]
+    if cells.empty:
+        raise ValueError("The table is empty.")
+    columns = cells.columns.to_numpy()
+    rows = cells.index.to_numpy()
+    cells.columns = range(cells.shape[1])
+
+    # One conversion for the whole table, not one per column.
+    flat = pd.to_numeric(cells.to_numpy().ravel(), errors="coerce")
+    values = pd.DataFrame(flat.reshape(cells.shape), index=cells.index, columns=cells.columns)
+    empty = (cells == "").to_numpy()
+    numeric = values.notna().to_numpy()
+    is_sense = cells.isin(SENSES.keys()).to_numpy()
+
+    sense_counts = is_sense.sum(axis=0)
+    if sense_counts.max() == 0:
+        raise ValueError("No constraint sense (<=, >= or =) was found.")
+    sense_column = int(sense_counts.argmax())
+    rhs_column = sense_column + 1
+    constraint_rows = np.flatnonzero(is_sense[:, sense_column])
+
+    # A label column holds text in some constraint row, or an objective label; otherwise the coefficients
+    # start at the first column.
+    labelled = bool(
+        (~numeric[constraint_rows, 0] & ~empty[constraint_rows, 0]).any()
+        or cells.iloc[:, 0].str.lower().isin(OBJECTIVE_LABELS.keys()).any()
+    )
+    first = 1 if labelled else 0
+    coefficients = slice(first, sense_column)
+    if sense_column - first < 1:
+        raise ValueError("The constraints have no coefficients before their sense.")
+    if rhs_column >= cells.shape[1]:
+        raise ValueError("The constraints have no right-hand side after their sense.")
+
+    errors = []
+
+    def report(indices: np.ndarray, bad: np.ndarray, offset: int, description: str):
+        """Errors for the cells marked in ``bad``, of the rows ``indices`` and the columns from ``offset``."""
+        for r, c in zip(*np.nonzero(bad)):
+            row, column = indices[r], c + offset
+            errors.append(f"row {rows[row] + 1}, column {columns[column] + 1}: {description} {cells.iat[row, column]!r}")
+
+    # The constraint block is validated at once: empty coefficients are zero, text is an error.
+    valid = numeric | empty
+    report(constraint_rows, ~valid[constraint_rows, coefficients], first, "invalid coefficient")
+    report(constraint_rows, ~numeric[constraint_rows, rhs_column, None], rhs_column, "invalid right-hand side")
+
+    # Other rows: the objective (by its label or, without labels, a numeric row above the constraints);
+    # text-only rows are headers.
+    objective = None
+    objective_function = None
+    for row in np.setdiff1d(np.arange(cells.shape[0]), constraint_rows):
+        label = cells.iat[row, 0].lower() if labelled else ""
+        has_numbers = bool(numeric[row, coefficients].any())
+        unlabelled_objective = not labelled and has_numbers and row < constraint_rows[0]
+        if objective is None and (label in OBJECTIVE_LABELS or unlabelled_objective):
+            report(np.array([row]), ~valid[row, None, coefficients], first, "invalid objective coefficient")
+            objective = values.iloc[row, coefficients].fillna(0.0).to_numpy(dtype=float)
+            objective_function = OBJECTIVE_LABELS.get(label)
+        elif is_sense[row].any():
+            column = int(np.flatnonzero(is_sense[row])[0])
+            errors.append(f"row {rows[row] + 1}: sense in column {columns[column] + 1} instead of column {columns[sense_column] + 1}")
+        elif has_numbers:
+            errors.append(f"row {rows[row] + 1}: no constraint sense")
+
+    if errors:
+        more = f" (and {len(errors) - MAX_REPORTED_ERRORS} more)" if len(errors) > MAX_REPORTED_ERRORS else ""
+        raise ValueError("; ".join(errors[:MAX_REPORTED_ERRORS]) + more)
+
+    A = values.iloc[constraint_rows, coefficients].fillna(0.0).to_numpy(dtype=float)
+    b = values.iloc[constraint_rows, rhs_column].to_numpy(dtype=float)
+    senses = tuple(SENSES[symbol] for symbol in cells.iloc[constraint_rows, sense_column])
+    m, n = A.shape
+    if m < 2 or n < 2:
+        raise ValueError(f"The model needs at least 2 variables and 2 constraints; the table has {n} and {m}.")
+    return ImportedModel(A=A, b=b, senses=senses, objective=objective, objective_function=objective_function)
+
+
+def import_text(text: str) -> ImportedModel:
+    """Parse pasted text; see ``parse_table``."""
+    return parse_table(read_text(text))
+
+
+def import_file(path: str | Path) -> ImportedModel:
+    """Parse a CSV, TSV or spreadsheet file; see ``parse_table``."""
+    return parse_table(read_file(path))
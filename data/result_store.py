@@ -0,0 +1,576 @@
+"""
+Persistent store of solved models, solve runs, optimal bases and scenario results.
+
+Everything lives in one SQLite file in WAL mode, so the app can read past results while a solve writes
+new ones. Models are keyed by ``LpArrays.canonical_hash``: a run or scenario is reloaded only for the very
+same problem. Bases are keyed by the structure of the problem instead (shape and constraint senses), so a
+basis stored for one problem warm-starts solves of its edited copies. Values are stored in the original
+units of the problem, as raw float64 bytes; scenario results as compressed JSON.
+
+The store keeps itself under its size limits after every write by dropping the least recently used runs
+and scenarios. ``prune`` does the same on demand, and also by age.
+
+Usage: ``python -m data.result_store [--path PATH] list | show HASH | prune [--max-mb MB] [--older-than DAYS]``
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, is_dataclass
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+
+from methods.lp_arrays import LpArrays
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    hash TEXT PRIMARY KEY,
+    structure TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    columns INTEGER NOT NULL,
+    variable_names TEXT NOT NULL,
+    constraint_names TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL REFERENCES models(hash) ON DELETE CASCADE,
+    engine TEXT NOT NULL,
+    status TEXT NOT NULL,
+    objective_value REAL,
+    iterations INTEGER NOT NULL,
+    elapsed REAL NOT NULL,
+    x BLOB NOT NULL,
+    slacks BLOB NOT NULL,
+    duals BLOB NOT NULL,
+    reduced_costs BLOB NOT NULL,
+    basis BLOB,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_model ON runs(model, engine, created);
+CREATE TABLE IF NOT EXISTS bases (
+    structure TEXT NOT NULL,
+    basis BLOB NOT NULL,
+    hits INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (structure, basis)
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL REFERENCES models(hash) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL,
+    UNIQUE (model, kind, key)
+);
+"""
+
+
+def default_store_path() -> Path:
+    """Store file of the app: ``$SIMPLEX_RESULT_STORE``, or ``results.sqlite3`` in ``~/.simplex_tableau``."""
+    configured = os.environ.get("SIMPLEX_RESULT_STORE")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".simplex_tableau" / "results.sqlite3"
+
+
+def structure_hash(arrays: LpArrays) -> str:
+    """Hash of what a basis depends on: the number of rows and columns and the constraint senses."""
+    text = f"{arrays.shape[0]}x{arrays.shape[1]}:" + "".join(symbol.value for symbol in arrays.senses)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _json_default(value):
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store a value of type {type(value).__name__}")
+
+
+def scenario_key(parameters: dict) -> str:
+    """Canonical text of the parameters of a scenario (enums, dataclasses and arrays included)."""
+    return json.dumps(parameters, sort_keys=True, default=_json_default, separators=(",", ":"))
+
+
+def _floats(values) -> bytes:
+    return np.ascontiguousarray(values, dtype=np.float64).tobytes()
+
+
+def _basis_bytes(basis) -> bytes:
+    return np.ascontiguousarray(basis, dtype=np.int64).tobytes()
+
+
+@dataclass(frozen=True)
+class StoredRun:
+    """A stored solve, in the original units of its problem; ``basis`` is None for the PuLP engine."""
+    id: int
+    engine: str
+    status: str
+    objective_value: float | None
+    x: np.ndarray
+    slacks: np.ndarray
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    basis: np.ndarray | None
+    iterations: int
+    elapsed: float
+    created: float
+
+
+@dataclass(frozen=True)
+class StoreLimits:
+    """
+    Size limits enforced after every write.
+
+    ``max_bytes`` bounds the stored runs, bases and scenarios together; ``max_runs_per_model`` and
+    ``max_bases_per_structure`` keep only the most recent entries of each model and structure.
+    """
+    max_bytes: int = 256 * 1024 * 1024
+    max_runs_per_model: int = 20
+    max_bases_per_structure: int = 64
+
+
+class ResultStore:
+    """
+    SQLite store of solve runs, bases and scenario results.
+
+    The connection is shared between threads (the app solves in a worker thread) behind a lock.
+
+    :param path: Database file, created with its directory when missing; ``":memory:"`` keeps the
+        store in memory.
+    :param limits: Size limits enforced on opening and after every write.
+    """
+
+    def __init__(self, path: str | Path, limits: StoreLimits = StoreLimits()):
+        self.path = path
+        self.limits = limits
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        # auto_vacuum only takes effect before the first table is created.
+        self._connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+        with self._transaction() as connection:
+            self._enforce_limits(connection)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _transaction(self):
+        return _Transaction(self._lock, self._connection)
+
+    @staticmethod
+    def _touch_model(connection: sqlite3.Connection, arrays: LpArrays, now: float) -> str:
+        model = arrays.canonical_hash()
+        connection.execute(
+            """
+            INSERT INTO models (hash, structure, rows, columns, variable_names, constraint_names, created, last_used)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (hash) DO UPDATE SET last_used = excluded.last_used
+            """,
+            (
+                model,
+                structure_hash(arrays),
+                arrays.shape[0],
+                arrays.shape[1],
+                json.dumps(list(arrays.variable_names)),
+                json.dumps(list(arrays.constraint_names)),
+                now,
+                now,
+            ),
+        )
+        return model
+
+    # ------------------------------------------------------------------ runs
+
+    def save_runs(self, arrays: LpArrays, runs: list[dict]) -> None:
+        """
+        Store solves of one problem in a single transaction.
+
+        :param arrays: The problem, in original units.
+        :param runs: One dictionary per solve with the keys ``engine``, ``status``, ``objective_value``,
+            ``x``, ``slacks``, ``duals``, ``reduced_costs`` (original units), and optionally ``basis``,
+            ``iterations`` and ``elapsed``.
+        """
+        now = time.time()
+        rows, bases = [], []
+        with self._transaction() as connection:
+            model = self._touch_model(connection, arrays, now)
+            for run in runs:
+                blobs = [_floats(run[key]) for key in ("x", "slacks", "duals", "reduced_costs")]
+                basis = run.get("basis")
+                basis_blob = None if basis is None else _basis_bytes(basis)
+                if basis_blob is not None:
+                    bases.append(basis_blob)
+                objective = run["objective_value"]
+                rows.append((
+                    model,
+                    run["engine"],
+                    run["status"],
+                    None if objective is None else float(objective),
+                    int(run.get("iterations", 0)),
+                    float(run.get("elapsed", 0.0)),
+                    *blobs,
+                    basis_blob,
+                    now,
+                    now,
+                    sum(len(blob) for blob in blobs) + len(basis_blob or b""),
+                ))
+            connection.executemany(
+                """
+                INSERT INTO runs (model, engine, status, objective_value, iterations, elapsed,
+                                  x, slacks, duals, reduced_costs, basis, created, last_used, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._insert_bases(connection, structure_hash(arrays), bases, now)
+            self._enforce_limits(connection)
+
+    def save_run(self, arrays: LpArrays, **run) -> None:
+        """Store one solve; see ``save_runs`` for the keyword arguments."""
+        self.save_runs(arrays, [run])
+
+    def load_run(self, arrays: LpArrays, engine: str | None = None) -> StoredRun | None:
+        """
+        Latest stored solve of the problem.
+
+        :param arrays: The problem.
+        :param engine: Only consider solves of this engine.
+        :return: The run, or None if the problem was never solved.
+        """
+        query = "SELECT * FROM runs WHERE model = ?"
+        parameters: list = [arrays.canonical_hash()]
+        if engine is not None:
+            query += " AND engine = ?"
+            parameters.append(engine)
+        with self._transaction() as connection:
+            row = connection.execute(query + " ORDER BY created DESC, id DESC LIMIT 1", parameters).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE runs SET last_used = ? WHERE id = ?", (time.time(), row["id"]))
+        return _stored_run(row)
+
+    def has_run(self, arrays: LpArrays, engine: str | None = None) -> bool:
+        """Whether a solve of the problem (by ``engine``, if given) is stored."""
+        query = "SELECT 1 FROM runs WHERE model = ?"
+        parameters: list = [arrays.canonical_hash()]
+        if engine is not None:
+            query += " AND engine = ?"
+            parameters.append(engine)
+        with self._transaction() as connection:
+            return connection.execute(query + " LIMIT 1", parameters).fetchone() is not None
+
+    def list_runs(self, model: str) -> list[StoredRun]:
+        """Stored solves of a model hash, latest first."""
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT * FROM runs WHERE model = ? ORDER BY created DESC, id DESC", (model,)).fetchall()
+        return [_stored_run(row) for row in rows]
+
+    # ------------------------------------------------------------------ bases
+
+    @staticmethod
+    def _insert_bases(connection: sqlite3.Connection, structure: str, bases: list[bytes], now: float):
+        connection.executemany(
+            """
+            INSERT INTO bases (structure, basis, hits, last_used, size) VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT (structure, basis) DO UPDATE SET hits = hits + 1, last_used = excluded.last_used
+            """,
+            [(structure, basis, now, len(basis)) for basis in bases],
+        )
+
+    def save_bases(self, arrays: LpArrays, bases) -> None:
+        """Store optimal bases found for the problem (for example by a scenario batch) in one transaction."""
+        with self._transaction() as connection:
+            self._insert_bases(connection, structure_hash(arrays), [_basis_bytes(basis) for basis in bases], time.time())
+            self._enforce_limits(connection)
+
+    def load_basis(self, arrays: LpArrays) -> np.ndarray | None:
+        """
+        Basis to warm-start a solve of the problem.
+
+        :return: The basis of the latest stored solve of the same problem, otherwise the basis stored most
+            often for problems of the same structure, or None.
+        """
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT basis FROM runs WHERE model = ? AND basis IS NOT NULL AND status = 'Optimal' ORDER BY created DESC LIMIT 1",
+                (arrays.canonical_hash(),),
+            ).fetchone()
+            if row is None:
+                row = connection.execute(
+                    "SELECT basis FROM bases WHERE structure = ? ORDER BY hits DESC, last_used DESC LIMIT 1",
+                    (structure_hash(arrays),),
+                ).fetchone()
+        return None if row is None else np.frombuffer(row["basis"], dtype=np.int64).copy()
+
+    # ------------------------------------------------------------------ scenarios
+
+    def save_scenario(self, arrays: LpArrays, kind: str, key: str, result) -> None:
+        """
+        Store the result of a scenario batch (a heatmap, a Monte Carlo run...), replacing an older one.
+
+        :param arrays: The problem the scenario was run on.
+        :param kind: Kind of scenario.
+        :param key: Canonical parameters of the scenario, see ``scenario_key``.
+        :param result: JSON-serializable result.
+        """
+        payload = zlib.compress(json.dumps(result, default=_json_default).encode())
+        now = time.time()
+        with self._transaction() as connection:
+            model = self._touch_model(connection, arrays, now)
+            connection.execute(
+                """
+                INSERT INTO scenarios (model, kind, key, payload, created, last_used, size) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (model, kind, key) DO UPDATE SET
+                    payload = excluded.payload, created = excluded.created, last_used = excluded.last_used, size = excluded.size
+                """,
+                (model, kind, key, payload, now, now, len(payload)),
+            )
+            self._enforce_limits(connection)
+
+    def load_scenario(self, arrays: LpArrays, kind: str, key: str):
+        """Stored result of a scenario of the problem, or None."""
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT id, payload FROM scenarios WHERE model = ? AND kind = ? AND key = ?",
+                (arrays.canonical_hash(), kind, key),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE scenarios SET last_used = ? WHERE id = ?", (time.time(), row["id"]))
+        return json.loads(zlib.decompress(row["payload"]))
+
+    # ------------------------------------------------------------------ maintenance
+
+    def models(self) -> list[dict]:
+        """Stored models, most recently used first, with their run and scenario counts."""
+        with self._transaction() as connection:
+            rows = connection.execute(
+                """
+                SELECT m.hash, m.rows, m.columns, m.variable_names, m.constraint_names, m.created, m.last_used,
+                       (SELECT COUNT(*) FROM runs r WHERE r.model = m.hash) AS runs,
+                       (SELECT COUNT(*) FROM scenarios s WHERE s.model = m.hash) AS scenarios
+                FROM models m ORDER BY m.last_used DESC
+                """
+            ).fetchall()
+        return [
+            {
+                "hash": row["hash"],
+                "shape": (row["rows"], row["columns"]),
+                "variable_names": json.loads(row["variable_names"]),
+                "constraint_names": json.loads(row["constraint_names"]),
+                "created": row["created"],
+                "last_used": row["last_used"],
+                "runs": row["runs"],
+                "scenarios": row["scenarios"],
+            }
+            for row in rows
+        ]
+
+    def scenarios(self, model: str) -> list[dict]:
+        """Kinds, parameters and sizes of the stored scenarios of a model hash, latest first."""
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT kind, key, created, size FROM scenarios WHERE model = ? ORDER BY created DESC", (model,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def size(self) -> int:
+        """Bytes held by the stored runs, bases and scenarios."""
+        with self._transaction() as connection:
+            return self._size(connection)
+
+    @staticmethod
+    def _size(connection: sqlite3.Connection) -> int:
+        return connection.execute(
+            "SELECT (SELECT COALESCE(SUM(size), 0) FROM runs) + (SELECT COALESCE(SUM(size), 0) FROM bases)"
+            " + (SELECT COALESCE(SUM(size), 0) FROM scenarios)"
+        ).fetchone()[0]
+
+    def prune(self, max_bytes: int | None = None, older_than: float | None = None) -> int:
+        """
+        Drop stored entries and reclaim their space.
+
+        :param max_bytes: Drop the least recently used runs, scenarios and bases until the store holds at
+            most this many bytes; defaults to the store limit.
+        :param older_than: Also drop the entries unused for this many seconds.
+        :return: Number of dropped runs, scenarios and bases.
+        """
+        with self._transaction() as connection:
+            dropped = 0
+            if older_than is not None:
+                cutoff = time.time() - older_than
+                for table in ("runs", "scenarios", "bases"):
+                    dropped += connection.execute(f"DELETE FROM {table} WHERE last_used < ?", (cutoff,)).rowcount
+            dropped += self._enforce_limits(connection, max_bytes)
+        with self._lock:
+            self._connection.execute("PRAGMA incremental_vacuum")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return dropped
+
+    def _enforce_limits(self, connection: sqlite3.Connection, max_bytes: int | None = None) -> int:
+        limits = self.limits
+        max_bytes = limits.max_bytes if max_bytes is None else max_bytes
+        dropped = connection.execute(
+            """
+            DELETE FROM runs WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (PARTITION BY model ORDER BY created DESC, id DESC) AS position FROM runs
+                ) WHERE position > ?
+            )
+            """,
+            (limits.max_runs_per_model,),
+        ).rowcount
+        dropped += connection.execute(
+            """
+            DELETE FROM bases WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid, ROW_NUMBER() OVER (PARTITION BY structure ORDER BY last_used DESC, hits DESC) AS position FROM bases
+                ) WHERE position > ?
+            )
+            """,
+            (limits.max_bases_per_structure,),
+        ).rowcount
+
+        excess = self._size(connection) - max_bytes
+        if excess > 0:
+            candidates = connection.execute(
+                """
+                SELECT 'runs' AS kind, id, size, last_used FROM runs
+                UNION ALL SELECT 'scenarios', id, size, last_used FROM scenarios
+                UNION ALL SELECT 'bases', rowid, size, last_used FROM bases
+                ORDER BY last_used
+                """
+            ).fetchall()
+            victims: dict[str, list[tuple[int]]] = {"runs": [], "scenarios": [], "bases": []}
+            for kind, row_id, size, _ in candidates:
+                if excess <= 0:
+                    break
+                victims[kind].append((row_id,))
+                excess -= size
+            for table, rows in victims.items():
+                column = "rowid" if table == "bases" else "id"
+                connection.executemany(f"DELETE FROM {table} WHERE {column} = ?", rows)
+                dropped += len(rows)
+
+        if dropped:
+            connection.execute(
+                "DELETE FROM models WHERE NOT EXISTS (SELECT 1 FROM runs WHERE runs.model = models.hash)"
+                " AND NOT EXISTS (SELECT 1 FROM scenarios WHERE scenarios.model = models.hash)"
+            )
+        return dropped
+
+
+class _Transaction:
+    """Holds the store lock for one transaction, committed on success and rolled back on error."""
+
+    def __init__(self, lock: threading.Lock, connection: sqlite3.Connection):
+        self._lock = lock
+        self._connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._lock.acquire()
+        self._connection.execute("BEGIN")
+        return self._connection
+
+    def __exit__(self, exc_type, *_):
+        try:
+            self._connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+def _stored_run(row: sqlite3.Row) -> StoredRun:
+    return StoredRun(
+        id=row["id"],
+        engine=row["engine"],
+        status=row["status"],
+        objective_value=row["objective_value"],
+        x=np.frombuffer(row["x"], dtype=np.float64).copy(),
+        slacks=np.frombuffer(row["slacks"], dtype=np.float64).copy(),
+        duals=np.frombuffer(row["duals"], dtype=np.float64).copy(),
+        reduced_costs=np.frombuffer(row["reduced_costs"], dtype=np.float64).copy(),
+        basis=None if row["basis"] is None else np.frombuffer(row["basis"], dtype=np.int64).copy(),
+        iterations=row["iterations"],
+        elapsed=row["elapsed"],
+        created=row["created"],
+    )
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m data.result_store", description="Inspect and prune the result store.")
+    parser.add_argument("--path", default=str(default_store_path()), help="database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="stored models")
+    show = commands.add_parser("show", help="runs and scenarios of a model")
+    show.add_argument("hash", help="model hash (or a unique prefix)")
+    prune = commands.add_parser("prune", help="drop the least recently used entries")
+    prune.add_argument("--max-mb", type=float, default=None, help="size to prune down to")
+    prune.add_argument("--older-than", type=float, default=None, help="also drop entries unused for this many days")
+    arguments = parser.parse_args(argv)
+
+    with ResultStore(arguments.path) as store:
+        match arguments.command:
+            case "list":
+                for model in store.models():
+                    print(
+                        f"{model['hash'][:12]}  {model['shape'][0]}x{model['shape'][1]}  "
+                        f"{model['runs']} runs  {model['scenarios']} scenarios  "
+                        f"used {time.strftime('%Y-%m-%d %H:%M', time.localtime(model['last_used']))}"
+                    )
+                print(f"{store.size() / 1024:.1f} KiB stored")
+            case "show":
+                matches = [model for model in store.models() if model["hash"].startswith(arguments.hash)]
+                if len(matches) != 1:
+                    parser.error(f"{len(matches)} models match {arguments.hash!r}")
+                model = matches[0]
+                print(f"{model['hash']}  {model['shape'][0]}x{model['shape'][1]}")
+                for run in store.list_runs(model["hash"]):
+                    objective = "—" if run.objective_value is None else f"{run.objective_value:.6g}"
+                    values = ", ".join(f"{name}={value:.6g}" for name, value in zip(model["variable_names"][:8], run.x))
+                    values += ", …" if run.x.size > 8 else ""
+                    print(f"  run {run.id}  {run.engine:<14} {run.status:<11} {objective:>12}  {run.elapsed * 1000:8.1f}ms  {values}")
+                for scenario in store.scenarios(model["hash"]):
+                    print(f"  scenario {scenario['kind']:<12} {scenario['size']:>8} B  {scenario['key']}")
+            case "prune":
+                max_bytes = None if arguments.max_mb is None else int(arguments.max_mb * 1024 * 1024)
+                older_than = None if arguments.older_than is None else arguments.older_than * 86400.0
+                dropped = store.prune(max_bytes, older_than)
+                print(f"dropped {dropped} entries, {store.size() / 1024:.1f} KiB stored")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,100 @@
 import flet as ft
 import asyncio  # Modificação: import para usar asyncio.sleep no callback de loading
+import importlib
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Callable
 
+# Só o necessário para o primeiro quadro é importado aqui. NumPy, pandas, PuLP, os solvers e os
+# componentes de resultado são importados no primeiro uso e pré-carregados em segundo plano (prewarm).
 from components.header import Header
-from components.value_box import ValueBox
+from components.variable_options import CATEGORY_DESCRIPTIONS
 from components.variables_controls import VariablesControls
-from components.constraint_values import ConstraintValues
+from components.model_grid import ModelGrid
+from components.progress_panel import ProgressPanel
+from components.result_sections import ResultSections
 
-from data.app_state import app_state, ObjectiveFunctionType, Variable, ConstraintSymbol
-from methods.simplex_tableu import SimplexTableau
+from data.app_state import app_state, ObjectiveFunctionType, Variable, ConstraintSymbol, VariableCategory
+from methods.solver_engine import SolverEngine
+from methods.progress import ProgressQueue, ProgressReporter
+
+if TYPE_CHECKING:
+    from data.model_import import ImportedModel
+    from data.result_store import ResultStore
+
+
+# Importados na primeira resolução (ou antes, pelo prewarm)
+DEFERRED_MODULES = (
+    "numpy",
+    "methods.simplex_tableu",
+    "components.tableau_viewer",
+    "components.parametric_chart",
+    "components.rhs_heatmap",
+    "components.tornado_chart",
+    "components.paged_table",
+    "components.diagnosis_panel",
+    "components.alternative_optima_panel",
+)
+
+# Nome e resolvedor de cada estrutura de rede reconhecida pelo simplex nativo
+STRUCTURE_SOLVERS = {
+    "transportation": ("problema de transporte", "Vogel + MODI"),
+    "assignment": ("problema de designação", "método húngaro"),
+    "network": ("fluxo em rede", "simplex de rede"),
+}
+
+# Processos usados pelo mapa de calor e pela decomposição; iniciados em segundo plano depois do primeiro quadro
+ANALYSIS_WORKERS = min(4, os.cpu_count() or 1)
+
+_result_store: "ResultStore | None" = None
+_result_store_opened = False
+_result_store_lock = threading.Lock()
+
+
+def get_result_store() -> "ResultStore | None":
+    """Abre o histórico persistente no primeiro uso (None se o arquivo não puder ser aberto)."""
+    global _result_store, _result_store_opened
+    with _result_store_lock:
+        if not _result_store_opened:
+            from data.result_store import ResultStore, default_store_path
+            try:
+                _result_store = ResultStore(default_store_path())
+            except (OSError, sqlite3.Error):
+                _result_store = None
+            _result_store_opened = True
+        return _result_store
+
+
+def prewarm():
+    """
+    Carrega em segundo plano o que a primeira resolução usa: os solvers, os componentes de resultado,
+    o histórico persistente e os processos de trabalho das análises.
+    """
+    from methods.workers import prewarm as prewarm_workers
+
+    for module in DEFERRED_MODULES:
+        importlib.import_module(module)
+    get_result_store()
+    prewarm_workers(ANALYSIS_WORKERS)
 
 
 def on_variable_change(value: float, name: str):
     """Callback para atualizar o valor de uma variável."""
     app_state.objective_function.update_variable(name, value)
+    app_state.record_edit(("variable", name), f"{name} na função objetivo = {value:g}")
+
+
+def on_variable_category_change(category: VariableCategory, name: str):
+    """Callback para marcar uma variável como contínua, inteira ou binária."""
+    app_state.objective_function.update_variable_category(name, category)
+    app_state.record_edit(("category", name), f"{name}: {CATEGORY_DESCRIPTIONS[category].lower()}")
+
+
+def on_variable_bounds_change(lower_bound: float | None, upper_bound: float | None, name: str):
+    """Callback para definir os limites de uma variável (None significa sem limite)."""
+    app_state.objective_function.update_variable_bounds(name, lower_bound, upper_bound)
+    app_state.record_edit(("bounds", name), f"Limites de {name}")
 
 
 def on_constraint_variable_change(value: float, name: str, constraint_name: str):
@@ -20,6 +102,7 @@ def on_constraint_variable_change(value: float, name: str, constraint_name: str)
     app_state.objective_function.update_constraint_variable(
         constraint_name, Variable(name=name, value=value)
     )
+    app_state.record_edit(("constraint_variable", constraint_name, name), f"{constraint_name}: {name} = {value:g}")
 
 
 def on_constraint_symbol_change(symbol: ConstraintSymbol, constraint_name: str):
@@ -27,6 +110,7 @@ def on_constraint_symbol_change(symbol: ConstraintSymbol, constraint_name: str):
     app_state.objective_function.update_contraint_symbol(
         constraint_name, symbol
     )
+    app_state.record_edit(("constraint_symbol", constraint_name), f"{constraint_name}: {symbol.value}")
 
 
 def on_constraint_value_change(value: float, constraint_name: str):
@@ -34,6 +118,7 @@ def on_constraint_value_change(value: float, constraint_name: str):
     app_state.objective_function.update_constraint_value(
         constraint_name, value
     )
+    app_state.record_edit(("constraint_value", constraint_name), f"{constraint_name}: lado direito = {value:g}")
 
 
 def main(page: ft.Page):
@@ -51,91 +136,60 @@ def main(page: ft.Page):
     page.scroll = ft.ScrollMode.AUTO
 
     header = Header.build()
-    objective_function_items: list[ValueBox] = [
-        ValueBox(page, variable.value, variable.name, 
-                    has_plus_icon=variable_index < app_state.objective_function.quantity_of_variables - 1, on_change_value=on_variable_change)
-        for variable_index, variable in enumerate(app_state.objective_function.variables)
-    ]
-
-    objective_function_row = ft.Row(
-        wrap=True,
-        spacing=8,         # espaço horizontal entre controles
-        run_spacing=8,     # espaço vertical entre "linhas"
-        alignment=ft.MainAxisAlignment.START,
-        run_alignment=ft.MainAxisAlignment.START,
-        controls=objective_function_items,
+    # Só as células visíveis existem como controles; a grade é redesenhada quando o modelo muda de fora dela
+    model_grid = ModelGrid(
+        page,
+        lambda: app_state.objective_function,
+        on_change_objective_value=on_variable_change,
+        on_change_category=on_variable_category_change,
+        on_change_bounds=on_variable_bounds_change,
+        on_change_variable_value=on_constraint_variable_change,
+        on_change_constraint_value=on_constraint_value_change,
+        on_change_constraint_symbol=on_constraint_symbol_change,
     )
 
-    def update_objective_function_items():
-        """Atualiza os itens da função objetivo com base no estado atual."""
-        nonlocal objective_function_items, objective_function_row
-        objective_function_items = [
-            ValueBox(page, variable.value, variable.name, 
-                        has_plus_icon=variable_index < app_state.objective_function.quantity_of_variables - 1, on_change_value=on_variable_change)
-            for variable_index, variable in enumerate(app_state.objective_function.variables)
-        ]
+    app_state.subscribe(model_grid.refresh, "objective_function")
+    app_state.subscribe(model_grid.refresh, "constraint")
 
-        objective_function_row.controls = objective_function_items
-        objective_function_row.update()
-        page.update()
+    # Criado na primeira resolução
+    simplex_tableau = None
 
-    constraint_items = [
-        ConstraintValues(
-            page, 
-            constraint,
-            on_change_variable_value=on_constraint_variable_change,
-            on_change_constraint_value=on_constraint_value_change,
-            on_change_constraint_symbol=on_constraint_symbol_change,
-        ) for constraint in app_state.objective_function.constraints
-    ]
-
-    constraint_items_column = ft.Column(
-        controls=constraint_items,
-        spacing=8,         # espaço horizontal entre controles
+    engine_dropdown = ft.Dropdown(
+        label="Método de resolução",
+        value=SolverEngine.PULP.value,
+        options=[
+            ft.DropdownOption(key=SolverEngine.PULP.value, text="PuLP (CBC)"),
+            ft.DropdownOption(key=SolverEngine.SIMPLEX.value, text="Simplex nativo"),
+            ft.DropdownOption(key=SolverEngine.INTERIOR_POINT.value, text="Pontos interiores"),
+            ft.DropdownOption(key=SolverEngine.EXACT.value, text="Exato (racional)"),
+            ft.DropdownOption(key=SolverEngine.DANTZIG_WOLFE.value, text="Decomposição Dantzig–Wolfe"),
+        ],
+        filled=True,
+        fill_color=ft.Colors.WHITE,
+        color=ft.Colors.BLACK,
+        border_radius=8,
     )
 
-    def update_constraint_items():
-        """Atualiza os itens de restrição com base no estado atual."""
-        nonlocal constraint_items
-        constraint_items = [
-            ConstraintValues(
-                page, 
-                constraint,
-                on_change_variable_value=on_constraint_variable_change,
-                on_change_constraint_value=on_constraint_value_change,
-                on_change_constraint_symbol=on_constraint_symbol_change,
-            ) for constraint in app_state.objective_function.constraints
-        ]
-
-        constraint_items_column.controls = constraint_items
-        constraint_items_column.update()
-        page.update()
-
-    app_state.subscribe(update_objective_function_items, "objective_function")
-    app_state.subscribe(update_constraint_items, "constraint")
-
-    simplex_tableau = SimplexTableau()
-
     # ALTERAÇÃO: CRIAÇÃO DO PLACEHOLDER DINÂMICO PARA RESULTADOS
+    # Cada parte dos resultados é uma seção com chave, substituída ou removida sem percorrer o painel
+    result_sections = ResultSections(horizontal_alignment=ft.CrossAxisAlignment.STRETCH)
+    result_sections.show("placeholder", [
+        ft.Icon(
+            name=ft.Icons.WORKSPACES,
+            color=ft.Colors.GREY_300,
+            size=44,
+        ),
+        ft.Text(
+            "Configure o problema e clique em \"Resolver\"",
+            theme_style=ft.TextThemeStyle.BODY_LARGE,
+            color=ft.Colors.GREY_400,
+            size=14,
+            text_align=ft.TextAlign.CENTER,
+        ),
+    ])
     results_placeholder = ft.Container(
         padding=ft.padding.symmetric(horizontal=20, vertical=64),
-        content=ft.Column(
-            controls=[
-                ft.Icon(
-                    name=ft.Icons.WORKSPACES,
-                    color=ft.Colors.GREY_300,
-                    size=44,
-                ),
-                ft.Text(
-                    "Configure o problema e clique em \"Resolver\"",
-                    theme_style=ft.TextThemeStyle.BODY_LARGE,
-                    color=ft.Colors.GREY_400,
-                    size=14,
-                    text_align=ft.TextAlign.CENTER,
-                ),
-            ],
-            horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
-        ),
+        content=result_sections,
     )
 
     # Modificação: Criação do container global de resultados para atualização dinâmica
@@ -183,23 +237,49 @@ def main(page: ft.Page):
 
     async def on_solve_click(e):
         """Callback para resolver o problema quando o botão é clicado."""
-        # ALTERAÇÃO: EXIBE ANIMAÇÃO DE LOADING NO PLACEHOLDER
-        results_placeholder.content.controls = [
-            ft.Row(
-                alignment=ft.MainAxisAlignment.CENTER,
-                controls=[
-                    ft.ProgressRing(color=ft.Colors.BLUE_700),
-                    ft.Text("Resolvendo o problema...", size=16, color=ft.Colors.GREY_800),
-                ],
-            )
-        ]
+        # Importados no primeiro uso (normalmente já carregados pelo prewarm)
+        import numpy as np
+        from components.alternative_optima_panel import AlternativeOptimaPanel
+        from components.diagnosis_panel import DiagnosisPanel
+        from components.paged_table import PagedTable, TableColumn, GREEN_TABLE, BLUE_TABLE, PURPLE_TABLE
+        from components.parametric_chart import ParametricChart
+        from components.rhs_heatmap import RhsHeatmap
+        from components.tableau_viewer import TableauViewer
+        from components.tornado_chart import TornadoChart
+        from methods.decomposition import DecompositionOptions
+        from methods.simplex_tableu import SimplexTableau
+
+        # ALTERAÇÃO: EXIBE ANIMAÇÃO DE LOADING NO PLACEHOLDER, COM O PROGRESSO DOS MOTORES NATIVOS
+        progress_panel = ProgressPanel()
+        result_sections.clear(update=False)
+        result_sections.show("progress", progress_panel, update=False)
         result_container.update()
         await asyncio.sleep(0.1)  # Modificação: pausa para renderizar o loading
 
         # Aqui você pode chamar a lógica de resolução do problema
         print("Resolver o problema", app_state.objective_function.variables, app_state.objective_function.constraints)
+        nonlocal simplex_tableau
+        simplex_tableau = SimplexTableau(
+            engine=SolverEngine(engine_dropdown.value),
+            store=get_result_store(),
+            decomposition=DecompositionOptions(workers=ANALYSIS_WORKERS),
+        )
         simplex_tableau.build(app_state.objective_function)
-        simplex_tableau.solve()
+
+        # A resolução roda em outra thread; os eventos de progresso chegam por uma fila asyncio
+        # e o painel mostra sempre o mais recente (no máximo ~10 atualizações por segundo)
+        progress_queue = ProgressQueue(asyncio.get_running_loop())
+
+        async def solve_in_background():
+            try:
+                await asyncio.to_thread(simplex_tableau.solve, progress=ProgressReporter(progress_queue.put))
+            finally:
+                progress_queue.close()
+
+        solve_task = asyncio.create_task(solve_in_background())
+        async for event in progress_queue.events():
+            progress_panel.show(event)
+        await solve_task
         solution = simplex_tableau.get_solution()
 
         # Modificação: atualiza container com resultados
@@ -216,6 +296,7 @@ def main(page: ft.Page):
                             [
                                 ft.Text("Status", weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN_900),
                                 ft.Text(solution["status"], color=ft.Colors.GREEN_800, size=20),
+                                *([ft.Text("Recarregado do histórico", size=12, italic=True, color=ft.Colors.GREEN_700)] if solution["reloaded"] else []),
                             ],
                             alignment=ft.MainAxisAlignment.CENTER,
                         ),
@@ -242,22 +323,51 @@ def main(page: ft.Page):
             ]
         )
 
-        # 2) Tabela de variáveis com alto contraste e tons de verde
-        table = ft.DataTable(
-            columns=[
-                ft.DataColumn(label=ft.Text("Variável", weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN_900)),
-                ft.DataColumn(label=ft.Text("Valor",     weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN_900)),
-            ],
-            rows=[
-                ft.DataRow(cells=[
-                    ft.DataCell(ft.Text(name, color=ft.Colors.BLACK, weight=ft.FontWeight.BOLD)),
-                    ft.DataCell(ft.Text(f"{value:.2f}", color=ft.Colors.GREEN_800, weight=ft.FontWeight.BOLD)),
-                ])
-                for name, value in solution["variables"].items()
+        # Certificado de otimalidade verificado automaticamente após o solve
+        if solution["certified"] is not None:
+            certificate = simplex_tableau.get_certificate()
+            if certificate["passed"]:
+                certificate_text = "✓ Verificado"
+                certificate_color, certificate_bg = ft.Colors.GREEN_800, ft.Colors.GREEN_100
+            else:
+                certificate_text = "✗ Falhou: " + ", ".join(certificate["failures"])
+                certificate_color, certificate_bg = ft.Colors.RED_800, ft.Colors.RED_100
+            cards.controls.append(ft.Card(
+                content=ft.Container(
+                    padding=ft.padding.all(16),
+                    bgcolor=certificate_bg,
+                    border_radius=ft.border_radius.all(8),
+                    tooltip="\n".join(
+                        f"{name}: {certificate[name]:.2e}"
+                        for name in ("primal_residual", "integrality_residual", "dual_residual", "complementarity", "duality_gap")
+                        if certificate[name] is not None
+                    ),
+                    content=ft.Column(
+                        [
+                            ft.Text("Certificado", weight=ft.FontWeight.BOLD, color=certificate_color),
+                            ft.Text(certificate_text, color=certificate_color, size=20),
+                        ],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                    ),
+                ),
+                elevation=2,
+                shape=ft.RoundedRectangleBorder(radius=8),
+            ))
+
+        # 2) Tabela de variáveis: só as linhas da página atual são construídas, a partir dos arrays da solução
+        variable_values = solution["variables"]
+        table = PagedTable(
+            [
+                TableColumn("Variável", np.array(list(variable_values), dtype=str), bold=True),
+                TableColumn(
+                    "Valor",
+                    np.fromiter(variable_values.values(), dtype=float, count=len(variable_values)),
+                    color=ft.Colors.GREEN_800,
+                    bold=True,
+                ),
             ],
-            border=ft.border.all(1, ft.Colors.GREEN_300),                   # BORDA VERDE
-            heading_row_color=ft.Colors.GREEN_200,                          # FUNDO DO CABEÇALHO
-            data_row_color=lambda i: (ft.Colors.WHITE if i % 2 == 0 else ft.Colors.GREEN_50),
+            GREEN_TABLE,
+            nonzero_column=1,
         )
 
         # 3) Divider em verde suave
@@ -271,42 +381,138 @@ def main(page: ft.Page):
             color=ft.Colors.GREEN_900,
         )
 
-        # 5) Atualiza o placeholder
-        results_placeholder.content.controls = [
-            cards,
-            divider,
-            section_title,
-            table,
-        ]
+        # 5) Atualiza o placeholder: as seções são montadas e enviadas à página de uma vez no final
+        result_sections.clear(update=False)
+        result_sections.show("summary", cards, update=False)
+        result_sections.show("variables", [divider, section_title, table], update=False)
+
+        # Estatísticas do branch-and-bound (apenas motores nativos com variáveis inteiras)
+        search_statistics = simplex_tableau.get_branch_and_bound_statistics()
+        if search_statistics is not None:
+            gap = search_statistics["gap"]
+            result_sections.get("summary").controls.append(ft.Row(
+                spacing=8,
+                controls=[
+                    ft.Icon(name=ft.Icons.ACCOUNT_TREE, color=ft.Colors.GREEN_700, size=20),
+                    ft.Text(
+                        f"Branch-and-bound: {search_statistics['nodes']} nós "
+                        f"({search_statistics['nodes_per_second']:.0f} nós/s), "
+                        f"gap {gap * 100 if gap is not None else float('nan'):.2f}%"
+                        + (" — limite de nós atingido" if search_statistics["node_limit_reached"] else ""),
+                        color=ft.Colors.GREEN_900,
+                        size=14,
+                    ),
+                ],
+            ))
+
+        # Estrutura detectada pelo simplex nativo: problemas de rede vão para os resolvedores especializados
+        structure = simplex_tableau.get_structure()
+        if structure is not None and structure["structure"] in STRUCTURE_SOLVERS:
+            structure_name, structure_solver = STRUCTURE_SOLVERS[structure["structure"]]
+            result_sections.get("summary").controls.append(ft.Row(
+                spacing=8,
+                controls=[
+                    ft.Icon(name=ft.Icons.HUB, color=ft.Colors.GREEN_700, size=20),
+                    ft.Text(
+                        f"Estrutura detectada: {structure_name} — resolvido por {structure_solver} "
+                        f"({structure['pivots']} pivôs)",
+                        color=ft.Colors.GREEN_900,
+                        size=14,
+                    ),
+                ],
+            ))
+
+        # Decomposição Dantzig–Wolfe: blocos resolvidos em paralelo, coordenados pelo problema mestre
+        decomposition = simplex_tableau.get_decomposition_statistics()
+        if decomposition is not None:
+            result_sections.get("summary").controls.append(ft.Row(
+                spacing=8,
+                controls=[
+                    ft.Icon(name=ft.Icons.VIEW_MODULE, color=ft.Colors.GREEN_700, size=20),
+                    ft.Text(
+                        f"Dantzig–Wolfe: {decomposition['blocks']} blocos, restrições de ligação: "
+                        f"{', '.join(decomposition['linking_constraints']) or 'nenhuma'} — "
+                        f"{decomposition['rounds']} rodadas, {decomposition['columns']} colunas geradas"
+                        + (" — limite de rodadas atingido" if decomposition["round_limit_reached"] else ""),
+                        color=ft.Colors.GREEN_900,
+                        size=14,
+                    ),
+                ],
+            ))
+
+        # Sem solução ótima: explica a inviabilidade (subsistema irredutível) ou a ilimitação (raio)
+        if solution["status"] == "Infeasible":
+            conflict = await asyncio.to_thread(simplex_tableau.get_infeasibility_diagnosis)
+            result_sections.show("diagnosis", [
+                ft.Divider(thickness=1, color=ft.Colors.RED_200),
+                DiagnosisPanel(conflict=conflict, infeasible=True),
+            ], update=False)
+        elif solution["status"] == "Unbounded":
+            ray = await asyncio.to_thread(simplex_tableau.get_unbounded_ray)
+            result_sections.show("diagnosis", [
+                ft.Divider(thickness=1, color=ft.Colors.ORANGE_200),
+                DiagnosisPanel(ray=ray, infeasible=False),
+            ], update=False)
+
+        # Iterações do simplex nativo: os tableaus são reconstruídos sob demanda, um por página
+        pivot_history = simplex_tableau.get_pivot_history()
+        if pivot_history is not None and len(pivot_history) > 1:
+            result_sections.show("pivots", [
+                ft.Divider(thickness=1, color=ft.Colors.INDIGO_200),
+                ft.Row(
+                    controls=[
+                        ft.Icon(name=ft.Icons.TABLE_CHART, color=ft.Colors.INDIGO_700, size=24),
+                        ft.Text(
+                            f"Iterações do Simplex ({pivot_history.pivots} pivôs):",
+                            weight=ft.FontWeight.BOLD,
+                            size=16,
+                            color=ft.Colors.INDIGO_900,
+                        ),
+                    ]
+                ),
+                TableauViewer(pivot_history),
+            ], update=False)
 
         # Adicionando análise detalhada dos preços-sombra com limites de variação
         detailed_shadow_analysis = simplex_tableau.get_detailed_shadow_price_analysis()
         if detailed_shadow_analysis:
-            # Criando tabela detalhada com informações de variação
-            detailed_shadow_rows = []
-            constraint_index = 0
-            for constraint_name, analysis in detailed_shadow_analysis.items():
-                if constraint_index < len(app_state.objective_function.constraints):
-                    display_name = app_state.objective_function.constraints[constraint_index].name
-                else:
-                    display_name = constraint_name
-                
-                shadow_price = analysis.get('shadow_price', 0) or 0
-                original_rhs = analysis.get('original_rhs', 0) or 0
-                
-                if abs(shadow_price) < 1e-6:
-                    shadow_price = 0.0
-                
-                detailed_shadow_rows.append(
-                    ft.DataRow(cells=[
-                        ft.DataCell(ft.Text(display_name, color=ft.Colors.BLACK, weight=ft.FontWeight.BOLD)),
-                        ft.DataCell(ft.Text(f"{shadow_price:.3f}", color=ft.Colors.BLUE_800, weight=ft.FontWeight.BOLD)),
-                        ft.DataCell(ft.Text(f"{original_rhs:.1f}", color=ft.Colors.GREY_700)),
-                    ])
-                )
-                constraint_index += 1
-                
-            results_placeholder.content.controls.extend([
+            # Os arrays são montados uma vez; as linhas são criadas por página
+            constraint_names = [constraint.name for constraint in app_state.objective_function.constraints]
+            shadow_analyses = list(detailed_shadow_analysis.items())
+            shadow_prices = np.array([analysis.get('shadow_price', 0) or 0 for _, analysis in shadow_analyses], dtype=float)
+            shadow_prices[np.abs(shadow_prices) < 1e-6] = 0.0
+            # No modo exato o preço-sombra é mostrado como fração, sem arredondamento
+            exact_shadow_prices = [analysis.get('shadow_price_exact') for _, analysis in shadow_analyses]
+            shadow_table = PagedTable(
+                [
+                    TableColumn(
+                        "Restrição",
+                        np.array([
+                            constraint_names[i] if i < len(constraint_names) else name
+                            for i, (name, _) in enumerate(shadow_analyses)
+                        ], dtype=str),
+                        bold=True,
+                    ),
+                    TableColumn(
+                        "Preço-Sombra",
+                        shadow_prices,
+                        text=lambda i: exact_shadow_prices[i] if exact_shadow_prices[i] is not None else f"{shadow_prices[i]:.3f}",
+                        color=ft.Colors.BLUE_800,
+                        bold=True,
+                        tooltip="Valor por unidade adicional de recurso",
+                    ),
+                    TableColumn(
+                        "Valor Atual",
+                        np.array([analysis.get('original_rhs', 0) or 0 for _, analysis in shadow_analyses], dtype=float),
+                        decimals=1,
+                        color=ft.Colors.GREY_700,
+                    ),
+                ],
+                BLUE_TABLE,
+                nonzero_column=1,
+            )
+
+            result_sections.show("shadow_prices", [
                 ft.Divider(thickness=1, color=ft.Colors.BLUE_300),
                 ft.Container(
                     content=ft.Column(
@@ -332,20 +538,290 @@ def main(page: ft.Page):
                     ),
                     margin=ft.margin.only(bottom=16),
                 ),
-                ft.DataTable(
+                shadow_table,
+            ], update=False)
+
+        # Análise paramétrica: curva completa do valor ótimo em função de um recurso ou coeficiente
+        is_linear_program = all(
+            variable.category == VariableCategory.CONTINUOUS for variable in app_state.objective_function.variables
+        )
+        # Soluções ótimas alternativas: vértices da face ótima, calculados apenas quando a seção é aberta
+        # (após uma resolução pelo PuLP, a base ótima é recuperada uma vez e compartilhada com as demais análises)
+        if simplex_tableau.is_optimal() and is_linear_program:
+            optima_content = ft.Column(controls=[ft.ProgressRing(color=ft.Colors.BLUE_700)])
+            optima_loaded = False
+
+            async def on_optima_expand(e):
+                """Enumera os vértices ótimos na primeira vez que a seção é aberta, fora da thread da interface."""
+                nonlocal optima_loaded
+                if e.data != "true" or optima_loaded:
+                    return
+                optima_loaded = True
+                try:
+                    optima = await asyncio.to_thread(simplex_tableau.get_alternative_optima)
+                    optima_content.controls = [
+                        AlternativeOptimaPanel(optima) if optima is not None
+                        else ft.Text("O problema não tem solução ótima.", color=ft.Colors.RED_700)
+                    ]
+                except ValueError as error:
+                    optima_content.controls = [ft.Text(str(error), color=ft.Colors.RED_700)]
+                if optima_content.page:
+                    optima_content.update()
+
+            result_sections.show("alternative_optima", [
+                ft.Divider(thickness=1, color=ft.Colors.BLUE_300),
+                ft.ExpansionTile(
+                    title=ft.Text(
+                        "Soluções Ótimas Alternativas",
+                        weight=ft.FontWeight.BOLD,
+                        size=16,
+                        color=ft.Colors.BLUE_900,
+                    ),
+                    subtitle=ft.Text(
+                        "Outros planos com o mesmo valor ótimo; clique para verificar.",
+                        color=ft.Colors.GREY_700,
+                        size=14,
+                        italic=True,
+                    ),
+                    leading=ft.Icon(name=ft.Icons.ALT_ROUTE, color=ft.Colors.BLUE_700, size=24),
+                    controls=[optima_content],
+                    on_change=on_optima_expand,
+                ),
+            ], update=False)
+
+        # Gráfico tornado: calculado e desenhado apenas quando a seção é aberta
+        if simplex_tableau.is_optimal() and is_linear_program:
+            tornado_content = ft.Column(controls=[ft.ProgressRing(color=ft.Colors.BLUE_700)])
+            tornado_loaded = False
+
+            def format_limit(value: float) -> str:
+                """Formata um limite de intervalo, que pode ser infinito."""
+                return "∞" if value == float("inf") else "-∞" if value == float("-inf") else f"{value:.3f}"
+
+            def range_table(first_column: str, rows: list[tuple[str, float, float, float]]) -> ft.DataTable:
+                """Tabela com o valor atual e o intervalo em que a base ótima se mantém."""
+                return ft.DataTable(
                     columns=[
-                        ft.DataColumn(label=ft.Text("Restrição", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900)),
-                        ft.DataColumn(label=ft.Text("Preço-Sombra", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900, 
-                                                   tooltip="Valor por unidade adicional de recurso")),
-                        ft.DataColumn(label=ft.Text("Valor Atual", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900)),
+                        ft.DataColumn(label=ft.Text(first_column, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900)),
+                        ft.DataColumn(label=ft.Text("Valor Atual", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900), numeric=True),
+                        ft.DataColumn(label=ft.Text("Intervalo de Validade", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900)),
+                    ],
+                    rows=[
+                        ft.DataRow(cells=[
+                            ft.DataCell(ft.Text(name, color=ft.Colors.BLACK)),
+                            ft.DataCell(ft.Text(f"{value:.3f}", color=ft.Colors.GREY_800)),
+                            ft.DataCell(ft.Text(f"[{format_limit(lower)}, {format_limit(upper)}]", color=ft.Colors.BLUE_800)),
+                        ])
+                        for name, value, lower, upper in rows
                     ],
-                    rows=detailed_shadow_rows,
                     border=ft.border.all(1, ft.Colors.BLUE_300),
                     heading_row_color=ft.Colors.BLUE_200,
                     data_row_color=lambda i: (ft.Colors.WHITE if i % 2 == 0 else ft.Colors.BLUE_50),
                     border_radius=ft.border_radius.all(8),
+                )
+
+            def on_tornado_expand(e):
+                """Calcula o gráfico tornado na primeira vez que a seção é aberta."""
+                nonlocal tornado_loaded
+                if e.data != "true" or tornado_loaded:
+                    return
+                tornado_loaded = True
+                try:
+                    tornado = simplex_tableau.get_tornado()
+                    tornado_content.controls = [
+                        TornadoChart(tornado),
+                        ft.Text(
+                            "Intervalos em que a base ótima se mantém (o preço-sombra e os valores das variáveis "
+                            "continuam válidos):",
+                            color=ft.Colors.GREY_700,
+                            size=14,
+                            italic=True,
+                        ),
+                        range_table("Restrição", [
+                            (row["name"], row["rhs"], row["lower"], row["upper"]) for row in tornado["constraints"]
+                        ]),
+                        range_table("Coeficiente", [
+                            (row["name"], row["cost"], row["lower"], row["upper"]) for row in tornado["variables"]
+                        ]),
+                    ]
+                except ValueError as error:
+                    tornado_content.controls = [ft.Text(str(error), color=ft.Colors.RED_700)]
+                if tornado_content.page:
+                    tornado_content.update()
+
+            result_sections.show("tornado", [
+                ft.Divider(thickness=1, color=ft.Colors.BLUE_300),
+                ft.ExpansionTile(
+                    title=ft.Text(
+                        "Gráfico Tornado - Impacto de ±10% em Cada Parâmetro",
+                        weight=ft.FontWeight.BOLD,
+                        size=16,
+                        color=ft.Colors.BLUE_900,
+                    ),
+                    subtitle=ft.Text(
+                        "Parâmetros ordenados pela variação do valor ótimo; clique para calcular.",
+                        color=ft.Colors.GREY_700,
+                        size=14,
+                        italic=True,
+                    ),
+                    leading=ft.Icon(name=ft.Icons.BAR_CHART, color=ft.Colors.BLUE_700, size=24),
+                    controls=[tornado_content],
+                    on_change=on_tornado_expand,
                 ),
-            ])
+            ], update=False)
+
+        if simplex_tableau.is_optimal() and is_linear_program:
+            parametric_chart_container = ft.Container()
+
+            async def show_parametric_curve(key: str):
+                """Calcula (fora da thread da interface) e exibe a curva paramétrica escolhida (ex.: "rhs:0" ou "obj:1")."""
+                kind, index = key.split(":")
+                index = int(index)
+                try:
+                    if kind == "rhs":
+                        constraint = app_state.objective_function.constraints[index]
+                        curve = await asyncio.to_thread(simplex_tableau.get_parametric_rhs, index)
+                        chart = ParametricChart(curve, f"disponibilidade de {constraint.name}", "shadow_price", "Preço-Sombra")
+                    else:
+                        variable = app_state.objective_function.variables[index]
+                        curve = await asyncio.to_thread(simplex_tableau.get_parametric_objective, index)
+                        chart = ParametricChart(curve, f"coeficiente de {variable.name}", "variable_value", f"Valor de {variable.name}")
+                    parametric_chart_container.content = chart
+                except ValueError as error:
+                    parametric_chart_container.content = ft.Text(str(error), color=ft.Colors.RED_700)
+                if parametric_chart_container.page:
+                    parametric_chart_container.update()
+
+            async def on_parametric_change(e):
+                await show_parametric_curve(e.control.value)
+
+            parametric_options = [
+                ft.DropdownOption(key=f"rhs:{i}", text=f"Disponibilidade: {constraint.name}")
+                for i, constraint in enumerate(app_state.objective_function.constraints)
+            ] + [
+                ft.DropdownOption(key=f"obj:{j}", text=f"Coeficiente: {variable.name}")
+                for j, variable in enumerate(app_state.objective_function.variables)
+            ]
+            parametric_dropdown = ft.Dropdown(
+                label="Parâmetro (de 0 a 2× o valor atual)",
+                value=parametric_options[0].key,
+                options=parametric_options,
+                on_change=on_parametric_change,
+                filled=True,
+                fill_color=ft.Colors.WHITE,
+                color=ft.Colors.BLACK,
+                border_radius=8,
+                width=360,
+            )
+            await show_parametric_curve(parametric_dropdown.value)
+
+            result_sections.show("parametric", [
+                ft.Divider(thickness=1, color=ft.Colors.BLUE_300),
+                ft.Row(
+                    controls=[
+                        ft.Icon(name=ft.Icons.SHOW_CHART, color=ft.Colors.BLUE_700, size=24),
+                        ft.Text(
+                            "Análise Paramétrica - Valor Ótimo por Parâmetro:",
+                            weight=ft.FontWeight.BOLD,
+                            size=16,
+                            color=ft.Colors.BLUE_900,
+                        ),
+                    ]
+                ),
+                ft.Text(
+                    "Cada segmento da curva mantém a mesma base ótima; a inclinação é o preço-sombra do recurso "
+                    "ou o valor da variável.",
+                    color=ft.Colors.GREY_700,
+                    size=14,
+                    italic=True,
+                ),
+                parametric_dropdown,
+                parametric_chart_container,
+            ], update=False)
+
+        # Mapa de calor: valor ótimo variando a disponibilidade de duas restrições ao mesmo tempo
+        constraints = app_state.objective_function.constraints
+        if simplex_tableau.is_optimal() and is_linear_program and len(constraints) >= 2:
+            heatmap_container = ft.Container()
+            heatmap_options = [
+                ft.DropdownOption(key=str(i), text=constraint.name) for i, constraint in enumerate(constraints)
+            ]
+            first_dropdown = ft.Dropdown(
+                label="Eixo horizontal",
+                value="0",
+                options=heatmap_options,
+                filled=True,
+                fill_color=ft.Colors.WHITE,
+                color=ft.Colors.BLACK,
+                border_radius=8,
+                width=220,
+            )
+            second_dropdown = ft.Dropdown(
+                label="Eixo vertical",
+                value="1",
+                options=heatmap_options,
+                filled=True,
+                fill_color=ft.Colors.WHITE,
+                color=ft.Colors.BLACK,
+                border_radius=8,
+                width=220,
+            )
+
+            async def on_heatmap_click(e):
+                """Calcula o mapa de calor em segundo plano e exibe o resultado."""
+                first, second = int(first_dropdown.value), int(second_dropdown.value)
+                if first == second:
+                    heatmap_container.content = ft.Text("Escolha duas restrições diferentes.", color=ft.Colors.RED_700)
+                    heatmap_container.update()
+                    return
+
+                heatmap_container.content = ft.Row(
+                    controls=[ft.ProgressRing(color=ft.Colors.BLUE_700), ft.Text("Calculando o mapa de calor...", color=ft.Colors.GREY_800)],
+                )
+                heatmap_container.update()
+                try:
+                    heatmap = await asyncio.to_thread(
+                        simplex_tableau.get_rhs_heatmap, first, second, workers=ANALYSIS_WORKERS,
+                    )
+                    heatmap_container.content = RhsHeatmap(
+                        heatmap,
+                        f"disponibilidade de {constraints[first].name}",
+                        f"disponibilidade de {constraints[second].name}",
+                    )
+                except ValueError as error:
+                    heatmap_container.content = ft.Text(str(error), color=ft.Colors.RED_700)
+                heatmap_container.update()
+
+            result_sections.show("heatmap", [
+                ft.Divider(thickness=1, color=ft.Colors.BLUE_300),
+                ft.Row(
+                    controls=[
+                        ft.Icon(name=ft.Icons.GRID_ON, color=ft.Colors.BLUE_700, size=24),
+                        ft.Text(
+                            "Mapa de Calor - Valor Ótimo por Duas Disponibilidades:",
+                            weight=ft.FontWeight.BOLD,
+                            size=16,
+                            color=ft.Colors.BLUE_900,
+                        ),
+                    ]
+                ),
+                ft.Text(
+                    "Varia a disponibilidade de duas restrições de 0 a 2× o valor atual. As linhas separam regiões "
+                    "com a mesma base ótima, onde o valor ótimo é linear.",
+                    color=ft.Colors.GREY_700,
+                    size=14,
+                    italic=True,
+                ),
+                ft.Row(
+                    controls=[
+                        first_dropdown,
+                        second_dropdown,
+                        ft.ElevatedButton("Gerar mapa de calor", icon=ft.Icons.PLAY_ARROW, on_click=on_heatmap_click),
+                    ],
+                    wrap=True,
+                ),
+                heatmap_container,
+            ], update=False)
 
         # Controles para análise de mudança de disponibilidade
         availability_change_checkbox = ft.Checkbox(
@@ -358,6 +834,9 @@ def main(page: ft.Page):
             ),
         )
 
+        # Novas disponibilidades digitadas, por índice da restrição
+        availability_edits: dict[int, str] = {}
+
         # Container para os campos de alteração de disponibilidade (inicialmente oculto)
         availability_analysis_container = ft.Container(
             visible=False,
@@ -384,82 +863,20 @@ def main(page: ft.Page):
             margin=ft.margin.only(top=16),
         )
 
-        # Função auxiliar para remover análises anteriores
-        def remove_previous_analysis():
-            """Remove análises anteriores de mudança de disponibilidade."""
-            controls_to_remove = []
-            
-            for i, control in enumerate(results_placeholder.content.controls):
-                should_remove = False
-                
-                if hasattr(control, '_is_analysis_element'):
-                    should_remove = True
-                
-                elif (isinstance(control, ft.Divider) and
-                      hasattr(control, 'thickness') and
-                      control.thickness >= 2):
-                    should_remove = True
-                
-                elif isinstance(control, ft.Container):
-                    try:
-                        content = control.content
-                        if hasattr(content, 'controls'):
-                            for inner in content.controls:
-                                if isinstance(inner, ft.Row):
-                                    for item in inner.controls:
-                                        if (isinstance(item, ft.Text) and
-                                            hasattr(item, 'value') and
-                                            item.value and
-                                            "Análise de Mudança" in item.value):
-                                            should_remove = True
-                                            break
-                                if should_remove:
-                                    break
-                    except (AttributeError, TypeError):
-                        pass
-                
-                if should_remove:
-                    controls_to_remove.append(i)
-            
-            for index in sorted(controls_to_remove, reverse=True):
-                if index < len(results_placeholder.content.controls):
-                    results_placeholder.content.controls.pop(index)
-            
-            return len(controls_to_remove) > 0
-
         def analyze_availability_change():
             """Analisa as mudanças de disponibilidade e atualiza os resultados."""
             try:
-                remove_previous_analysis()
-                
-                new_values = []
-                changes_summary = []
-                for field in availability_analysis_container.availability_fields:
+                # Campos não editados (ou com texto inválido) mantêm o valor original
+                original_values = np.array([constraint.value for constraint in app_state.objective_function.constraints], dtype=float)
+                new_values = original_values.copy()
+                for index, text in availability_edits.items():
                     try:
-                        value = float(field.value)
-                        new_values.append(value)
-                        constraint_index = field.constraint_index
-                        original_value = app_state.objective_function.constraints[constraint_index].value
-                        constraint_name = app_state.objective_function.constraints[constraint_index].name
-                        changes_summary.append({
-                            "name": constraint_name,
-                            "original": original_value,
-                            "new": value,
-                            "change": value - original_value
-                        })
+                        new_values[index] = float(text)
                     except ValueError:
-                        constraint_index = field.constraint_index
-                        original_value = app_state.objective_function.constraints[constraint_index].value
-                        new_values.append(original_value)
-                        constraint_name = app_state.objective_function.constraints[constraint_index].name
-                        changes_summary.append({
-                            "name": constraint_name,
-                            "original": original_value,
-                            "new": original_value,
-                            "change": 0
-                        })
-
-                availability_analysis = simplex_tableau.analyze_resource_availability_change(new_values)
+                        pass
+                changes = new_values - original_values
+
+                availability_analysis = simplex_tableau.analyze_resource_availability_change(new_values.tolist())
 
                 if availability_analysis["is_viable"]:
                     status_color = ft.Colors.GREEN_800
@@ -565,34 +982,28 @@ def main(page: ft.Page):
                 )
 
                 # Tabela de mudanças detalhadas
-                changes_table = ft.DataTable(
-                    columns=[
-                        ft.DataColumn(label=ft.Text("Restrição", weight=ft.FontWeight.BOLD, color=ft.Colors.PURPLE_900)),
-                        ft.DataColumn(label=ft.Text("Valor Original", weight=ft.FontWeight.BOLD, color=ft.Colors.PURPLE_900)),
-                        ft.DataColumn(label=ft.Text("Novo Valor", weight=ft.FontWeight.BOLD, color=ft.Colors.PURPLE_900)),
-                        ft.DataColumn(label=ft.Text("Variação", weight=ft.FontWeight.BOLD, color=ft.Colors.PURPLE_900)),
-                    ],
-                    rows=[
-                        ft.DataRow(cells=[
-                            ft.DataCell(ft.Text(change["name"], color=ft.Colors.BLACK, weight=ft.FontWeight.BOLD)),
-                            ft.DataCell(ft.Text(f"{change['original']:.2f}", color=ft.Colors.GREY_700)),
-                            ft.DataCell(ft.Text(f"{change['new']:.2f}", color=ft.Colors.BLUE_800)),
-                            ft.DataCell(ft.Text(
-                                f"{change['change']:+.2f}",
-                                color=ft.Colors.GREEN_700 if change['change'] >= 0 else ft.Colors.RED_700,
-                                weight=ft.FontWeight.BOLD,
-                            )),
-                        ])
-                        for change in changes_summary
+                changes_table = PagedTable(
+                    [
+                        TableColumn(
+                            "Restrição",
+                            np.array([constraint.name for constraint in app_state.objective_function.constraints], dtype=str),
+                            bold=True,
+                        ),
+                        TableColumn("Valor Original", original_values, color=ft.Colors.GREY_700),
+                        TableColumn("Novo Valor", new_values, color=ft.Colors.BLUE_800),
+                        TableColumn(
+                            "Variação",
+                            changes,
+                            text=lambda i: f"{changes[i]:+.2f}",
+                            color=lambda i: ft.Colors.GREEN_700 if changes[i] >= 0 else ft.Colors.RED_700,
+                            bold=True,
+                        ),
                     ],
-                    border=ft.border.all(1, ft.Colors.PURPLE_300),
-                    heading_row_color=ft.Colors.PURPLE_200,
-                    data_row_color=lambda i: (ft.Colors.WHITE if i % 2 == 0 else ft.Colors.PURPLE_50),
-                    border_radius=ft.border_radius.all(8),
+                    PURPLE_TABLE,
+                    nonzero_column=3,
                 )
 
                 divider = ft.Divider(thickness=2, color=ft.Colors.PURPLE_300)
-                divider._is_analysis_element = True
                 
                 title_container = ft.Container(
                     content=ft.Row(
@@ -609,16 +1020,13 @@ def main(page: ft.Page):
                     ),
                     margin=ft.margin.only(bottom=16),
                 )
-                title_container._is_analysis_element = True
                 
                 cards_row = ft.Row(
                     controls=[status_card, profit_card],
                     spacing=16,
                 )
-                cards_row._is_analysis_element = True
                 
                 spacer = ft.Container(height=16)
-                spacer._is_analysis_element = True
                 
                 details_text = ft.Text(
                     "Detalhes das Mudanças:",
@@ -626,10 +1034,7 @@ def main(page: ft.Page):
                     size=16,
                     color=ft.Colors.PURPLE_900,
                 )
-                details_text._is_analysis_element = True
-                
-                changes_table._is_analysis_element = True
-                
+
                 analysis_results = [
                     divider,
                     title_container,
@@ -639,14 +1044,24 @@ def main(page: ft.Page):
                     changes_table,
                 ]
 
-                remove_previous_analysis();
+                # Sem solução viável com os novos valores: mostra o conflito ou a direção de ilimitação
+                if not availability_analysis["has_feasible_solution"] and (
+                    availability_analysis.get("conflict") is not None or availability_analysis.get("unbounded_ray") is not None
+                ):
+                    analysis_results.extend([
+                        ft.Container(height=16),
+                        DiagnosisPanel(
+                            conflict=availability_analysis["conflict"],
+                            ray=availability_analysis["unbounded_ray"],
+                            infeasible=availability_analysis["conflict"] is not None,
+                        ),
+                    ])
 
-                results_placeholder.content.controls.extend(analysis_results)
-                result_container.update()
+                # Uma nova análise substitui a anterior na mesma seção, sem reconstruir o painel
+                result_sections.show("availability_analysis", analysis_results)
 
             except Exception as e:
                 print(f"Erro na análise de disponibilidade: {e}")
-                remove_previous_analysis()
                 
                 error_message = ft.Container(
                     content=ft.Row(
@@ -661,9 +1076,7 @@ def main(page: ft.Page):
                     padding=ft.padding.all(16),
                     border_radius=ft.border_radius.all(8),
                 )
-                error_message._is_analysis_element = True
-                results_placeholder.content.controls.append(error_message)
-                result_container.update()
+                result_sections.show("availability_analysis", error_message)
 
         analyze_button = ft.ElevatedButton(
             text="Analisar Mudança",
@@ -686,56 +1099,235 @@ def main(page: ft.Page):
             availability_analysis_container.visible = e.control.value
             
             if e.control.value:
-                availability_fields = []
-                for i, constraint in enumerate(app_state.objective_function.constraints):
-                    field = ft.TextField(
-                        label=f"Nova disponibilidade para {constraint.name}",
-                        value=str(constraint.value),
-                        hint_text=f"Valor atual: {constraint.value}",
-                        width=250,
-                        height=50,
+                availability_edits.clear()
+                constraints = app_state.objective_function.constraints
+
+                def build_availability_field(i: int) -> ft.TextField:
+                    """Campo criado só quando a restrição aparece na página; o texto digitado fica em availability_edits."""
+                    return ft.TextField(
+                        value=availability_edits.get(i, str(constraints[i].value)),
+                        hint_text=f"Valor atual: {constraints[i].value}",
+                        width=160,
+                        height=44,
+                        dense=True,
                         border_color=ft.Colors.PURPLE_300,
                         focused_border_color=ft.Colors.PURPLE_700,
                         text_style=ft.TextStyle(size=14, color=ft.Colors.BLACK),
-                        label_style=ft.TextStyle(color=ft.Colors.PURPLE_800),
+                        on_change=lambda e, i=i: availability_edits.__setitem__(i, e.control.value),
                     )
-                    field.constraint_index = i
-                    availability_fields.append(field)
-                
-                fields_row = ft.Row(
-                    controls=availability_fields,
-                    wrap=True,
-                    spacing=16,
-                    run_spacing=8,
+
+                availability_table = PagedTable(
+                    [
+                        TableColumn("Restrição", np.array([constraint.name for constraint in constraints], dtype=str), bold=True),
+                        TableColumn("Valor Atual", np.array([constraint.value for constraint in constraints], dtype=float), color=ft.Colors.GREY_700),
+                        TableColumn("Nova Disponibilidade", np.zeros(len(constraints)), build=build_availability_field),
+                    ],
+                    PURPLE_TABLE,
+                    page_size=10,
                 )
-                
-                availability_analysis_container.content.controls.extend([fields_row, analyze_button])
-                
-                # Armazenar referência aos campos para uso posterior
-                availability_analysis_container.availability_fields = availability_fields
+
+                availability_analysis_container.content.controls.extend([availability_table, analyze_button])
             else:
                 # Remover campos e botão quando desmarcado
                 if len(availability_analysis_container.content.controls) > 2:
                     availability_analysis_container.content.controls = availability_analysis_container.content.controls[:2]
                 
                 # Remover análises anteriores dos resultados
-                remove_previous_analysis()
-                result_container.update()
+                result_sections.remove("availability_analysis")
             
             availability_analysis_container.update()
 
         availability_change_checkbox.on_change = on_change_availability_checkbox_analysis
 
         # Adicionar o checkbox e container aos resultados
-        results_placeholder.content.controls.extend([
+        result_sections.show("availability", [
             ft.Divider(thickness=1, color=ft.Colors.GREY_300),
             availability_change_checkbox,
             availability_analysis_container,
-        ])
+        ], update=False)
 
         result_container.update()
 
 
+    # Histórico de edições: desfazer/refazer e volta a qualquer ponto, recarregando a solução salva
+    variables_controls = VariablesControls(
+        page,
+        "Variável",
+        on_change_value=app_state.set_quantity_of_variables,
+    )
+    constraints_controls = VariablesControls(
+        page,
+        "Restrição",
+        on_change_value=app_state.set_quantity_of_constraints,
+    )
+    objective_radio = ft.RadioGroup(
+        content=ft.Row(
+            controls=[
+                ft.Radio(
+                    label="Maximizar",
+                    value=ObjectiveFunctionType.MAXIMIZE.value,
+                    active_color=ft.Colors.BLUE_700,
+                    label_style=ft.TextStyle(
+                        color=ft.Colors.GREY_800,
+                        size=14,
+                        weight=ft.FontWeight.NORMAL,
+                    ),
+                ),
+                ft.Radio(
+                    label="Minimizar",
+                    value=ObjectiveFunctionType.MINIMIZE.value,
+                    active_color=ft.Colors.BLUE_700,
+                    label_style=ft.TextStyle(
+                        color=ft.Colors.GREY_800,
+                        size=14,
+                        weight=ft.FontWeight.NORMAL,
+                    ),
+                ),
+            ]
+        ),
+        on_change=lambda e: app_state.set_objective_function(ObjectiveFunctionType(e.control.value)),
+        value=app_state.objective_function.objective_function.value,
+    )
+
+    def restore_solution():
+        """Se o estado restaurado já foi resolvido com o método escolhido, recarrega a solução salva."""
+        from methods.lp_arrays import LpArrays
+
+        result_store = get_result_store()
+        if result_store is None:
+            return
+        try:
+            arrays = LpArrays.from_problem(app_state.objective_function)
+        except ValueError:
+            return
+        if result_store.has_run(arrays, engine_dropdown.value):
+            page.run_task(on_solve_click, None)
+
+    def on_undo(_=None):
+        if app_state.undo():
+            restore_solution()
+
+    def on_redo(_=None):
+        if app_state.redo():
+            restore_solution()
+
+    def on_history_jump(position: int):
+        app_state.jump_to(position)
+        restore_solution()
+
+    undo_button = ft.IconButton(icon=ft.Icons.UNDO, tooltip="Desfazer (Ctrl+Z)", on_click=on_undo, disabled=True)
+    redo_button = ft.IconButton(icon=ft.Icons.REDO, tooltip="Refazer (Ctrl+Y)", on_click=on_redo, disabled=True)
+    history_menu = ft.PopupMenuButton(icon=ft.Icons.HISTORY, tooltip="Histórico de edições", items=[])
+
+    import_text_field = ft.TextField(
+        multiline=True,
+        min_lines=8,
+        max_lines=14,
+        hint_text="Cole aqui a tabela (ex.: copiada de uma planilha):\nmax\t5\t4\nc1\t2\t3\t<=\t5\nc2\t4\t1\t<=\t11",
+        text_style=ft.TextStyle(font_family="monospace", size=13),
+    )
+    import_error = ft.Text(color=ft.Colors.RED_700, selectable=True)
+
+    def apply_import(load: Callable[[], "ImportedModel"]):
+        """Valida a tabela inteira e só então grava o modelo, em uma única edição."""
+        try:
+            imported = load()
+        except (ValueError, OSError) as error:
+            import_error.value = str(error)
+            page.update()
+            return
+        app_state.set_coefficients(
+            imported.objective.tolist() if imported.objective is not None else None,
+            imported.A.tolist(),
+            imported.b.tolist(),
+            list(imported.senses),
+            imported.objective_function,
+        )
+        page.close(import_dialog)
+
+    def on_import_file(e: ft.FilePickerResultEvent):
+        from data.model_import import import_file
+
+        if e.files:
+            apply_import(lambda: import_file(e.files[0].path))
+
+    def on_import_text(_):
+        from data.model_import import import_text
+
+        apply_import(lambda: import_text(import_text_field.value or ""))
+
+    import_picker = ft.FilePicker(on_result=on_import_file)
+    page.overlay.append(import_picker)
+
+    import_dialog = ft.AlertDialog(
+        modal=True,
+        title=ft.Text("Importar coeficientes"),
+        content=ft.Column(
+            tight=True,
+            width=560,
+            controls=[
+                ft.Text(
+                    "Uma restrição por linha: coeficientes, símbolo (<=, >= ou =) e lado direito. "
+                    "Rótulos na primeira coluna, cabeçalho e uma linha max/min com a função objetivo são opcionais.",
+                    size=13,
+                    color=ft.Colors.GREY_700,
+                ),
+                import_text_field,
+                import_error,
+            ],
+        ),
+        actions=[
+            ft.TextButton(
+                "Carregar arquivo",
+                icon=ft.Icons.UPLOAD_FILE,
+                on_click=lambda _: import_picker.pick_files(
+                    dialog_title="Importar coeficientes",
+                    allowed_extensions=["csv", "tsv", "txt", "xlsx", "xls"],
+                ),
+            ),
+            ft.TextButton("Cancelar", on_click=lambda _: page.close(import_dialog)),
+            ft.FilledButton("Importar", on_click=on_import_text),
+        ],
+    )
+
+    def on_import_click(_):
+        import_error.value = ""
+        page.open(import_dialog)
+
+    import_button = ft.IconButton(icon=ft.Icons.TABLE_VIEW, tooltip="Importar coeficientes (colar, CSV ou planilha)", on_click=on_import_click)
+
+    def update_history_controls():
+        """Sincroniza os botões, o menu do histórico e os controles que não são refeitos a cada edição."""
+        history = app_state.history
+        state = app_state.objective_function
+        undo_button.disabled = not history.can_undo
+        redo_button.disabled = not history.can_redo
+        # Só os pontos mais recentes; o menu não precisa listar o histórico inteiro
+        entries = list(enumerate(history.entries))[-30:]
+        history_menu.items = [
+            ft.PopupMenuItem(
+                text=("● " if position == history.position else "    ") + (entry.label or "Edição"),
+                on_click=lambda _, position=position: on_history_jump(position),
+            )
+            for position, entry in reversed(entries)
+        ]
+        variables_controls.set_value(state.quantity_of_variables)
+        constraints_controls.set_value(state.quantity_of_constraints)
+        objective_radio.value = state.objective_function.value
+        page.update()
+
+    app_state.subscribe(update_history_controls, "history")
+    update_history_controls()
+
+    def on_keyboard(e: ft.KeyboardEvent):
+        key = e.key.upper()
+        if e.ctrl and (key == "Y" or (key == "Z" and e.shift)):
+            on_redo()
+        elif e.ctrl and key == "Z":
+            on_undo()
+
+    page.on_keyboard_event = on_keyboard
+
     page.add(
         ft.Container(
             padding=ft.padding.all(20),
@@ -759,7 +1351,11 @@ def main(page: ft.Page):
                                                 "Configuração do Problema",
                                                 theme_style=ft.TextThemeStyle.TITLE_LARGE,
                                                 color=ft.Colors.BLACK,
-                                            )
+                                            ),
+                                            undo_button,
+                                            redo_button,
+                                            history_menu,
+                                            import_button,
                                         ]
                                     )
                                 ),
@@ -777,11 +1373,7 @@ def main(page: ft.Page):
                                                                 size=20,
                                                                 color=ft.Colors.BLACK,
                                                             ),
-                                                            VariablesControls(
-                                                                page, 
-                                                                "Variável",
-                                                                on_change_value=app_state.set_quantity_of_variables,
-                                                            ),
+                                                            variables_controls,
                                                         ]
                                                     ),
                                                     ft.Column(
@@ -792,11 +1384,7 @@ def main(page: ft.Page):
                                                                 size=20,
                                                                 color=ft.Colors.BLACK,
                                                             ),
-                                                            VariablesControls(
-                                                                page, 
-                                                                "Restrição",
-                                                                on_change_value=app_state.set_quantity_of_constraints,
-                                                            ),
+                                                            constraints_controls,
                                                         ]
                                                     ),
                                                 ]
@@ -810,36 +1398,7 @@ def main(page: ft.Page):
                                                         size=20,
                                                         color=ft.Colors.BLACK,
                                                     ),
-                                                    ft.RadioGroup(
-                                                        content=ft.Row(
-                                                            controls=[
-                                                                ft.Radio(
-                                                                    label="Maximizar",
-                                                                    value=ObjectiveFunctionType.MAXIMIZE.value,
-                                                                    active_color=ft.Colors.BLUE_700,
-                                                                    label_style=ft.TextStyle(
-                                                                        color=ft.Colors.GREY_800,
-                                                                        size=14,
-                                                                        weight=ft.FontWeight.NORMAL,
-                                                                    ),
-                                                                ),
-                                                                ft.Radio(
-                                                                    label="Minimizar",
-                                                                    value=ObjectiveFunctionType.MINIMIZE.value,
-                                                                    active_color=ft.Colors.BLUE_700,
-                                                                    label_style=ft.TextStyle(
-                                                                        color=ft.Colors.GREY_800,
-                                                                        size=14,
-                                                                        weight=ft.FontWeight.NORMAL,
-                                                                    ),
-                                                                ),
-                                                            ]
-                                                        ),
-                                                        on_change=lambda e: app_state.objective_function.set_objective_function(
-                                                            e.control.value
-                                                        ),
-                                                        value=app_state.objective_function.objective_function.value,
-                                                    )
+                                                    objective_radio,
                                                 ]
                                             ),
                                         ]
@@ -857,76 +1416,31 @@ def main(page: ft.Page):
                                                 ft.Row(
                                                     controls=[
                                                         ft.Text(
-                                                            "Função Objetivo",
+                                                            "Função Objetivo e Restrições",
                                                             theme_style=ft.TextThemeStyle.TITLE_LARGE,
                                                             color=ft.Colors.BLACK,
                                                         ),
                                                         ft.Icon(
                                                             name=ft.Icons.INFO_OUTLINE,
                                                             color=ft.Colors.GREY_600,
-                                                            tooltip="A função objetivo é a equação que você deseja maximizar ou minimizar.",
+                                                            tooltip=(
+                                                                "A linha Z é a função objetivo, a equação que você deseja maximizar ou minimizar; "
+                                                                "as demais são as restrições que devem ser atendidas. "
+                                                                "Clique no nome de uma variável para mudar o tipo e os limites."
+                                                            ),
                                                             size=20,
                                                         )
                                                     ]
                                                 ),
                                             ),
-                                            ft.Container(
-                                                content=ft.Column(
-                                                    controls=[
-                                                        ft.Text(
-                                                            "Maximizar Z =",
-                                                            theme_style=ft.TextThemeStyle.BODY_LARGE,
-                                                            size=20,
-                                                            color=ft.Colors.BLACK,
-                                                        ),
-                                                        objective_function_row,
-                                                    ],
-                                                    horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
-                                                ),
-                                                bgcolor=ft.Colors.GREY_100,
-                                                border_radius=ft.border_radius.all(8),
-                                                padding=ft.padding.symmetric(horizontal=20, vertical=10),
-                                                margin=ft.margin.only(top=10),
-                                                expand=True,
-                                            )
+                                            model_grid,
                                         ]
                                     )
                                 ),
-                                ft.Container(
-                                    ft.Divider(
-                                        color=ft.Colors.GREY_300,
-                                        thickness=1,
-                                        height=1,
-                                    ),
-                                    margin=ft.margin.only(top=20, bottom=20),
-                                ),
-                                ft.Container(
-                                    ft.Column(
-                                        controls=[
-                                            ft.Container(
-                                                ft.Row(
-                                                    controls=[
-                                                        ft.Text(
-                                                            "Restrições",
-                                                            theme_style=ft.TextThemeStyle.TITLE_LARGE,
-                                                            color=ft.Colors.BLACK,
-                                                        ),
-                                                        ft.Icon(
-                                                            name=ft.Icons.INFO_OUTLINE,
-                                                            color=ft.Colors.GREY_600,
-                                                            tooltip="As restrições são as limitações ou condições que devem ser atendidas no problema.",
-                                                            size=20,
-                                                        )
-                                                    ]
-                                                ),
-                                            ),
-                                        ],
-                                    ),
-                                ),
-                                constraint_items_column,
                                 ft.Container(
                                     ft.Column(
                                         controls=[
+                                            engine_dropdown,
                                             ft.ElevatedButton(
                                                 text="Resolver",
                                                 height=64,
@@ -962,6 +1476,9 @@ def main(page: ft.Page):
 
     page.update()
 
+    # Depois do primeiro quadro: carrega solvers, componentes de resultado e processos em segundo plano
+    page.run_thread(prewarm)
+
 
 if __name__ == "__main__":
     ft.app(target=main)
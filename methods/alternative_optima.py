@@ -0,0 +1,192 @@
+"""
+Alternative optimal solutions of a linear program.
+
+At an optimal basis, a nonbasic column with a zero reduced cost can enter without changing the objective
+value: the optimum is not unique, unless every such pivot is degenerate. Pivots on zero reduced cost
+columns keep the duals, and so every reduced cost, unchanged; the vertices they reach are exactly the
+vertices of the optimal face. They are enumerated breadth-first from the final basis of the solve, one
+factorization per basis and no solve, until the face is exhausted or a vertex or time cap is hit. An
+entering column that nothing blocks is an unbounded edge of the optimal face, reported as a ray.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import SimplexResult, StandardForm
+
+
+@dataclass(frozen=True)
+class AlternativeOptimaOptions:
+    """
+    :param max_vertices: Stop after this many optimal vertices (the solve's own included).
+    :param time_limit: Stop after this many seconds.
+    :param tolerance: Relative size below which a reduced cost counts as zero.
+    """
+    max_vertices: int = 20
+    time_limit: float = 2.0
+    tolerance: float = 1e-9
+
+
+@dataclass(frozen=True)
+class AlternativeOptima:
+    """
+    Optimal vertices and unbounded optimal edges of a linear program, in the units of the solved arrays.
+
+    :param zero_reduced_costs: Structural variables that are nonbasic at the solve's optimum with a zero
+        reduced cost; the optimum can only be non-unique if this or ``zero_slacks`` is not empty.
+    :param zero_slacks: Constraints whose slack is nonbasic with a zero dual.
+    :param vertices: Values of the structural variables at each optimal vertex, the solve's first.
+    :param rays: Directions along which the objective stays optimal without limit, largest entry 1.
+    :param bases: Bases visited; degenerate vertices are reached through several of them.
+    :param complete: Whether every vertex of the optimal face was found within the caps.
+    :param elapsed: Seconds spent.
+    """
+    zero_reduced_costs: tuple[int, ...]
+    zero_slacks: tuple[int, ...]
+    vertices: tuple[np.ndarray, ...]
+    rays: tuple[np.ndarray, ...]
+    bases: int
+    complete: bool
+    elapsed: float
+
+    @property
+    def unique(self) -> bool:
+        """Whether the solve's optimum is the only optimal solution; only certain when ``complete``."""
+        return len(self.vertices) == 1 and not self.rays
+
+
+def _nonbasic_values(values: np.ndarray, lower: np.ndarray, upper: np.ndarray, basis: np.ndarray) -> np.ndarray:
+    """Nonbasic values snapped to the bound they sit at (zero for free variables), zero in basic positions."""
+    snapped = np.where(np.isfinite(lower), lower, np.where(np.isfinite(upper), upper, 0.0))
+    at_upper = np.isfinite(upper) & (~np.isfinite(lower) | (np.abs(values - upper) < np.abs(values - lower)))
+    snapped[at_upper] = upper[at_upper]
+    snapped[basis] = 0.0
+    return snapped
+
+
+def enumerate_optimal_vertices(
+    arrays: LpArrays,
+    result: SimplexResult,
+    options: AlternativeOptimaOptions = AlternativeOptimaOptions(),
+) -> AlternativeOptima:
+    """
+    Enumerate the vertices of the optimal face by pivoting on zero reduced cost columns from the final basis.
+
+    :param arrays: A linear program.
+    :param result: An optimal native solve of ``arrays``, whose basis is the starting point.
+    :return: The optimal vertices and rays found.
+    """
+    if not result.is_optimal:
+        raise ValueError("Alternative optima need an optimal solution.")
+
+    start = time.perf_counter()
+    form = StandardForm.from_arrays(arrays)
+    m, N = form.shape
+    n = form.n_structural
+    if result.basis.size != m:
+        raise ValueError("Alternative optima need the optimal basis of a native solve.")
+
+    # Artificial columns stay so that a basis with redundant rows can be factorized; they never enter.
+    A = np.hstack([form.A, np.eye(m)])
+    lower = np.concatenate([form.lower, np.zeros(m)])
+    upper = np.concatenate([form.upper, np.zeros(m)])
+    cost = np.concatenate([form.cost, np.zeros(m)])
+    values = np.concatenate([form.column_values(result.x), np.zeros(m)])
+
+    basis = np.asarray(result.basis, dtype=int)
+    y = np.linalg.solve(A[:, basis].T, cost[basis])
+    reduced = cost - y @ A
+    zero = np.abs(reduced) <= options.tolerance * max(np.abs(cost).max(initial=0.0), 1.0)
+    zero[N:] = False
+    nonbasic = np.ones(N + m, dtype=bool)
+    nonbasic[basis] = False
+    slack_rows = {int(column): i for i, column in enumerate(form.slack_columns) if column >= 0}
+    starting = np.flatnonzero(zero & nonbasic & (upper > lower))
+    enterable = np.flatnonzero(zero & (upper > lower))
+
+    tolerance = options.tolerance * max(np.abs(values).max(initial=0.0), 1.0)
+    vertices: dict[tuple, np.ndarray] = {}
+    rays: dict[tuple, np.ndarray] = {}
+    queue = deque([(basis, _nonbasic_values(values, lower, upper, basis))])
+    seen = {(frozenset(basis.tolist()), tuple(np.round(queue[0][1], 9)))}
+    bases = 0
+    interrupted = False
+
+    def timed_out() -> bool:
+        return time.perf_counter() - start > options.time_limit
+
+    while queue and len(vertices) < options.max_vertices and not timed_out():
+        basis, x_nonbasic = queue.popleft()
+        bases += 1
+        binv = np.linalg.inv(A[:, basis])
+        x_basic = binv @ (form.b - A @ x_nonbasic)
+        point = x_nonbasic.copy()
+        point[basis] = np.clip(x_basic, lower[basis], upper[basis])
+        vertices.setdefault(tuple(np.round(point[:N] / tolerance)), point[:n])
+
+        candidates = np.setdiff1d(enterable, basis)
+        alphas = binv @ A[:, candidates]
+        for k, q in enumerate(candidates):
+            alpha = alphas[:, k]
+            for direction in (1.0, -1.0):
+                span = upper[q] - x_nonbasic[q] if direction > 0 else x_nonbasic[q] - lower[q]
+                if span <= tolerance:
+                    continue
+
+                # Ratio test: the basic variables move by -direction * alpha per unit step.
+                change = -direction * alpha
+                decreasing = np.flatnonzero((change < -1e-9) & np.isfinite(lower[basis]))
+                increasing = np.flatnonzero((change > 1e-9) & np.isfinite(upper[basis]))
+                rows = np.concatenate([decreasing, increasing])
+                room = np.concatenate([
+                    x_basic[decreasing] - lower[basis][decreasing],
+                    upper[basis][increasing] - x_basic[increasing],
+                ])
+                ratios = np.maximum(room, 0.0) / np.abs(change[rows])
+                step = ratios.min(initial=np.inf)
+
+                if span <= step:
+                    if not np.isfinite(span):
+                        ray = np.zeros(N + m)
+                        ray[q] = direction
+                        ray[basis] = change
+                        largest = np.abs(ray[:n]).max(initial=0.0)
+                        if largest > 0:
+                            rays.setdefault(tuple(np.round(ray[:n] / largest, 9)), ray[:n] / largest)
+                        continue
+                    # The entering variable reaches its opposite bound first: same basis, new vertex.
+                    next_basis = basis
+                    next_values = x_nonbasic.copy()
+                    next_values[q] += direction * span
+                else:
+                    ties = np.flatnonzero(ratios <= step + tolerance)
+                    k_row = ties[np.argmax(np.abs(alpha[rows[ties]]))]
+                    r = int(rows[k_row])
+                    leaving = basis[r]
+                    next_basis = basis.copy()
+                    next_basis[r] = q
+                    next_values = x_nonbasic.copy()
+                    next_values[q] = 0.0
+                    next_values[leaving] = lower[leaving] if k_row < decreasing.size else upper[leaving]
+
+                key = (frozenset(next_basis.tolist()), tuple(np.round(next_values, 9)))
+                if key not in seen:
+                    seen.add(key)
+                    queue.append((next_basis, next_values))
+            if timed_out():
+                interrupted = True
+                break
+
+    return AlternativeOptima(
+        zero_reduced_costs=tuple(int(j) for j in starting if j < n),
+        zero_slacks=tuple(slack_rows[int(j)] for j in starting if int(j) in slack_rows),
+        vertices=tuple(vertices.values()),
+        rays=tuple(rays.values()),
+        bases=bases,
+        complete=not queue and not interrupted,
+        elapsed=time.perf_counter() - start,
+    )
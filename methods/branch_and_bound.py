@@ -0,0 +1,281 @@
+"""
+Branch-and-bound for problems with integer and binary variables.
+
+Every node is the LP relaxation of its parent with one variable bound tightened to ``x_j <= floor(v)``
+or ``x_j >= ceil(v)``. Bounds are handled by the bounded simplex without adding rows, so the parent's
+optimal basis is a dual feasible basis of the child, and the native simplex re-optimizes it with a few
+dual simplex pivots (and bound flips) instead of solving the child from scratch.
+"""
+
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, SimplexResult, OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+from methods.workers import solver_pool
+
+
+class NodeSelection(Enum):
+    """Order in which open nodes are explored."""
+    BEST_BOUND = "best_bound"
+    DEPTH_FIRST = "depth_first"
+
+
+@dataclass(frozen=True)
+class BranchAndBoundOptions:
+    """
+    :param node_selection: Best-bound proves optimality with fewer nodes, depth-first finds
+        integer solutions sooner and keeps fewer nodes open.
+    :param node_limit: Maximum number of nodes to evaluate.
+    :param workers: Number of processes evaluating nodes in parallel (1 evaluates them in-process).
+    :param integrality_tolerance: Distance to the nearest integer below which a value counts as integer.
+    :param gap_tolerance: Relative gap under which a node cannot improve the incumbent.
+    """
+    node_selection: NodeSelection = NodeSelection.BEST_BOUND
+    node_limit: int = 10_000
+    workers: int = 1
+    integrality_tolerance: float = 1e-6
+    gap_tolerance: float = 1e-9
+
+
+@dataclass
+class BranchAndBoundStatistics:
+    """Search statistics, with objective values in the sense of the original problem."""
+    nodes: int = 0
+    pruned: int = 0
+    lp_iterations: int = 0
+    elapsed: float = 0.0
+    best_bound: float | None = None
+    incumbent: float | None = None
+    node_limit_reached: bool = False
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def gap(self) -> float | None:
+        if self.incumbent is None or self.best_bound is None:
+            return None
+        return abs(self.best_bound - self.incumbent) / max(1.0, abs(self.incumbent))
+
+
+@dataclass(order=True)
+class _Node:
+    priority: tuple
+    branches: tuple[tuple[int, ConstraintSymbol, float], ...] = field(compare=False)
+    basis: np.ndarray | None = field(compare=False)
+    bound: float = field(compare=False)
+    depth: int = field(compare=False)
+
+
+def _solve_node(arrays: LpArrays, basis: np.ndarray | None) -> SimplexResult:
+    return RevisedSimplex(arrays).solve(basis)
+
+
+class BranchAndBound:
+    """
+    Branch-and-bound driver on top of the native simplex.
+
+    :param arrays: The problem; ``arrays.categories`` marks the integer and binary variables.
+    :param options: Search options.
+    :param progress: Receives throttled progress events with the node count and the incumbent.
+    """
+
+    def __init__(
+        self,
+        arrays: LpArrays,
+        options: BranchAndBoundOptions = BranchAndBoundOptions(),
+        progress: ProgressReporter | None = None,
+    ):
+        self.options = options
+        self.progress = progress
+        self.statistics = BranchAndBoundStatistics()
+        self._original = arrays
+        self._sign = -1.0 if arrays.maximize else 1.0
+        self._integer = np.flatnonzero(arrays.integer_mask)
+
+        # Integer variables can only take integer values inside their bounds.
+        lower = arrays.lower.copy()
+        upper = arrays.upper.copy()
+        binary = arrays.binary_mask
+        lower[binary] = np.maximum(lower[binary], 0.0)
+        upper[binary] = np.minimum(upper[binary], 1.0)
+        lower[self._integer] = np.ceil(lower[self._integer] - options.integrality_tolerance)
+        upper[self._integer] = np.floor(upper[self._integer] + options.integrality_tolerance)
+        self._root = arrays.with_bounds(lower, upper)
+        self._counter = itertools.count()
+
+    def solve(self) -> SimplexResult:
+        """
+        Run the search.
+
+        :return: The best integer solution. The status is ``"Optimal"`` only when the search finished;
+            if the node limit stopped it, the status is ``"Not Solved"`` and the incumbent (if any) is returned.
+        """
+        start = time.perf_counter()
+        statistics = self.statistics = BranchAndBoundStatistics()
+        open_nodes: list[_Node] = [self._node((), None, -math.inf, 0)]
+        incumbent: SimplexResult | None = None
+        incumbent_value = math.inf
+        unbounded = False
+
+        executor = solver_pool(self.options.workers)
+        while open_nodes and not unbounded:
+            if statistics.nodes >= self.options.node_limit:
+                statistics.node_limit_reached = True
+                break
+
+            batch: list[_Node] = []
+            while open_nodes and len(batch) < self.options.workers and statistics.nodes + len(batch) < self.options.node_limit:
+                node = heapq.heappop(open_nodes)
+                if self._can_improve(node.bound, incumbent_value):
+                    batch.append(node)
+                else:
+                    statistics.pruned += 1
+            if not batch:
+                continue
+
+            node_arrays = [self._arrays(node.branches) for node in batch]
+            bases = [node.basis for node in batch]
+            if executor is not None and len(batch) > 1:
+                results = list(executor.map(_solve_node, node_arrays, bases))
+            else:
+                results = [_solve_node(arrays, basis) for arrays, basis in zip(node_arrays, bases)]
+
+            for node, result in zip(batch, results):
+                statistics.nodes += 1
+                statistics.lp_iterations += result.iterations
+
+                if result.status == UNBOUNDED and node.depth == 0:
+                    unbounded = True
+                    break
+                if not result.is_optimal:
+                    statistics.pruned += 1
+                    continue
+
+                value = self._sign * result.objective_value
+                if not self._can_improve(value, incumbent_value):
+                    statistics.pruned += 1
+                    continue
+
+                branch_variable = self._branching_variable(result.x)
+                if branch_variable is None:
+                    incumbent, incumbent_value = result, value
+                    statistics.incumbent = result.objective_value
+                    continue
+
+                self._branch(open_nodes, node, result, branch_variable, value)
+
+            if self.progress is not None and self.progress.due():
+                self.progress.emit(ProgressEvent(
+                    phase=SolvePhase.BRANCH_AND_BOUND,
+                    iteration=statistics.lp_iterations,
+                    objective_value=statistics.incumbent,
+                    primal_infeasibility=None,
+                    dual_infeasibility=None,
+                    elapsed=self.progress.elapsed,
+                    nodes=statistics.nodes,
+                ))
+
+        bounds = [node.bound for node in open_nodes if self._can_improve(node.bound, incumbent_value)]
+        best_bound = min([incumbent_value, *bounds])
+        statistics.best_bound = self._sign * best_bound if math.isfinite(best_bound) else None
+        statistics.elapsed = time.perf_counter() - start
+
+        if unbounded:
+            return self._empty_result(UNBOUNDED)
+        if incumbent is None:
+            return self._empty_result(NOT_SOLVED if statistics.node_limit_reached else INFEASIBLE)
+        return self._final_result(incumbent, NOT_SOLVED if statistics.node_limit_reached else OPTIMAL)
+
+    # ------------------------------------------------------------------ search helpers
+
+    def _node(self, branches, basis, bound: float, depth: int) -> _Node:
+        counter = next(self._counter)
+        match self.options.node_selection:
+            case NodeSelection.BEST_BOUND:
+                priority = (bound, counter)
+            case NodeSelection.DEPTH_FIRST:
+                priority = (-depth, -counter)
+            case _:
+                raise ValueError("Invalid node selection")
+        return _Node(priority=priority, branches=branches, basis=basis, bound=bound, depth=depth)
+
+    def _can_improve(self, bound: float, incumbent_value: float) -> bool:
+        if not math.isfinite(incumbent_value):
+            return True
+        return bound < incumbent_value - self.options.gap_tolerance * max(1.0, abs(incumbent_value))
+
+    def _arrays(self, branches) -> LpArrays:
+        if not branches:
+            return self._root
+        lower = self._root.lower.copy()
+        upper = self._root.upper.copy()
+        for j, symbol, value in branches:
+            if symbol == ConstraintSymbol.LESS_THAN_OR_EQUAL:
+                upper[j] = min(upper[j], value)
+            else:
+                lower[j] = max(lower[j], value)
+        return self._root.with_bounds(lower, upper)
+
+    def _branching_variable(self, x: np.ndarray) -> int | None:
+        """Most fractional integer variable, or None when the solution is integral."""
+        if self._integer.size == 0:
+            return None
+        values = x[self._integer]
+        fractionality = np.abs(values - np.round(values))
+        k = int(np.argmax(fractionality))
+        if fractionality[k] <= self.options.integrality_tolerance:
+            return None
+        return int(self._integer[k])
+
+    def _branch(self, open_nodes: list[_Node], node: _Node, result: SimplexResult, j: int, bound: float):
+        value = result.x[j]
+        down = node.branches + ((j, ConstraintSymbol.LESS_THAN_OR_EQUAL, math.floor(value)),)
+        up = node.branches + ((j, ConstraintSymbol.GREATER_THAN_OR_EQUAL, math.ceil(value)),)
+
+        # Depth-first explores the child on the side the LP value rounds to first (pushed last).
+        children = [down, up] if value - math.floor(value) >= 0.5 else [up, down]
+        for branches in children:
+            heapq.heappush(open_nodes, self._node(branches, result.basis, bound, node.depth + 1))
+
+    # ------------------------------------------------------------------ results
+
+    def _empty_result(self, status: str) -> SimplexResult:
+        m, n = self._original.shape
+        return SimplexResult(
+            status=status,
+            objective_value=None,
+            x=np.zeros(n),
+            slacks=np.zeros(m),
+            duals=np.zeros(m),
+            reduced_costs=np.zeros(n),
+            basis=np.zeros(0, dtype=int),
+            iterations=self.statistics.lp_iterations,
+        )
+
+    def _final_result(self, leaf: SimplexResult, status: str) -> SimplexResult:
+        """Incumbent with integers rounded; duals are those of the incumbent's LP with its branches fixed."""
+        original = self._original
+        x = leaf.x.copy()
+        x[self._integer] = np.round(x[self._integer])
+
+        return SimplexResult(
+            status=status,
+            objective_value=float(original.c @ x),
+            x=x,
+            slacks=original.b - original.A @ x,
+            duals=leaf.duals,
+            reduced_costs=leaf.reduced_costs,
+            basis=leaf.basis,
+            iterations=self.statistics.lp_iterations,
+        )
@@ -0,0 +1,187 @@
+"""
+Verification of optimality certificates.
+
+A solution is certified by its values together with its shadow prices and reduced costs: it is optimal
+when it is feasible (primal residual), the duals have the signs of an optimal dual solution (dual
+residual), every nonzero dual belongs to a tight constraint or bound (complementary slackness), and both
+objectives agree (duality gap). Everything is measured in one pass of array operations, relative to the
+size of the coefficients involved, so checking a solution costs about as much as one matrix product.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, SimplexResult
+
+
+@dataclass(frozen=True)
+class CertificateTolerances:
+    """Largest relative residuals a certificate may have and still pass."""
+    primal: float = 1e-6
+    dual: float = 1e-6
+    complementarity: float = 1e-6
+    gap: float = 1e-6
+    integrality: float = 1e-6
+
+
+@dataclass(frozen=True)
+class Certificate:
+    """
+    Largest relative residuals of a solution.
+
+    The dual measures are None when no duals were checked (for example for mixed-integer solutions,
+    whose duals are not an optimality certificate).
+    """
+    primal_residual: float
+    integrality_residual: float
+    dual_residual: float | None
+    complementarity: float | None
+    duality_gap: float | None
+    tolerances: CertificateTolerances
+
+    @property
+    def failures(self) -> list[str]:
+        """Names of the measures above their tolerance."""
+        checks = {
+            "primal": (self.primal_residual, self.tolerances.primal),
+            "integrality": (self.integrality_residual, self.tolerances.integrality),
+            "dual": (self.dual_residual, self.tolerances.dual),
+            "complementarity": (self.complementarity, self.tolerances.complementarity),
+            "gap": (self.duality_gap, self.tolerances.gap),
+        }
+        return [name for name, (value, tolerance) in checks.items() if value is not None and not value <= tolerance]
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+
+def verify(
+    arrays: LpArrays,
+    x: np.ndarray,
+    duals: np.ndarray | None = None,
+    reduced_costs: np.ndarray | None = None,
+    tolerances: CertificateTolerances = CertificateTolerances(),
+) -> Certificate:
+    """
+    Measure how far a solution is from a certified optimum.
+
+    Duals are the derivatives of the optimal value with respect to the right-hand sides, and reduced costs
+    ``c - A^T y``, both in the sense of the objective (as PuLP and the native engines report them).
+
+    :param arrays: The problem.
+    :param x: Variable values.
+    :param duals: Shadow prices, one per constraint; None only checks feasibility.
+    :param reduced_costs: Reduced costs, one per variable; computed from the duals when None.
+    :param tolerances: Tolerances of the returned certificate.
+    :return: The certificate.
+    """
+    x = np.asarray(x, dtype=float)
+    senses = np.array([symbol.value for symbol in arrays.senses])
+    less = senses == ConstraintSymbol.LESS_THAN_OR_EQUAL.value
+    greater = senses == ConstraintSymbol.GREATER_THAN_OR_EQUAL.value
+
+    activity = arrays.A @ x
+    slack = arrays.b - activity
+    # Residuals are relative to the size of the terms they come from.
+    magnitude = np.abs(arrays.A)
+    row_scale = 1.0 + np.maximum(np.abs(arrays.b), magnitude @ np.abs(x))
+    row_violation = np.where(less, np.maximum(-slack, 0.0), np.where(greater, np.maximum(slack, 0.0), np.abs(slack)))
+    with np.errstate(invalid="ignore"):
+        bound_violation = np.maximum(np.maximum(arrays.lower - x, 0.0), np.maximum(x - arrays.upper, 0.0))
+    primal = max(
+        float(np.max(row_violation / row_scale, initial=0.0)),
+        float(np.max(bound_violation / (1.0 + np.abs(x)), initial=0.0)),
+    )
+
+    integer = arrays.integer_mask
+    integrality = float(np.max(np.abs(x[integer] - np.round(x[integer])), initial=0.0))
+
+    if duals is None:
+        return Certificate(primal, integrality, None, None, None, tolerances)
+
+    y = np.asarray(duals, dtype=float)
+    expected = arrays.c - arrays.A.T @ y
+    d = expected if reduced_costs is None else np.asarray(reduced_costs, dtype=float)
+    # Improvement direction: maximizing gains from positive duals on <= rows, minimizing from negative.
+    sense = 1.0 if arrays.maximize else -1.0
+    cost_scale = 1.0 + np.maximum(np.abs(arrays.c), magnitude.T @ np.abs(y))
+
+    row_sign_violation = np.where(less, np.maximum(-sense * y, 0.0), np.where(greater, np.maximum(sense * y, 0.0), 0.0))
+    with np.errstate(invalid="ignore"):
+        at_lower = np.isfinite(arrays.lower) & (np.abs(x - arrays.lower) <= tolerances.primal * (1.0 + np.abs(x)))
+        at_upper = np.isfinite(arrays.upper) & (np.abs(x - arrays.upper) <= tolerances.primal * (1.0 + np.abs(x)))
+    # A variable at its lower bound may only lose from increasing, one at its upper bound from decreasing.
+    column_violation = np.where(
+        at_lower & at_upper,
+        0.0,
+        np.where(at_lower, np.maximum(sense * d, 0.0), np.where(at_upper, np.maximum(-sense * d, 0.0), np.abs(d))),
+    )
+    dual = max(
+        float(np.max(row_sign_violation / (1.0 + np.abs(y)), initial=0.0)),
+        float(np.max(column_violation / cost_scale, initial=0.0)),
+        float(np.max(np.abs(d - expected) / cost_scale, initial=0.0)),
+    )
+
+    # Reduced costs within the dual tolerance count as zero: they push against no bound.
+    d = np.where(np.abs(d) <= tolerances.dual * cost_scale, 0.0, d)
+    objective = float(arrays.c @ x)
+    objective_scale = 1.0 + abs(objective)
+    with np.errstate(invalid="ignore"):
+        distance = np.where(
+            sense * d < 0.0,
+            np.where(np.isfinite(arrays.lower), x - arrays.lower, 0.0),
+            np.where(np.isfinite(arrays.upper), arrays.upper - x, 0.0),
+        )
+    inequality = less | greater
+    complementarity = max(
+        float(np.max(np.abs(y[inequality] * slack[inequality]), initial=0.0)),
+        float(np.max(np.abs(d * distance), initial=0.0)),
+    ) / objective_scale
+
+    # Dual objective: b^T y plus each reduced cost times the bound it pushes the variable to.
+    with np.errstate(invalid="ignore"):
+        bound = np.where(sense * d < 0.0, arrays.lower, arrays.upper)
+        bound_terms = np.where(d == 0.0, 0.0, d * bound)
+    dual_objective = float(arrays.b @ y + np.sum(bound_terms))
+    gap = abs(objective - dual_objective) / objective_scale if np.isfinite(dual_objective) else np.inf
+
+    return Certificate(primal, integrality, dual, complementarity, gap, tolerances)
+
+
+def verify_result(arrays: LpArrays, result: SimplexResult, tolerances: CertificateTolerances = CertificateTolerances()) -> Certificate:
+    """Verify an optimal native result; mixed-integer results are only checked for feasibility."""
+    if arrays.is_mixed_integer:
+        return verify(arrays, result.x, tolerances=tolerances)
+    return verify(arrays, result.x, result.duals, result.reduced_costs, tolerances)
+
+
+def solve_verified(
+    arrays: LpArrays,
+    basis: np.ndarray | None = None,
+    tolerances: CertificateTolerances = CertificateTolerances(),
+) -> tuple[SimplexResult, Certificate | None]:
+    """
+    Solve a linear program, warm-started from ``basis``, and verify the result.
+
+    An optimal result that fails verification is solved again from scratch; the second result is kept
+    when it is not worse. Batch tools use this to re-solve and flag failing results.
+
+    :return: The result and its certificate (None when the result is not optimal).
+    """
+    result = RevisedSimplex(arrays).solve(basis)
+    if not result.is_optimal:
+        return result, None
+    certificate = verify_result(arrays, result, tolerances)
+    if certificate.passed or basis is None:
+        return result, certificate
+
+    retry = RevisedSimplex(arrays).solve()
+    if retry.is_optimal:
+        retry_certificate = verify_result(arrays, retry, tolerances)
+        if retry_certificate.passed or len(retry_certificate.failures) <= len(certificate.failures):
+            return retry, retry_certificate
+    return result, certificate
@@ -0,0 +1,358 @@
+"""
+Column generation around the native simplex.
+
+For problems with too many columns to write down (cutting patterns, routes, schedules), the master LP is
+restricted to a few columns and a pricing oracle looks for a column with a negative reduced cost under
+the master's current duals. Each new column joins the master, which is re-solved warm from its previous
+basis (a primal simplex continuation, since the old basis stays feasible). When the oracle finds nothing,
+the restricted master's optimum is the optimum over all columns.
+
+The oracle is any callable from the duals to candidate columns; ``KnapsackPricing`` is the built-in one for
+cutting stock. Columns that stay nonbasic with a nonzero reduced cost age, one round at a time, and leave
+the master for a bounded pool once they are too old (or when the master is over its column limit). The
+pool is priced before the oracle, so a column that becomes attractive again returns without asking the
+oracle; the oldest pool columns are deleted when the pool is full.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, SimplexResult, NOT_SOLVED
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    A column of the master problem.
+
+    :param coefficients: Coefficient in each master row.
+    :param cost: Objective coefficient.
+    :param name: Variable name; generated when empty.
+    :param lower: Lower bound of the variable.
+    :param upper: Upper bound of the variable.
+    """
+    coefficients: np.ndarray = field(repr=False)
+    cost: float
+    name: str = ""
+    lower: float = 0.0
+    upper: float = np.inf
+
+
+PricingOracle = Callable[[np.ndarray], Iterable[Column]]
+"""Receives the master duals (``SimplexResult.duals``) and returns candidate columns."""
+
+
+@dataclass(frozen=True)
+class ColumnGenerationOptions:
+    """
+    :param max_rounds: Maximum number of master solves.
+    :param tolerance: Relative reduced cost below which a column improves the master.
+    :param max_age: Rounds a column may stay nonbasic with a nonzero reduced cost before it leaves the master.
+    :param max_columns: Largest number of master columns; None for no limit. Basic columns are always kept.
+    :param pool_size: Largest number of columns kept in the pool for later rounds.
+    """
+    max_rounds: int = 1_000
+    tolerance: float = 1e-9
+    max_age: int = 10
+    max_columns: int | None = None
+    pool_size: int = 1_000
+
+
+@dataclass
+class ColumnGenerationStatistics:
+    """Statistics of a column generation run."""
+    rounds: int = 0
+    pricing_calls: int = 0
+    columns_generated: int = 0
+    columns_from_pool: int = 0
+    columns_retired: int = 0
+    columns_deleted: int = 0
+    largest_master: int = 0
+    master_iterations: int = 0
+    elapsed: float = 0.0
+    round_limit_reached: bool = False
+
+
+@dataclass
+class _Entry:
+    column: Column
+    age: int = 0
+
+
+class ColumnGeneration:
+    """
+    Column generation loop with a warm-started restricted master.
+
+    :param master: The restricted master: its rows and the initial columns, which must make it feasible.
+        Generated columns are continuous, like the master.
+    :param pricing: The pricing oracle.
+    :param options: Loop and pool options.
+    :param progress: Receives throttled progress events with the round and the master objective.
+    """
+
+    def __init__(
+        self,
+        master: LpArrays,
+        pricing: PricingOracle,
+        options: ColumnGenerationOptions = ColumnGenerationOptions(),
+        progress: ProgressReporter | None = None,
+    ):
+        if master.is_mixed_integer:
+            raise ValueError("The restricted master must be a linear program.")
+        self.master = master
+        self.pricing = pricing
+        self.options = options
+        self.progress = progress
+        self.statistics = ColumnGenerationStatistics()
+        self.columns: list[Column] = []
+        self._sign = -1.0 if master.maximize else 1.0
+
+    def solve(self) -> SimplexResult:
+        """
+        Run the column generation.
+
+        :return: The result of the final restricted master; ``x`` follows ``self.columns``. If the round
+            limit stopped the loop, the status is ``"Not Solved"`` and the last master solution is returned.
+            An infeasible restricted master is reported as infeasible, since no duals are available to price.
+        """
+        start = time.perf_counter()
+        self.statistics = ColumnGenerationStatistics()
+        try:
+            return self._loop()
+        finally:
+            self.statistics.elapsed = time.perf_counter() - start
+
+    def _loop(self) -> SimplexResult:
+        statistics = self.statistics
+        master = self.master
+        active = [
+            _Entry(Column(master.A[:, j].copy(), float(master.c[j]), name, float(low), float(up)))
+            for j, (name, low, up) in enumerate(zip(master.variable_names, master.lower, master.upper))
+        ]
+        pool: list[Column] = []
+        basis = None
+        named = 0
+
+        while True:
+            self.columns = [entry.column for entry in active]
+            arrays = self._arrays(self.columns)
+            result = RevisedSimplex(arrays).solve(basis)
+            statistics.rounds += 1
+            statistics.master_iterations += result.iterations
+            statistics.largest_master = max(statistics.largest_master, len(active))
+            if not result.is_optimal:
+                return result
+            basis = result.basis
+            threshold = self.options.tolerance * max(1.0, abs(result.objective_value))
+
+            # A column ages while it is nonbasic and its reduced cost keeps it out.
+            basic = np.zeros(len(active), dtype=bool)
+            basic[basis[basis < len(active)]] = True
+            idle = ~basic & (np.abs(result.reduced_costs) > threshold)
+            for entry, is_idle in zip(active, idle):
+                entry.age = entry.age + 1 if is_idle else 0
+
+            new = self._from_pool(pool, result.duals, threshold)
+            statistics.columns_from_pool += len(new)
+            if not new:
+                statistics.pricing_calls += 1
+                new = [
+                    column for column in self.pricing(result.duals)
+                    if self._reduced_cost(column, result.duals) < -threshold
+                ]
+                statistics.columns_generated += len(new)
+            self._report(result, statistics)
+            if not new:
+                return result
+            if statistics.rounds >= self.options.max_rounds:
+                statistics.round_limit_reached = True
+                return replace(result, status=NOT_SOLVED)
+
+            old_columns = len(active)
+            kept = self._retire(active, basic, len(new), pool)
+            for column in new:
+                if not column.name:
+                    named += 1
+                    column = replace(column, name=f"c{named}")
+                active.append(_Entry(column))
+            basis = self._remap(basis, old_columns, kept, len(active))
+
+    def _arrays(self, columns: list[Column]) -> LpArrays:
+        master = self.master
+        return replace(
+            master,
+            c=np.array([column.cost for column in columns]),
+            A=np.array([column.coefficients for column in columns], dtype=float).T.reshape(master.shape[0], len(columns)),
+            variable_names=tuple(column.name for column in columns),
+            lower=np.array([column.lower for column in columns]),
+            upper=np.array([column.upper for column in columns]),
+            categories=(),
+        )
+
+    def _reduced_cost(self, column: Column, duals: np.ndarray) -> float:
+        """Reduced cost in the minimization sense: negative when the column improves the master."""
+        return self._sign * (column.cost - duals @ column.coefficients)
+
+    def _from_pool(self, pool: list[Column], duals: np.ndarray, threshold: float) -> list[Column]:
+        """Take the pool columns that improve the master under ``duals`` out of the pool."""
+        if not pool:
+            return []
+        costs = np.array([column.cost for column in pool])
+        coefficients = np.array([column.coefficients for column in pool])
+        improving = self._sign * (costs - coefficients @ duals) < -threshold
+        returning = [column for column, take in zip(pool, improving) if take]
+        pool[:] = [column for column, take in zip(pool, improving) if not take]
+        return returning
+
+    def _retire(self, active: list[_Entry], basic: np.ndarray, incoming: int, pool: list[Column]) -> np.ndarray:
+        """
+        Move aged columns (and the oldest nonbasic ones, while the master is over its limit) to the pool.
+
+        :return: The previous positions of the columns that stay, in their new order.
+        """
+        ages = np.array([entry.age for entry in active])
+        retire = ~basic & (ages > self.options.max_age)
+        if self.options.max_columns is not None:
+            excess = len(active) - int(retire.sum()) + incoming - self.options.max_columns
+            if excess > 0:
+                candidates = np.flatnonzero(~basic & ~retire)
+                retire[candidates[np.argsort(-ages[candidates], kind="stable")[:excess]]] = True
+
+        for j in np.flatnonzero(retire):
+            pool.append(active[j].column)
+        self.statistics.columns_retired += int(retire.sum())
+        overflow = len(pool) - self.options.pool_size
+        if overflow > 0:
+            del pool[:overflow]
+            self.statistics.columns_deleted += overflow
+
+        kept = np.flatnonzero(~retire)
+        active[:] = [active[j] for j in kept]
+        return kept
+
+    @staticmethod
+    def _remap(basis: np.ndarray, old_columns: int, kept: np.ndarray, new_columns: int) -> np.ndarray:
+        """
+        The basis in the new master: kept columns move to their new position, slack columns follow the new column count.
+
+        Only nonbasic columns leave, so every basic column is among the kept ones.
+        """
+        position = np.full(old_columns, -1)
+        position[kept] = np.arange(kept.size)
+        structural = basis < old_columns
+        remapped = basis + (new_columns - old_columns)
+        remapped[structural] = position[basis[structural]]
+        return remapped
+
+    def _report(self, result: SimplexResult, statistics: ColumnGenerationStatistics):
+        if self.progress is None or not self.progress.due():
+            return
+        self.progress.emit(ProgressEvent(
+            phase=SolvePhase.COLUMN_GENERATION,
+            iteration=statistics.rounds,
+            objective_value=result.objective_value,
+            primal_infeasibility=None,
+            dual_infeasibility=None,
+            elapsed=self.progress.elapsed,
+        ))
+
+
+class KnapsackPricing:
+    """
+    Pricing oracle of the cutting stock problem: the pattern of largest dual value that fits in a roll.
+
+    Solves ``max duals @ a  s.t.  widths @ a <= roll_width``, with integer ``a >= 0`` (at most the demand
+    of each item when ``demands`` is given), by dynamic programming over the roll width. Counts are split in
+    powers of two, so the table has ``sum(log2(count))`` rows instead of one per copy.
+
+    :param widths: Integer width of each item (one master row per item).
+    :param roll_width: Integer width of a roll.
+    :param demands: Largest count of each item in a pattern; None allows as many as fit.
+    """
+
+    def __init__(self, widths, roll_width: int, demands=None):
+        widths = np.asarray(widths, dtype=float)
+        if np.any(widths != np.round(widths)) or roll_width != int(roll_width):
+            raise ValueError("Knapsack pricing needs integer widths.")
+        if np.any(widths <= 0) or np.any(widths > roll_width):
+            raise ValueError("Every width must be positive and fit in a roll.")
+        self.widths = widths.astype(int)
+        self.roll_width = int(roll_width)
+        fits = self.roll_width // self.widths
+        self.counts = fits if demands is None else np.minimum(fits, np.asarray(demands, dtype=int))
+        self.patterns = 0
+
+    def __call__(self, duals: np.ndarray) -> list[Column]:
+        pattern = self.best_pattern(duals)
+        if duals @ pattern <= 1.0:
+            return []
+        self.patterns += 1
+        return [Column(pattern.astype(float), 1.0, f"pattern {self.patterns}")]
+
+    def best_pattern(self, values: np.ndarray) -> np.ndarray:
+        """
+        The pattern of largest total value.
+
+        :param values: Value of one piece of each item.
+        :return: Count of each item in the pattern.
+        """
+        items, weights, copies = [], [], []
+        for i in np.flatnonzero(values > 0):
+            remaining, chunk = int(self.counts[i]), 1
+            while remaining > 0:
+                take = min(chunk, remaining)
+                items.append(i)
+                weights.append(take * int(self.widths[i]))
+                copies.append(take)
+                remaining -= take
+                chunk *= 2
+
+        best = np.zeros(self.roll_width + 1)
+        took = np.zeros((len(items), self.roll_width + 1), dtype=bool)
+        for t, (i, weight, count) in enumerate(zip(items, weights, copies)):
+            candidate = best[:-weight] + count * values[i] if weight <= self.roll_width else np.empty(0)
+            better = np.zeros(self.roll_width + 1, dtype=bool)
+            better[weight:] = candidate > best[weight:] + 1e-12
+            best = np.where(better, np.concatenate([best[:weight], candidate]), best)
+            took[t] = better
+
+        pattern = np.zeros(self.widths.size, dtype=int)
+        capacity = self.roll_width
+        for t in range(len(items) - 1, -1, -1):
+            if took[t, capacity]:
+                pattern[items[t]] += copies[t]
+                capacity -= weights[t]
+        return pattern
+
+
+def cutting_stock_master(widths, demands, roll_width: int) -> LpArrays:
+    """
+    Restricted master of the cutting stock problem: ``min rolls  s.t.  pieces of each item >= demand``.
+
+    The initial columns cut as many pieces of a single item as fit in a roll, which covers any demand.
+
+    :param widths: Width of each item.
+    :param demands: Pieces needed of each item.
+    :param roll_width: Width of a roll.
+    :return: The master, to be solved with ``ColumnGeneration`` and ``KnapsackPricing``.
+    """
+    widths = np.asarray(widths, dtype=float)
+    demands = np.asarray(demands, dtype=float)
+    items = widths.size
+    return LpArrays(
+        c=np.ones(items),
+        A=np.diag(np.floor(roll_width / widths)),
+        b=demands,
+        senses=(ConstraintSymbol.GREATER_THAN_OR_EQUAL,) * items,
+        maximize=False,
+        variable_names=tuple(f"only {width:g}" for width in widths),
+        constraint_names=tuple(f"demand {width:g}" for width in widths),
+        lower=np.zeros(items),
+        upper=np.full(items, np.inf),
+    )
@@ -0,0 +1,524 @@
+"""
+Dantzig–Wolfe decomposition of block-angular problems.
+
+In a block-angular problem the rows and columns split into independent blocks, tied together only by a
+few linking rows (shared resources). Every point of a block's feasible set is a convex combination of
+its vertices plus a nonnegative combination of its extreme rays, so the problem can be written over
+those weights instead: the master problem keeps the linking rows, plus one convexity row per block.
+
+The master is restricted to the vertices and rays found so far. Each round its duals price the blocks
+(each block's own rows, with the objective ``c_k - duals @ A0_k``); the blocks are solved in parallel
+and every vertex or ray with a negative reduced cost joins the master, which is then re-solved warm
+from its previous basis. When no block prices out, the master solution is optimal for the whole problem,
+the master's linking-row duals are the shadow prices of the linking rows and the duals of the last
+pricing solves are those of the block rows. A first phase with artificial columns in the linking rows
+finds a feasible master before the real costs are used.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, SimplexResult, OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+from methods.workers import solver_pool
+
+
+@dataclass(frozen=True)
+class BlockStructure:
+    """
+    Partition of a problem into blocks linked by a few rows.
+
+    :param linking_rows: Rows shared by the blocks; they stay in the master problem.
+    :param block_rows: Rows of each block.
+    :param block_columns: Columns of each block. Columns in no block only appear in linking rows (or in
+        no row) and stay in the master problem as they are.
+    """
+    linking_rows: tuple[int, ...]
+    block_rows: tuple[tuple[int, ...], ...]
+    block_columns: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_rows(cls, arrays: LpArrays, block_rows) -> "BlockStructure":
+        """
+        Build the structure from the rows of each block; every other row is a linking row.
+
+        :param arrays: The problem.
+        :param block_rows: Row indices of each block.
+        :return: The structure, with the columns of each block read from its rows.
+        """
+        m, n = arrays.shape
+        owner = np.full(m, -1)
+        for k, rows in enumerate(block_rows):
+            for i in rows:
+                if not 0 <= i < m:
+                    raise ValueError(f"Block {k + 1} refers to row {i}, but the problem has {m} constraints.")
+                if owner[i] >= 0:
+                    raise ValueError(f"Constraint {arrays.constraint_names[i]} is in blocks {owner[i] + 1} and {k + 1}.")
+                owner[i] = k
+
+        column_owner = np.full(n, -1)
+        for k, rows in enumerate(block_rows):
+            columns = np.flatnonzero((arrays.A[list(rows)] != 0).any(axis=0)) if len(rows) else np.empty(0, dtype=int)
+            for j in columns:
+                if column_owner[j] >= 0:
+                    raise ValueError(
+                        f"Variable {arrays.variable_names[j]} appears in blocks {column_owner[j] + 1} and {k + 1}; "
+                        "a variable must belong to one block or only to linking constraints."
+                    )
+                column_owner[j] = k
+
+        return cls(
+            linking_rows=tuple(int(i) for i in np.flatnonzero(owner < 0)),
+            block_rows=tuple(tuple(sorted(int(i) for i in rows)) for rows in block_rows),
+            block_columns=tuple(tuple(int(j) for j in np.flatnonzero(column_owner == k)) for k in range(len(block_rows))),
+        )
+
+    @property
+    def blocks(self) -> int:
+        return len(self.block_rows)
+
+
+class _Components:
+    """Union-find over the columns, counting the groups of columns that share a row."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.touched = [False] * n
+        self.count = 0
+
+    def find(self, j: int) -> int:
+        while self.parent[j] != j:
+            self.parent[j] = self.parent[self.parent[j]]
+            j = self.parent[j]
+        return j
+
+    def add_row(self, columns) -> None:
+        if not len(columns):
+            return
+        roots = {self.find(j) for j in columns if self.touched[j]}
+        self.count += 1 - len(roots)
+        root = self.find(columns[0])
+        for j in columns:
+            self.parent[self.find(j)] = root
+            self.touched[j] = True
+
+
+def detect_blocks(arrays: LpArrays, max_linking_fraction: float = 0.25) -> BlockStructure | None:
+    """
+    Find a block-angular structure: the fewest linking rows whose removal splits the rest into blocks.
+
+    Linking rows are usually the densest, so the candidates are the densest rows, up to
+    ``max_linking_fraction`` of them. The rows are added back from the sparsest candidate to the
+    densest while counting the blocks, which gives the block count for every number of linking rows in
+    one pass. Linking rows that only touch one block are then moved into it.
+
+    :param arrays: The problem.
+    :param max_linking_fraction: Largest share of the rows that may be linking rows.
+    :return: The structure, or None when no split into at least two blocks was found.
+    """
+    m, n = arrays.shape
+    pattern = arrays.A != 0
+    row_columns = [np.flatnonzero(row).tolist() for row in pattern]
+    order = np.argsort(-pattern.sum(axis=1), kind="stable")
+    limit = min(int(max_linking_fraction * m), m - 1) if m else 0
+
+    components = _Components(n)
+    for i in order[limit:]:
+        components.add_row(row_columns[i])
+    counts = {limit: components.count}
+    for k in range(limit, 0, -1):
+        components.add_row(row_columns[order[k - 1]])
+        counts[k - 1] = components.count
+    linking_count = next((k for k in range(limit + 1) if counts[k] >= 2), None)
+    if linking_count is None:
+        return None
+
+    linking = set(order[:linking_count].tolist())
+    components = _Components(n)
+    for i in range(m):
+        if i not in linking:
+            components.add_row(row_columns[i])
+    roots = sorted({components.find(j) for j in range(n) if components.touched[j]})
+    label = {root: k for k, root in enumerate(roots)}
+    column_block = np.array([label[components.find(j)] if components.touched[j] else -1 for j in range(n)], dtype=int)
+
+    block_rows: list[list[int]] = [[] for _ in roots]
+    for i in range(m):
+        blocks = set(column_block[row_columns[i]].tolist()) - {-1}
+        if i not in linking:
+            # Rows without coefficients stay with the linking rows.
+            if blocks:
+                block_rows[blocks.pop()].append(i)
+        elif len(blocks) == 1 and np.all(column_block[row_columns[i]] >= 0):
+            block_rows[blocks.pop()].append(i)
+            linking.discard(i)
+
+    return BlockStructure.from_rows(arrays, [rows for rows in block_rows if rows])
+
+
+@dataclass(frozen=True)
+class DecompositionOptions:
+    """
+    :param blocks: Rows of each block; None detects the block structure.
+    :param workers: Number of processes solving the blocks in parallel (1 solves them in-process).
+    :param max_rounds: Maximum number of master solves.
+    :param tolerance: Relative reduced cost below which a column joins the master.
+    """
+    blocks: tuple[tuple[int, ...], ...] | None = None
+    workers: int = 1
+    max_rounds: int = 1_000
+    tolerance: float = 1e-7
+
+
+@dataclass
+class DecompositionStatistics:
+    """Statistics of a decomposed solve, with objective values in the sense of the original problem."""
+    blocks: int = 0
+    linking_rows: tuple[int, ...] = ()
+    rounds: int = 0
+    columns: int = 0
+    master_iterations: int = 0
+    pricing_iterations: int = 0
+    elapsed: float = 0.0
+    best_bound: float | None = None
+    objective: float | None = None
+    round_limit_reached: bool = False
+
+    @property
+    def gap(self) -> float | None:
+        if self.objective is None or self.best_bound is None:
+            return None
+        return abs(self.objective - self.best_bound) / max(1.0, abs(self.objective))
+
+
+@dataclass(frozen=True)
+class _Column:
+    """A vertex (or ray) of one block, as a column of the master problem."""
+    block: int
+    values: np.ndarray = field(repr=False)
+    is_ray: bool
+    cost: float
+    linking: np.ndarray = field(repr=False)
+
+
+def _price_block(arrays: LpArrays, basis: np.ndarray | None, need_point: bool) -> tuple[SimplexResult, SimplexResult | None]:
+    """
+    Solve one pricing problem, warm-started from the block's previous basis.
+
+    :param need_point: Also find a vertex when the block is unbounded (the first columns need one).
+    :return: The result, and the vertex found with a zero objective when the block was unbounded and a vertex is needed.
+    """
+    result = RevisedSimplex(arrays).solve(basis)
+    point = None
+    if result.status == UNBOUNDED and need_point:
+        point = RevisedSimplex(arrays.with_objective(np.zeros_like(arrays.c))).solve()
+    return result, point
+
+
+class DantzigWolfe:
+    """
+    Dantzig–Wolfe column generation on top of the native simplex.
+
+    :param arrays: The problem, which must be continuous.
+    :param structure: Its block structure.
+    :param options: Solve options.
+    :param progress: Receives throttled progress events with the round and the master objective.
+    """
+
+    def __init__(
+        self,
+        arrays: LpArrays,
+        structure: BlockStructure,
+        options: DecompositionOptions = DecompositionOptions(),
+        progress: ProgressReporter | None = None,
+    ):
+        if arrays.is_mixed_integer:
+            raise ValueError("The decomposition only solves linear programs.")
+        self.arrays = arrays
+        self.structure = structure
+        self.options = options
+        self.progress = progress
+        self.statistics = DecompositionStatistics()
+
+        m, n = arrays.shape
+        self._sign = -1.0 if arrays.maximize else 1.0
+        self._cost = self._sign * arrays.c
+        self._linking = np.array(structure.linking_rows, dtype=int)
+        self._A0 = arrays.A[self._linking]
+        self._columns_of = [np.array(columns, dtype=int) for columns in structure.block_columns]
+        in_block = np.zeros(n, dtype=bool)
+        for columns in self._columns_of:
+            in_block[columns] = True
+        self._master_columns = np.flatnonzero(~in_block)
+
+        # One artificial column per linking row (two for equalities) makes the first master feasible.
+        signs = []
+        for i in self._linking:
+            match arrays.senses[i]:
+                case ConstraintSymbol.LESS_THAN_OR_EQUAL:
+                    signs.append((i, -1.0))
+                case ConstraintSymbol.GREATER_THAN_OR_EQUAL:
+                    signs.append((i, 1.0))
+                case _:
+                    signs.extend([(i, 1.0), (i, -1.0)])
+        self._artificials = np.zeros((len(self._linking), len(signs)))
+        position = {int(i): p for p, i in enumerate(self._linking)}
+        for a, (i, sign) in enumerate(signs):
+            self._artificials[position[int(i)], a] = sign
+
+        self._blocks = [
+            LpArrays(
+                c=self._cost[columns],
+                A=arrays.A[np.ix_(rows, columns)],
+                b=arrays.b[list(rows)],
+                senses=tuple(arrays.senses[i] for i in rows),
+                maximize=False,
+                variable_names=tuple(arrays.variable_names[j] for j in columns),
+                constraint_names=tuple(arrays.constraint_names[i] for i in rows),
+                lower=arrays.lower[columns],
+                upper=arrays.upper[columns],
+            )
+            for rows, columns in zip(structure.block_rows, self._columns_of)
+        ]
+        self._generated: list[_Column] = []
+
+    def solve(self) -> SimplexResult:
+        """
+        Run the column generation.
+
+        :return: The result of the original problem, without a basis. The status is ``"Not Solved"``
+            when the round limit stopped the column generation before it converged.
+        """
+        start = time.perf_counter()
+        statistics = self.statistics = DecompositionStatistics(
+            blocks=self.structure.blocks, linking_rows=self.structure.linking_rows
+        )
+        self._generated = []
+        try:
+            return self._column_generation()
+        finally:
+            statistics.elapsed = time.perf_counter() - start
+
+    def _column_generation(self) -> SimplexResult:
+        statistics = self.statistics
+        executor = solver_pool(self.options.workers) if self.structure.blocks > 1 else None
+        bases: list[np.ndarray | None] = [None] * self.structure.blocks
+
+        # The first columns: each block's own optimum, or any vertex and a ray when it is unbounded.
+        priced = self._price(executor, [block.c for block in self._blocks], bases, need_point=True)
+        for k, (result, point) in enumerate(priced):
+            statistics.pricing_iterations += result.iterations
+            if result.status in (INFEASIBLE, NOT_SOLVED):
+                return self._empty_result(result.status)
+            if result.status == UNBOUNDED:
+                if point is None or not point.is_optimal:
+                    return self._empty_result(point.status if point is not None else NOT_SOLVED)
+                self._add_column(k, point.x, is_ray=False)
+                self._add_column(k, result.ray, is_ray=True)
+            else:
+                self._add_column(k, result.x, is_ray=False)
+                bases[k] = result.basis
+
+        phase = 1 if self._linking.size else 2
+        scale = 1.0 + np.abs(self.arrays.b[self._linking]).max(initial=0.0)
+        basis = None
+        while True:
+            if statistics.rounds >= self.options.max_rounds:
+                statistics.round_limit_reached = True
+                return self._empty_result(NOT_SOLVED)
+            statistics.rounds += 1
+
+            columns_before = self._master_size()
+            master = RevisedSimplex(self._master(phase)).solve(basis)
+            statistics.master_iterations += master.iterations
+            if master.status == UNBOUNDED and phase == 2:
+                return self._unbounded_result(master.ray)
+            if not master.is_optimal:
+                return self._empty_result(master.status)
+            basis = master.basis
+
+            p = self._linking.size
+            prices, convexity = master.duals[:p], master.duals[p:]
+            phase_costs = [block.c if phase == 2 else np.zeros_like(block.c) for block in self._blocks]
+            costs = [cost - prices @ self._A0[:, columns] for cost, columns in zip(phase_costs, self._columns_of)]
+            priced = self._price(executor, costs, bases, need_point=False)
+
+            threshold = -self.options.tolerance * max(1.0, abs(master.objective_value))
+            bound = master.objective_value
+            added = 0
+            for k, (result, _) in enumerate(priced):
+                statistics.pricing_iterations += result.iterations
+                if result.status == UNBOUNDED:
+                    self._add_column(k, result.ray, is_ray=True)
+                    added += 1
+                    bound = -np.inf
+                    continue
+                if not result.is_optimal:
+                    return self._empty_result(result.status)
+                bases[k] = result.basis
+                reduced_cost = result.objective_value - convexity[k]
+                bound += min(reduced_cost, 0.0)
+                if reduced_cost < threshold:
+                    self._add_column(k, result.x, is_ray=False)
+                    added += 1
+
+            if phase == 2:
+                statistics.objective = self._sign * master.objective_value
+                if np.isfinite(bound):
+                    best = self._sign * bound
+                    if statistics.best_bound is None or self._sign * (best - statistics.best_bound) > 0:
+                        statistics.best_bound = best
+            self._report(phase, master, priced, convexity)
+
+            if added:
+                # New columns go before the slack columns of the master's standard form.
+                basis = np.where(basis >= columns_before, basis + added, basis)
+                continue
+            if phase == 2:
+                statistics.best_bound = statistics.objective
+                return self._optimal_result(master, priced)
+            if master.objective_value > self.options.tolerance * scale:
+                return self._empty_result(INFEASIBLE)
+            phase = 2
+
+    def _price(self, executor, costs: list[np.ndarray], bases: list[np.ndarray | None], need_point: bool):
+        """Solve every block with its pricing objective, in parallel when a pool is given."""
+        blocks = [block.with_objective(cost) for block, cost in zip(self._blocks, costs)]
+        points = [need_point] * len(blocks)
+        if executor is None:
+            return list(map(_price_block, blocks, bases, points))
+        return list(executor.map(_price_block, blocks, bases, points))
+
+    def _add_column(self, block: int, values: np.ndarray, is_ray: bool):
+        columns = self._columns_of[block]
+        self._generated.append(_Column(
+            block=block,
+            values=np.asarray(values, dtype=float).copy(),
+            is_ray=is_ray,
+            cost=float(self._cost[columns] @ values),
+            linking=self._A0[:, columns] @ values,
+        ))
+        self.statistics.columns += 1
+
+    def _master_size(self) -> int:
+        return self._master_columns.size + self._artificials.shape[1] + len(self._generated)
+
+    def _master(self, phase: int) -> LpArrays:
+        """
+        The restricted master: original columns outside the blocks, artificial columns, then the generated columns.
+
+        Rows are the linking rows followed by one convexity row per block. The artificial columns cost 1
+        in phase one and are fixed at zero in phase two, where the other columns take their real costs.
+        """
+        n0 = self._master_columns.size
+        artificials = self._artificials.shape[1]
+        generated = len(self._generated)
+        blocks = self.structure.blocks
+
+        linking = np.hstack([
+            self._A0[:, self._master_columns],
+            self._artificials,
+            np.array([column.linking for column in self._generated]).T.reshape(self._linking.size, generated),
+        ])
+        convexity = np.zeros((blocks, n0 + artificials + generated))
+        for g, column in enumerate(self._generated):
+            if not column.is_ray:
+                convexity[column.block, n0 + artificials + g] = 1.0
+
+        if phase == 1:
+            cost = np.concatenate([np.zeros(n0), np.ones(artificials), np.zeros(generated)])
+        else:
+            cost = np.concatenate([
+                self._cost[self._master_columns], np.zeros(artificials), [column.cost for column in self._generated]
+            ])
+        return LpArrays(
+            c=cost,
+            A=np.vstack([linking, convexity]),
+            b=np.concatenate([self.arrays.b[self._linking], np.ones(blocks)]),
+            senses=tuple(self.arrays.senses[i] for i in self._linking) + (ConstraintSymbol.EQUAL,) * blocks,
+            maximize=False,
+            variable_names=tuple(self.arrays.variable_names[j] for j in self._master_columns)
+            + tuple(f"a{a + 1}" for a in range(artificials))
+            + tuple(f"w{g + 1}" for g in range(generated)),
+            constraint_names=tuple(self.arrays.constraint_names[i] for i in self._linking)
+            + tuple(f"convexity {k + 1}" for k in range(blocks)),
+            lower=np.concatenate([self.arrays.lower[self._master_columns], np.zeros(artificials + generated)]),
+            upper=np.concatenate([
+                self.arrays.upper[self._master_columns],
+                np.full(artificials, np.inf if phase == 1 else 0.0),
+                np.full(generated, np.inf),
+            ]),
+        )
+
+    def _combine(self, weights: np.ndarray) -> np.ndarray:
+        """Values of the original variables for master values (or a master direction) ``weights``."""
+        n0 = self._master_columns.size
+        offset = n0 + self._artificials.shape[1]
+        x = np.zeros(self.arrays.shape[1])
+        x[self._master_columns] = weights[:n0]
+        for g, column in enumerate(self._generated):
+            if weights[offset + g] != 0.0:
+                x[self._columns_of[column.block]] += weights[offset + g] * column.values
+        return x
+
+    def _optimal_result(self, master: SimplexResult, priced) -> SimplexResult:
+        arrays = self.arrays
+        x = np.clip(self._combine(master.x), arrays.lower, arrays.upper)
+
+        # Linking rows take the master's duals, block rows those of the last pricing solves (same prices).
+        duals = np.zeros(arrays.shape[0])
+        duals[self._linking] = master.duals[: self._linking.size]
+        for rows, (result, _) in zip(self.structure.block_rows, priced):
+            duals[list(rows)] = result.duals
+        duals *= self._sign
+
+        return SimplexResult(
+            status=OPTIMAL,
+            objective_value=float(arrays.c @ x),
+            x=x,
+            slacks=arrays.b - arrays.A @ x,
+            duals=duals,
+            reduced_costs=arrays.c - duals @ arrays.A,
+            basis=np.empty(0, dtype=int),
+            iterations=self.statistics.master_iterations + self.statistics.pricing_iterations,
+        )
+
+    def _unbounded_result(self, ray: np.ndarray | None) -> SimplexResult:
+        result = self._empty_result(UNBOUNDED)
+        result.ray = self._combine(ray) if ray is not None else None
+        return result
+
+    def _empty_result(self, status: str) -> SimplexResult:
+        m, n = self.arrays.shape
+        return SimplexResult(
+            status=status,
+            objective_value=None,
+            x=np.zeros(n),
+            slacks=np.zeros(m),
+            duals=np.zeros(m),
+            reduced_costs=np.zeros(n),
+            basis=np.empty(0, dtype=int),
+            iterations=self.statistics.master_iterations + self.statistics.pricing_iterations,
+        )
+
+    def _report(self, phase: int, master: SimplexResult, priced, convexity: np.ndarray):
+        if self.progress is None or not self.progress.due():
+            return
+        # Sum of the negative reduced costs of the blocks: how far the master still is from optimal.
+        pricing = sum(
+            min(result.objective_value - convexity[k], 0.0)
+            for k, (result, _) in enumerate(priced)
+            if result.is_optimal
+        )
+        self.progress.emit(ProgressEvent(
+            phase=SolvePhase.DECOMPOSITION,
+            iteration=self.statistics.rounds,
+            objective_value=self._sign * master.objective_value if phase == 2 else master.objective_value,
+            primal_infeasibility=master.objective_value if phase == 1 else None,
+            dual_infeasibility=float(-pricing),
+            elapsed=self.progress.elapsed,
+        ))
@@ -0,0 +1,199 @@
+"""
+Diagnosis of infeasible and unbounded problems.
+
+An irreducible infeasible subsystem (IIS) is a set of constraints and variable bounds that has no solution,
+while every proper subset of it does: the smallest explanation of an infeasibility. It is found in two
+steps. The phase-one duals of the failed solve (a Farkas certificate) already name an infeasible
+subsystem, usually a small part of the problem. A deletion filter then drops its members one at a time
+while the rest stays infeasible. Each test is a phase-one problem of the subsystem with one elastic
+variable per member; dropping a member only zeroes the cost of its elastic variables, so every test
+re-optimizes the previous basis without refactorizing. Whenever the rest is still infeasible, the members
+with a zero dual are dropped too, since the new certificate does not use them.
+
+An unbounded problem is explained by a ray: a direction along which every constraint stays satisfied and
+the objective improves without limit.
+"""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, INFEASIBLE, UNBOUNDED
+
+
+class BoundSide(Enum):
+    """Which bound of a variable an IIS member is."""
+    LOWER = "lower"
+    UPPER = "upper"
+
+
+@dataclass(frozen=True)
+class IrreducibleInfeasibleSubsystem:
+    """
+    :param rows: Constraints of the subsystem.
+    :param bounds: Variable bounds of the subsystem, as ``(variable, side)``.
+    :param tests: Phase-one re-optimizations made by the deletion filter.
+    :param elapsed: Seconds spent, including the phase-one solve when no certificate was given.
+    """
+    rows: tuple[int, ...]
+    bounds: tuple[tuple[int, BoundSide], ...]
+    tests: int
+    elapsed: float
+
+
+def _farkas_support(arrays: LpArrays, farkas: np.ndarray, tolerance: float) -> tuple[list[int], list[tuple[int, BoundSide]]]:
+    """Rows and bounds the certificate uses: a negative ``farkas @ A`` holds a variable at its lower bound."""
+    scale = np.abs(farkas).max(initial=0.0)
+    rows = np.flatnonzero(np.abs(farkas) > tolerance * max(scale, 1.0))
+    weights = farkas[rows] @ arrays.A[rows]
+    limit = tolerance * max(np.abs(weights).max(initial=0.0), 1.0)
+    bounds = [(int(j), BoundSide.LOWER) for j in np.flatnonzero((weights < -limit) & np.isfinite(arrays.lower))]
+    bounds += [(int(j), BoundSide.UPPER) for j in np.flatnonzero((weights > limit) & np.isfinite(arrays.upper))]
+    return rows.tolist(), sorted(bounds, key=lambda bound: bound[0])
+
+
+class _ElasticSubsystem:
+    """
+    Phase-one problem of a subsystem: its rows and bound rows, free variables and one elastic column per
+    direction a member can be violated in. The cost of a member's elastic columns is 1 while it is in the
+    subsystem and 0 once dropped.
+    """
+
+    def __init__(self, arrays: LpArrays, rows: list[int], bounds: list[tuple[int, BoundSide]]):
+        columns = np.flatnonzero((arrays.A[rows] != 0).any(axis=0) if rows else np.zeros(arrays.shape[1], dtype=bool))
+        columns = np.union1d(columns, [j for j, _ in bounds]).astype(int)
+        position = {int(j): k for k, j in enumerate(columns)}
+
+        matrix = [arrays.A[i, columns] for i in rows]
+        senses = [arrays.senses[i] for i in rows]
+        rhs = [arrays.b[i] for i in rows]
+        for j, side in bounds:
+            row = np.zeros(columns.size)
+            row[position[j]] = 1.0
+            matrix.append(row)
+            senses.append(ConstraintSymbol.GREATER_THAN_OR_EQUAL if side == BoundSide.LOWER else ConstraintSymbol.LESS_THAN_OR_EQUAL)
+            rhs.append(arrays.lower[j] if side == BoundSide.LOWER else arrays.upper[j])
+
+        # A <= row is violated upwards and needs a -1 elastic column, a >= row +1, an equality both.
+        elastic, self.owner = [], []
+        for member, symbol in enumerate(senses):
+            for sign in {ConstraintSymbol.LESS_THAN_OR_EQUAL: (-1.0,), ConstraintSymbol.GREATER_THAN_OR_EQUAL: (1.0,)}.get(symbol, (1.0, -1.0)):
+                column = np.zeros(len(senses))
+                column[member] = sign
+                elastic.append(column)
+                self.owner.append(member)
+        self.owner = np.array(self.owner, dtype=int)
+        self.members = len(senses)
+        self.structural = columns.size
+
+        m = len(senses)
+        A = np.hstack([np.array(matrix).reshape(m, columns.size), np.array(elastic).T.reshape(m, self.owner.size)])
+        self.arrays = LpArrays(
+            c=np.concatenate([np.zeros(columns.size), np.ones(self.owner.size)]),
+            A=A,
+            b=np.array(rhs, dtype=float),
+            senses=tuple(senses),
+            maximize=False,
+            variable_names=tuple(f"x{j}" for j in columns) + tuple(f"e{k}" for k in range(self.owner.size)),
+            constraint_names=tuple(f"m{k}" for k in range(m)),
+            lower=np.concatenate([np.full(columns.size, -np.inf), np.zeros(self.owner.size)]),
+            upper=np.full(columns.size + self.owner.size, np.inf),
+        )
+
+    def cost(self, active: np.ndarray) -> np.ndarray:
+        return np.concatenate([np.zeros(self.structural), active[self.owner].astype(float)])
+
+
+def find_iis(
+    arrays: LpArrays,
+    farkas: np.ndarray | None = None,
+    tolerance: float = 1e-7,
+) -> IrreducibleInfeasibleSubsystem | None:
+    """
+    Find an irreducible infeasible subsystem of the constraints and variable bounds.
+
+    Integer requirements are ignored: the subsystem explains why the linear relaxation is infeasible.
+
+    :param arrays: The problem.
+    :param farkas: Phase-one row duals of a failed native solve (``SimplexResult.farkas``); without them the
+        problem is solved once to get them.
+    :param tolerance: Relative size below which a phase-one objective or a dual counts as zero.
+    :return: The subsystem, or None when the linear relaxation is feasible.
+    """
+    start = time.perf_counter()
+    crossed = np.flatnonzero(arrays.lower > arrays.upper)
+    if crossed.size:
+        j = int(crossed[0])
+        return IrreducibleInfeasibleSubsystem((), ((j, BoundSide.LOWER), (j, BoundSide.UPPER)), 0, time.perf_counter() - start)
+
+    if farkas is None:
+        result = RevisedSimplex(arrays).solve()
+        if result.status != INFEASIBLE or result.farkas is None:
+            return None
+        farkas = result.farkas
+
+    rows, bounds = _farkas_support(arrays, np.asarray(farkas, dtype=float), tolerance)
+    subsystem = _ElasticSubsystem(arrays, rows, bounds)
+    active = np.ones(subsystem.members, dtype=bool)
+    threshold = tolerance * (1.0 + np.abs(subsystem.arrays.b).max(initial=0.0))
+
+    simplex = RevisedSimplex(subsystem.arrays)
+    result = simplex.solve()
+    if not result.is_optimal or result.objective_value <= threshold:
+        # The certificate was too inexact to trust its support; filter the whole problem instead.
+        rows = list(range(arrays.shape[0]))
+        bounds = [(j, BoundSide.LOWER) for j in np.flatnonzero(np.isfinite(arrays.lower))]
+        bounds += [(j, BoundSide.UPPER) for j in np.flatnonzero(np.isfinite(arrays.upper))]
+        subsystem = _ElasticSubsystem(arrays, rows, sorted(bounds, key=lambda bound: bound[0]))
+        active = np.ones(subsystem.members, dtype=bool)
+        simplex = RevisedSimplex(subsystem.arrays)
+        result = simplex.solve()
+        if not result.is_optimal or result.objective_value <= threshold:
+            return None
+
+    # Bounds are tested first, so that the subsystem explains the conflict with constraints where it can.
+    tests = 0
+    order = list(range(len(rows), subsystem.members)) + list(range(len(rows)))
+    for member in order:
+        if not active[member]:
+            continue
+        active[member] = False
+        result = simplex.reoptimize(subsystem.cost(active))
+        tests += 1
+        if result.is_optimal and result.objective_value > threshold:
+            # Still infeasible without it; members the new certificate does not use can go as well.
+            scale = max(np.abs(result.duals).max(initial=0.0), 1.0)
+            active &= np.abs(result.duals) > tolerance * scale
+        else:
+            active[member] = True
+
+    members = np.flatnonzero(active)
+    return IrreducibleInfeasibleSubsystem(
+        rows=tuple(int(rows[k]) for k in members if k < len(rows)),
+        bounds=tuple(bounds[k - len(rows)] for k in members if k >= len(rows)),
+        tests=tests,
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def find_unbounded_ray(arrays: LpArrays, ray: np.ndarray | None = None) -> np.ndarray | None:
+    """
+    Find a direction along which the problem is feasible and the objective improves without limit.
+
+    :param arrays: The problem; integer requirements are ignored.
+    :param ray: Ray of a failed native solve (``SimplexResult.ray``); without it the problem is solved once.
+    :return: The direction, scaled so that its largest entry is 1 in absolute value, or None when the
+        linear relaxation is not unbounded.
+    """
+    if ray is None:
+        result = RevisedSimplex(arrays).solve()
+        if result.status != UNBOUNDED or result.ray is None:
+            return None
+        ray = result.ray
+    ray = np.asarray(ray, dtype=float)
+    largest = np.abs(ray).max(initial=0.0)
+    return ray / largest if largest > 0 else None
@@ -0,0 +1,497 @@
+"""
+Exact simplex with integer-preserving (Bareiss) pivots.
+
+Every row is multiplied by the least common multiple of its denominators, so the whole tableau is
+made of Python integers. A pivot on ``a = T[r, q]`` replaces every other row by
+``(a * T[i] - T[i, q] * T[r]) / D``, where ``D`` is the previous pivot; the division is always exact
+and the entries stay bounded by determinants of the basis, instead of growing like the numerators
+and denominators of a ``fractions.Fraction`` tableau. The true tableau is ``T / D`` at every step.
+
+The float engines can hand their optimal basis to ``ExactSimplex.solve`` to verify it. Basic slacks
+only cover their own row, so the exact basic solution and duals come from a fraction-free solve of
+the much smaller square block of structural basic columns and uncovered rows; only when that basis
+turns out not to be optimal is the full tableau loaded and refined with exact pivots.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from math import lcm
+from typing import Sequence
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import SimplexResult, OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED
+
+
+def to_fraction(value: float) -> Fraction:
+    """Exact value the user typed: ``0.1`` becomes ``1/10``, not the binary float closest to it."""
+    return Fraction(repr(float(value)))
+
+
+def fraction_free_solve(matrix: np.ndarray, rhs: np.ndarray) -> tuple[np.ndarray, int] | None:
+    """
+    Solve ``matrix @ X = rhs`` exactly for an integer matrix with Bareiss elimination.
+
+    :param matrix: Square integer matrix (object dtype).
+    :param rhs: Integer right-hand sides, one per column (object dtype).
+    :return: ``(X, D)`` with the solution ``X / D`` in integers, or None if the matrix is singular.
+    """
+    k = matrix.shape[0]
+    M = np.hstack([matrix, rhs]).astype(object)
+    D = 1
+    for col in range(k):
+        rows = [r for r in range(col, k) if M[r, col] != 0]
+        if not rows:
+            return None
+        p = min(rows, key=lambda row: abs(M[row, col]))
+        if p != col:
+            M[[col, p]] = M[[p, col]]
+        a = M[col, col]
+        M[col + 1:, col + 1:] = (a * M[col + 1:, col + 1:] - np.multiply.outer(M[col + 1:, col], M[col, col + 1:])) // D
+        M[col + 1:, col] = 0
+        D = a
+
+    # Back substitution stays in integers: D is the determinant (up to sign) and X = D * solution.
+    X = np.zeros((k, M.shape[1] - k), dtype=object)
+    for i in range(k - 1, -1, -1):
+        X[i] = (D * M[i, k:] - M[i, i + 1:k] @ X[i + 1:]) // M[i, i]
+    return X, D
+
+
+@dataclass
+class ExactResult:
+    """Exact solution, with the same sign conventions as SimplexResult."""
+    status: str
+    objective_value: Fraction | None
+    x: list[Fraction]
+    slacks: list[Fraction]
+    duals: list[Fraction]
+    reduced_costs: list[Fraction]
+    basis: list[int]
+    pivots: int
+    basis_loaded: bool = False
+
+    @property
+    def is_optimal(self) -> bool:
+        return self.status == OPTIMAL
+
+    def to_simplex_result(self) -> SimplexResult:
+        """Float copy of the result, for code that works with SimplexResult."""
+        return SimplexResult(
+            status=self.status,
+            objective_value=float(self.objective_value) if self.objective_value is not None else None,
+            x=np.array([float(value) for value in self.x]),
+            slacks=np.array([float(value) for value in self.slacks]),
+            duals=np.array([float(value) for value in self.duals]),
+            reduced_costs=np.array([float(value) for value in self.reduced_costs]),
+            basis=np.array(self.basis, dtype=int),
+            iterations=self.pivots,
+        )
+
+
+class ExactSimplex:
+    """
+    Two-phase exact simplex on an integer tableau.
+
+    The tableau has one row per constraint plus the phase two and phase one objective rows, and
+    one column per structural variable, slack, artificial and the right-hand side. Artificial
+    columns are kept for every row: they form ``D * B^-1`` and give the exact duals. Variable bounds
+    other than ``x >= 0`` are written as constraint rows (see ``LpArrays.with_bound_rows``); the
+    results are mapped back to the original variables and rows.
+
+    :param arrays: The problem to solve (linear programs only).
+    :param max_pivots: Pivot limit; defaults to a multiple of the problem size.
+    """
+
+    def __init__(self, arrays: LpArrays, max_pivots: int | None = None):
+        if arrays.is_mixed_integer:
+            raise ValueError("Exact mode solves linear programs only; integer variables are not supported.")
+
+        self.arrays = arrays
+        self._objective = [to_fraction(value) for value in arrays.c]
+        self._A = [[to_fraction(value) for value in row] for row in arrays.A]
+        self._b = [to_fraction(value) for value in arrays.b]
+
+        if arrays.has_default_bounds:
+            self._columns = np.arange(arrays.shape[1])
+            self._signs = np.ones(arrays.shape[1])
+        else:
+            arrays, self._columns, self._signs = arrays.with_bound_rows()
+
+        m, n = arrays.shape
+        A = [[to_fraction(value) for value in row] for row in arrays.A]
+        b = [to_fraction(value) for value in arrays.b]
+        objective = [to_fraction(value) for value in arrays.c]
+        cost = [-value for value in objective] if arrays.maximize else objective
+        self._bound_rows = arrays.senses[len(self._b):]
+
+        slack_rows = [i for i, symbol in enumerate(arrays.senses) if symbol != ConstraintSymbol.EQUAL]
+        N = n + len(slack_rows)
+        self._n = n
+        self._N = N
+        self._m = m
+
+        self._row_sign = [-1 if value < 0 else 1 for value in b]
+        self._row_factor = [lcm(*(value.denominator for value in row), b[i].denominator) for i, row in enumerate(A)]
+        self._cost_factor = lcm(1, *(value.denominator for value in cost))
+
+        rows = m + 2
+        T = np.zeros((rows, N + m + 1), dtype=object)
+        for i in range(m):
+            factor = self._row_sign[i] * self._row_factor[i]
+            for j in range(n):
+                T[i, j] = int(A[i][j] * factor)
+            T[i, N + m] = int(b[i] * factor)
+            T[i, N + i] = 1
+        for k, i in enumerate(slack_rows):
+            # The slack of row i is scaled by the row factor, so its column stays a unit column.
+            T[i, n + k] = self._row_sign[i] * (1 if arrays.senses[i] == ConstraintSymbol.LESS_THAN_OR_EQUAL else -1)
+        for j in range(n):
+            T[m, j] = int(cost[j] * self._cost_factor)
+
+        basis = [N + i for i in range(m)]
+        for k, i in enumerate(slack_rows):
+            if T[i, n + k] == 1:
+                basis[i] = n + k
+
+        self._initial_tableau = T
+        self._initial_basis = basis
+        self.max_pivots = max_pivots if max_pivots is not None else 50 * (m + N) + 100
+        self._reset()
+
+    # ------------------------------------------------------------------ public API
+
+    def solve(self, basis: Sequence[int] | None = None, values: Sequence[float] | None = None) -> ExactResult:
+        """
+        Solve exactly, optionally starting from a basis found by a float engine.
+
+        :param basis: Standard form column indices, one per row (as in SimplexResult.basis).
+        :param values: Float values of the variables in that solution. Only needed when the problem
+            has bounds other than ``x >= 0``, to tell which nonbasic variables sit on which bound.
+        :return: The exact result; ``pivots`` counts the pivots made after the basis was loaded.
+        """
+        if basis is not None and self._bound_rows:
+            basis = self._expand_basis(basis, values) if values is not None else None
+        if basis is not None:
+            certified = self._certify_basis(basis)
+            if certified is not None:
+                return certified
+
+        status = None
+        loaded = False
+        if basis is not None and self._load_basis(basis):
+            loaded = True
+            self.pivots = 0
+            if self._primal_feasible():
+                status = self._primal(phase_one=False)
+            elif self._dual_feasible():
+                status = self._dual()
+                if status == OPTIMAL:
+                    status = self._primal(phase_one=False)
+
+        if status is None:
+            loaded = False
+            self._reset()
+            status = self._two_phase()
+
+        result = self._result(status)
+        result.basis_loaded = loaded
+        return result
+
+    def _expand_basis(self, basis: Sequence[int], values: Sequence[float]) -> list[int]:
+        """
+        Map a basis of the bounded problem to the problem with bound rows.
+
+        A bound row's slack is basic unless the variable is nonbasic at that bound; then the
+        variable's column takes its place in the basis.
+        """
+        arrays = self.arrays
+        n0 = arrays.shape[1]
+        n, N = self._n, self._N
+        bound_slacks = N - sum(symbol != ConstraintSymbol.EQUAL for symbol in self._bound_rows)
+        column_of = {(int(j), sign > 0): k for k, (j, sign) in enumerate(zip(self._columns, self._signs))}
+
+        def structural(j: int, value: float) -> int:
+            return column_of.get((j, value >= 0), column_of[(j, True)])
+
+        in_basis = {int(column) for column in basis if column < n0}
+        expanded = [
+            structural(int(column), values[column]) if column < n0 else n + int(column) - n0
+            for column in basis
+        ]
+
+        row = 0
+        for j in range(n0):
+            # Same rows, in the same order, as LpArrays.with_bound_rows. A fixed variable has one
+            # equality row without a slack, so its column is always basic.
+            if np.isfinite(arrays.lower[j]) and arrays.lower[j] == arrays.upper[j]:
+                if j not in in_basis:
+                    expanded.append(structural(j, arrays.lower[j]))
+                continue
+            bounds = [bound for bound, has_row in (
+                (arrays.lower[j], np.isfinite(arrays.lower[j]) and arrays.lower[j] != 0.0),
+                (arrays.upper[j], np.isfinite(arrays.upper[j])),
+            ) if has_row]
+            tight = False
+            for bound in bounds:
+                at_bound = abs(values[j] - bound) <= 1e-7 * (1.0 + abs(bound))
+                if j not in in_basis and at_bound and not tight:
+                    expanded.append(structural(j, bound))
+                    tight = True
+                else:
+                    expanded.append(bound_slacks + row)
+                row += 1
+        return expanded
+
+    # ------------------------------------------------------------------ tableau
+
+    def _reset(self):
+        T = self._initial_tableau.copy()
+        m, N = self._m, self._N
+        artificial_rows = [i for i, column in enumerate(self._initial_basis) if column >= N]
+        T[m + 1, N:N + m] = 1
+        for i in artificial_rows:
+            T[m + 1] = T[m + 1] - T[i]
+        self._T = T
+        self._D = 1
+        self.basis = list(self._initial_basis)
+        self.pivots = 0
+
+    def _pivot(self, r: int, q: int):
+        T = self._T
+        a = T[r, q]
+        pivot_row = T[r].copy()
+        T = (a * T - np.multiply.outer(T[:, q], pivot_row)) // self._D
+        T[r] = pivot_row
+        if a < 0:
+            # Keep D positive so that the sign of every entry is the sign of the true tableau value.
+            T = -T
+            a = -a
+        self._T = T
+        self._D = a
+        self.basis[r] = q
+        self.pivots += 1
+
+    def _load_basis(self, basis: Sequence[int]) -> bool:
+        m, N = self._m, self._N
+        target = [int(column) for column in basis]
+        if len(target) != m or len(set(target)) != m or any(column < 0 or column >= N for column in target):
+            return False
+
+        self._reset()
+        target_set = set(target)
+        for q in target:
+            if q in self.basis:
+                continue
+            rows = [r for r in range(m) if self.basis[r] not in target_set and self._T[r, q] != 0]
+            if not rows:
+                return False
+            # The smallest nonzero pivot keeps the intermediate integers short.
+            r = min(rows, key=lambda row: abs(self._T[row, q]))
+            self._pivot(r, q)
+        return True
+
+    def _primal_feasible(self) -> bool:
+        return all(value >= 0 for value in self._T[:self._m, -1])
+
+    def _dual_feasible(self) -> bool:
+        in_basis = set(self.basis)
+        return all(self._T[self._m, j] >= 0 for j in range(self._N) if j not in in_basis)
+
+    # ------------------------------------------------------------------ phases
+
+    def _two_phase(self) -> str:
+        m, N = self._m, self._N
+        status = self._primal(phase_one=True)
+        if status == NOT_SOLVED:
+            return status
+        if sum(self._T[i, -1] for i in range(m) if self.basis[i] >= N) > 0:
+            return INFEASIBLE
+
+        # Pivot zero-level artificials out; rows where that is impossible are redundant.
+        for r in range(m):
+            if self.basis[r] >= N:
+                candidates = [j for j in range(N) if j not in self.basis and self._T[r, j] != 0]
+                if candidates:
+                    self._pivot(r, candidates[0])
+
+        return self._primal(phase_one=False)
+
+    def _primal(self, phase_one: bool) -> str:
+        m, N = self._m, self._N
+        objective_row = m + 1 if phase_one else m
+        stalled = 0
+        while True:
+            if self.pivots >= self.max_pivots:
+                return NOT_SOLVED
+
+            T = self._T
+            in_basis = set(self.basis)
+            candidates = [j for j in range(N) if j not in in_basis and T[objective_row, j] < 0]
+            if not candidates:
+                return OPTIMAL
+
+            # Dantzig pricing, Bland's rule while degenerate pivots stall the objective.
+            q = candidates[0] if stalled > 50 else min(candidates, key=lambda j: T[objective_row, j])
+
+            best = None
+            r = None
+            for i in range(m):
+                if T[i, q] > 0:
+                    ratio = Fraction(T[i, -1], T[i, q])
+                    if best is None or ratio < best or (ratio == best and self.basis[i] < self.basis[r]):
+                        best, r = ratio, i
+            if r is None:
+                return UNBOUNDED
+
+            stalled = stalled + 1 if best == 0 else 0
+            self._pivot(r, q)
+
+    def _dual(self) -> str:
+        m, N = self._m, self._N
+        while True:
+            if self.pivots >= self.max_pivots:
+                return NOT_SOLVED
+
+            T = self._T
+            r = min(range(m), key=lambda i: T[i, -1])
+            if T[r, -1] >= 0:
+                return OPTIMAL
+
+            in_basis = set(self.basis)
+            best = None
+            q = None
+            for j in range(N):
+                if j not in in_basis and T[r, j] < 0:
+                    ratio = Fraction(T[m, j], -T[r, j])
+                    if best is None or ratio < best:
+                        best, q = ratio, j
+            if q is None:
+                return INFEASIBLE
+            self._pivot(r, q)
+
+    # ------------------------------------------------------------------ results
+
+    def _certify_basis(self, basis: Sequence[int]) -> ExactResult | None:
+        """
+        Exact basic solution and duals of a basis without building the tableau.
+
+        :return: The exact result if the basis is optimal, None otherwise.
+        """
+        m, N = self._m, self._N
+        target = [int(column) for column in basis]
+        if len(target) != m or len(set(target)) != m or any(column < 0 or column >= N for column in target):
+            return None
+
+        T0 = self._initial_tableau
+        # Slack column n + k is a unit column on its own row; a basic slack takes that row out of the core.
+        slack_rows = {}
+        for column in target:
+            if column >= self._n:
+                slack_rows[column] = int(np.flatnonzero(T0[:m, column])[0])
+        structural = [column for column in target if column < self._n]
+        core_rows = sorted(set(range(m)) - set(slack_rows.values()))
+        if len(core_rows) != len(structural):
+            return None
+
+        core = T0[np.ix_(core_rows, structural)]
+        primal = fraction_free_solve(core, T0[core_rows, -1].reshape(-1, 1))
+        dual = fraction_free_solve(core.T, T0[m, structural].reshape(-1, 1))
+        if primal is None or dual is None:
+            return None
+
+        values = {column: Fraction(value, primal[1]) for column, value in zip(structural, primal[0][:, 0])}
+        x_core = [values[column] for column in structural]
+        for column, row in slack_rows.items():
+            activity = sum((a * value for a, value in zip(T0[row, structural], x_core)), Fraction(0))
+            values[column] = (T0[row, -1] - activity) / T0[row, column]
+
+        y = [Fraction(0)] * m
+        for row, value in zip(core_rows, dual[0][:, 0]):
+            y[row] = Fraction(value, dual[1])
+        y_rows = [i for i in range(m) if y[i] != 0]
+        reduced = [
+            T0[m, j] - sum((y[i] * T0[i, j] for i in y_rows), Fraction(0))
+            for j in range(N)
+        ]
+
+        if any(value < 0 for value in values.values()) or any(value < 0 for value in reduced):
+            return None
+
+        self.basis = target
+        self.pivots = 0
+        result = self._exact_result(OPTIMAL, values, [-value for value in y], reduced)
+        result.basis_loaded = True
+        return result
+
+    def _result(self, status: str) -> ExactResult:
+        m, N = self._m, self._N
+        if status != OPTIMAL:
+            return self._exact_result(status, {}, [], [])
+
+        T, D = self._T, self._D
+        values = {column: Fraction(T[i, -1], D) for i, column in enumerate(self.basis)}
+        artificial = [Fraction(T[m, N + i], D) for i in range(m)]
+        reduced = [Fraction(T[m, j], D) for j in range(N)]
+        return self._exact_result(status, values, artificial, reduced)
+
+    def _exact_result(self, status: str, values: dict, artificial: list, reduced: list) -> ExactResult:
+        """
+        Map the integer problem back to the original one.
+
+        :param values: Value of each basic standard form column.
+        :param artificial: Phase two objective row under the artificial columns, which is ``-y``
+            of the integer rows.
+        :param reduced: Phase two objective row under the structural and slack columns.
+        """
+        arrays = self.arrays
+        m, n = arrays.shape
+        zero = Fraction(0)
+
+        if status != OPTIMAL:
+            return ExactResult(
+                status=status,
+                objective_value=None,
+                x=[zero] * n,
+                slacks=[zero] * m,
+                duals=[zero] * m,
+                reduced_costs=[zero] * n,
+                basis=list(self.basis),
+                pivots=self.pivots,
+            )
+
+        x = [zero] * n
+        for k, (j, sign) in enumerate(zip(self._columns, self._signs)):
+            x[j] += values.get(k, zero) if sign > 0 else -values.get(k, zero)
+
+        # Bound rows come after the original rows; their duals are not reported.
+        sign = -1 if arrays.maximize else 1
+        duals = [
+            sign * -artificial[i] * self._row_sign[i] * self._row_factor[i] / self._cost_factor
+            for i in range(m)
+        ]
+        if self._bound_rows:
+            reduced_costs = [
+                self._objective[j] - sum((duals[i] * self._A[i][j] for i in range(m) if duals[i] and self._A[i][j]), zero)
+                for j in range(n)
+            ]
+        else:
+            reduced_costs = [sign * reduced[j] / self._cost_factor for j in range(n)]
+            for j in set(self.basis) & set(range(n)):
+                reduced_costs[j] = zero
+
+        objective_value = sum((c * value for c, value in zip(self._objective, x)), zero)
+        slacks = [self._b[i] - sum((a * value for a, value in zip(self._A[i], x)), zero) for i in range(m)]
+
+        return ExactResult(
+            status=status,
+            objective_value=objective_value,
+            x=x,
+            slacks=slacks,
+            duals=duals,
+            reduced_costs=reduced_costs,
+            basis=list(self.basis),
+            pivots=self.pivots,
+        )
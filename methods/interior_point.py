@@ -0,0 +1,253 @@
+"""
+Primal-dual interior-point engine (Mehrotra predictor-corrector).
+
+Each iteration solves the normal equations ``A D A^T dy = r`` once for the predictor and once for the
+corrector with the same factorization, so the whole solve costs a few dozen factorizations regardless
+of the number of vertices a simplex path would visit. When SciPy is installed and the matrix is sparse,
+the normal equations are built and factorized as sparse matrices (``pip install .[sparse]``); otherwise
+a dense Cholesky is used. Either falls back to least squares when the factorization fails.
+
+The interior solution is not a vertex, so ``solve_interior_point`` finishes with a crossover: a basis
+is picked from the values farthest from their bounds and handed to the native simplex as a warm start,
+which yields the vertex solution, shadow prices and basis that the rest of the application relies on.
+The barrier itself needs ``x >= 0``, so other variable bounds are passed to it as constraint rows.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, SimplexResult, StandardForm, OPTIMAL, NOT_SOLVED
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+
+try:
+    import scipy.sparse as sparse
+    import scipy.sparse.linalg as sparse_linalg
+except ImportError:  # SciPy is optional
+    sparse = None
+    sparse_linalg = None
+
+
+SPARSE_DENSITY_THRESHOLD = 0.1
+
+
+@dataclass
+class InteriorPointResult:
+    """Interior solution of the standard form (``x``, duals ``y`` and dual slacks ``s``)."""
+    status: str
+    x: np.ndarray
+    y: np.ndarray
+    s: np.ndarray
+    iterations: int
+
+
+class _NormalEquations:
+    """Factorization of ``A diag(d) A^T`` for one iteration."""
+
+    def __init__(self, A, d: np.ndarray, regularization: float):
+        if sparse is not None and sparse.issparse(A):
+            matrix = (A @ sparse.diags(d) @ A.T).tocsc()
+            matrix = matrix + regularization * sparse.identity(matrix.shape[0], format="csc")
+            try:
+                self._solve = sparse_linalg.factorized(matrix)
+            except RuntimeError:  # exactly singular factor
+                dense = matrix.toarray()
+                self._solve = lambda rhs: np.linalg.lstsq(dense, rhs, rcond=None)[0]
+            return
+
+        matrix = (A * d) @ A.T
+        matrix[np.diag_indices_from(matrix)] += regularization
+        try:
+            factor = np.linalg.cholesky(matrix)
+            self._solve = lambda rhs: np.linalg.solve(factor.T, np.linalg.solve(factor, rhs))
+        except np.linalg.LinAlgError:
+            self._solve = lambda rhs: np.linalg.lstsq(matrix, rhs, rcond=None)[0]
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        return self._solve(rhs)
+
+
+def _step_length(values: np.ndarray, direction: np.ndarray) -> float:
+    negative = direction < 0
+    if not np.any(negative):
+        return 1.0
+    return float(min(1.0, np.min(-values[negative] / direction[negative])))
+
+
+def interior_point(
+    form: StandardForm,
+    tolerance: float = 1e-8,
+    max_iterations: int = 100,
+    progress: ProgressReporter | None = None,
+) -> InteriorPointResult:
+    """
+    Solve ``min cost @ x  s.t.  A @ x = b, x >= 0`` with Mehrotra's predictor-corrector method.
+
+    :param form: The problem in standard form.
+    :param tolerance: Relative tolerance on primal residual, dual residual and duality gap.
+    :param max_iterations: Iteration limit.
+    :param progress: Receives throttled progress events with the residuals of each iteration.
+    :return: The interior solution; ``status`` is ``"Not Solved"`` when the method did not converge.
+    """
+    A_dense, b, c = form.A, form.b, form.cost
+    m, N = A_dense.shape
+    use_sparse = sparse is not None and m > 0 and np.count_nonzero(A_dense) < SPARSE_DENSITY_THRESHOLD * A_dense.size
+    A = sparse.csr_matrix(A_dense) if use_sparse else A_dense
+    regularization = 1e-12 * max(1.0, float(np.abs(A_dense).max(initial=0.0)) ** 2)
+
+    # Mehrotra's starting point.
+    initial = _NormalEquations(A, np.ones(N), regularization)
+    x = A.T @ initial.solve(b)
+    y = initial.solve(A @ c)
+    s = c - A.T @ y
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    s += max(-1.5 * s.min(initial=0.0), 0.0)
+    x_dot_s = x @ s
+    x += 0.5 * x_dot_s / max(s.sum(), 1e-12)
+    s += 0.5 * x_dot_s / max(x.sum(), 1e-12)
+    x = np.maximum(x, 1e-8)
+    s = np.maximum(s, 1e-8)
+
+    b_norm = 1.0 + np.linalg.norm(b)
+    c_norm = 1.0 + np.linalg.norm(c)
+
+    iteration = 0
+    while iteration < max_iterations:
+        iteration += 1
+        primal_residual = A @ x - b
+        dual_residual = A.T @ y + s - c
+        mu = x @ s / N
+
+        primal_objective = c @ x
+        gap = abs(primal_objective - b @ y) / (1.0 + abs(primal_objective))
+        if progress is not None and progress.due():
+            progress.emit(ProgressEvent(
+                phase=SolvePhase.INTERIOR_POINT,
+                iteration=iteration,
+                objective_value=float(-primal_objective if form.maximize else primal_objective),
+                primal_infeasibility=float(np.abs(primal_residual).sum()),
+                dual_infeasibility=float(np.abs(dual_residual).sum()),
+                elapsed=progress.elapsed,
+            ))
+        if (
+            np.linalg.norm(primal_residual) / b_norm < tolerance
+            and np.linalg.norm(dual_residual) / c_norm < tolerance
+            and gap < tolerance
+        ):
+            return InteriorPointResult(OPTIMAL, x, y, s, iteration)
+
+        # Diverging iterates are the usual sign of an infeasible or unbounded problem.
+        divergence = 1e12 * max(b_norm, c_norm)
+        if not (np.isfinite(mu) and s.min() > 0 and x.min() > 0) or np.abs(x).max() > divergence or np.abs(y).max() > divergence:
+            break
+
+        d = x / s
+        normal = _NormalEquations(A, d, regularization)
+
+        def direction(complementarity: np.ndarray):
+            rhs = -primal_residual - A @ (complementarity / s + d * dual_residual)
+            dy = normal.solve(rhs)
+            dx = complementarity / s + d * (dual_residual + A.T @ dy)
+            ds = -dual_residual - A.T @ dy
+            return dx, dy, ds
+
+        # Predictor (affine scaling) step.
+        dx_aff, dy_aff, ds_aff = direction(-x * s)
+        alpha_primal = _step_length(x, dx_aff)
+        alpha_dual = _step_length(s, ds_aff)
+        mu_aff = (x + alpha_primal * dx_aff) @ (s + alpha_dual * ds_aff) / N
+        sigma = (mu_aff / mu) ** 3
+
+        # Corrector step with centering.
+        dx, dy, ds = direction(-x * s - dx_aff * ds_aff + sigma * mu)
+        eta = max(0.9, 1.0 - mu)
+        alpha_primal = eta * _step_length(x, dx)
+        alpha_dual = eta * _step_length(s, ds)
+
+        x = x + alpha_primal * dx
+        y = y + alpha_dual * dy
+        s = s + alpha_dual * ds
+
+    return InteriorPointResult(NOT_SOLVED, x, y, s, iteration)
+
+
+def crossover_basis(form: StandardForm, x: np.ndarray) -> np.ndarray | None:
+    """
+    Pick a basis for an interior solution: the columns farthest from their bounds, skipping any
+    column that is linearly dependent on the columns already chosen.
+
+    :param form: The problem in standard form.
+    :param x: Interior solution of the standard form.
+    :return: Standard form column indices, or None if no full-rank basis exists.
+    """
+    m, N = form.shape
+    if m == 0:
+        return np.zeros(0, dtype=int)
+
+    with np.errstate(invalid="ignore"):
+        distance = np.fmin(x - form.lower, form.upper - x)
+    # Free variables have no bound to sit on and belong in the basis whenever possible.
+    distance = np.where(np.isnan(distance) | np.isinf(distance), np.abs(x) + np.abs(x).max(initial=0.0) + 1.0, distance)
+
+    chosen: list[int] = []
+    orthonormal = np.zeros((m, 0))
+    for column in np.argsort(-distance, kind="stable"):
+        vector = form.A[:, column]
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            continue
+        residual = vector - orthonormal @ (orthonormal.T @ vector)
+        residual_norm = np.linalg.norm(residual)
+        if residual_norm > 1e-7 * norm:
+            chosen.append(int(column))
+            orthonormal = np.hstack([orthonormal, (residual / residual_norm)[:, None]])
+            if len(chosen) == m:
+                return np.array(chosen)
+
+    return None
+
+
+def solve_interior_point(
+    arrays: LpArrays,
+    tolerance: float = 1e-8,
+    max_iterations: int = 100,
+    record_history: bool = False,
+    progress: ProgressReporter | None = None,
+) -> SimplexResult:
+    """
+    Solve a problem with the interior-point method followed by a crossover to a vertex basis.
+
+    If the interior-point method does not converge (for example on infeasible or unbounded
+    problems), the native simplex solves the problem from scratch and reports the status.
+
+    :param arrays: The problem to solve.
+    :param record_history: Record the pivot history of the crossover (and of the fallback simplex).
+    :param progress: Receives throttled progress events from the barrier and the crossover.
+    :return: The vertex solution, with ``barrier_iterations`` set to the interior-point iteration count.
+    """
+    simplex = RevisedSimplex(arrays, record_history=record_history, progress=progress)
+    form = simplex.form
+    if arrays.has_default_bounds:
+        barrier_form = form
+    else:
+        expanded, columns, signs = arrays.with_bound_rows()
+        barrier_form = StandardForm.from_arrays(expanded)
+    with np.errstate(all="ignore"):
+        barrier = interior_point(barrier_form, tolerance=tolerance, max_iterations=max_iterations, progress=progress)
+
+    basis = None
+    if barrier.status == OPTIMAL:
+        x = barrier.x
+        if barrier_form is not form:
+            # Structural values of the original variables, then the slacks of the original rows.
+            n = form.n_structural
+            structural = np.zeros(n)
+            np.add.at(structural, columns, signs * x[:columns.size])
+            slack_rows = np.flatnonzero(form.slack_columns >= 0)
+            activity = form.b[slack_rows] - form.A[slack_rows, :n] @ structural
+            x = np.concatenate([structural, activity / form.A[slack_rows, form.slack_columns[slack_rows]]])
+        basis = crossover_basis(form, x)
+    result = simplex.solve(basis)
+    result.barrier_iterations = barrier.iterations
+    return result
@@ -0,0 +1,208 @@
+import hashlib
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from data.app_state import ObjectiveFunctionState, ObjectiveFunctionType, ConstraintSymbol, VariableCategory
+
+
+@dataclass(frozen=True)
+class LpArrays:
+    """
+    Dense array form of a linear programming problem.
+
+    Row ``i`` of ``A`` together with ``senses[i]`` and ``b[i]`` describes one constraint
+    and column ``j`` holds the coefficients of ``variable_names[j]``, which must lie between
+    ``lower[j]`` and ``upper[j]`` (infinite for a missing bound). An empty ``categories``
+    means every variable is continuous.
+    """
+    c: np.ndarray
+    A: np.ndarray
+    b: np.ndarray
+    senses: tuple[ConstraintSymbol, ...]
+    maximize: bool
+    variable_names: tuple[str, ...]
+    constraint_names: tuple[str, ...]
+    lower: np.ndarray
+    upper: np.ndarray
+    categories: tuple[VariableCategory, ...] = ()
+
+    @classmethod
+    def from_problem(cls, problem: ObjectiveFunctionState) -> "LpArrays":
+        """
+        Build the array form of the given problem.
+
+        :param problem: An instance of ObjectiveFunctionState containing the problem definition.
+        :return: The problem as LpArrays.
+        """
+        match problem.objective_function:
+            case ObjectiveFunctionType.MAXIMIZE:
+                maximize = True
+            case ObjectiveFunctionType.MINIMIZE:
+                maximize = False
+            case _:
+                raise ValueError("Invalid objective function type")
+
+        for constraint in problem.constraints:
+            if not isinstance(constraint.symbol, ConstraintSymbol):
+                raise ValueError("Invalid constraint type")
+
+        n = len(problem.variables)
+        c = np.array([variable.value for variable in problem.variables], dtype=float)
+        A = np.array(
+            [[variable.value for variable in constraint.variables[:n]] for constraint in problem.constraints],
+            dtype=float,
+        ).reshape(len(problem.constraints), n)
+        b = np.array([constraint.value for constraint in problem.constraints], dtype=float)
+
+        lower = np.array(
+            [-np.inf if variable.lower_bound is None else variable.lower_bound for variable in problem.variables],
+            dtype=float,
+        )
+        upper = np.array(
+            [np.inf if variable.upper_bound is None else variable.upper_bound for variable in problem.variables],
+            dtype=float,
+        )
+        binary = np.array([variable.category == VariableCategory.BINARY for variable in problem.variables], dtype=bool)
+        lower[binary] = np.maximum(lower[binary], 0.0)
+        upper[binary] = np.minimum(upper[binary], 1.0)
+
+        return cls(
+            c=c,
+            A=A,
+            b=b,
+            senses=tuple(constraint.symbol for constraint in problem.constraints),
+            maximize=maximize,
+            variable_names=tuple(variable.name for variable in problem.variables),
+            constraint_names=tuple(constraint.name for constraint in problem.constraints),
+            lower=lower,
+            upper=upper,
+            categories=tuple(variable.category for variable in problem.variables),
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of constraints and number of variables."""
+        return self.A.shape
+
+    @property
+    def integer_mask(self) -> np.ndarray:
+        """Boolean mask of the integer and binary variables."""
+        if not self.categories:
+            return np.zeros(self.shape[1], dtype=bool)
+        return np.array([category != VariableCategory.CONTINUOUS for category in self.categories], dtype=bool)
+
+    @property
+    def binary_mask(self) -> np.ndarray:
+        """Boolean mask of the binary variables."""
+        if not self.categories:
+            return np.zeros(self.shape[1], dtype=bool)
+        return np.array([category == VariableCategory.BINARY for category in self.categories], dtype=bool)
+
+    @property
+    def is_mixed_integer(self) -> bool:
+        return bool(self.integer_mask.any())
+
+    @property
+    def has_default_bounds(self) -> bool:
+        """True when every variable is only bounded by ``x >= 0``."""
+        return bool(np.all(self.lower == 0.0) and np.all(self.upper == np.inf))
+
+    def canonical_hash(self) -> str:
+        """
+        SHA-256 of the problem data, the same for every copy of the same problem.
+
+        Names are left out, so renaming a variable or constraint keeps the hash; ``-0.0`` hashes like
+        ``0.0`` and an empty ``categories`` like all-continuous variables.
+        """
+        digest = hashlib.sha256()
+        digest.update(np.array(self.shape, dtype=np.int64).tobytes())
+        digest.update(b"max" if self.maximize else b"min")
+        digest.update("".join(symbol.value for symbol in self.senses).encode())
+        for values in (self.c, self.A, self.b, self.lower, self.upper):
+            digest.update((np.ascontiguousarray(values, dtype=np.float64) + 0.0).tobytes())
+        digest.update(self.integer_mask.tobytes() + self.binary_mask.tobytes())
+        return digest.hexdigest()
+
+    def with_rhs(self, b: np.ndarray) -> "LpArrays":
+        """Return a copy of the problem with a different right-hand side."""
+        return replace(self, b=np.asarray(b, dtype=float))
+
+    def with_objective(self, c: np.ndarray) -> "LpArrays":
+        """Return a copy of the problem with different objective coefficients."""
+        return replace(self, c=np.asarray(c, dtype=float))
+
+    def with_bounds(self, lower: np.ndarray, upper: np.ndarray) -> "LpArrays":
+        """Return a copy of the problem with different variable bounds."""
+        return replace(self, lower=np.asarray(lower, dtype=float), upper=np.asarray(upper, dtype=float))
+
+    def with_bound_rows(self) -> tuple["LpArrays", np.ndarray, np.ndarray]:
+        """
+        Return a copy of the problem in which every variable is only bounded by ``x >= 0``.
+
+        Variables with a negative (or missing) lower bound are split into ``x = x+ - x-`` and every
+        other bound becomes a constraint row appended after the existing ones (a single equality
+        row for a fixed variable). This is the form
+        for engines that do not handle bounds themselves; the bound values are copied, not shifted,
+        so the copy is exact.
+
+        :return: The copy, and for each of its columns the original column and its sign
+            (``x[j] = sum(sign * x' over the columns of j)``).
+        """
+        m, n = self.shape
+        split = self.lower < 0
+        columns = np.concatenate([np.arange(n), np.flatnonzero(split)])
+        signs = np.concatenate([np.ones(n), -np.ones(int(split.sum()))])
+        A = self.A[:, columns] * signs
+
+        rows, senses, rhs, names = [], [], [], []
+        for j in range(n):
+            row = np.where(columns == j, signs, 0.0)
+            if np.isfinite(self.lower[j]) and self.lower[j] == self.upper[j]:
+                rows.append(row)
+                senses.append(ConstraintSymbol.EQUAL)
+                rhs.append(self.lower[j])
+                names.append(f"{self.variable_names[j]} = {self.lower[j]:g}")
+                continue
+            if np.isfinite(self.lower[j]) and self.lower[j] != 0.0:
+                rows.append(row)
+                senses.append(ConstraintSymbol.GREATER_THAN_OR_EQUAL)
+                rhs.append(self.lower[j])
+                names.append(f"{self.variable_names[j]} >= {self.lower[j]:g}")
+            if np.isfinite(self.upper[j]):
+                rows.append(row)
+                senses.append(ConstraintSymbol.LESS_THAN_OR_EQUAL)
+                rhs.append(self.upper[j])
+                names.append(f"{self.variable_names[j]} <= {self.upper[j]:g}")
+
+        categories = tuple(self.categories[j] for j in columns) if self.categories else ()
+        expanded = replace(
+            self,
+            c=self.c[columns] * signs,
+            A=A,
+            variable_names=tuple(
+                self.variable_names[j] if sign > 0 else f"{self.variable_names[j]}-"
+                for j, sign in zip(columns, signs)
+            ),
+            lower=np.zeros(columns.size),
+            upper=np.full(columns.size, np.inf),
+            categories=categories,
+        )
+        expanded = expanded.with_constraints(np.array(rows).reshape(len(rows), columns.size), tuple(senses), np.array(rhs), tuple(names))
+        return expanded, columns, signs
+
+    def with_constraints(
+        self,
+        rows: np.ndarray,
+        senses: tuple[ConstraintSymbol, ...],
+        rhs: np.ndarray,
+        names: tuple[str, ...],
+    ) -> "LpArrays":
+        """Return a copy of the problem with extra constraints appended after the existing ones."""
+        return replace(
+            self,
+            A=np.vstack([self.A, np.asarray(rows, dtype=float).reshape(len(senses), self.shape[1])]),
+            b=np.concatenate([self.b, np.asarray(rhs, dtype=float)]),
+            senses=self.senses + tuple(senses),
+            constraint_names=self.constraint_names + tuple(names),
+        )
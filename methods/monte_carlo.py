@@ -0,0 +1,337 @@
+"""
+Monte Carlo analysis of a linear program with uncertain coefficients.
+
+Samples are processed in batches. Before anything is solved, every batch is tested against the bases that
+were optimal for earlier samples: a basis stays optimal for a sample when its basic solution is within
+bounds and its reduced costs keep their signs, which is a batched linear solve over the whole batch.
+Only the samples that no known basis fits are solved, warm-started from the nominal basis and spread
+over worker processes; their optimal bases then join the known ones.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from enum import Enum
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.certificate import CertificateTolerances, solve_verified
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, StandardForm, OPTIMAL
+from methods.workers import solver_pool
+
+
+class UncertainTarget(Enum):
+    """Coefficient an uncertainty applies to."""
+    OBJECTIVE = "objective"
+    RHS = "rhs"
+    MATRIX = "matrix"
+
+
+class DistributionKind(Enum):
+    """Supported distributions and their parameters."""
+    NORMAL = "normal"  # (mean, standard deviation)
+    UNIFORM = "uniform"  # (low, high)
+    TRIANGULAR = "triangular"  # (low, mode, high)
+
+
+_PARAMETER_COUNT = {
+    DistributionKind.NORMAL: 2,
+    DistributionKind.UNIFORM: 2,
+    DistributionKind.TRIANGULAR: 3,
+}
+
+
+@dataclass(frozen=True)
+class Uncertainty:
+    """
+    A coefficient drawn from a distribution.
+
+    :param target: Which coefficients the index refers to.
+    :param index: Variable index for the objective, constraint index for the right-hand side, or
+        ``(constraint, variable)`` for a matrix entry.
+    :param distribution: Distribution of the coefficient.
+    :param parameters: Parameters of the distribution, in the units of the coefficient.
+    """
+    target: UncertainTarget
+    index: int | tuple[int, int]
+    distribution: DistributionKind
+    parameters: tuple[float, ...]
+
+    def __post_init__(self):
+        if len(self.parameters) != _PARAMETER_COUNT[self.distribution]:
+            raise ValueError(f"{self.distribution.name} needs {_PARAMETER_COUNT[self.distribution]} parameters.")
+        if (self.target == UncertainTarget.MATRIX) != isinstance(self.index, tuple):
+            raise ValueError("Matrix entries take a (constraint, variable) index, other targets a single index.")
+
+    def sample(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        match self.distribution:
+            case DistributionKind.NORMAL:
+                return rng.normal(self.parameters[0], self.parameters[1], count)
+            case DistributionKind.UNIFORM:
+                return rng.uniform(self.parameters[0], self.parameters[1], count)
+            case DistributionKind.TRIANGULAR:
+                return rng.triangular(*self.parameters, count)
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Outcome of a Monte Carlo run.
+
+    ``objective_values`` holds one value per sample (nan when the sample has no optimal solution);
+    ``basis_counts`` maps each optimal basis (standard form column indices) to the number of samples it
+    was optimal for, and ``binding_counts`` counts per constraint the optimal samples where it is binding.
+    ``fast_path`` samples were answered by a known basis; the other ``solves`` needed a simplex solve,
+    whose result was verified and, when that failed, solved again from scratch. ``flagged`` counts the
+    optimal samples that still failed verification.
+    """
+    seed: int | None
+    objective_values: np.ndarray
+    statuses: Counter
+    basis_counts: Counter
+    binding_counts: np.ndarray
+    fast_path: int = 0
+    solves: int = 0
+    flagged: int = 0
+    optimal: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        self.optimal = self.statuses[OPTIMAL]
+
+    def quantiles(self, probabilities) -> np.ndarray:
+        """Quantiles of the optimal value over the optimal samples."""
+        values = self.objective_values[np.isfinite(self.objective_values)]
+        if values.size == 0:
+            return np.full(len(probabilities), np.nan)
+        return np.quantile(values, probabilities)
+
+
+@dataclass
+class _Samples:
+    """Sampled coefficients of a batch; ``A`` is None when the matrix is not uncertain."""
+    c: np.ndarray
+    b: np.ndarray
+    A: np.ndarray | None
+
+    def __len__(self) -> int:
+        return self.c.shape[0]
+
+    def take(self, mask: np.ndarray) -> "_Samples":
+        return _Samples(self.c[mask], self.b[mask], None if self.A is None else self.A[mask])
+
+    def arrays(self, nominal: LpArrays, k: int) -> LpArrays:
+        arrays = nominal.with_objective(self.c[k]).with_rhs(self.b[k])
+        if self.A is not None:
+            arrays = replace(arrays, A=self.A[k])
+        return arrays
+
+
+def _sample(arrays: LpArrays, uncertainties: list[Uncertainty], count: int, rng: np.random.Generator) -> _Samples:
+    c = np.tile(arrays.c, (count, 1))
+    b = np.tile(arrays.b, (count, 1))
+    A = None
+    for uncertainty in uncertainties:
+        values = uncertainty.sample(rng, count)
+        match uncertainty.target:
+            case UncertainTarget.OBJECTIVE:
+                c[:, uncertainty.index] = values
+            case UncertainTarget.RHS:
+                b[:, uncertainty.index] = values
+            case UncertainTarget.MATRIX:
+                if A is None:
+                    A = np.tile(arrays.A, (count, 1, 1))
+                A[:, uncertainty.index[0], uncertainty.index[1]] = values
+    return _Samples(c, b, A)
+
+
+def _solve_chunk(nominal: LpArrays, samples: _Samples, basis: np.ndarray | None, verification: CertificateTolerances):
+    """Solve samples one by one; returns the status, structural values, basis and verification outcome of each."""
+    results = []
+    for k in range(len(samples)):
+        result, certificate = solve_verified(samples.arrays(nominal, k), basis, verification)
+        results.append((result.status, result.x, result.basis, certificate is None or certificate.passed))
+    return results
+
+
+class _BasisTest:
+    """Vectorized optimality test of one basis for a batch of samples."""
+
+    def __init__(self, form: StandardForm, basis: np.ndarray, x: np.ndarray, tolerance: float):
+        """
+        :param form: Standard form of the nominal problem.
+        :param basis: Standard form column indices of the basis, artificial columns included.
+        :param x: Structural values of the solve that found the basis, which place its nonbasic
+            variables on their bounds.
+        """
+        m, N = form.shape
+        n = form.n_structural
+        self.form = form
+        self.basis = basis
+        self.nonbasic = np.setdiff1d(np.arange(N), basis)
+        self.lower = np.concatenate([form.lower, np.zeros(m)])[basis]
+        self.upper = np.concatenate([form.upper, np.zeros(m)])[basis]
+
+        # Nonbasic slacks sit on their zero lower bound; structural ones on the closer bound.
+        lower, upper = form.lower[self.nonbasic], form.upper[self.nonbasic]
+        hint = np.concatenate([x, np.zeros(N - n)])[self.nonbasic]
+        fixed = lower == upper
+        self.at_lower = ~fixed & np.isfinite(lower) & (~np.isfinite(upper) | (np.abs(hint - lower) <= np.abs(hint - upper)))
+        self.at_upper = ~fixed & ~self.at_lower & np.isfinite(upper)
+        self.free = ~fixed & ~self.at_lower & ~self.at_upper
+        self.nonbasic_values = np.where(self.at_lower | fixed, lower, np.where(self.at_upper, upper, 0.0))
+        self.tolerance = tolerance
+
+    def __call__(self, samples: _Samples) -> tuple[np.ndarray, np.ndarray]:
+        """Mask of the samples for which the basis is optimal, and their structural values."""
+        form = self.form
+        m, N = form.shape
+        n = form.n_structural
+        count = len(samples)
+
+        sign = form.row_sign
+        slacks = form.A[:, n:]
+        if samples.A is None:
+            A = np.broadcast_to(np.hstack([form.A, np.eye(m)]), (count, m, N + m))
+        else:
+            A = np.concatenate(
+                [samples.A * sign[None, :, None], np.broadcast_to(slacks, (count, m, N - n)), np.broadcast_to(np.eye(m), (count, m, m))],
+                axis=2,
+            )
+        cost = np.hstack([-samples.c if form.maximize else samples.c, np.zeros((count, N + m - n))])
+
+        B = A[:, :, self.basis]
+        A_N = A[:, :, self.nonbasic]
+        rhs = samples.b * sign - A_N @ self.nonbasic_values
+        try:
+            x_B = np.linalg.solve(B, rhs[:, :, None])[:, :, 0]
+            y = np.linalg.solve(np.transpose(B, (0, 2, 1)), cost[:, self.basis, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            return np.zeros(count, dtype=bool), np.empty((0, n))
+
+        reduced = cost[:, self.nonbasic] - np.einsum("km,kmj->kj", y, A_N)
+        slack = self.tolerance * (1.0 + np.abs(x_B))
+        scale = self.tolerance * (1.0 + np.abs(cost[:, self.nonbasic]))
+        optimal = (
+            np.all((x_B >= self.lower - slack) & (x_B <= self.upper + slack), axis=1)
+            & np.all(~self.at_lower | (reduced >= -scale), axis=1)
+            & np.all(~self.at_upper | (reduced <= scale), axis=1)
+            & np.all(~self.free | (np.abs(reduced) <= scale), axis=1)
+        )
+
+        values = np.zeros((int(optimal.sum()), N + m))
+        values[:, self.nonbasic] = self.nonbasic_values
+        values[:, self.basis] = x_B[optimal]
+        return optimal, values[:, :n]
+
+
+def monte_carlo(
+    arrays: LpArrays,
+    uncertainties: list[Uncertainty],
+    samples: int = 1000,
+    seed: int | None = None,
+    batch_size: int = 256,
+    workers: int = 1,
+    max_bases: int = 8,
+    tolerance: float = 1e-7,
+    verification: CertificateTolerances = CertificateTolerances(),
+) -> MonteCarloResult:
+    """
+    Solve a linear program for random draws of its uncertain coefficients.
+
+    :param arrays: The nominal problem (integrality is ignored).
+    :param uncertainties: Distributions of the uncertain coefficients; the others keep their nominal value.
+    :param samples: Number of samples.
+    :param seed: Seed of the random generator; the same seed gives the same samples and results.
+    :param batch_size: Number of samples tested and solved together.
+    :param workers: Number of processes solving the samples no known basis fits (1 solves in-process).
+    :param max_bases: Number of most frequent bases tried on each batch before solving.
+    :param tolerance: Feasibility and optimality tolerance of the basis test.
+    :param verification: Tolerances of the certificate every solved sample is checked against.
+    :return: The distribution of the optimal value, bases and binding constraints.
+    """
+    rng = np.random.default_rng(seed)
+    form = StandardForm.from_arrays(arrays)
+    m, n = arrays.shape
+    equality = np.array([symbol == ConstraintSymbol.EQUAL for symbol in arrays.senses], dtype=bool)
+
+    nominal = RevisedSimplex(arrays).solve()
+    warm_start = nominal.basis if nominal.is_optimal else None
+
+    objective_values = np.full(samples, np.nan)
+    statuses = Counter()
+    basis_counts = Counter()
+    binding_counts = np.zeros(m, dtype=int)
+    tests: dict[tuple[int, ...], _BasisTest] = {}
+    fast_path = solves = flagged = 0
+
+    def add_basis(basis: np.ndarray, x: np.ndarray):
+        key = tuple(int(column) for column in basis)
+        if key not in tests:
+            tests[key] = _BasisTest(form, np.asarray(key), x, tolerance)
+        return key
+
+    def record(indices: np.ndarray, batch: _Samples, x: np.ndarray, key: tuple[int, ...]):
+        c = batch.c
+        activity = np.einsum("kmj,kj->km", batch.A, x) if batch.A is not None else x @ arrays.A.T
+        binding = equality | (np.abs(batch.b - activity) <= tolerance * (1.0 + np.abs(batch.b)))
+        objective_values[indices] = np.einsum("kj,kj->k", c, x)
+        binding_counts[:] += binding.sum(axis=0)
+        statuses[OPTIMAL] += len(indices)
+        basis_counts[key] += len(indices)
+
+    if nominal.is_optimal:
+        add_basis(nominal.basis, nominal.x)
+
+    executor = solver_pool(workers)
+    for start in range(0, samples, batch_size):
+        indices = np.arange(start, min(start + batch_size, samples))
+        batch = _sample(arrays, uncertainties, len(indices), rng)
+
+        # Fast path: the most frequent known bases first.
+        candidates = sorted(tests, key=lambda key: -basis_counts[key])[:max_bases]
+        for key in candidates:
+            if len(indices) == 0:
+                break
+            optimal, x = tests[key](batch)
+            if optimal.any():
+                record(indices[optimal], batch.take(optimal), x, key)
+                fast_path += int(optimal.sum())
+                indices, batch = indices[~optimal], batch.take(~optimal)
+
+        if len(indices) == 0:
+            continue
+        solves += len(indices)
+        chunks = np.array_split(np.arange(len(indices)), max(1, min(workers, len(indices))))
+        if executor is not None and len(chunks) > 1:
+            outcomes = executor.map(
+                _solve_chunk,
+                [arrays] * len(chunks),
+                [batch.take(chunk) for chunk in chunks],
+                [warm_start] * len(chunks),
+                [verification] * len(chunks),
+            )
+        else:
+            outcomes = [_solve_chunk(arrays, batch, warm_start, verification)]
+        results = [result for outcome in outcomes for result in outcome]
+
+        for k, (status, x, basis, verified) in enumerate(results):
+            if status != OPTIMAL:
+                statuses[status] += 1
+                continue
+            flagged += not verified
+            key = add_basis(basis, x)
+            single = np.zeros(len(indices), dtype=bool)
+            single[k] = True
+            record(indices[single], batch.take(single), x[None, :], key)
+
+    return MonteCarloResult(
+        seed=seed,
+        objective_values=objective_values,
+        statuses=statuses,
+        basis_counts=basis_counts,
+        binding_counts=binding_counts,
+        fast_path=fast_path,
+        solves=solves,
+        flagged=flagged,
+    )
@@ -0,0 +1,633 @@
+"""
+Native revised simplex engine.
+
+The problem is brought to the form ``min cost @ x  s.t.  A @ x = b, lower <= x <= upper`` by adding
+one slack column per inequality. Variable bounds are handled implicitly: a nonbasic variable sits at
+one of its bounds (or at zero when it is free), the primal ratio test lets the entering variable flip
+to its opposite bound without a basis change, and the dual simplex uses the bound-flipping ratio test,
+so bounds never add rows to the basis. The engine keeps an explicit basis inverse, updated with
+product-form (eta) pivots and refactorized periodically, so a solve can be warm-started from any basis
+of a previous solve.
+"""
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.pivot_history import PivotHistory
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+
+
+OPTIMAL = "Optimal"
+INFEASIBLE = "Infeasible"
+UNBOUNDED = "Unbounded"
+NOT_SOLVED = "Not Solved"
+
+
+@dataclass
+class SimplexResult:
+    """
+    Result of a native solve, in the units of the arrays that were solved.
+
+    ``duals`` are the derivatives of the objective value with respect to each right-hand side and
+    ``reduced_costs`` are ``c - duals @ A``, both with the same sign conventions as PuLP's ``pi`` and ``dj``.
+    ``basis`` holds column indices of the standard form (structural columns first, then slacks).
+    When the status is ``"Unbounded"``, ``ray`` is a direction of the structural variables along which
+    the problem stays feasible and the objective improves without limit. When phase one proves the problem
+    infeasible, ``farkas`` holds the phase-one duals of the rows: the rows with a nonzero entry, with the
+    bounds of the variables where ``farkas @ A`` is nonzero, are already infeasible by themselves.
+    """
+    status: str
+    objective_value: float | None
+    x: np.ndarray
+    slacks: np.ndarray
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    basis: np.ndarray
+    iterations: int = 0
+    barrier_iterations: int = 0
+    history: PivotHistory | None = field(default=None, repr=False)
+    ray: np.ndarray | None = field(default=None, repr=False)
+    farkas: np.ndarray | None = field(default=None, repr=False)
+
+    @property
+    def is_optimal(self) -> bool:
+        return self.status == OPTIMAL
+
+
+@dataclass
+class StandardForm:
+    """
+    Form ``min cost @ x  s.t.  A @ x = b, lower <= x <= upper`` of an LpArrays problem.
+
+    Slack columns (bounded by ``x >= 0``) follow the structural columns. Rows are negated where the
+    right-hand side is below the activity of the initial nonbasic values, so that phase one can start
+    from nonnegative artificial variables.
+    """
+    A: np.ndarray
+    b: np.ndarray
+    cost: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    row_sign: np.ndarray
+    n_structural: int
+    slack_columns: np.ndarray = field(repr=False)
+    maximize: bool = False
+
+    @classmethod
+    def from_arrays(cls, arrays: LpArrays) -> "StandardForm":
+        m, n = arrays.shape
+        slack_rows = [i for i, symbol in enumerate(arrays.senses) if symbol != ConstraintSymbol.EQUAL]
+
+        slacks = np.zeros((m, len(slack_rows)))
+        slack_columns = np.full(m, -1)
+        for k, i in enumerate(slack_rows):
+            slacks[i, k] = 1.0 if arrays.senses[i] == ConstraintSymbol.LESS_THAN_OR_EQUAL else -1.0
+            slack_columns[i] = n + k
+
+        lower = np.concatenate([arrays.lower, np.zeros(len(slack_rows))])
+        upper = np.concatenate([arrays.upper, np.full(len(slack_rows), np.inf)])
+        initial = initial_values(lower, upper)
+
+        row_sign = np.where(arrays.b - arrays.A @ initial[:n] < 0, -1.0, 1.0)
+        A = np.hstack([arrays.A, slacks]) * row_sign[:, None]
+        objective = -arrays.c if arrays.maximize else arrays.c
+
+        return cls(
+            A=A,
+            b=row_sign * arrays.b,
+            cost=np.concatenate([objective, np.zeros(len(slack_rows))]),
+            lower=lower,
+            upper=upper,
+            row_sign=row_sign,
+            n_structural=n,
+            slack_columns=slack_columns,
+            maximize=arrays.maximize,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.A.shape
+
+    def column_values(self, x: np.ndarray) -> np.ndarray:
+        """Values of the structural and slack columns for structural values ``x``."""
+        n = self.n_structural
+        values = np.zeros(self.shape[1])
+        values[:n] = x
+        rows = np.flatnonzero(self.slack_columns >= 0)
+        columns = self.slack_columns[rows]
+        values[columns] = (self.b[rows] - self.A[rows, :n] @ x) / self.A[rows, columns]
+        return values
+
+
+def initial_values(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Starting value of nonbasic variables: the lower bound, else the upper bound, else zero (free)."""
+    return np.where(np.isfinite(lower), lower, np.where(np.isfinite(upper), upper, 0.0))
+
+
+class RevisedSimplex:
+    """
+    Two-phase bounded revised simplex with a dual simplex for warm starts.
+
+    :param arrays: The problem to solve.
+    :param tolerance: Feasibility and optimality tolerance.
+    :param max_iterations: Iteration limit; defaults to a multiple of the problem size.
+    :param refactor_frequency: Number of eta updates between two refactorizations of the basis inverse.
+    :param record_history: Keep a PivotHistory of the solve, from which every intermediate tableau can be rebuilt.
+    :param progress: Receives throttled progress events during the solve.
+    """
+
+    def __init__(
+        self,
+        arrays: LpArrays,
+        tolerance: float = 1e-9,
+        max_iterations: int | None = None,
+        refactor_frequency: int = 64,
+        record_history: bool = False,
+        progress: ProgressReporter | None = None,
+    ):
+        self.arrays = arrays
+        self.form = StandardForm.from_arrays(arrays)
+        m, N = self.form.shape
+
+        self.tolerance = tolerance
+        self.pivot_tolerance = 1e-9
+        self.max_iterations = max_iterations if max_iterations is not None else 50 * (m + N) + 100
+        self.refactor_frequency = refactor_frequency
+        self.record_history = record_history
+        self.progress = progress
+
+        # One artificial column per row is always present; artificials can leave but never enter,
+        # and outside phase one they are fixed at zero.
+        self._A = np.hstack([self.form.A, np.eye(m)])
+        self._enterable = np.concatenate([np.ones(N, dtype=bool), np.zeros(m, dtype=bool)])
+        self._phase_one_cost = np.concatenate([np.zeros(N), np.ones(m)])
+        self._phase_two_cost = np.concatenate([self.form.cost, np.zeros(m)])
+        self._lower = np.concatenate([self.form.lower, np.zeros(m)])
+        self._upper = np.concatenate([self.form.upper, np.zeros(m)])
+
+        self.basis = np.zeros(m, dtype=int)
+        self.binv = np.eye(m)
+        self.x_basic = np.zeros(m)
+        # Values of the nonbasic variables (zero in basic positions).
+        self.x_nonbasic = np.zeros(N + m)
+        self.iterations = 0
+        self.bound_flips = 0
+        self.history: PivotHistory | None = None
+        self._phase = 2
+        # Entering column and direction of the last primal step that nothing blocked.
+        self._unbounded: tuple[int, float] | None = None
+        self._farkas: np.ndarray | None = None
+
+    # ------------------------------------------------------------------ public API
+
+    def solve(self, basis: Sequence[int] | None = None) -> SimplexResult:
+        """
+        Solve the problem, optionally warm-started from a basis of a previous solve.
+
+        Nonbasic variables of the warm-start basis are placed at the bound their reduced cost
+        points to. A basis that is then primal feasible continues with the primal simplex, one that
+        is only dual feasible (for example after a right-hand side or bound change) continues with
+        the dual simplex; anything else falls back to a cold two-phase solve.
+
+        :param basis: Standard form column indices, one per row.
+        :return: The solve result.
+        """
+        self.iterations = 0
+        self.bound_flips = 0
+        self.history = None
+        self._unbounded = None
+        self._farkas = None
+        if np.any(self.form.lower > self.form.upper):
+            return self._result(INFEASIBLE)
+        status = None
+
+        if basis is not None and self._load_basis(basis):
+            self._start_history(2)
+            if self._primal_infeasibility().max(initial=0.0) <= self.tolerance:
+                status = self._primal(self._phase_two_cost)
+            elif self._dual_feasible(self._phase_two_cost):
+                status = self._dual(self._phase_two_cost)
+                if status == OPTIMAL:
+                    status = self._primal(self._phase_two_cost)
+
+        if status is None:
+            status = self._two_phase()
+
+        return self._result(status)
+
+    def reoptimize(self, c: np.ndarray) -> SimplexResult:
+        """
+        Re-optimize the last solve for a new objective, continuing from its basis without refactorizing.
+
+        Only the objective changes, so the optimal basis of the last solve stays primal feasible and the
+        primal simplex goes on from it. Call it after a solve that ended optimal.
+
+        :param c: New objective coefficients of the structural variables.
+        :return: The solve result.
+        """
+        self.arrays = self.arrays.with_objective(c)
+        n = self.form.n_structural
+        self.form.cost[:n] = -self.arrays.c if self.arrays.maximize else self.arrays.c
+        self._phase_two_cost[:n] = self.form.cost[:n]
+        self.iterations = 0
+        self.history = None
+        self._unbounded = None
+        self._phase = 2
+        return self._result(self._primal(self._phase_two_cost))
+
+    # ------------------------------------------------------------------ phases
+
+    def _two_phase(self) -> str:
+        m, N = self.form.shape
+        basis = np.arange(N, N + m)
+        for i, column in enumerate(self.form.slack_columns):
+            if column >= 0 and self.form.A[i, column] > 0:
+                basis[i] = column
+
+        self.basis = basis
+        self.binv = np.eye(m)
+        self.x_nonbasic = np.concatenate([initial_values(self.form.lower, self.form.upper), np.zeros(m)])
+        self.x_nonbasic[basis] = 0.0
+        self.x_basic = self.form.b - self._A @ self.x_nonbasic
+
+        # A starting basis of slacks only is already feasible and needs no phase one.
+        if np.all(basis < N):
+            self._start_history(2)
+            return self._primal(self._phase_two_cost)
+        self._start_history(1)
+
+        phase_one_cost = self._phase_one_cost
+        self._upper[N:] = np.inf
+        try:
+            status = self._primal(phase_one_cost)
+        finally:
+            self._upper[N:] = 0.0
+        if status == NOT_SOLVED:
+            return status
+        if phase_one_cost[self.basis] @ self.x_basic > self.tolerance * (1 + np.abs(self.form.b).max(initial=0)):
+            self._farkas = (phase_one_cost[self.basis] @ self.binv) * self.form.row_sign
+            return INFEASIBLE
+
+        self._drive_out_artificials()
+        self._phase = 2
+        if self.history is not None:
+            self.history.record_phase_change()
+        return self._primal(self._phase_two_cost)
+
+    def _start_history(self, phase: int):
+        self._phase = phase
+        if not self.record_history:
+            return
+        n = self.form.n_structural
+        slack_rows = np.flatnonzero(self.form.slack_columns >= 0)
+        self.history = PivotHistory(
+            A=self._A,
+            b=self.form.b,
+            costs=(self._phase_one_cost, self._phase_two_cost),
+            column_names=self.arrays.variable_names[:n] + tuple(f"s{i + 1}" for i in slack_rows),
+            slack_columns=self.form.slack_columns,
+            maximize=self.arrays.maximize,
+            basis=self.basis,
+            x_nonbasic=self.x_nonbasic,
+            phase=phase,
+            refactor_frequency=self.refactor_frequency,
+        )
+
+    def _drive_out_artificials(self):
+        """Pivot zero-level artificials out of the basis; rows where that is impossible are redundant."""
+        N = self.form.shape[1]
+        for r in np.flatnonzero(self.basis >= N):
+            row = self.binv[r] @ self._A[:, :N]
+            row[self.basis[self.basis < N]] = 0.0
+            candidates = np.flatnonzero(np.abs(row) > 1e-7)
+            if candidates.size:
+                q = candidates[np.argmax(np.abs(row[candidates]))]
+                self._pivot(q, r, self.binv @ self._A[:, q], 0.0)
+
+    def _primal(self, cost: np.ndarray) -> str:
+        stalled = 0
+        while True:
+            if self.iterations >= self.max_iterations:
+                return NOT_SOLVED
+
+            reduced = self._reduced_costs(cost)
+            improving = self._nonbasic_enterable() & (
+                ((reduced < -self.tolerance) & (self.x_nonbasic < self._upper - self.tolerance))
+                | ((reduced > self.tolerance) & (self.x_nonbasic > self._lower + self.tolerance))
+            )
+            candidates = np.flatnonzero(improving)
+            if self.progress is not None and self.progress.due():
+                phase = SolvePhase.PHASE_ONE if self._phase == 1 else SolvePhase.PHASE_TWO
+                self._report_progress(phase, cost, float(np.abs(reduced[candidates]).sum()))
+            if candidates.size == 0:
+                return OPTIMAL
+
+            # Dantzig pricing, with Bland's rule while the objective is stalled to avoid cycling.
+            bland = stalled > 50
+            q = candidates[0] if bland else candidates[np.argmax(np.abs(reduced[candidates]))]
+            direction = 1.0 if reduced[q] < 0 else -1.0
+            step = self._primal_step(q, direction, bland)
+            if not np.isfinite(step):
+                self._unbounded = (int(q), direction)
+                return UNBOUNDED
+            stalled = stalled + 1 if step <= self.tolerance else 0
+
+    def _primal_step(self, q: int, direction: float, bland: bool = False) -> float:
+        """
+        Move nonbasic column ``q`` in ``direction`` until a basic variable or its own opposite bound blocks it.
+
+        :return: The step taken (infinite when nothing blocks, in which case nothing changed).
+        """
+        alpha = self.binv @ self._A[:, q]
+        step, r, target = self._ratio_test(alpha, direction, bland)
+
+        # The entering variable reaching its opposite bound first is a bound flip: no basis change.
+        span = self._upper[q] - self.x_nonbasic[q] if direction > 0 else self.x_nonbasic[q] - self._lower[q]
+        if span <= step:
+            if not np.isfinite(span):
+                return np.inf
+            self._flip(np.array([q]), np.array([direction * span]))
+            if self.history is not None:
+                self.history.record_flip(q, direction * span, self._phase)
+            self.iterations += 1
+            self.bound_flips += 1
+            return span
+
+        self._pivot(q, r, alpha, target)
+        return step
+
+    def _dual(self, cost: np.ndarray) -> str:
+        while True:
+            if self.iterations >= self.max_iterations:
+                return NOT_SOLVED
+
+            infeasibility = self._primal_infeasibility()
+            if self.progress is not None and self.progress.due():
+                self._report_progress(SolvePhase.DUAL_SIMPLEX, cost, 0.0)
+            r = int(np.argmax(infeasibility)) if infeasibility.size else 0
+            if infeasibility.size == 0 or infeasibility[r] <= self.tolerance:
+                return OPTIMAL
+
+            leaving = self.basis[r]
+            below = self.x_basic[r] < self._lower[leaving]
+            target = self._lower[leaving] if below else self._upper[leaving]
+
+            q, flips = self._dual_ratio_test(r, below, cost, infeasibility[r])
+            if q is None:
+                return INFEASIBLE
+            steps = None
+            if flips.size:
+                directions = np.where(self.x_nonbasic[flips] >= self._upper[flips] - self.tolerance, -1.0, 1.0)
+                steps = directions * (self._upper[flips] - self._lower[flips])
+                self._flip(flips, steps)
+                self.bound_flips += flips.size
+            self._pivot(q, r, self.binv @ self._A[:, q], target, flips if flips.size else None, steps)
+
+    def _dual_ratio_test(self, r: int, below: bool, cost: np.ndarray, infeasibility: float) -> tuple[int | None, np.ndarray]:
+        """
+        Entering column for the basic variable of row ``r`` leaving through its lower (``below``) or upper bound.
+
+        :return: The entering column (None when no nonbasic variable can move the row back, which proves
+            the problem infeasible) and the columns to flip before the pivot.
+        """
+        # x_B[r] moves by -row[j] * dx_j; it has to go up when below its lower bound.
+        row = self.binv[r] @ self._A
+        signed = -row if below else row
+        reduced = self._reduced_costs(cost)
+        nonbasic = self._nonbasic_enterable() & (self._upper > self._lower)
+        at_upper = self.x_nonbasic >= self._upper - self.tolerance
+        free = ~np.isfinite(self._lower) & ~np.isfinite(self._upper)
+        eligible = nonbasic & (
+            (free & (np.abs(signed) > self.pivot_tolerance))
+            | (~at_upper & ~free & (signed > self.pivot_tolerance))
+            | (at_upper & ~free & (signed < -self.pivot_tolerance))
+        )
+        candidates = np.flatnonzero(eligible)
+        if candidates.size == 0:
+            return None, np.zeros(0, dtype=int)
+        return self._bound_flipping_ratio_test(candidates, reduced, signed, infeasibility)
+
+    def _bound_flipping_ratio_test(
+        self,
+        candidates: np.ndarray,
+        reduced: np.ndarray,
+        signed: np.ndarray,
+        infeasibility: float,
+    ) -> tuple[int | None, np.ndarray]:
+        """
+        Long-step dual ratio test.
+
+        Candidates are passed in order of their dual ratio. Passing a boxed candidate flips it to its
+        opposite bound, which reduces the primal infeasibility of the leaving row by ``|row_j| * span_j``;
+        the entering variable is the first candidate that cannot be passed while the row stays infeasible.
+
+        :return: The entering column (None if every candidate could be flipped, which proves the
+            problem infeasible) and the columns to flip before the pivot.
+        """
+        ratios = np.abs(reduced[candidates]) / np.abs(signed[candidates])
+        order = np.lexsort((-np.abs(signed[candidates]), ratios))
+        slope = infeasibility
+        flips = []
+        for k in order:
+            j = candidates[k]
+            span = self._upper[j] - self._lower[j]
+            decrease = abs(signed[j]) * span
+            if not np.isfinite(span) or slope - decrease <= self.tolerance:
+                return int(j), np.array(flips, dtype=int)
+            slope -= decrease
+            flips.append(j)
+        return None, np.array(flips, dtype=int)
+
+    def _report_progress(self, phase: SolvePhase, cost: np.ndarray, dual_infeasibility: float):
+        values = self.x_nonbasic.copy()
+        values[self.basis] = self.x_basic
+        objective = float(cost @ values)
+        if phase != SolvePhase.PHASE_ONE and self.form.maximize:
+            objective = -objective
+        self.progress.emit(ProgressEvent(
+            phase=phase,
+            iteration=self.iterations,
+            objective_value=objective,
+            primal_infeasibility=float(self._primal_infeasibility().sum()),
+            dual_infeasibility=dual_infeasibility,
+            elapsed=self.progress.elapsed,
+        ))
+
+    # ------------------------------------------------------------------ linear algebra
+
+    def _nonbasic_enterable(self) -> np.ndarray:
+        mask = self._enterable.copy()
+        mask[self.basis] = False
+        return mask
+
+    def _reduced_costs(self, cost: np.ndarray) -> np.ndarray:
+        y = cost[self.basis] @ self.binv
+        reduced = cost - y @ self._A
+        reduced[~self._nonbasic_enterable()] = 0.0
+        return reduced
+
+    def _primal_infeasibility(self) -> np.ndarray:
+        lower = self._lower[self.basis]
+        upper = self._upper[self.basis]
+        return np.maximum(np.maximum(lower - self.x_basic, self.x_basic - upper), 0.0)
+
+    def _dual_feasible(self, cost: np.ndarray) -> bool:
+        reduced = self._reduced_costs(cost)
+        can_increase = self.x_nonbasic < self._upper - self.tolerance
+        can_decrease = self.x_nonbasic > self._lower + self.tolerance
+        improving = ((reduced < -self.tolerance) & can_increase) | ((reduced > self.tolerance) & can_decrease)
+        return not np.any(improving & self._nonbasic_enterable())
+
+    def _ratio_test(self, alpha: np.ndarray, direction: float, bland: bool = False) -> tuple[float, int | None, float]:
+        """
+        Largest step of the entering variable in ``direction`` that keeps the basic variables within bounds.
+
+        :return: The step, the blocking row (None if no basic variable blocks) and the bound the
+            blocking variable leaves at.
+        """
+        lower = self._lower[self.basis]
+        upper = self._upper[self.basis]
+        change = -direction * alpha
+
+        decreasing = np.flatnonzero((change < -self.pivot_tolerance) & np.isfinite(lower))
+        increasing = np.flatnonzero((change > self.pivot_tolerance) & np.isfinite(upper))
+        rows = np.concatenate([decreasing, increasing])
+        if rows.size == 0:
+            return np.inf, None, 0.0
+
+        room = np.concatenate([self.x_basic[decreasing] - lower[decreasing], upper[increasing] - self.x_basic[increasing]])
+        ratios = np.maximum(room, 0.0) / np.abs(change[rows])
+        best = ratios.min()
+        ties = np.flatnonzero(ratios <= best + self.tolerance)
+        k = ties[np.argmin(self.basis[rows[ties]])] if bland else ties[np.argmax(np.abs(alpha[rows[ties]]))]
+        r = int(rows[k])
+        target = lower[r] if k < decreasing.size else upper[r]
+        return float(best), r, float(target)
+
+    def _flip(self, columns: np.ndarray, steps: np.ndarray):
+        """Move nonbasic variables to their opposite bounds and update the basic values."""
+        self.x_nonbasic[columns] += steps
+        self.x_basic -= self.binv @ (self._A[:, columns] @ steps)
+
+    def _pivot(
+        self,
+        q: int,
+        r: int,
+        alpha: np.ndarray,
+        target: float,
+        flips: np.ndarray | None = None,
+        steps: np.ndarray | None = None,
+    ):
+        """
+        Bring column ``q`` into the basis at row ``r``; the leaving variable becomes nonbasic at ``target``.
+
+        ``flips`` and ``steps`` are the bound flips already applied for this pivot, passed only to be recorded.
+        """
+        theta = (self.x_basic[r] - target) / alpha[r]
+        leaving = self.basis[r]
+        if self.history is not None:
+            self.history.record_pivot(q, r, leaving, alpha, target, self._phase, flips, steps)
+        entering_value = self.x_nonbasic[q] + theta
+        self.x_basic -= theta * alpha
+        self.x_basic[r] = entering_value
+        self.x_nonbasic[q] = 0.0
+        self.x_nonbasic[leaving] = target
+
+        pivot_row = self.binv[r] / alpha[r]
+        self.binv -= np.outer(alpha, pivot_row)
+        self.binv[r] = pivot_row
+
+        self.basis[r] = q
+        self.iterations += 1
+        if self.iterations % self.refactor_frequency == 0:
+            self._refactor()
+
+    def _refactor(self):
+        self.binv = np.linalg.inv(self._A[:, self.basis])
+        self.x_basic = self.binv @ (self.form.b - self._A @ self.x_nonbasic)
+
+    def _load_basis(self, basis: Sequence[int]) -> bool:
+        m, N = self.form.shape
+        basis = np.asarray(basis, dtype=int)
+        if basis.shape != (m,) or len(set(basis.tolist())) != m or basis.min(initial=0) < 0 or basis.max(initial=0) >= N:
+            return False
+        try:
+            binv = np.linalg.inv(self._A[:, basis])
+        except np.linalg.LinAlgError:
+            return False
+        if not np.all(np.isfinite(binv)):
+            return False
+
+        self.basis = basis.copy()
+        self.binv = binv
+
+        # Each nonbasic variable goes to the bound that keeps its reduced cost dual feasible.
+        reduced = self._reduced_costs(self._phase_two_cost)
+        lower, upper = self._lower, self._upper
+        values = initial_values(lower, upper)
+        prefer_upper = (reduced < -self.tolerance) & np.isfinite(upper)
+        values[prefer_upper] = upper[prefer_upper]
+        values[N:] = 0.0
+        values[self.basis] = 0.0
+        self.x_nonbasic = values
+        self.x_basic = binv @ (self.form.b - self._A @ values)
+        return True
+
+    # ------------------------------------------------------------------ results
+
+    def _ray(self) -> np.ndarray | None:
+        """Structural part of the edge the unbounded step would have followed: the entering column moves, the basis follows."""
+        if self._unbounded is None:
+            return None
+        q, direction = self._unbounded
+        values = np.zeros(self._A.shape[1])
+        values[q] = direction
+        values[self.basis] -= direction * (self.binv @ self._A[:, q])
+        return values[: self.form.n_structural]
+
+    def _result(self, status: str) -> SimplexResult:
+        m, N = self.form.shape
+        n = self.form.n_structural
+        arrays = self.arrays
+
+        if status != OPTIMAL:
+            return SimplexResult(
+                status=status,
+                objective_value=None,
+                x=np.zeros(n),
+                slacks=np.zeros(m),
+                duals=np.zeros(m),
+                reduced_costs=np.zeros(n),
+                basis=self.basis.copy(),
+                iterations=self.iterations,
+                history=self.history,
+                ray=self._ray() if status == UNBOUNDED else None,
+                farkas=self._farkas if status == INFEASIBLE else None,
+            )
+
+        values = self.x_nonbasic.copy()
+        values[self.basis] = np.clip(self.x_basic, self._lower[self.basis], self._upper[self.basis])
+        x = values[:n]
+
+        # Duals of the internal minimization, mapped back to d(objective)/d(b) of the original rows.
+        y = self._phase_two_cost[self.basis] @ self.binv
+        reduced = self.form.cost[:n] - y @ self.form.A[:, :n]
+        duals = y * self.form.row_sign
+        if arrays.maximize:
+            duals, reduced = -duals, -reduced
+
+        return SimplexResult(
+            status=status,
+            objective_value=float(arrays.c @ x),
+            x=x,
+            slacks=arrays.b - arrays.A @ x,
+            duals=duals,
+            reduced_costs=reduced,
+            basis=self.basis.copy(),
+            iterations=self.iterations,
+            history=self.history,
+        )
@@ -0,0 +1,822 @@
+"""
+Specialized solvers for network-structured linear programs.
+
+A constraint matrix is a network matrix when, after negating some rows, every column has at most one
++1 and one -1 and nothing else: each row is then the flow balance of a node and each variable an arc.
+Slack columns, and columns with a single nonzero, are arcs to an extra root node whose balance is
+implied. Transportation problems (every variable ships from one supply row to one demand row) and
+assignment problems (as many supply as demand rows, all of them 1) are the common special cases.
+
+All of them are solved by a network simplex, which keeps the basis as a spanning tree (parent pointers
+and node potentials) instead of a basis inverse, so a pivot only walks a cycle of the tree. Transportation
+problems start from Vogel's approximation and their pivots are the MODI method (the node potentials are
+the u and v multipliers); assignment problems are solved by the Hungarian algorithm, whose matching and
+potentials only have to be completed into a tree. Every solver returns a SimplexResult with the duals,
+the reduced costs and an optimal basis of the standard form, so the analyses work unchanged.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Sequence
+
+import numpy as np
+
+from data.app_state import ConstraintSymbol
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import SimplexResult, OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+
+
+class ProblemStructure(Enum):
+    """Structure of the constraint matrix, from the most general to the most specific."""
+    GENERAL = "general"
+    NETWORK = "network"
+    TRANSPORTATION = "transportation"
+    ASSIGNMENT = "assignment"
+
+
+@dataclass(frozen=True)
+class NetworkForm:
+    """
+    Arc form of a network-structured LpArrays problem.
+
+    Nodes are the constraint rows and the root ``m``. Row ``i`` multiplied by ``row_sign[i]`` reads
+    ``outflow - inflow = supply[i]``; arc ``j`` goes from ``tail[j]`` to ``head[j]`` and costs ``cost[j]``
+    (of the minimization). Arcs are the standard form columns: structural columns, then one slack per
+    inequality row (``slack_columns[i]``, -1 for equalities). In transportation and assignment problems the
+    supply rows are the ones with ``row_sign`` +1 and the demand rows the ones with -1.
+    """
+    structure: ProblemStructure
+    row_sign: np.ndarray
+    supply: np.ndarray
+    tail: np.ndarray
+    head: np.ndarray
+    cost: np.ndarray
+    slack_columns: np.ndarray
+    n_structural: int
+
+    @classmethod
+    def from_arrays(cls, arrays: LpArrays) -> "NetworkForm | None":
+        """
+        Detect the network structure of a problem.
+
+        Variables must be bounded only by ``x >= 0`` (an upper bound the structure already implies, like
+        ``x <= 1`` in an assignment, is allowed). With integer variables the right-hand side must be
+        integer, so that the optimal vertices, which the network simplex returns, are integer.
+
+        :return: The arc form, or None when the problem is not a network problem.
+        """
+        m, n = arrays.shape
+        A = arrays.A
+        if m == 0 or n == 0 or np.any(arrays.lower != 0.0):
+            return None
+        if not np.all((A == 0.0) | (np.abs(A) == 1.0)):
+            return None
+        nonzero = A != 0.0
+        counts = nonzero.sum(axis=0)
+        if np.any(counts == 0) or np.any(counts > 2):
+            return None
+        if arrays.is_mixed_integer and not np.all(arrays.b == np.round(arrays.b)):
+            return None
+
+        columns = np.arange(n)
+        first = np.argmax(nonzero, axis=0)
+        last = m - 1 - np.argmax(nonzero[::-1], axis=0)
+        pairs = counts == 2
+        row_sign, components = _row_signs(m, first[pairs], last[pairs], -A[first[pairs], columns[pairs]] * A[last[pairs], columns[pairs]])
+        if row_sign is None:
+            return None
+
+        structure = ProblemStructure.NETWORK
+        if np.all(pairs) and np.all(A[nonzero] == 1.0):
+            oriented = _orient_bipartite(arrays, row_sign, components)
+            if oriented is not None:
+                row_sign = oriented
+                structure = ProblemStructure.TRANSPORTATION
+                supply_rows = np.where(row_sign[first] > 0, first, last)
+                demand_rows = np.where(row_sign[first] > 0, last, first)
+                if (
+                    np.sum(row_sign > 0) == np.sum(row_sign < 0)
+                    and np.all(arrays.b == 1.0)
+                    and np.unique(supply_rows * m + demand_rows).size == n
+                ):
+                    structure = ProblemStructure.ASSIGNMENT
+                if not _bounds_implied(arrays, supply_rows, demand_rows):
+                    return None
+        if structure == ProblemStructure.NETWORK and np.any(np.isfinite(arrays.upper)):
+            return None
+
+        signed = A * row_sign[:, None]
+        tail = np.where((signed == 1.0).any(axis=0), np.argmax(signed == 1.0, axis=0), m)
+        head = np.where((signed == -1.0).any(axis=0), np.argmax(signed == -1.0, axis=0), m)
+
+        slack_rows = np.array([i for i, symbol in enumerate(arrays.senses) if symbol != ConstraintSymbol.EQUAL], dtype=int)
+        slack_columns = np.full(m, -1)
+        slack_columns[slack_rows] = n + np.arange(slack_rows.size)
+        slack_sign = np.array(
+            [1.0 if arrays.senses[i] == ConstraintSymbol.LESS_THAN_OR_EQUAL else -1.0 for i in slack_rows]
+        ) * row_sign[slack_rows]
+        slack_tail = np.where(slack_sign > 0, slack_rows, m)
+        slack_head = np.where(slack_sign > 0, m, slack_rows)
+
+        objective = -arrays.c if arrays.maximize else arrays.c
+        return cls(
+            structure=structure,
+            row_sign=row_sign,
+            supply=row_sign * arrays.b,
+            tail=np.concatenate([tail, slack_tail]).astype(int),
+            head=np.concatenate([head, slack_head]).astype(int),
+            cost=np.concatenate([objective, np.zeros(slack_rows.size)]),
+            slack_columns=slack_columns,
+            n_structural=n,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of rows (nodes other than the root) and of standard form columns (arcs)."""
+        return self.row_sign.size, self.tail.size
+
+    @property
+    def supply_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.row_sign > 0)
+
+    @property
+    def demand_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.row_sign < 0)
+
+
+def detect_structure(arrays: LpArrays) -> ProblemStructure:
+    """Structure of the problem's constraint matrix."""
+    form = NetworkForm.from_arrays(arrays)
+    return form.structure if form is not None else ProblemStructure.GENERAL
+
+
+def _row_signs(m: int, first: np.ndarray, last: np.ndarray, relation: np.ndarray) -> tuple[np.ndarray | None, np.ndarray]:
+    """
+    Signs that turn every two-entry column into a +1/-1 pair: ``sign[last] = relation * sign[first]``.
+
+    :return: The signs (None when they contradict each other) and the connected component of every row.
+    """
+    edges = np.unique(np.stack([first, last, relation.astype(int)], axis=1), axis=0) if first.size else np.zeros((0, 3), dtype=int)
+    neighbours: list[list[tuple[int, int]]] = [[] for _ in range(m)]
+    for p, q, r in edges.tolist():
+        neighbours[p].append((q, r))
+        neighbours[q].append((p, r))
+
+    sign = np.zeros(m)
+    component = np.full(m, -1)
+    for start in range(m):
+        if sign[start]:
+            continue
+        sign[start] = 1.0
+        component[start] = start
+        stack = [start]
+        while stack:
+            p = stack.pop()
+            for q, r in neighbours[p]:
+                if not sign[q]:
+                    sign[q] = r * sign[p]
+                    component[q] = start
+                    stack.append(q)
+                elif sign[q] != r * sign[p]:
+                    return None, component
+    return sign, component
+
+
+def _orient_bipartite(arrays: LpArrays, row_sign: np.ndarray, components: np.ndarray) -> np.ndarray | None:
+    """
+    Flip whole components so that supply rows (+1) are ``<=`` or ``=`` and demand rows (-1) ``>=`` or ``=``.
+
+    :return: The signs of a transportation problem, or None when the rows do not read as supplies and demands.
+    """
+    if np.any(arrays.b < 0):
+        return None
+    is_less = np.array([symbol == ConstraintSymbol.LESS_THAN_OR_EQUAL for symbol in arrays.senses])
+    is_greater = np.array([symbol == ConstraintSymbol.GREATER_THAN_OR_EQUAL for symbol in arrays.senses])
+    oriented = row_sign.copy()
+    for component in np.unique(components):
+        rows = components == component
+        for flip in (1.0, -1.0):
+            signs = row_sign[rows] * flip
+            if not np.any((signs > 0) & is_greater[rows]) and not np.any((signs < 0) & is_less[rows]):
+                oriented[rows] = signs
+                break
+        else:
+            return None
+    return oriented
+
+
+def _bounds_implied(arrays: LpArrays, supply_rows: np.ndarray, demand_rows: np.ndarray) -> bool:
+    """True when every finite upper bound is implied by the supply (and an equality demand) of its arc."""
+    b = arrays.b
+    capacity = b[supply_rows].copy()
+    equal_demand = np.array([arrays.senses[i] == ConstraintSymbol.EQUAL for i in demand_rows], dtype=bool)
+    capacity[equal_demand] = np.minimum(capacity[equal_demand], b[demand_rows[equal_demand]])
+    return bool(np.all(arrays.upper >= capacity))
+
+
+class NetworkSimplex:
+    """
+    Primal network simplex on a spanning tree of the rows and the root.
+
+    The tree holds one arc per row, which is the basis of the standard form; an artificial arc between
+    row ``i`` and the root (column ``N + i``, as in the native simplex) is added where no other arc can
+    start the tree, driven to zero by a first phase and then fixed at zero.
+
+    :param arrays: The problem to solve.
+    :param form: Its arc form; detected from ``arrays`` when not given.
+    :param tolerance: Feasibility and optimality tolerance.
+    :param max_iterations: Pivot limit; defaults to a multiple of the problem size.
+    :param progress: Receives throttled progress events during the solve.
+    """
+
+    def __init__(
+        self,
+        arrays: LpArrays,
+        form: NetworkForm | None = None,
+        tolerance: float = 1e-9,
+        max_iterations: int | None = None,
+        progress: ProgressReporter | None = None,
+    ):
+        self.arrays = arrays
+        self.form = form if form is not None else NetworkForm.from_arrays(arrays)
+        if self.form is None:
+            raise ValueError("The problem does not have a network structure.")
+        m, N = self.form.shape
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations if max_iterations is not None else 50 * (m + N) + 100
+        self.progress = progress
+
+        root = m
+        self._tail = np.concatenate([self.form.tail, np.arange(m)])
+        self._head = np.concatenate([self.form.head, np.full(m, root)])
+        self._phase_one_cost = np.concatenate([np.zeros(N), np.ones(m)])
+        self._phase_two_cost = np.concatenate([self.form.cost, np.zeros(m)])
+        self._upper = np.concatenate([np.full(N, np.inf), np.zeros(m)])
+        self._real = np.concatenate([np.ones(N, dtype=bool), np.zeros(m, dtype=bool)])
+
+        self.flow = np.zeros(N + m)
+        self.potential = np.zeros(m + 1)
+        self.parent = np.full(m + 1, -1)
+        self.parent_arc = np.full(m + 1, -1)
+        self.depth = np.zeros(m + 1, dtype=int)
+        self.children: list[set[int]] = [set() for _ in range(m + 1)]
+        self.in_tree = np.zeros(N + m, dtype=bool)
+        self.iterations = 0
+        self._phase = 2
+
+    # ------------------------------------------------------------------ public API
+
+    def solve(
+        self,
+        basis: Sequence[int] | None = None,
+        x: np.ndarray | None = None,
+        potentials: np.ndarray | None = None,
+    ) -> SimplexResult:
+        """
+        Solve the problem, optionally from a basis of a previous solve or from a starting solution.
+
+        :param basis: Standard form column indices, one per row. A basis that forms a tree with a feasible
+            flow continues from there; anything else is ignored.
+        :param x: Structural values to start from, e.g. Vogel's approximation or an optimal assignment. Their
+            positive arcs must not form a cycle; zero arcs complete the tree.
+        :param potentials: Node potentials (rows, then root) that ``x`` is optimal for; arcs tight for them are
+            preferred to complete the tree, which saves degenerate pivots.
+        :return: The solve result.
+        """
+        self.iterations = 0
+        if basis is not None and self._load_basis(basis):
+            status = self._primal(self._phase_two_cost, 2)
+        else:
+            status = self._two_phase(x, potentials)
+        return self._result(status)
+
+    # ------------------------------------------------------------------ phases
+
+    def _two_phase(self, x: np.ndarray | None, potentials: np.ndarray | None) -> str:
+        if not self._start(x, potentials) and (x is None or not self._start(None, None)):
+            return NOT_SOLVED
+        m, N = self.form.shape
+
+        if np.any(self.flow[N:] > self.tolerance):
+            self._upper[N:] = np.inf
+            try:
+                status = self._primal(self._phase_one_cost, 1)
+            finally:
+                self._upper[N:] = 0.0
+            if status == NOT_SOLVED:
+                return status
+            if self.flow[N:].sum() > self.tolerance * (1 + np.abs(self.form.supply).max(initial=0.0)):
+                return INFEASIBLE
+            self.flow[N:] = 0.0
+        self._drive_out_artificials()
+        return self._primal(self._phase_two_cost, 2)
+
+    def _start(self, x: np.ndarray | None, potentials: np.ndarray | None) -> bool:
+        """
+        Build a starting tree around the flow ``x``: positive arcs first, then the arcs of the slacks and
+        the artificials that balance the rows, then zero arcs until the tree spans every row.
+
+        :return: False when the positive arcs of ``x`` contain a cycle.
+        """
+        m, N = self.form.shape
+        n = self.form.n_structural
+        root = m
+        self.flow = np.zeros(N + m)
+        if x is not None:
+            self.flow[:n] = np.maximum(np.asarray(x, dtype=float), 0.0)
+
+        # Whatever the structural flow leaves unbalanced goes to the slack, or else to the artificial.
+        imbalance = self.form.supply - self._net_outflow(self.flow)[:m]
+        self._tail[N:], self._head[N:] = np.arange(m), root
+        slack_rows = np.flatnonzero(self.form.slack_columns >= 0)
+        slacks = self.form.slack_columns[slack_rows]
+        slack_flow = np.where(self._tail[slacks] == slack_rows, 1.0, -1.0) * imbalance[slack_rows]
+        absorbed = slack_flow >= -self.tolerance
+        self.flow[slacks[absorbed]] = np.maximum(slack_flow[absorbed], 0.0)
+        imbalance[slack_rows[absorbed]] = 0.0
+        inflow = imbalance < 0
+        self._tail[N:][inflow], self._head[N:][inflow] = root, np.flatnonzero(inflow)
+        self.flow[N:] = np.abs(imbalance)
+
+        positive = np.flatnonzero(self.flow > self.tolerance)
+        structural = np.arange(n)
+        if potentials is not None:
+            potentials = np.asarray(potentials, dtype=float)
+            reduced = self._phase_two_cost[:n] - potentials[self._tail[:n]] + potentials[self._head[:n]]
+            zero = np.concatenate([structural[np.argsort(np.abs(reduced), kind="stable")], np.arange(n, N), np.arange(N, N + m)])
+        else:
+            zero = np.concatenate([np.arange(n, N), np.arange(N, N + m), structural])
+
+        tree = _spanning_tree(m + 1, self._tail, self._head, positive, zero)
+        if tree is None:
+            return False
+        self._set_tree(tree)
+        return True
+
+    def _load_basis(self, basis: Sequence[int]) -> bool:
+        """Load a tree from a basis and compute its flow; False when it is not a tree or the flow is infeasible."""
+        m, N = self.form.shape
+        basis = np.asarray(basis, dtype=int)
+        if basis.shape != (m,) or basis.min(initial=0) < 0 or basis.max(initial=0) >= N + m:
+            return False
+        self._tail[N:], self._head[N:] = np.arange(m), m
+        tree = _spanning_tree(m + 1, self._tail, self._head, basis, np.zeros(0, dtype=int))
+        if tree is None or len(tree) != m:
+            return False
+        self._set_tree(tree)
+
+        # The flow on the arc above a node carries the supply of the node's whole subtree.
+        self.flow = np.zeros(N + m)
+        subtree_supply = np.append(self.form.supply, 0.0)
+        for node in self._preorder()[::-1]:
+            if node == m:
+                continue
+            arc = self.parent_arc[node]
+            self.flow[arc] = subtree_supply[node] if self._tail[arc] == node else -subtree_supply[node]
+            subtree_supply[self.parent[node]] += subtree_supply[node]
+        if np.any(self.flow < -self.tolerance) or np.any(np.abs(self.flow[N:]) > self.tolerance):
+            return False
+        self.flow = np.maximum(self.flow, 0.0)
+        self.flow[N:] = 0.0
+        return True
+
+    def _drive_out_artificials(self):
+        """Swap zero artificials out of the tree for real arcs; rows where that is impossible are redundant."""
+        m, N = self.form.shape
+        for arc in np.flatnonzero(self.in_tree[N:]) + N:
+            node = self._tail[arc] if self._tail[arc] != m else self._head[arc]
+            inside = np.zeros(m + 1, dtype=bool)
+            inside[self._subtree(node)] = True
+            crossing = np.flatnonzero(self._real & ~self.in_tree & (inside[self._tail] != inside[self._head]))
+            if crossing.size:
+                entering = int(crossing[0])
+                attach = self._tail[entering] if inside[self._tail[entering]] else self._head[entering]
+                self._exchange(entering, node, attach, self._phase_two_cost)
+
+    def _primal(self, cost: np.ndarray, phase: int) -> str:
+        self._phase = phase
+        self._compute_potentials(cost)
+        stalled = 0
+        while True:
+            if self.iterations >= self.max_iterations:
+                return NOT_SOLVED
+            reduced = cost - self.potential[self._tail] + self.potential[self._head]
+            candidates = np.flatnonzero(self._real & ~self.in_tree & (reduced < -self.tolerance))
+            if self.progress is not None and self.progress.due():
+                self._report_progress(cost, float(np.abs(reduced[candidates]).sum()))
+            if candidates.size == 0:
+                return OPTIMAL
+
+            # Dantzig pricing, with Bland's rule while the objective is stalled to avoid cycling.
+            bland = stalled > 50
+            entering = int(candidates[0] if bland else candidates[np.argmin(reduced[candidates])])
+            step = self._pivot(entering, cost, bland)
+            if not np.isfinite(step):
+                return UNBOUNDED
+            stalled = stalled + 1 if step <= self.tolerance else 0
+
+    def _report_progress(self, cost: np.ndarray, dual_infeasibility: float):
+        objective = float(cost @ self.flow)
+        if self._phase == 2 and self.arrays.maximize:
+            objective = -objective
+        self.progress.emit(ProgressEvent(
+            phase=SolvePhase.PHASE_ONE if self._phase == 1 else SolvePhase.PHASE_TWO,
+            iteration=self.iterations,
+            objective_value=objective,
+            primal_infeasibility=float(self.flow[self.form.shape[1]:].sum()),
+            dual_infeasibility=dual_infeasibility,
+            elapsed=self.progress.elapsed,
+        ))
+
+    # ------------------------------------------------------------------ tree operations
+
+    def _pivot(self, entering: int, cost: np.ndarray, bland: bool = False) -> float:
+        """
+        Push flow around the cycle the entering arc closes in the tree, until an arc of the cycle blocks.
+
+        :return: The flow pushed (infinite when nothing blocks, in which case nothing changed).
+        """
+        tail, head = int(self._tail[entering]), int(self._head[entering])
+        up_from_head, up_from_tail = [], []
+        u, v = head, tail
+        while u != v:
+            if self.depth[u] >= self.depth[v]:
+                up_from_head.append(u)
+                u = self.parent[u]
+            else:
+                up_from_tail.append(v)
+                v = self.parent[v]
+
+        # The cycle runs from the apex down to the tail, along the entering arc, and up from the head.
+        nodes = up_from_tail[::-1] + [-1] + up_from_head
+        arcs = np.array([entering if node < 0 else self.parent_arc[node] for node in nodes])
+        down = len(up_from_tail)
+        forward = np.empty(arcs.size, dtype=bool)
+        forward[:down] = self._head[arcs[:down]] == np.array(up_from_tail[::-1], dtype=int)
+        forward[down] = True
+        forward[down + 1:] = self._tail[arcs[down + 1:]] == np.array(up_from_head, dtype=int)
+
+        room = np.where(forward, self._upper[arcs] - self.flow[arcs], self.flow[arcs])
+        step = room.min()
+        if not np.isfinite(step):
+            return np.inf
+        step = max(step, 0.0)
+        ties = np.flatnonzero(room <= step + self.tolerance)
+        # Bland's rule takes the lowest arc index; otherwise the last blocking arc from the apex.
+        k = int(ties[np.argmin(arcs[ties])] if bland else ties[-1])
+
+        self.flow[arcs[forward]] += step
+        self.flow[arcs[~forward]] = np.maximum(self.flow[arcs[~forward]] - step, 0.0)
+        # Only real arcs enter and they have no upper bound, so the entering arc never blocks.
+        self.flow[arcs[k]] = self._upper[arcs[k]] if forward[k] else 0.0
+        self.iterations += 1
+        self._exchange(entering, nodes[k], head if k > down else tail, cost)
+        return step
+
+    def _exchange(self, entering: int, leaving_node: int, attach: int, cost: np.ndarray):
+        """
+        Replace the arc above ``leaving_node`` by ``entering``, whose endpoint ``attach`` lies below it.
+
+        The path from ``attach`` up to ``leaving_node`` is reversed, the subtree is hung from the other
+        endpoint of the entering arc, and its potentials and depths are shifted.
+        """
+        other = int(self._head[entering] if self._tail[entering] == attach else self._tail[entering])
+        self.in_tree[self.parent_arc[leaving_node]] = False
+        self.in_tree[entering] = True
+
+        new_parent, new_arc, node = other, entering, attach
+        while True:
+            old_parent, old_arc = int(self.parent[node]), int(self.parent_arc[node])
+            self.children[old_parent].discard(node)
+            self.parent[node], self.parent_arc[node] = new_parent, new_arc
+            self.children[new_parent].add(node)
+            if node == leaving_node:
+                break
+            new_parent, new_arc, node = node, old_arc, old_parent
+
+        # Potentials of the moved subtree shift by one constant, set by the entering arc's reduced cost.
+        if self._tail[entering] == attach:
+            target = cost[entering] + self.potential[other]
+        else:
+            target = self.potential[other] - cost[entering]
+        nodes = self._subtree(attach)
+        self.potential[nodes] += target - self.potential[attach]
+        self._compute_depths(attach)
+
+    def _set_tree(self, arcs: list[int]):
+        """Hang the tree of ``arcs`` from the root."""
+        m, N = self.form.shape
+        root = m
+        neighbours: list[list[tuple[int, int]]] = [[] for _ in range(m + 1)]
+        for arc in arcs:
+            neighbours[self._tail[arc]].append((self._head[arc], arc))
+            neighbours[self._head[arc]].append((self._tail[arc], arc))
+        self.parent[:] = -1
+        self.parent_arc[:] = -1
+        self.children = [set() for _ in range(m + 1)]
+        self.in_tree[:] = False
+        self.in_tree[arcs] = True
+        self.depth[root] = 0
+        stack = [root]
+        seen = np.zeros(m + 1, dtype=bool)
+        seen[root] = True
+        while stack:
+            node = stack.pop()
+            for neighbour, arc in neighbours[node]:
+                if not seen[neighbour]:
+                    seen[neighbour] = True
+                    self.parent[neighbour], self.parent_arc[neighbour] = node, arc
+                    self.depth[neighbour] = self.depth[node] + 1
+                    self.children[node].add(neighbour)
+                    stack.append(neighbour)
+
+    def _compute_potentials(self, cost: np.ndarray):
+        """Potentials for which every tree arc has zero reduced cost, zero at the root."""
+        self.potential[:] = 0.0
+        for node in self._preorder()[1:]:
+            arc, parent = self.parent_arc[node], self.parent[node]
+            if self._tail[arc] == node:
+                self.potential[node] = cost[arc] + self.potential[parent]
+            else:
+                self.potential[node] = self.potential[parent] - cost[arc]
+
+    def _compute_depths(self, top: int):
+        stack = [top]
+        self.depth[top] = self.depth[self.parent[top]] + 1
+        while stack:
+            node = stack.pop()
+            for child in self.children[node]:
+                self.depth[child] = self.depth[node] + 1
+                stack.append(child)
+
+    def _subtree(self, top: int) -> list[int]:
+        nodes, stack = [], [top]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(self.children[node])
+        return nodes
+
+    def _preorder(self) -> list[int]:
+        return self._subtree(self.form.shape[0])
+
+    def _net_outflow(self, flow: np.ndarray) -> np.ndarray:
+        nodes = self.form.shape[0] + 1
+        return np.bincount(self._tail, flow, minlength=nodes) - np.bincount(self._head, flow, minlength=nodes)
+
+    # ------------------------------------------------------------------ results
+
+    def _result(self, status: str) -> SimplexResult:
+        m, N = self.form.shape
+        n = self.form.n_structural
+        arrays = self.arrays
+        basis = self.parent_arc[:m].copy()
+
+        if status != OPTIMAL:
+            return SimplexResult(
+                status=status,
+                objective_value=None,
+                x=np.zeros(n),
+                slacks=np.zeros(m),
+                duals=np.zeros(m),
+                reduced_costs=np.zeros(n),
+                basis=basis,
+                iterations=self.iterations,
+            )
+
+        x = self.flow[:n].copy()
+        duals = self.potential[:m] * self.form.row_sign
+        if arrays.maximize:
+            duals = -duals
+        return SimplexResult(
+            status=status,
+            objective_value=float(arrays.c @ x),
+            x=x,
+            slacks=arrays.b - arrays.A @ x,
+            duals=duals,
+            reduced_costs=arrays.c - duals @ arrays.A,
+            basis=basis,
+            iterations=self.iterations,
+        )
+
+
+def _spanning_tree(nodes: int, tail: np.ndarray, head: np.ndarray, required: np.ndarray, optional: np.ndarray) -> list[int] | None:
+    """
+    Arcs of a spanning tree containing every ``required`` arc, completed from ``optional`` in order.
+
+    :return: The arcs, or None when the required arcs contain a cycle.
+    """
+    parent = list(range(nodes))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    tree: list[int] = []
+    for arc in required.tolist():
+        a, b = find(int(tail[arc])), find(int(head[arc]))
+        if a == b:
+            return None
+        parent[a] = b
+        tree.append(arc)
+    for arc in optional.tolist():
+        if len(tree) == nodes - 1:
+            break
+        a, b = find(int(tail[arc])), find(int(head[arc]))
+        if a != b:
+            parent[a] = b
+            tree.append(arc)
+    return tree
+
+
+def vogel_approximation(form: NetworkForm) -> np.ndarray | None:
+    """
+    Vogel's approximation of a transportation problem.
+
+    Each step allocates as much as possible to the cheapest cell of the row or column whose two cheapest
+    cells differ the most. Supply left over goes to a dummy demand (the slacks of ``<=`` supply rows).
+
+    :return: Structural values whose positive cells form a tree, or None when the approximation gets stuck.
+    """
+    m, _ = form.shape
+    n = form.n_structural
+    supply_rows, demand_rows = form.supply_rows, form.demand_rows
+    supply_index = np.full(m, -1)
+    supply_index[supply_rows] = np.arange(supply_rows.size)
+    demand_index = np.full(m, -1)
+    demand_index[demand_rows] = np.arange(demand_rows.size)
+
+    arcs_from = supply_index[form.tail[:n]]
+    arcs_to = demand_index[form.head[:n]]
+    cost = np.full((supply_rows.size, demand_rows.size + 1), np.inf)
+    column = np.full(cost.shape, -1)
+    # Parallel arcs keep the cheapest one.
+    order = np.argsort(-form.cost[:n], kind="stable")
+    cost[arcs_from[order], arcs_to[order]] = form.cost[:n][order]
+    column[arcs_from[order], arcs_to[order]] = order
+
+    remaining_supply = form.supply[supply_rows].copy()
+    remaining_demand = np.append(-form.supply[demand_rows], 0.0)
+    surplus = remaining_supply.sum() - remaining_demand.sum()
+    if surplus < 0:
+        return None
+    remaining_demand[-1] = surplus
+    has_slack = form.slack_columns[supply_rows] >= 0
+    cost[has_slack, -1] = 0.0
+
+    x = np.zeros(n)
+    active = cost.copy()
+    active[remaining_supply <= 0, :] = np.inf
+    active[:, remaining_demand <= 0] = np.inf
+    rows_left, columns_left = remaining_supply > 0, remaining_demand > 0
+    while rows_left.any() and columns_left.any():
+        row_penalty = _penalties(active[rows_left])
+        column_penalty = _penalties(active[:, columns_left].T)
+        if row_penalty.max() >= column_penalty.max():
+            i = np.flatnonzero(rows_left)[np.argmax(row_penalty)]
+            j = int(np.argmin(active[i]))
+        else:
+            j = np.flatnonzero(columns_left)[np.argmax(column_penalty)]
+            i = int(np.argmin(active[:, j]))
+        if not np.isfinite(active[i, j]):
+            return None
+
+        amount = min(remaining_supply[i], remaining_demand[j])
+        if column[i, j] >= 0:
+            x[column[i, j]] += amount
+        remaining_supply[i] -= amount
+        remaining_demand[j] -= amount
+        if remaining_supply[i] <= 0:
+            rows_left[i] = False
+            active[i, :] = np.inf
+        if remaining_demand[j] <= 0:
+            columns_left[j] = False
+            active[:, j] = np.inf
+    return x
+
+
+def _penalties(costs: np.ndarray) -> np.ndarray:
+    """Difference between the two cheapest cells of every row; a row with one finite cell gets an infinite penalty."""
+    if costs.shape[1] < 2:
+        return np.where(np.isfinite(costs[:, 0]), np.inf, -np.inf) if costs.shape[1] else np.full(costs.shape[0], -np.inf)
+    cheapest = np.partition(costs, 1, axis=1)[:, :2]
+    with np.errstate(invalid="ignore"):
+        penalty = cheapest[:, 1] - cheapest[:, 0]
+    return np.where(np.isfinite(cheapest[:, 0]), np.nan_to_num(penalty, nan=np.inf), -np.inf)
+
+
+def hungarian(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Minimum-cost perfect matching of a square cost matrix (``inf`` marks a missing pair).
+
+    Shortest augmenting paths with potentials: each row is added in turn and matched along the path of
+    smallest reduced cost, so the potentials stay dual feasible and the matching optimal throughout.
+
+    :return: The column of every row and the row and column potentials ``u``, ``v`` with
+        ``cost[i, j] >= u[i] + v[j]``, equal on the matching; None when no perfect matching exists.
+    """
+    k = cost.shape[0]
+    u = np.zeros(k + 1)
+    v = np.zeros(k + 1)
+    match = np.zeros(k + 1, dtype=int)  # row (1-based) matched to each column; column 0 is the new row
+    way = np.zeros(k + 1, dtype=int)
+    for row in range(1, k + 1):
+        match[0] = row
+        column = 0
+        shortest = np.full(k + 1, np.inf)
+        used = np.zeros(k + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = match[column]
+            reduced = cost[current - 1] - u[current] - v[1:]
+            free = ~used[1:]
+            better = free & (reduced < shortest[1:])
+            shortest[1:][better] = reduced[better]
+            way[1:][better] = column
+            candidates = np.where(free, shortest[1:], np.inf)
+            following = int(np.argmin(candidates)) + 1
+            delta = candidates[following - 1]
+            if not np.isfinite(delta):
+                return None
+            u[match[used]] += delta
+            v[used] -= delta
+            shortest[1:][free] -= delta
+            column = following
+            if match[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    assignment = np.zeros(k, dtype=int)
+    assignment[match[1:] - 1] = np.arange(k)
+    return assignment, u[1:], v[1:]
+
+
+def solve_network(
+    arrays: LpArrays,
+    form: NetworkForm | None = None,
+    basis: Sequence[int] | None = None,
+    progress: ProgressReporter | None = None,
+) -> SimplexResult | None:
+    """
+    Solve a network-structured problem with the solver for its structure.
+
+    Assignments are matched by the Hungarian algorithm, transportation problems start from Vogel's
+    approximation and other networks from the slacks; the network simplex then completes the tree (or
+    solves the problem). A basis of a previous solve is tried first.
+
+    :param arrays: The problem.
+    :param form: Its arc form; detected when not given.
+    :param basis: Basis of a previous solve of the same structure; when it is not a feasible tree the
+        problem is solved from the slacks.
+    :param progress: Receives throttled progress events from the network simplex.
+    :return: The result, or None when the problem is not a network problem.
+    """
+    form = form if form is not None else NetworkForm.from_arrays(arrays)
+    if form is None:
+        return None
+    simplex = NetworkSimplex(arrays, form, progress=progress)
+    if basis is not None:
+        return simplex.solve(basis)
+
+    match form.structure:
+        case ProblemStructure.ASSIGNMENT:
+            start = _assignment_start(form)
+            if start is None:
+                return simplex.solve()
+            return simplex.solve(x=start[0], potentials=start[1])
+        case ProblemStructure.TRANSPORTATION:
+            return simplex.solve(x=vogel_approximation(form))
+        case _:
+            return simplex.solve()
+
+
+def _assignment_start(form: NetworkForm) -> tuple[np.ndarray, np.ndarray] | None:
+    """Optimal assignment of the Hungarian algorithm and its potentials as node potentials; None when there is none."""
+    n = form.n_structural
+    supply_rows, demand_rows = form.supply_rows, form.demand_rows
+    position = np.full(form.shape[0] + 1, -1)
+    position[supply_rows] = np.arange(supply_rows.size)
+    position[demand_rows] = np.arange(demand_rows.size)
+    rows, columns = position[form.tail[:n]], position[form.head[:n]]
+
+    cost = np.full((supply_rows.size, demand_rows.size), np.inf)
+    cost[rows, columns] = form.cost[:n]
+    matching = hungarian(cost)
+    if matching is None:
+        return None
+    assignment, u, v = matching
+
+    arc = np.full(cost.shape, -1)
+    arc[rows, columns] = np.arange(n)
+    x = np.zeros(n)
+    x[arc[np.arange(assignment.size), assignment]] = 1.0
+    potentials = np.zeros(form.shape[0] + 1)
+    potentials[supply_rows] = u
+    potentials[demand_rows] = -v
+    return x, potentials
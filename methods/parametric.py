@@ -0,0 +1,351 @@
+"""
+Parametric programming on one right-hand side or one objective coefficient.
+
+The optimal value is a piecewise-linear function of a single right-hand side (concave for maximization,
+convex for minimization) and of a single objective coefficient (the other way around). Starting from an
+optimal basis, the parameter is moved until a basic variable reaches a bound (right-hand side) or a
+reduced cost reaches zero (objective coefficient); that point is a breakpoint, and one dual (respectively
+primal) simplex pivot gives the basis of the next segment. Each segment has a constant slope: the shadow
+price of the row, or the value of the variable.
+"""
+
+import copy
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import RevisedSimplex, OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED
+
+
+class ParametricKind(Enum):
+    """Which coefficient the parameter replaces."""
+    RHS = "rhs"
+    OBJECTIVE = "objective"
+
+
+@dataclass(frozen=True)
+class ParametricSegment:
+    """
+    Interval of the parameter over which one basis stays optimal.
+
+    :param slope: Derivative of the optimal value: the shadow price of the row for a right-hand side,
+        the value of the variable for an objective coefficient.
+    :param basis: The optimal basis over the interval (standard form column indices).
+    """
+    start: float
+    end: float
+    objective_start: float
+    objective_end: float
+    slope: float
+    basis: np.ndarray
+
+    def value(self, parameter: float) -> float:
+        return self.objective_start + self.slope * (parameter - self.start)
+
+
+@dataclass(frozen=True)
+class ParametricCurve:
+    """
+    Optimal value as a function of one coefficient, over ``[start, end]``.
+
+    The segments are sorted and contiguous. When they do not cover the whole range, ``status_below`` and
+    ``status_above`` tell why the problem has no optimal solution beyond them (``"Infeasible"`` or ``"Unbounded"``).
+    """
+    kind: ParametricKind
+    index: int
+    current: float
+    start: float
+    end: float
+    segments: tuple[ParametricSegment, ...]
+    status_below: str
+    status_above: str
+
+    @property
+    def breakpoints(self) -> list[float]:
+        """Parameter values where the optimal basis changes, including both ends of the curve."""
+        if not self.segments:
+            return []
+        return [self.segments[0].start, *(segment.end for segment in self.segments)]
+
+    def value(self, parameter: float) -> float | None:
+        """Optimal value for the given parameter, or None where the problem has no optimal solution."""
+        for segment in self.segments:
+            if segment.start - 1e-12 <= parameter <= segment.end + 1e-12:
+                return segment.value(parameter)
+        return None
+
+
+class ParametricSimplex(RevisedSimplex):
+    """
+    Revised simplex that moves one coefficient of a solved problem along a line.
+
+    Call ``solve`` first; each walk starts from the optimal state it leaves and modifies the problem
+    held by the engine, so a second walk needs a copy (``copy.deepcopy``) of the solved instance.
+    """
+
+    def walk_rhs(self, row: int, stop: float) -> tuple[list[ParametricSegment], str]:
+        """
+        Move ``b[row]`` from its current value to ``stop``.
+
+        :return: The segments in the order they were visited, and ``"Optimal"`` if the walk reached
+            ``stop`` or the status of the problem beyond the last segment.
+        """
+        sign = self.form.row_sign[row]
+        parameter = float(sign * self.form.b[row])
+        direction = 1.0 if stop >= parameter else -1.0
+        segments = []
+
+        while not self._reached(parameter, stop, direction):
+            if self.iterations >= self.max_iterations:
+                return segments, NOT_SOLVED
+
+            # dx_B / dt when b[row] moves by `direction * t`; _ratio_test moves x_B by -alpha per unit.
+            change = direction * sign * self.binv[:, row]
+            limit, r, target = self._ratio_test(-change, 1.0)
+            step = min(limit, direction * (stop - parameter))
+
+            start, objective_start = parameter, self._objective()
+            self.x_basic += step * change
+            self.form.b[row] += direction * sign * step
+            parameter += direction * step
+            if step > 0:
+                segments.append(self._segment(start, parameter, objective_start, self._shadow_price(row)))
+
+            if r is None or self._reached(parameter, stop, direction):
+                break
+            # The blocking variable leaves at its bound; the dual ratio test keeps the basis dual feasible.
+            q, _ = self._dual_ratio_test(r, change[r] < 0, self._phase_two_cost, 0.0)
+            if q is None:
+                return segments, INFEASIBLE
+            self._pivot(q, r, self.binv @ self._A[:, q], target)
+
+        return segments, OPTIMAL
+
+    def walk_objective(self, column: int, stop: float) -> tuple[list[ParametricSegment], str]:
+        """
+        Move ``c[column]`` from its current value to ``stop``.
+
+        :return: The segments in the order they were visited, and ``"Optimal"`` if the walk reached
+            ``stop`` or the status of the problem beyond the last segment.
+        """
+        sense = -1.0 if self.form.maximize else 1.0
+        parameter = float(sense * self._phase_two_cost[column])
+        direction = 1.0 if stop >= parameter else -1.0
+        segments = []
+
+        while not self._reached(parameter, stop, direction):
+            if self.iterations >= self.max_iterations:
+                return segments, NOT_SOLVED
+
+            # Derivative of the internal reduced costs when c[column] moves by `direction * t`.
+            delta = direction * sense
+            enterable = self._nonbasic_enterable()
+            rows = np.flatnonzero(self.basis == column)
+            if rows.size:
+                derivative = -delta * (self.binv[rows[0]] @ self._A)
+            else:
+                derivative = np.zeros(self._A.shape[1])
+                derivative[column] = delta
+            derivative[~enterable] = 0.0
+
+            limit, q, entering_direction = self._reduced_cost_ratio_test(derivative)
+            step = min(limit, direction * (stop - parameter))
+
+            start, objective_start = parameter, self._objective()
+            self._phase_two_cost[column] += delta * step
+            self.form.cost[column] += delta * step
+            parameter += direction * step
+            if step > 0:
+                segments.append(self._segment(start, parameter, objective_start, self._value(column)))
+
+            if q is None or self._reached(parameter, stop, direction):
+                break
+            if not np.isfinite(self._primal_step(q, entering_direction)):
+                return segments, UNBOUNDED
+
+        return segments, OPTIMAL
+
+    def _reached(self, parameter: float, stop: float, direction: float) -> bool:
+        return direction * (stop - parameter) <= self.tolerance * (1.0 + abs(stop))
+
+    def _reduced_cost_ratio_test(self, derivative: np.ndarray) -> tuple[float, int | None, float]:
+        """
+        Largest parameter step before a nonbasic reduced cost changes sign.
+
+        :return: The step, the column whose reduced cost reaches zero (None if none does) and the
+            direction in which that column then has to move.
+        """
+        reduced = self._reduced_costs(self._phase_two_cost)
+        lower, upper = self._lower, self._upper
+        movable = self._nonbasic_enterable() & (upper - lower > self.tolerance)
+        at_upper = np.isfinite(upper) & (self.x_nonbasic >= upper - self.tolerance)
+        free = ~np.isfinite(lower) & ~np.isfinite(upper)
+
+        # At a lower bound the reduced cost must stay >= 0, at an upper bound <= 0 and when free = 0.
+        falling = movable & ~at_upper & (derivative < -self.pivot_tolerance)
+        rising = movable & (at_upper | free) & (derivative > self.pivot_tolerance)
+        ratios = np.full(reduced.size, np.inf)
+        ratios[falling] = np.maximum(reduced[falling], 0.0) / -derivative[falling]
+        ratios[rising] = np.maximum(-reduced[rising], 0.0) / derivative[rising]
+        ratios[free & movable & (np.abs(derivative) > self.pivot_tolerance)] = 0.0
+
+        q = int(np.argmin(ratios))
+        if not np.isfinite(ratios[q]):
+            return np.inf, None, 0.0
+        return float(ratios[q]), q, 1.0 if derivative[q] < 0 else -1.0
+
+    def _values(self) -> np.ndarray:
+        values = self.x_nonbasic.copy()
+        values[self.basis] = self.x_basic
+        return values
+
+    def _objective(self) -> float:
+        objective = float(self._phase_two_cost @ self._values())
+        return -objective if self.form.maximize else objective
+
+    def _value(self, column: int) -> float:
+        return float(self._values()[column])
+
+    def _shadow_price(self, row: int) -> float:
+        """Shadow price of ``row`` in the original sense, as in SimplexResult.duals."""
+        y = self._phase_two_cost[self.basis] @ self.binv
+        dual = float(y[row] * self.form.row_sign[row])
+        return -dual if self.form.maximize else dual
+
+    def _segment(self, start: float, end: float, objective_start: float, slope: float) -> ParametricSegment:
+        return ParametricSegment(
+            start=start,
+            end=end,
+            objective_start=objective_start,
+            objective_end=objective_start + slope * (end - start),
+            slope=slope,
+            basis=self.basis.copy(),
+        )
+
+
+def _orient(segments: list[ParametricSegment]) -> list[ParametricSegment]:
+    """Segments of a walk towards smaller values, rewritten with ``start < end``."""
+    return [
+        ParametricSegment(
+            start=segment.end,
+            end=segment.start,
+            objective_start=segment.objective_end,
+            objective_end=segment.objective_start,
+            slope=segment.slope,
+            basis=segment.basis,
+        )
+        for segment in reversed(segments)
+    ]
+
+
+def _clip(segments: list[ParametricSegment], low: float, high: float) -> tuple[ParametricSegment, ...]:
+    clipped = []
+    for segment in segments:
+        start, end = max(segment.start, low), min(segment.end, high)
+        if end > start:
+            clipped.append(ParametricSegment(
+                start=start,
+                end=end,
+                objective_start=segment.value(start),
+                objective_end=segment.value(end),
+                slope=segment.slope,
+                basis=segment.basis,
+            ))
+    return tuple(clipped)
+
+
+def _parametric(
+    arrays: LpArrays,
+    kind: ParametricKind,
+    index: int,
+    start: float,
+    end: float,
+    basis: np.ndarray | None,
+) -> ParametricCurve:
+    current = float(arrays.b[index] if kind == ParametricKind.RHS else arrays.c[index])
+    low, high = min(start, end), max(start, end)
+
+    simplex = ParametricSimplex(arrays)
+    result = simplex.solve(basis)
+    if not result.is_optimal:
+        raise ValueError("Parametric analysis needs a problem with an optimal solution.")
+
+    walks = {}
+    for stop in (low, high):
+        if stop == current:
+            walks[stop] = [], OPTIMAL
+            continue
+        # A walk changes the problem held by the engine: the downward one runs on a copy of the solved state.
+        walker = copy.deepcopy(simplex) if stop == low and high != current else simplex
+        if kind == ParametricKind.RHS:
+            segments, status = walker.walk_rhs(index, stop)
+        else:
+            segments, status = walker.walk_objective(index, stop)
+        if status == OPTIMAL and segments:
+            # The walk stops within tolerance of `stop`; the last segment ends exactly there.
+            last = segments[-1]
+            segments[-1] = walker._segment(last.start, stop, last.objective_start, last.slope)
+        walks[stop] = segments, status
+
+    below, status_below = walks[low]
+    above, status_above = walks[high]
+    if current <= low:
+        # The whole range lies above the current value: only the upward walk matters.
+        below, status_below = [], status_above
+    if current >= high:
+        above, status_above = [], status_below
+    below = _orient(below) if current > low else []
+    above = above if current < high else []
+    if below and above and np.array_equal(below[-1].basis, above[0].basis):
+        # Both walks start from the same basis; its two halves are one segment.
+        below[-1] = ParametricSegment(
+            start=below[-1].start,
+            end=above[0].end,
+            objective_start=below[-1].objective_start,
+            objective_end=above[0].objective_end,
+            slope=above[0].slope,
+            basis=above[0].basis,
+        )
+        above = above[1:]
+    segments = below + above
+
+    return ParametricCurve(
+        kind=kind,
+        index=index,
+        current=current,
+        start=low,
+        end=high,
+        segments=_clip(segments, low, high),
+        status_below=status_below,
+        status_above=status_above,
+    )
+
+
+def parametric_rhs(arrays: LpArrays, row: int, start: float, end: float, basis: np.ndarray | None = None) -> ParametricCurve:
+    """
+    Optimal value as a function of the right-hand side of one constraint.
+
+    :param arrays: A linear program (integrality is ignored) with an optimal solution.
+    :param row: Index of the constraint.
+    :param start: One end of the range of the right-hand side.
+    :param end: The other end of the range.
+    :param basis: Optimal basis of the problem, if known, to skip the initial solve.
+    :return: The piecewise-linear curve; the slope of each segment is the shadow price of the row.
+    """
+    return _parametric(arrays, ParametricKind.RHS, row, start, end, basis)
+
+
+def parametric_objective(arrays: LpArrays, column: int, start: float, end: float, basis: np.ndarray | None = None) -> ParametricCurve:
+    """
+    Optimal value as a function of the objective coefficient of one variable.
+
+    :param arrays: A linear program (integrality is ignored) with an optimal solution.
+    :param column: Index of the variable.
+    :param start: One end of the range of the coefficient.
+    :param end: The other end of the range.
+    :param basis: Optimal basis of the problem, if known, to skip the initial solve.
+    :return: The piecewise-linear curve; the slope of each segment is the value of the variable.
+    """
+    return _parametric(arrays, ParametricKind.OBJECTIVE, column, start, end, basis)
@@ -0,0 +1,312 @@
+"""
+Pivot history of the native simplex.
+
+A full tableau per iteration costs ``m * (n + m)`` values, so the engine only records what each step
+changed: the entering and leaving columns, the pivot element and the eta column (the entering column in
+terms of the current basis, stored sparsely), plus the columns moved by bound flips. Any intermediate
+tableau is rebuilt on demand by replaying the eta updates from the nearest tableau in a small LRU cache.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+from methods.scaling import ScalingFactors
+
+
+class StepKind(Enum):
+    """What a recorded step did to the basis."""
+    PIVOT = "pivot"
+    BOUND_FLIP = "bound_flip"
+    PHASE_CHANGE = "phase_change"
+
+
+@dataclass(frozen=True)
+class PivotRecord:
+    """
+    One step of the simplex.
+
+    :param kind: Pivot, bound flip (nonbasic variables moved to their opposite bound without a basis
+        change) or the switch from phase one to phase two.
+    :param phase: Phase the step belongs to (1 or 2).
+    :param entering: Column entering the basis (or moving to its opposite bound in a primal bound flip).
+    :param leaving: Column leaving the basis.
+    :param row: Basis position of the pivot.
+    :param pivot_element: Entry of the eta column in the pivot row.
+    :param eta_rows: Rows of the nonzero entries of the eta column.
+    :param eta_values: Nonzero entries of the eta column.
+    :param leaving_value: Bound at which the leaving variable becomes nonbasic.
+    :param flip_columns: Nonbasic columns moved to their opposite bound before the pivot.
+    :param flip_steps: Change of value of each flipped column.
+    """
+    kind: StepKind
+    phase: int
+    entering: int | None = None
+    leaving: int | None = None
+    row: int | None = None
+    pivot_element: float = 0.0
+    eta_rows: np.ndarray | None = None
+    eta_values: np.ndarray | None = None
+    leaving_value: float = 0.0
+    flip_columns: np.ndarray | None = None
+    flip_steps: np.ndarray | None = None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays of the record."""
+        arrays = (self.eta_rows, self.eta_values, self.flip_columns, self.flip_steps)
+        return sum(array.nbytes for array in arrays if array is not None)
+
+
+@dataclass(frozen=True)
+class Tableau:
+    """
+    Simplex tableau after a given number of steps, in the units of the original problem.
+
+    ``body`` is ``B^-1 A`` restricted to ``column_names`` (artificial columns only appear in phase
+    one), ``rhs`` holds the values of the basic variables and ``reduced_costs`` the objective row of the
+    internal minimization, so a tableau is optimal when no nonbasic variable at its lower bound has a
+    negative entry. ``entering``/``leaving_row`` mark the pivot of the next step, if it is one.
+    """
+    step: int
+    phase: int
+    column_names: tuple[str, ...]
+    row_names: tuple[str, ...]
+    body: np.ndarray
+    rhs: np.ndarray
+    reduced_costs: np.ndarray
+    objective_value: float
+    entering: int | None
+    leaving_row: int | None
+    next_step: StepKind | None
+
+
+@dataclass
+class _State:
+    basis: np.ndarray
+    binv: np.ndarray
+    x_nonbasic: np.ndarray
+    phase: int
+
+
+class PivotHistory:
+    """
+    Compact record of a native simplex solve.
+
+    :param A: Standard form matrix with the artificial columns appended (never copied or modified).
+    :param b: Standard form right-hand side.
+    :param costs: Objective of phase one and of phase two over every column.
+    :param column_names: Names of the structural and slack columns.
+    :param slack_columns: Slack column of each row (-1 for equality rows).
+    :param maximize: Whether the original objective is a maximization.
+    :param basis: Basis the recorded steps start from.
+    :param x_nonbasic: Values of the nonbasic variables at the start.
+    :param phase: Phase the recorded steps start in.
+    :param cache_size: Number of rebuilt tableaus kept in memory.
+    :param refactor_frequency: Number of replayed eta updates between two refactorizations.
+    """
+
+    def __init__(
+        self,
+        A: np.ndarray,
+        b: np.ndarray,
+        costs: tuple[np.ndarray, np.ndarray],
+        column_names: tuple[str, ...],
+        slack_columns: np.ndarray,
+        maximize: bool,
+        basis: np.ndarray,
+        x_nonbasic: np.ndarray,
+        phase: int,
+        cache_size: int = 8,
+        refactor_frequency: int = 64,
+    ):
+        m = A.shape[0]
+        self._A = A
+        self._b = b
+        self._costs = costs
+        self._names = tuple(column_names) + tuple(f"a{i + 1}" for i in range(m))
+        self._slack_columns = slack_columns
+        self._n_columns = A.shape[1] - m
+        self._objective_sign = -1.0 if maximize else 1.0
+        self._start = _State(basis=basis.copy(), binv=None, x_nonbasic=x_nonbasic.copy(), phase=phase)
+        self._scale = np.ones(A.shape[1])
+        self.records: list[PivotRecord] = []
+        self.cache_size = cache_size
+        self.refactor_frequency = refactor_frequency
+        self._cache: OrderedDict[int, tuple[_State, Tableau]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of tableaus: the starting one plus one per recorded step."""
+        return len(self.records) + 1
+
+    @property
+    def pivots(self) -> int:
+        return sum(record.kind == StepKind.PIVOT for record in self.records)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the recorded steps (the cache and the shared problem data excluded)."""
+        return sum(record.nbytes for record in self.records)
+
+    # ------------------------------------------------------------------ recording
+
+    def record_pivot(
+        self,
+        q: int,
+        r: int,
+        leaving: int,
+        alpha: np.ndarray,
+        target: float,
+        phase: int,
+        flip_columns: np.ndarray | None = None,
+        flip_steps: np.ndarray | None = None,
+    ):
+        """Record a basis change; the bound flips of a long-step dual ratio test are attached to it."""
+        rows = np.flatnonzero(alpha)
+        self.records.append(PivotRecord(
+            kind=StepKind.PIVOT,
+            phase=phase,
+            entering=int(q),
+            leaving=int(leaving),
+            row=int(r),
+            pivot_element=float(alpha[r]),
+            eta_rows=rows.astype(np.int32),
+            eta_values=alpha[rows].copy(),
+            leaving_value=float(target),
+            flip_columns=None if flip_columns is None else np.asarray(flip_columns, dtype=np.int32).copy(),
+            flip_steps=None if flip_steps is None else np.asarray(flip_steps, dtype=float).copy(),
+        ))
+
+    def record_flip(self, q: int, step: float, phase: int):
+        """Record a primal bound flip: the entering column moves to its opposite bound instead of entering."""
+        self.records.append(PivotRecord(
+            kind=StepKind.BOUND_FLIP,
+            phase=phase,
+            entering=int(q),
+            flip_columns=np.array([q], dtype=np.int32),
+            flip_steps=np.array([step], dtype=float),
+        ))
+
+    def record_phase_change(self):
+        self.records.append(PivotRecord(kind=StepKind.PHASE_CHANGE, phase=2))
+
+    def set_scaling(self, factors: ScalingFactors):
+        """Report tableaus in the units of the unscaled problem the solved arrays were scaled from."""
+        m = self._A.shape[0]
+        if factors.row.size != m:
+            raise ValueError("Scaling factors do not match the problem")
+        scale = np.ones(self._A.shape[1])
+        scale[:factors.col.size] = factors.col
+        rows = np.flatnonzero(self._slack_columns >= 0)
+        scale[self._slack_columns[rows]] = 1.0 / factors.row[rows]
+        scale[self._n_columns:] = 1.0 / factors.row
+        self._scale = scale
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Drop the rebuilt tableaus kept in memory."""
+        self._cache.clear()
+
+    # ------------------------------------------------------------------ rebuilding
+
+    def tableau(self, step: int) -> Tableau:
+        """
+        Tableau after ``step`` recorded steps (0 is the starting tableau).
+
+        :param step: Index between 0 and ``len(self) - 1``.
+        :return: The rebuilt tableau.
+        """
+        if not 0 <= step < len(self):
+            raise IndexError("Step out of range")
+        if step in self._cache:
+            self._cache.move_to_end(step)
+            return self._cache[step][1]
+
+        cached = [k for k in self._cache if k < step]
+        if cached:
+            start = max(cached)
+            state = self._copy(self._cache[start][0])
+        else:
+            start = 0
+            state = self._copy(self._start)
+            state.binv = np.linalg.inv(self._A[:, state.basis])
+
+        since_refactor = 0
+        for record in self.records[start:step]:
+            since_refactor += self._apply(state, record)
+            if since_refactor >= self.refactor_frequency:
+                state.binv = np.linalg.inv(self._A[:, state.basis])
+                since_refactor = 0
+
+        tableau = self._build(step, state)
+        self._cache[step] = (state, tableau)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return tableau
+
+    @staticmethod
+    def _copy(state: _State) -> _State:
+        return _State(
+            basis=state.basis.copy(),
+            binv=None if state.binv is None else state.binv.copy(),
+            x_nonbasic=state.x_nonbasic.copy(),
+            phase=state.phase,
+        )
+
+    def _apply(self, state: _State, record: PivotRecord) -> int:
+        """Replay one step; returns the number of eta updates applied."""
+        state.phase = record.phase
+        if record.flip_columns is not None:
+            state.x_nonbasic[record.flip_columns] += record.flip_steps
+        if record.kind != StepKind.PIVOT:
+            return 0
+
+        alpha = np.zeros(state.basis.size)
+        alpha[record.eta_rows] = record.eta_values
+        r = record.row
+        pivot_row = state.binv[r] / record.pivot_element
+        state.binv -= np.outer(alpha, pivot_row)
+        state.binv[r] = pivot_row
+
+        state.x_nonbasic[record.entering] = 0.0
+        state.x_nonbasic[record.leaving] = record.leaving_value
+        state.basis[r] = record.entering
+        return 1
+
+    def _build(self, step: int, state: _State) -> Tableau:
+        m = state.basis.size
+        columns = np.arange(self._n_columns + m if state.phase == 1 else self._n_columns)
+        cost = self._costs[0] if state.phase == 1 else self._costs[1]
+        scale = self._scale
+
+        x_basic = state.binv @ (self._b - self._A @ state.x_nonbasic)
+        values = state.x_nonbasic.copy()
+        values[state.basis] = x_basic
+        reduced = cost - (cost[state.basis] @ state.binv) @ self._A
+        reduced[state.basis] = 0.0
+        objective = float(cost @ values)
+        if state.phase == 2:
+            objective *= self._objective_sign
+
+        entering = leaving_row = next_step = None
+        if step < len(self.records):
+            following = self.records[step]
+            next_step = following.kind
+            if following.kind == StepKind.PIVOT:
+                entering, leaving_row = following.entering, following.row
+
+        return Tableau(
+            step=step,
+            phase=state.phase,
+            column_names=tuple(self._names[j] for j in columns),
+            row_names=tuple(self._names[j] for j in state.basis),
+            body=(state.binv @ self._A[:, columns]) * scale[state.basis][:, None] / scale[columns][None, :],
+            rhs=x_basic * scale[state.basis],
+            reduced_costs=reduced[columns] / scale[columns],
+            objective_value=objective,
+            entering=entering,
+            leaving_row=leaving_row,
+            next_step=next_step,
+        )
@@ -0,0 +1,113 @@
+"""
+Progress events of the native engines.
+
+The engines call ``ProgressReporter.due()`` once per iteration, which only reads the clock, and build
+an event when it returns True, so reporting costs nothing measurable however fast the iterations are.
+Events usually come from a worker thread; ``ProgressQueue`` hands them over to an asyncio loop, where
+the consumer only ever sees the latest event, so a slow consumer never holds the solver back.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Callable
+
+
+class SolvePhase(Enum):
+    """Stage of a solve a progress event comes from."""
+    PHASE_ONE = "phase_one"
+    PHASE_TWO = "phase_two"
+    DUAL_SIMPLEX = "dual_simplex"
+    INTERIOR_POINT = "interior_point"
+    BRANCH_AND_BOUND = "branch_and_bound"
+    DECOMPOSITION = "decomposition"
+    COLUMN_GENERATION = "column_generation"
+    FINISHED = "finished"
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    Snapshot of a running solve.
+
+    Infeasibilities are sums over the problem as the engine sees it (after scaling). The objective value
+    is in the sense of the original problem; in phase one it is the sum of the artificial variables, and
+    in branch-and-bound it is the incumbent. ``status`` is only set on the final event.
+    """
+    phase: SolvePhase
+    iteration: int
+    objective_value: float | None
+    primal_infeasibility: float | None
+    dual_infeasibility: float | None
+    elapsed: float
+    nodes: int = 0
+    status: str | None = None
+
+
+class ProgressReporter:
+    """
+    Throttles progress events before passing them to a callback.
+
+    :param callback: Receives the events; called from the thread that runs the solve.
+    :param interval: Minimum number of seconds between two events.
+    """
+
+    def __init__(self, callback: Callable[[ProgressEvent], None], interval: float = 0.1):
+        self._callback = callback
+        self.interval = interval
+        self._start = time.perf_counter()
+        self._last = -float("inf")
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def due(self) -> bool:
+        """Whether enough time passed since the last event for a new one."""
+        return time.perf_counter() - self._last >= self.interval
+
+    def emit(self, event: ProgressEvent):
+        self._last = time.perf_counter()
+        self._callback(event)
+
+
+class ProgressQueue:
+    """
+    Asyncio queue fed from another thread.
+
+    :param loop: The loop the consumer runs on.
+    :param maxsize: Number of pending events kept; the oldest one is dropped when the queue is full.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 16):
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, event: ProgressEvent):
+        """Thread-safe; use it as the callback of a ProgressReporter."""
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    def close(self):
+        """Thread-safe; ends the iteration of ``events()`` once the pending events are consumed."""
+        self._loop.call_soon_threadsafe(self._put, self._CLOSED)
+
+    def _put(self, item):
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+    async def events(self) -> AsyncIterator[ProgressEvent]:
+        """Yield the latest event each time the consumer is ready, skipping those it had no time for."""
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            closed = items[-1] is self._CLOSED
+            events = [item for item in items if item is not self._CLOSED]
+            if events:
+                yield events[-1]
+            if closed:
+                return
@@ -0,0 +1,227 @@
+"""
+Ranging and one-at-a-time (tornado) sensitivity from an optimal basis.
+
+Every right-hand side and objective coefficient gets the interval over which the optimal basis stays
+optimal, read off the final basis with one factorization and a few matrix products. Inside that interval
+the optimal value moves linearly, with the shadow price or the variable value as slope, so a tornado
+swing only needs a solve when it leaves the interval, and that solve is warm-started from the basis.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from methods.certificate import CertificateTolerances, solve_verified
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import SimplexResult, StandardForm, OPTIMAL
+from methods.parametric import ParametricKind
+
+
+@dataclass(frozen=True)
+class Ranging:
+    """
+    Ranges of an optimal basis, in the units of ``arrays``.
+
+    ``rhs_lower``/``rhs_upper`` bound each right-hand side and ``cost_lower``/``cost_upper`` each
+    objective coefficient; ``shadow_prices`` and ``values`` are the slopes of the optimal value in them.
+    """
+    rhs: np.ndarray
+    rhs_lower: np.ndarray
+    rhs_upper: np.ndarray
+    shadow_prices: np.ndarray
+    cost: np.ndarray
+    cost_lower: np.ndarray
+    cost_upper: np.ndarray
+    values: np.ndarray
+
+
+@dataclass(frozen=True)
+class TornadoBar:
+    """
+    Optimal value with one parameter moved down and up, the others at their nominal value.
+
+    ``objective_low``/``objective_high`` are None when the problem has no optimal solution there (see
+    ``status_low``/``status_high``); ``resolved`` tells whether a move left the range and needed a solve,
+    and ``flagged`` whether such a solve failed verification even after a re-solve from scratch.
+    """
+    kind: ParametricKind
+    index: int
+    nominal: float
+    low: float
+    high: float
+    objective_low: float | None
+    objective_high: float | None
+    status_low: str
+    status_high: str
+    resolved: bool
+    flagged: bool = False
+
+    @property
+    def swing(self) -> float:
+        """Spread of the optimal value; infinite when either move loses the optimal solution."""
+        if self.objective_low is None or self.objective_high is None:
+            return np.inf
+        return abs(self.objective_high - self.objective_low)
+
+
+def _nonbasic_positions(lower: np.ndarray, upper: np.ndarray, values: np.ndarray):
+    """Masks of the nonbasic variables at their lower bound, at their upper bound, and free at zero."""
+    fixed = lower == upper
+    at_lower = ~fixed & np.isfinite(lower) & (~np.isfinite(upper) | (np.abs(values - lower) <= np.abs(values - upper)))
+    at_upper = ~fixed & ~at_lower & np.isfinite(upper)
+    free = ~fixed & ~at_lower & ~at_upper
+    return at_lower, at_upper, free
+
+
+def ranging(arrays: LpArrays, result: SimplexResult, tolerance: float = 1e-9) -> Ranging:
+    """
+    Compute the right-hand side and objective ranges of an optimal solution.
+
+    :param arrays: A linear program.
+    :param result: An optimal solve of ``arrays``, whose basis is ranged.
+    :param tolerance: Entries of the tableau below this are treated as zero.
+    :return: The ranges.
+    """
+    if not result.is_optimal:
+        raise ValueError("Ranging needs an optimal solution.")
+
+    form = StandardForm.from_arrays(arrays)
+    m, N = form.shape
+    n = form.n_structural
+    A = np.hstack([form.A, np.eye(m)])
+    lower = np.concatenate([form.lower, np.zeros(m)])
+    upper = np.concatenate([form.upper, np.zeros(m)])
+    cost = np.concatenate([form.cost, np.zeros(m)])
+    values = np.concatenate([form.column_values(result.x), np.zeros(m)])
+
+    basis = result.basis
+    nonbasic = np.setdiff1d(np.arange(N), basis)
+    binv = np.linalg.inv(A[:, basis])
+
+    # Right-hand sides: the basic values move along B^-1 e_i (rows are signed in the standard form).
+    direction = binv * form.row_sign[None, :]
+    x_B = values[basis][:, None]
+    room_up = (upper[basis][:, None] - x_B)
+    room_down = (x_B - lower[basis][:, None])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        increase = np.where(direction > tolerance, room_up / direction, np.where(direction < -tolerance, -room_down / direction, np.inf))
+        decrease = np.where(direction > tolerance, room_down / direction, np.where(direction < -tolerance, -room_up / direction, np.inf))
+    increase = np.maximum(np.min(increase, axis=0), 0.0)
+    decrease = np.maximum(np.min(decrease, axis=0), 0.0)
+
+    # Objective coefficients, in the minimization form of the standard form.
+    y = np.linalg.solve(A[:, basis].T, cost[basis])
+    reduced = cost[nonbasic] - y @ A[:, nonbasic]
+    at_lower, at_upper, free = _nonbasic_positions(lower[nonbasic], upper[nonbasic], values[nonbasic])
+
+    up = np.full(n, np.inf)
+    down = np.full(n, -np.inf)
+
+    # A nonbasic coefficient only has to keep its own reduced cost sign.
+    position = {column: k for k, column in enumerate(nonbasic)}
+    for j in range(n):
+        if j in position:
+            k = position[j]
+            if at_lower[k]:
+                down[j] = -reduced[k]
+            elif at_upper[k]:
+                up[j] = -reduced[k]
+            elif free[k]:
+                up[j] = down[j] = -reduced[k]
+
+    # A basic coefficient moves every reduced cost along its tableau row.
+    alpha = binv @ A[:, nonbasic]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = reduced[None, :] / alpha
+    positive, negative = alpha > tolerance, alpha < -tolerance
+    caps_up = (at_lower & positive) | (at_upper & negative)
+    caps_down = (at_lower & negative) | (at_upper & positive)
+    pinned = (free & (positive | negative)).any(axis=1)
+    row_up = np.where(pinned, 0.0, np.min(np.where(caps_up, ratio, np.inf), axis=1))
+    row_down = np.where(pinned, 0.0, np.max(np.where(caps_down, ratio, -np.inf), axis=1))
+    for r, column in enumerate(basis):
+        if column < n:
+            up[column], down[column] = max(row_up[r], 0.0), min(row_down[r], 0.0)
+
+    # Back to the sense of the objective: maximizing negates the standard form costs.
+    if form.maximize:
+        up, down = -down, -up
+
+    return Ranging(
+        rhs=arrays.b.copy(),
+        rhs_lower=arrays.b - decrease,
+        rhs_upper=arrays.b + increase,
+        shadow_prices=np.asarray(result.duals, dtype=float),
+        cost=arrays.c.copy(),
+        cost_lower=arrays.c + down,
+        cost_upper=arrays.c + up,
+        values=np.asarray(result.x, dtype=float),
+    )
+
+
+def tornado(
+    arrays: LpArrays,
+    result: SimplexResult,
+    change: float = 0.1,
+    tolerance: float = 1e-9,
+    verification: CertificateTolerances = CertificateTolerances(),
+) -> list[TornadoBar]:
+    """
+    Move every right-hand side and objective coefficient by ``±change`` (relative), one at a time.
+
+    Moves inside the range of the optimal basis are evaluated from its shadow prices and variable values;
+    only moves past the range are solved, warm-started from the optimal basis.
+
+    :param arrays: A linear program.
+    :param result: An optimal solve of ``arrays``.
+    :param change: Relative move of each parameter.
+    :param tolerance: Passed to ``ranging``.
+    :param verification: Tolerances of the certificate every solve is checked against.
+    :return: The bars, largest swing first.
+    """
+    ranges = ranging(arrays, result, tolerance)
+    objective = float(result.objective_value)
+    bars = []
+
+    def evaluate(kind: ParametricKind, index: int, value: float) -> tuple[float | None, str, bool, bool]:
+        if kind == ParametricKind.RHS:
+            inside = ranges.rhs_lower[index] <= value <= ranges.rhs_upper[index]
+            if inside:
+                return objective + ranges.shadow_prices[index] * (value - ranges.rhs[index]), OPTIMAL, False, False
+            rhs = arrays.b.copy()
+            rhs[index] = value
+            changed = arrays.with_rhs(rhs)
+        else:
+            inside = ranges.cost_lower[index] <= value <= ranges.cost_upper[index]
+            if inside:
+                return objective + ranges.values[index] * (value - ranges.cost[index]), OPTIMAL, False, False
+            costs = arrays.c.copy()
+            costs[index] = value
+            changed = arrays.with_objective(costs)
+
+        solved, certificate = solve_verified(changed, result.basis, verification)
+        flagged = certificate is not None and not certificate.passed
+        return (float(solved.objective_value) if solved.is_optimal else None), solved.status, True, flagged
+
+    parameters = [(ParametricKind.RHS, i, arrays.b[i]) for i in range(arrays.shape[0])]
+    parameters += [(ParametricKind.OBJECTIVE, j, arrays.c[j]) for j in range(arrays.shape[1])]
+    for kind, index, nominal in parameters:
+        low, high = nominal - change * abs(nominal), nominal + change * abs(nominal)
+        objective_low, status_low, resolved_low, flagged_low = evaluate(kind, index, low)
+        objective_high, status_high, resolved_high, flagged_high = evaluate(kind, index, high)
+        bars.append(TornadoBar(
+            kind=kind,
+            index=index,
+            nominal=float(nominal),
+            low=float(low),
+            high=float(high),
+            objective_low=objective_low,
+            objective_high=objective_high,
+            status_low=status_low,
+            status_high=status_high,
+            resolved=resolved_low or resolved_high,
+            flagged=flagged_low or flagged_high,
+        ))
+
+    bars.sort(key=lambda bar: -bar.swing)
+    return bars
@@ -0,0 +1,198 @@
+"""
+Optimal value over a grid of two right-hand sides.
+
+Dual feasibility of a basis does not depend on the right-hand side, so an optimal basis stays optimal
+wherever its basic variables stay within their bounds. Those variables are affine in the two varied
+right-hand sides, as is the optimal value (its slopes are the two shadow prices). One solve therefore
+covers a whole polygon of the grid, computed with a few array operations over every grid point. Only
+points that no known basis covers, near the region boundaries, are solved again, in parallel.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from methods.certificate import Certificate, CertificateTolerances, solve_verified
+from methods.lp_arrays import LpArrays
+from methods.native_simplex import SimplexResult, StandardForm, OPTIMAL, NOT_SOLVED
+from methods.workers import solver_pool
+
+
+@dataclass(frozen=True)
+class BasisRegion:
+    """An optimal basis and the affine optimal value over the points it covers."""
+    basis: np.ndarray
+    objective_value: float
+    duals: tuple[float, float]
+    origin: tuple[float, float]
+
+    def value(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        return self.objective_value + self.duals[0] * (first - self.origin[0]) + self.duals[1] * (second - self.origin[1])
+
+
+@dataclass(frozen=True)
+class RhsGrid:
+    """
+    Result of a sweep over ``first_values x second_values``.
+
+    Arrays are indexed ``[i, j]`` for ``first_values[i]`` and ``second_values[j]``. ``region`` holds
+    the index in ``regions`` of the basis that is optimal at each point (-1 where the problem has no
+    optimal solution, see ``status``), and ``solves`` the number of simplex solves the sweep needed.
+    ``flagged`` marks the points whose values come from a solve that failed verification even after a
+    re-solve from scratch.
+    """
+    rows: tuple[int, int]
+    first_values: np.ndarray
+    second_values: np.ndarray
+    objective: np.ndarray
+    status: np.ndarray
+    region: np.ndarray
+    regions: tuple[BasisRegion, ...]
+    solves: int
+    flagged: np.ndarray
+
+
+def _coverage(
+    arrays: LpArrays,
+    result: SimplexResult,
+    rows: tuple[int, int],
+    first: np.ndarray,
+    second: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+    """
+    Grid points where the optimal basis of ``result`` (solved at the right-hand side of ``arrays``)
+    stays primal feasible.
+    """
+    form = StandardForm.from_arrays(arrays)
+    m, N = form.shape
+    A = np.hstack([form.A, np.eye(m)])
+    lower = np.concatenate([form.lower, np.zeros(m)])
+    upper = np.concatenate([form.upper, np.zeros(m)])
+
+    # Values of the standard form columns at the solved point (artificials are zero).
+    values = np.concatenate([form.column_values(result.x), np.zeros(m)])
+
+    basis = result.basis
+    unit = np.zeros((m, 2))
+    unit[rows[0], 0] = form.row_sign[rows[0]]
+    unit[rows[1], 1] = form.row_sign[rows[1]]
+    try:
+        derivatives = np.linalg.solve(A[:, basis], unit)
+    except np.linalg.LinAlgError:
+        return np.zeros((first.size, second.size), dtype=bool)
+
+    delta_first = first[:, None] - arrays.b[rows[0]]
+    delta_second = second[None, :] - arrays.b[rows[1]]
+    basic = (
+        values[basis][:, None, None]
+        + derivatives[:, 0, None, None] * delta_first[None]
+        + derivatives[:, 1, None, None] * delta_second[None]
+    )
+    slack = tolerance * (1.0 + np.abs(values[basis]))[:, None, None]
+    inside = (basic >= lower[basis][:, None, None] - slack) & (basic <= upper[basis][:, None, None] + slack)
+    return inside.all(axis=0)
+
+
+def sweep_rhs(
+    arrays: LpArrays,
+    rows: tuple[int, int],
+    first_values: np.ndarray,
+    second_values: np.ndarray,
+    basis: np.ndarray | None = None,
+    workers: int = 1,
+    tolerance: float = 1e-7,
+    verification: CertificateTolerances = CertificateTolerances(),
+) -> RhsGrid:
+    """
+    Compute the optimal value for every pair of right-hand sides of two constraints.
+
+    :param arrays: A linear program (integrality is ignored).
+    :param rows: Indices of the two constraints whose right-hand sides vary.
+    :param first_values: Values of the right-hand side of ``rows[0]``.
+    :param second_values: Values of the right-hand side of ``rows[1]``.
+    :param basis: Optimal basis of ``arrays``, used as the first region and as warm start of every solve.
+    :param workers: Number of processes solving uncovered points in parallel (1 solves in-process).
+    :param tolerance: Feasibility tolerance of the region test.
+    :param verification: Tolerances of the certificate every solve is checked against.
+    :return: The grid of optimal values, statuses and regions.
+    """
+    if rows[0] == rows[1]:
+        raise ValueError("The two constraints must be different.")
+    first = np.asarray(first_values, dtype=float)
+    second = np.asarray(second_values, dtype=float)
+    shape = (first.size, second.size)
+
+    objective = np.full(shape, np.nan)
+    status = np.full(shape, NOT_SOLVED, dtype=object)
+    region = np.full(shape, -1)
+    flagged = np.zeros(shape, dtype=bool)
+    pending = np.ones(shape, dtype=bool)
+    regions: list[BasisRegion] = []
+    solves = 0
+
+    def point_arrays(i: int, j: int) -> LpArrays:
+        b = arrays.b.copy()
+        b[rows[0]], b[rows[1]] = first[i], second[j]
+        return arrays.with_rhs(b)
+
+    def add_region(point: LpArrays, result: SimplexResult, certificate: Certificate, seed: tuple[int, int] | None):
+        covered = _coverage(point, result, rows, first, second, tolerance) & pending
+        if seed is not None:
+            covered[seed] = True
+        flagged[covered] = not certificate.passed
+        entry = BasisRegion(
+            basis=result.basis.copy(),
+            objective_value=float(result.objective_value),
+            duals=(float(result.duals[rows[0]]), float(result.duals[rows[1]])),
+            origin=(float(point.b[rows[0]]), float(point.b[rows[1]])),
+        )
+        grid_first, grid_second = np.meshgrid(first, second, indexing="ij")
+        objective[covered] = entry.value(grid_first[covered], grid_second[covered])
+        status[covered] = OPTIMAL
+        region[covered] = len(regions)
+        pending[covered] = False
+        regions.append(entry)
+
+    warm_start = basis
+    if basis is not None:
+        result, certificate = solve_verified(arrays, basis, verification)
+        solves += 1
+        if result.is_optimal:
+            add_region(arrays, result, certificate, None)
+            warm_start = result.basis
+
+    executor = solver_pool(workers)
+    while pending.any():
+        # Seeds spread over the uncovered points, one per worker.
+        candidates = np.argwhere(pending)
+        picks = np.unique(np.linspace(0, len(candidates) - 1, min(max(workers, 1), len(candidates))).astype(int))
+        seeds = [tuple(int(k) for k in candidates[p]) for p in picks]
+        seed_arrays = [point_arrays(i, j) for i, j in seeds]
+
+        if executor is not None and len(seeds) > 1:
+            results = list(executor.map(solve_verified, seed_arrays, [warm_start] * len(seeds), [verification] * len(seeds)))
+        else:
+            results = [solve_verified(point, warm_start, verification) for point in seed_arrays]
+        solves += len(seeds)
+
+        for seed, point, (result, certificate) in zip(seeds, seed_arrays, results):
+            if not pending[seed]:
+                continue
+            if result.is_optimal:
+                add_region(point, result, certificate, seed)
+            else:
+                status[seed] = result.status
+                pending[seed] = False
+
+    return RhsGrid(
+        rows=(int(rows[0]), int(rows[1])),
+        first_values=first,
+        second_values=second,
+        objective=objective,
+        status=status,
+        region=region,
+        regions=tuple(regions),
+        solves=solves,
+        flagged=flagged,
+    )
@@ -0,0 +1,216 @@
+"""
+Row and column scaling of linear programming problems.
+
+Scaling replaces ``A`` by ``R A S``, ``b`` by ``R b``, ``c`` by ``S c`` and the variable bounds by
+``S^-1 l`` and ``S^-1 u``, where ``R`` and ``S`` are positive diagonal matrices. The scaled problem has the same optimal basis, and its
+solution is mapped back to the original units with the ``unscale_*`` helpers.
+All factors are rounded to powers of two, so scaling and unscaling are exact in floating point.
+
+Multiplying every row factor of a connected block of ``A`` by ``a`` and dividing its column factors by ``a``
+leaves ``R A S`` unchanged, so the passes do not determine that common factor and can let it drift far
+enough to push ``R b`` or ``S c`` below every tolerance. It is pinned so that the row and column factors of
+each block are balanced, every factor is kept within ``2**±MAX_EXPONENT``, and a problem whose scaled
+right-hand side, costs or bounds still leave a sane range is not scaled at all.
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from methods.lp_arrays import LpArrays
+
+
+MAX_EXPONENT = 20
+# Nonzero right-hand sides, costs and bounds that scaling shrinks below or grows above these are rejected.
+MIN_MAGNITUDE = 1e-6
+MAX_MAGNITUDE = 1e9
+
+
+@dataclass(frozen=True)
+class ScalingFactors:
+    """Diagonal row (``R``) and column (``S``) scaling factors."""
+    row: np.ndarray
+    col: np.ndarray
+
+    @classmethod
+    def identity(cls, m: int, n: int) -> "ScalingFactors":
+        return cls(row=np.ones(m), col=np.ones(n))
+
+    def apply(self, arrays: LpArrays) -> LpArrays:
+        """Return the scaled copy of the problem."""
+        return replace(
+            arrays,
+            A=self.row[:, None] * arrays.A * self.col[None, :],
+            b=self.row * arrays.b,
+            c=self.col * arrays.c,
+            lower=arrays.lower / self.col,
+            upper=arrays.upper / self.col,
+        )
+
+    def scale_rhs(self, b: np.ndarray) -> np.ndarray:
+        return self.row * np.asarray(b, dtype=float)
+
+    def unscale_primal(self, x: np.ndarray) -> np.ndarray:
+        """Variable values in original units (``x = S x'``)."""
+        return self.col * np.asarray(x, dtype=float)
+
+    def unscale_duals(self, y: np.ndarray) -> np.ndarray:
+        """Shadow prices in original units (``y = R y'``)."""
+        return self.row * np.asarray(y, dtype=float)
+
+    def unscale_reduced_costs(self, d: np.ndarray) -> np.ndarray:
+        """Reduced costs in original units (``d = d' / S``)."""
+        return np.asarray(d, dtype=float) / self.col
+
+    def unscale_slacks(self, s: np.ndarray) -> np.ndarray:
+        """Constraint slacks in original units (``s = s' / R``)."""
+        return np.asarray(s, dtype=float) / self.row
+
+    def unscale_rhs(self, b: np.ndarray) -> np.ndarray:
+        """Right-hand side values or RHS ranges in original units (``b = b' / R``)."""
+        return np.asarray(b, dtype=float) / self.row
+
+    def unscale_costs(self, c: np.ndarray) -> np.ndarray:
+        """Objective coefficients or cost ranges in original units (``c = c' / S``)."""
+        return np.asarray(c, dtype=float) / self.col
+
+
+def _magnitudes(A: np.ndarray) -> np.ndarray:
+    """Absolute values of ``A`` with structural zeros replaced by NaN."""
+    magnitudes = np.abs(A)
+    return np.where(magnitudes > 0, magnitudes, np.nan)
+
+
+def _geometric_factors(magnitudes: np.ndarray, axis: int) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        largest = np.nanmax(magnitudes, axis=axis, initial=-np.inf, where=~np.isnan(magnitudes))
+        smallest = np.nanmin(magnitudes, axis=axis, initial=np.inf, where=~np.isnan(magnitudes))
+        factors = 1.0 / np.sqrt(largest * smallest)
+    return np.where(np.isfinite(factors) & (factors > 0), factors, 1.0)
+
+
+def _equilibration_factors(magnitudes: np.ndarray, axis: int) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        factors = 1.0 / np.nanmax(magnitudes, axis=axis, initial=-np.inf, where=~np.isnan(magnitudes))
+    return np.where(np.isfinite(factors) & (factors > 0), factors, 1.0)
+
+
+def _blocks(pattern: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Connected block of every row and column of a sparsity pattern, labelled by its smallest row or column."""
+    m, n = pattern.shape
+    rows = np.arange(m)
+    cols = np.arange(m, m + n)
+    while True:
+        new_cols = np.minimum(cols, np.where(pattern, rows[:, None], m + n).min(axis=0, initial=m + n))
+        new_rows = np.minimum(rows, np.where(pattern, new_cols[None, :], m + n).min(axis=1, initial=m + n))
+        if np.array_equal(new_rows, rows) and np.array_equal(new_cols, cols):
+            return rows, cols
+        rows, cols = new_rows, new_cols
+
+
+def _balance(row_exponents: np.ndarray, col_exponents: np.ndarray, pattern: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pin the free common factor of every block: shift its row and column exponents by opposite integers so
+    that their means meet. Rows or columns without nonzeros do not touch ``A`` and get a factor of 1.
+    """
+    row_exponents, col_exponents = row_exponents.copy(), col_exponents.copy()
+    row_blocks, col_blocks = _blocks(pattern)
+    for block in np.unique(np.concatenate([row_blocks, col_blocks])):
+        rows, cols = row_blocks == block, col_blocks == block
+        if not rows.any() or not cols.any():
+            row_exponents[rows] = 0.0
+            col_exponents[cols] = 0.0
+            continue
+        shift = np.round((col_exponents[cols].mean() - row_exponents[rows].mean()) / 2)
+        row_exponents[rows] += shift
+        col_exponents[cols] -= shift
+    return row_exponents, col_exponents
+
+
+def _in_range(original: np.ndarray, factors: np.ndarray) -> bool:
+    """Whether scaling the finite nonzero entries of ``original`` by ``factors`` keeps them in a sane range."""
+    mask = np.isfinite(original) & (original != 0)
+    scaled = np.abs(original[mask] * factors[mask])
+    shrunk = (scaled < MIN_MAGNITUDE) & (factors[mask] < 1)
+    grown = (scaled > MAX_MAGNITUDE) & (factors[mask] > 1)
+    return not np.any(shrunk | grown)
+
+
+def magnitude_ratio(A: np.ndarray) -> float:
+    """Ratio between the largest and smallest nonzero magnitude of ``A`` (1.0 is perfectly scaled)."""
+    magnitudes = np.abs(A[A != 0])
+    if magnitudes.size == 0:
+        return 1.0
+    return float(magnitudes.max() / magnitudes.min())
+
+
+def compute_scaling(
+    A: np.ndarray,
+    geometric_passes: int = 4,
+    tolerance: float = 0.9,
+    fixed_columns: np.ndarray | None = None,
+) -> ScalingFactors:
+    """
+    Compute scaling factors for a constraint matrix.
+
+    A few geometric mean passes (alternating rows and columns) reduce the spread of the
+    coefficient magnitudes, then one row and one column equilibration pass bring the
+    largest magnitude of every row and column close to 1. The factors are then rounded to powers of
+    two, balanced block by block and clamped to ``2**±MAX_EXPONENT``.
+
+    :param A: The constraint matrix.
+    :param geometric_passes: Maximum number of geometric mean passes.
+    :param tolerance: Stop the geometric passes once a pass improves the magnitude ratio by less than this factor.
+    :param fixed_columns: Boolean mask of columns that must keep a factor of 1, such as integer
+        variables, whose integrality would not survive scaling.
+    :return: The row and column scaling factors.
+    """
+    m, n = A.shape
+    row = np.ones(m)
+    col = np.ones(n)
+    if A.size == 0 or not np.any(A):
+        return ScalingFactors(row=row, col=col)
+
+    magnitudes = _magnitudes(A)
+    ratio = magnitude_ratio(A)
+    for _ in range(geometric_passes):
+        row_pass = _geometric_factors(magnitudes * col[None, :], axis=1)
+        candidate_row = row * row_pass
+        col_pass = _geometric_factors(candidate_row[:, None] * magnitudes * col[None, :], axis=0)
+        candidate_col = col * col_pass
+
+        candidate_ratio = magnitude_ratio(candidate_row[:, None] * A * candidate_col[None, :])
+        if candidate_ratio > ratio * tolerance:
+            if candidate_ratio < ratio:
+                row, col = candidate_row, candidate_col
+            break
+        row, col, ratio = candidate_row, candidate_col, candidate_ratio
+
+    row = row * _equilibration_factors(row[:, None] * magnitudes * col[None, :], axis=1)
+    col = col * _equilibration_factors(row[:, None] * magnitudes * col[None, :], axis=0)
+
+    row_exponents, col_exponents = _balance(np.round(np.log2(row)), np.round(np.log2(col)), A != 0)
+    row = np.exp2(np.clip(row_exponents, -MAX_EXPONENT, MAX_EXPONENT))
+    col = np.exp2(np.clip(col_exponents, -MAX_EXPONENT, MAX_EXPONENT))
+    if fixed_columns is not None:
+        col[fixed_columns] = 1.0
+    return ScalingFactors(row=row, col=col)
+
+
+def scale_problem(arrays: LpArrays) -> tuple[LpArrays, ScalingFactors]:
+    """
+    Scale a problem before solving it; a problem whose scaled right-hand side, costs or bounds would leave
+    a sane range is returned unscaled, with identity factors.
+
+    :param arrays: The problem in array form.
+    :return: The scaled problem and the factors needed to undo the scaling.
+    """
+    factors = compute_scaling(arrays.A, fixed_columns=arrays.integer_mask)
+    if not (
+        _in_range(arrays.b, factors.row)
+        and _in_range(arrays.c, factors.col)
+        and _in_range(arrays.lower, 1.0 / factors.col)
+        and _in_range(arrays.upper, 1.0 / factors.col)
+    ):
+        factors = ScalingFactors.identity(*arrays.shape)
+    return factors.apply(arrays), factors
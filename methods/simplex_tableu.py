@@ -1,11 +1,84 @@
+import time
+from dataclasses import asdict
+
+import numpy as np
 import pulp as plp
 
-from data.app_state import ObjectiveFunctionState, ObjectiveFunctionType, ConstraintSymbol
+from data.app_state import ObjectiveFunctionState, ConstraintSymbol, VariableCategory
+from data.result_store import ResultStore, StoredRun, scenario_key
+from methods.alternative_optima import AlternativeOptimaOptions, enumerate_optimal_vertices
+from methods.branch_and_bound import BranchAndBound, BranchAndBoundOptions, BranchAndBoundStatistics
+from methods.certificate import Certificate, CertificateTolerances, verify
+from methods.decomposition import BlockStructure, DantzigWolfe, DecompositionOptions, DecompositionStatistics, detect_blocks
+from methods.diagnosis import BoundSide, find_iis, find_unbounded_ray
+from methods.exact_simplex import ExactResult, ExactSimplex
+from methods.interior_point import solve_interior_point
+from methods.lp_arrays import LpArrays
+from methods.monte_carlo import Uncertainty, monte_carlo
+from methods.native_simplex import RevisedSimplex, SimplexResult, StandardForm
+from methods.network import NetworkForm, ProblemStructure, solve_network
+from methods.parametric import ParametricCurve, ParametricKind, parametric_objective, parametric_rhs
+from methods.progress import ProgressEvent, ProgressReporter, SolvePhase
+from methods.ranging import ranging, tornado
+from methods.rhs_grid import sweep_rhs
+from methods.scaling import ScalingFactors, scale_problem
+from methods.solver_engine import SolverEngine
+
+
+_PULP_STATUS_CODES = {name: code for code, name in plp.LpStatus.items()}
 
 
 class SimplexTableau:
-    def __init__(self):
+    def __init__(
+        self,
+        scaling: bool = True,
+        engine: SolverEngine = SolverEngine.PULP,
+        branch_and_bound: BranchAndBoundOptions = BranchAndBoundOptions(),
+        verification: CertificateTolerances = CertificateTolerances(),
+        store: ResultStore | None = None,
+        detect_structure: bool = True,
+        decomposition: DecompositionOptions = DecompositionOptions(),
+    ):
+        """
+        :param scaling: Scale rows and columns of the problem before solving. Results are always
+            reported in the original units.
+        :param engine: Solver engine. The native engines write their results back into the PuLP
+            model, so every analysis method works the same way regardless of the engine. The exact
+            engine solves with the native simplex and certifies the result in rational arithmetic.
+        :param branch_and_bound: Search options used by the native engines when the problem has
+            integer or binary variables.
+        :param verification: Tolerances of the optimality certificate checked after every solve.
+        :param store: Persistent store of past results. A solve of a problem the store already holds is
+            reloaded from it (the exact engine always solves again, to keep its exact result), other
+            solves of the native engines are warm-started from its bases, and scenario results with the
+            same parameters are reloaded instead of recomputed.
+        :param detect_structure: With the native simplex engine, solve transportation, assignment and
+            other network problems with the network solvers instead of the general simplex.
+        :param decomposition: Options of the Dantzig–Wolfe engine, which solves block-angular linear
+            programs by column generation (problems without a block structure go to the native simplex).
+        """
+        if not isinstance(engine, SolverEngine):
+            raise ValueError("Invalid solver engine")
+
         self._model: plp.LpProblem
+        self._variables: list[plp.LpVariable]
+        self._scaling_enabled = scaling
+        self._engine = engine
+        self._arrays: LpArrays
+        self._scaled: LpArrays
+        self._scaling: ScalingFactors
+        self._result: SimplexResult | None = None
+        self._exact_result: ExactResult | None = None
+        self._branch_and_bound_options = branch_and_bound
+        self._branch_and_bound_statistics: BranchAndBoundStatistics | None = None
+        self._verification = verification
+        self._certificate: Certificate | None = None
+        self._store = store
+        self._reloaded = False
+        self._detect_structure = detect_structure
+        self._structure: ProblemStructure | None = None
+        self._decomposition_options = decomposition
+        self._decomposition_statistics: DecompositionStatistics | None = None
 
     def build(self, problem: ObjectiveFunctionState):
         """"
@@ -13,55 +86,890 @@ class SimplexTableau:
         
         :param problem: An instance of ObjectiveFunctionState containing the problem definition.
         """
-        objective = plp.LpMaximize
-        match problem.objective_function:
-            case ObjectiveFunctionType.MAXIMIZE:
-                objective = plp.LpMaximize
-            case ObjectiveFunctionType.MINIMIZE:
-                objective = plp.LpMinimize
-            case _:
-                raise ValueError("Invalid objective function type")
+        arrays = LpArrays.from_problem(problem)
+        m, n = arrays.shape
+        if self._scaling_enabled:
+            scaled, scaling = scale_problem(arrays)
+        else:
+            scaling = ScalingFactors.identity(m, n)
+            scaled = scaling.apply(arrays)
 
+        objective = plp.LpMaximize if scaled.maximize else plp.LpMinimize
         ppl = plp.LpProblem("Simplex Problem", objective)
 
         variables: list[plp.LpVariable] = []
-        for variable in problem.variables:
-            var = plp.LpVariable(variable.name, lowBound=0)
+        categories = scaled.categories or (VariableCategory.CONTINUOUS,) * n
+        for name, category, lower, upper in zip(scaled.variable_names, categories, scaled.lower, scaled.upper):
+            # Binary variables already have their bounds clamped to [0, 1] in the arrays.
+            match category:
+                case VariableCategory.CONTINUOUS:
+                    cat = plp.LpContinuous
+                case VariableCategory.INTEGER | VariableCategory.BINARY:
+                    cat = plp.LpInteger
+                case _:
+                    raise ValueError("Invalid variable category")
+            var = plp.LpVariable(
+                name,
+                lowBound=float(lower) if np.isfinite(lower) else None,
+                upBound=float(upper) if np.isfinite(upper) else None,
+                cat=cat,
+            )
             variables.append(var)
 
         # Define the objective function
-        ppl += plp.lpSum(coefficient.value * var for coefficient, var in zip(problem.variables, variables))
+        ppl += plp.lpSum(coefficient * var for coefficient, var in zip(scaled.c, variables))
 
         # Define the constraints
-        for constraint in problem.constraints:
-            match constraint.symbol:
+        for row, symbol, value in zip(scaled.A, scaled.senses, scaled.b):
+            expression = plp.lpSum(coefficient * var for coefficient, var in zip(row, variables))
+            match symbol:
                 case ConstraintSymbol.LESS_THAN_OR_EQUAL:
-                    ppl += plp.lpSum(coefficient.value * var for coefficient, var in zip(constraint.variables, variables)) <= constraint.value
+                    ppl += expression <= value
                 case ConstraintSymbol.GREATER_THAN_OR_EQUAL:
-                    ppl += plp.lpSum(coefficient.value * var for coefficient, var in zip(constraint.variables, variables)) >= constraint.value
+                    ppl += expression >= value
                 case ConstraintSymbol.EQUAL:
-                    ppl += plp.lpSum(coefficient.value * var for coefficient, var in zip(constraint.variables, variables)) == constraint.value
+                    ppl += expression == value
                 case _:
                     raise ValueError("Invalid constraint type")
         
         # Store the model in the instance variable
         # This allows the tableau to be used later for solving or extracting results
         self._model = ppl
+        self._variables = variables
+        self._arrays = arrays
+        self._scaled = scaled
+        self._scaling = scaling
+        self._result = None
+        self._exact_result = None
+        self._branch_and_bound_statistics = None
+        self._certificate = None
+        self._reloaded = False
+        self._structure = None
+        self._decomposition_statistics = None
 
-    def solve(self):
+    def solve(self, solver: plp.LpSolver | None = None, progress: ProgressReporter | None = None):
         """
         Solve the linear programming problem using the simplex method.
         
+        :param solver: Optional PuLP solver to use instead of the default CBC configuration
+            (only used by the PuLP engine).
+        :param progress: Receives throttled progress events from the native engines, and a final
+            event with the status from every engine.
         :return: The status of the solution.
         """
-        self._model.solve()
-        return plp.LpStatus[self._model.status]
+        self._exact_result = None
+        self._reloaded = self._reload()
+        if self._reloaded:
+            status = plp.LpStatus[self._model.status]
+        else:
+            start = time.perf_counter()
+            if self._engine == SolverEngine.PULP:
+                # A basis recovered for an earlier problem must not be taken for this one's.
+                self._result = None
+                self._model.solve(solver)
+            else:
+                self._store_native_result(self._solve_native(progress))
+            status = plp.LpStatus[self._model.status]
+            self._certificate = self._verify() if status == "Optimal" else None
+            self._save_run(status, time.perf_counter() - start)
+
+        if progress is not None:
+            progress.emit(ProgressEvent(
+                phase=SolvePhase.FINISHED,
+                iteration=self._result.iterations if self._result is not None else 0,
+                objective_value=self.get_objective_value() if status == "Optimal" else None,
+                primal_infeasibility=None,
+                dual_infeasibility=None,
+                elapsed=progress.elapsed,
+                nodes=self._branch_and_bound_statistics.nodes if self._branch_and_bound_statistics is not None else 0,
+                status=status,
+            ))
+        return status
+
+    def _reload(self) -> bool:
+        """Load the stored run of this problem and engine into the model; False when there is none to trust."""
+        if self._store is None or self._engine == SolverEngine.EXACT:
+            return False
+        run = self._store.load_run(self._exact_arrays(), self._engine.value)
+        if run is None or run.status not in _PULP_STATUS_CODES:
+            return False
+
+        previous = self._result
+        self._store_native_result(self._scaled_run(run))
+        if run.basis is None:
+            self._result = previous
+        self._certificate = self._verify() if run.status == "Optimal" else None
+        if self._certificate is not None and not self._certificate.passed:
+            self._result = previous
+            self._certificate = None
+            return False
+        return True
+
+    def _scaled_run(self, run: StoredRun) -> SimplexResult:
+        """A stored run (original units) as a result of the scaled problem."""
+        return self._scaled_result(SimplexResult(
+            status=run.status,
+            objective_value=run.objective_value,
+            x=run.x,
+            slacks=run.slacks,
+            duals=run.duals,
+            reduced_costs=run.reduced_costs,
+            basis=run.basis if run.basis is not None else np.empty(0, dtype=int),
+            iterations=run.iterations,
+        ))
+
+    def _scaled_result(self, result: SimplexResult) -> SimplexResult:
+        """A result of the unscaled problem as a result of the scaled problem."""
+        return SimplexResult(
+            status=result.status,
+            objective_value=result.objective_value,
+            x=result.x / self._scaling.col,
+            slacks=result.slacks * self._scaling.row,
+            duals=result.duals / self._scaling.row,
+            reduced_costs=result.reduced_costs * self._scaling.col,
+            basis=result.basis,
+            iterations=result.iterations,
+        )
+
+    def _save_run(self, status: str, elapsed: float):
+        """Store the solve just made, in original units."""
+        if self._store is None or status == "Not Solved":
+            return
+        native = not self._arrays.is_mixed_integer
+        self._store.save_run(
+            self._exact_arrays(),
+            engine=self._engine.value,
+            status=status,
+            objective_value=self.get_objective_value() if status == "Optimal" else None,
+            x=self._scaling.unscale_primal([v.varValue or 0.0 for v in self._variables]),
+            slacks=self._scaling.unscale_slacks([constraint.slack or 0.0 for constraint in self._model.constraints.values()]),
+            duals=self._scaling.unscale_duals([constraint.pi or 0.0 for constraint in self._model.constraints.values()]),
+            reduced_costs=self._scaling.unscale_reduced_costs([v.dj or 0.0 for v in self._variables]),
+            basis=self._optimal_basis() if native else None,
+            iterations=self._result.iterations if self._result is not None else 0,
+            elapsed=elapsed,
+        )
+
+    def _optimal_basis(self):
+        """Basis of the last native solve when it is optimal; a decomposed solve has none."""
+        if self._result is not None and self._result.is_optimal and self._result.basis.size == self._scaled.shape[0]:
+            return self._result.basis
+        return None
+
+    def _optimal_result(self) -> SimplexResult:
+        """
+        Optimal native result of the current problem, with its basis.
+
+        PuLP and the decomposition expose no basis; it is then recovered with one native solve, which is
+        kept as the result of the last solve so that every later analysis starts from the same basis.
+        """
+        if self._optimal_basis() is not None:
+            return self._result
+        result = RevisedSimplex(self._scaled.with_rhs(self._current_rhs())).solve(self._stored_basis())
+        if result.is_optimal:
+            self._result = result
+        return result
+
+    def _stored_basis(self):
+        """Basis of the previous solve, otherwise one from the store to warm-start a first solve."""
+        basis = self._optimal_basis()
+        if basis is not None:
+            return basis
+        if self._store is None:
+            return None
+        return self._store.load_basis(self._exact_arrays())
+
+    def _stored_scenario(self, kind: str, parameters: dict, compute, reusable: bool = True):
+        """
+        Reload a scenario result of this problem from the store, or compute and store it.
+
+        :param kind: Kind of scenario.
+        :param parameters: Everything besides the problem that the result depends on.
+        :param compute: Computes the result.
+        :param reusable: False for results that are not reproducible; they are computed every time.
+        """
+        if self._store is None or not reusable:
+            return compute()
+        arrays = self._exact_arrays()
+        key = scenario_key({**parameters, "verification": self._verification})
+        result = self._store.load_scenario(arrays, kind, key)
+        if result is None:
+            result = compute()
+            self._store.save_scenario(arrays, kind, key, result)
+        return result
+
+    def _save_bases(self, bases):
+        """Store optimal bases found by a scenario batch, to warm-start later solves."""
+        if self._store is not None:
+            self._store.save_bases(self._exact_arrays(), bases)
+
+    @property
+    def verification_tolerances(self) -> CertificateTolerances:
+        """Tolerances of the optimality certificate checked after every solve."""
+        return self._verification
+
+    def _verify(self) -> Certificate:
+        """Check the solution stored in the PuLP model against the unscaled problem."""
+        arrays = self._exact_arrays()
+        x = self._scaling.unscale_primal([v.varValue or 0.0 for v in self._variables])
+        if arrays.is_mixed_integer:
+            return verify(arrays, x, tolerances=self._verification)
+        duals = self._scaling.unscale_duals([constraint.pi or 0.0 for constraint in self._model.constraints.values()])
+        reduced_costs = self._scaling.unscale_reduced_costs([v.dj or 0.0 for v in self._variables])
+        return verify(arrays, x, duals, reduced_costs, self._verification)
+
+    def _current_rhs(self) -> np.ndarray:
+        """Scaled right-hand side currently stored in the PuLP constraints."""
+        return np.array([-(constraint.constant or 0.0) for constraint in self._model.constraints.values()])
+
+    def _solve_native(self, progress: ProgressReporter | None = None) -> SimplexResult:
+        if self._engine == SolverEngine.SIMPLEX and self._detect_structure:
+            result = self._solve_structured(progress)
+            if result is not None:
+                return result
+
+        arrays = self._scaled.with_rhs(self._current_rhs())
+
+        if arrays.is_mixed_integer:
+            search = BranchAndBound(arrays, self._branch_and_bound_options, progress)
+            result = search.solve()
+            self._branch_and_bound_statistics = search.statistics
+            return result
+
+        # Problems without a block structure fall through to the native simplex.
+        if self._engine == SolverEngine.DANTZIG_WOLFE:
+            result = self._solve_decomposed(arrays, progress)
+            if result is not None:
+                return result
+
+        # Re-solves after a change start from the previous optimal basis with either engine, first
+        # solves from a stored basis of the same structure.
+        basis = self._stored_basis()
+        if basis is not None and self._engine != SolverEngine.EXACT:
+            return self._simplex(arrays, progress).solve(basis)
+
+        match self._engine:
+            case SolverEngine.SIMPLEX | SolverEngine.DANTZIG_WOLFE:
+                return self._simplex(arrays, progress).solve()
+            case SolverEngine.INTERIOR_POINT:
+                return solve_interior_point(arrays, record_history=True, progress=progress)
+            case SolverEngine.EXACT:
+                result = self._simplex(arrays, progress).solve(basis)
+                return self._certify(arrays, result)
+            case _:
+                raise ValueError("Invalid solver engine")
+
+    def _solve_structured(self, progress: ProgressReporter | None = None) -> SimplexResult | None:
+        """
+        Solve transportation, assignment and other network problems with the network solvers.
+
+        The structure is read from the unscaled problem, where the coefficients are still +1 and -1, and
+        the result is scaled back. Integer variables need no branch-and-bound: network problems with an
+        integer right-hand side have integer optimal vertices.
+
+        :return: The result, or None when the problem has no network structure.
+        """
+        arrays = self._exact_arrays()
+        form = NetworkForm.from_arrays(arrays)
+        self._structure = form.structure if form is not None else ProblemStructure.GENERAL
+        if form is None:
+            return None
+        return self._scaled_result(solve_network(arrays, form, self._stored_basis(), progress))
+
+    def _solve_decomposed(self, arrays: LpArrays, progress: ProgressReporter | None = None) -> SimplexResult | None:
+        """
+        Solve a block-angular problem by Dantzig–Wolfe decomposition.
+
+        The blocks are the ones given in the options, or detected from the problem. The result has no
+        basis, so the analyses that need one find it with a native solve of their own.
+
+        :return: The result, or None when the problem has no block structure.
+        """
+        options = self._decomposition_options
+        if options.blocks is not None:
+            structure = BlockStructure.from_rows(arrays, options.blocks)
+        else:
+            structure = detect_blocks(arrays)
+        if structure is None or structure.blocks < 2:
+            return None
+        solver = DantzigWolfe(arrays, structure, options, progress)
+        result = solver.solve()
+        self._decomposition_statistics = solver.statistics
+        return result
+
+    @staticmethod
+    def _simplex(arrays: LpArrays, progress: ProgressReporter | None = None) -> RevisedSimplex:
+        """Native simplex for a top-level solve, recording its pivots for the tableau viewer."""
+        return RevisedSimplex(arrays, record_history=True, progress=progress)
+
+    def _exact_arrays(self) -> LpArrays:
+        """Unscaled problem with the current right-hand side, so that exact values are the ones the user typed."""
+        return self._arrays.with_rhs(self._scaling.unscale_rhs(self._current_rhs()))
+
+    def _certify(self, arrays: LpArrays, result: SimplexResult) -> SimplexResult:
+        """
+        Re-solve exactly from the basis of a float result and keep the exact result.
+
+        :param arrays: The scaled problem the float result belongs to.
+        :param result: The float result.
+        :return: The float result, re-solved from the exact optimal basis if the exact solve moved away from it.
+        """
+        exact = ExactSimplex(self._exact_arrays()).solve(*self._exact_warm_start(result))
+        self._exact_result = exact
+        if not exact.is_optimal:
+            return exact.to_simplex_result()
+        if result.is_optimal and exact.basis_loaded and exact.pivots == 0:
+            return result
+        # With bounds the exact basis includes bound rows; the float engine then re-solves from scratch.
+        return self._simplex(arrays).solve(exact.basis)
+
+    def _exact_warm_start(self, result: SimplexResult | None) -> tuple:
+        """Basis and unscaled variable values of a float result, as ExactSimplex.solve expects them."""
+        if result is None or not result.is_optimal:
+            return None, None
+        return result.basis, self._scaling.unscale_primal(result.x)
+
+    def _store_native_result(self, result: SimplexResult):
+        """Write a native result into the PuLP model, as if PuLP had solved it."""
+        for variable, value, reduced_cost in zip(self._variables, result.x, result.reduced_costs):
+            variable.varValue = float(value)
+            variable.dj = float(reduced_cost)
+
+        for constraint, dual, slack in zip(self._model.constraints.values(), result.duals, result.slacks):
+            constraint.pi = float(dual)
+            constraint.slack = float(slack)
+
+        self._model.status = _PULP_STATUS_CODES[result.status]
+        self._result = result
 
     def get_solution(self):
+        values = [v.varValue if v.varValue is not None else 0.0 for v in self._variables]
         return {
             "status": plp.LpStatus[self._model.status],
+            "certified": self._certificate.passed if self._certificate is not None else None,
+            "reloaded": self._reloaded,
             "objective_value": plp.value(self._model.objective),
-            "variables": {v.name: v.varValue for v in self._model.variables()}
+            "variables": dict(zip(
+                (v.name for v in self._variables),
+                self._scaling.unscale_primal(values).tolist(),
+            ))
+        }
+
+    def get_certificate(self):
+        """
+        Get the optimality certificate checked after the last solve.
+
+        Mixed-integer solutions are only checked for feasibility and integrality.
+
+        :return: A dictionary with the outcome, the failing measures, the largest relative residuals and
+            the tolerances, or None if the last solve was not optimal.
+        """
+        if self._certificate is None:
+            return None
+        return {
+            "passed": self._certificate.passed,
+            "failures": self._certificate.failures,
+            "primal_residual": self._certificate.primal_residual,
+            "integrality_residual": self._certificate.integrality_residual,
+            "dual_residual": self._certificate.dual_residual,
+            "complementarity": self._certificate.complementarity,
+            "duality_gap": self._certificate.duality_gap,
+            "tolerances": asdict(self._certificate.tolerances),
+        }
+
+    def verify_exact(self, refine: bool = True):
+        """
+        Check the current solution against an exact rational solve.
+
+        The exact solve starts from the basis of the native engines (the PuLP engine does not expose
+        one, so the problem is solved exactly from scratch). When the float solution is wrong and
+        ``refine`` is set, the model is re-solved from the exact optimal basis.
+
+        :param refine: Replace the float solution when the exact one differs.
+        :return: A dictionary with the verification outcome, the exact objective value and the
+            largest differences between the float and exact primal and dual values.
+        """
+        if self._arrays.is_mixed_integer:
+            raise ValueError("Exact verification is only available for linear programs.")
+
+        exact = ExactSimplex(self._exact_arrays()).solve(*self._exact_warm_start(self._result))
+        status = plp.LpStatus[self._model.status]
+
+        if exact.is_optimal:
+            solution = self.get_solution()["variables"]
+            duals = self.get_shadow_prices()
+            primal_error = max((abs(float(value) - solution[name]) for name, value in zip(solution, exact.x)), default=0.0)
+            dual_error = max((abs(float(value) - duals[name]) for name, value in zip(duals, exact.duals)), default=0.0)
+            # Alternative optima and degenerate duals differ from the exact ones without being wrong,
+            # so the objective value decides; the differences are only reported.
+            objective_value = float(exact.objective_value)
+            objective_error = abs((self.get_objective_value() or 0.0) - objective_value)
+            verified = status == exact.status and objective_error <= 1e-6 * (1.0 + abs(objective_value))
+        else:
+            primal_error = dual_error = None
+            verified = status == exact.status
+
+        refined = False
+        if refine and not verified:
+            result = exact.to_simplex_result()
+            if exact.is_optimal:
+                result = self._simplex(self._scaled.with_rhs(self._current_rhs())).solve(exact.basis)
+            self._store_native_result(result)
+            self._certificate = self._verify() if result.is_optimal else None
+            refined = True
+        self._exact_result = exact
+
+        return {
+            "verified": verified,
+            "refined": refined,
+            "status": exact.status,
+            "float_status": status,
+            "objective_value": exact.objective_value,
+            "pivots": exact.pivots,
+            "basis_certified": exact.basis_loaded and exact.pivots == 0,
+            "max_primal_error": primal_error,
+            "max_dual_error": dual_error,
+        }
+
+    def get_exact_solution(self):
+        """
+        Get the exact solution of the last exact solve or verification.
+
+        :return: A dictionary like get_solution with ``fractions.Fraction`` values, plus the exact
+            shadow prices and reduced costs, or None if no exact result is available.
+        """
+        exact = self._exact_result
+        if exact is None:
+            return None
+        return {
+            "status": exact.status,
+            "objective_value": exact.objective_value,
+            "variables": dict(zip(self._arrays.variable_names, exact.x)),
+            "shadow_prices": dict(zip(self._model.constraints.keys(), exact.duals)),
+            "reduced_costs": dict(zip(self._arrays.variable_names, exact.reduced_costs)),
+        }
+
+    def get_pivot_history(self):
+        """
+        Get the pivot history of the last native solve.
+
+        The history is rebuilt into tableaus lazily with ``history.tableau(step)``, in the units of the
+        original problem. The PuLP engine, branch-and-bound searches and the network solvers do not record one.
+
+        :return: A PivotHistory, or None if no history is available.
+        """
+        if self._result is None or self._result.history is None:
+            return None
+        history = self._result.history
+        history.set_scaling(self._scaling)
+        return history
+
+    def get_parametric_rhs(self, constraint_index: int, start: float | None = None, end: float | None = None):
+        """
+        Get the optimal value as a piecewise-linear function of one constraint's right-hand side.
+
+        The whole curve comes from one run that starts at the current optimal basis and takes one dual
+        simplex pivot per breakpoint, instead of one solve per sampled value.
+
+        :param constraint_index: Index of the constraint.
+        :param start: One end of the range; defaults to 0, or to minus the largest right-hand side when the
+            current one is 0.
+        :param end: The other end; defaults to twice the current right-hand side, or to the largest
+            right-hand side when the current one is 0.
+        :return: A dictionary with the range, the breakpoints and one entry per segment with its
+            interval, objective values at both ends and shadow price.
+        """
+        row = self._scaling.row[constraint_index]
+        rhs = self._scaling.unscale_rhs(self._current_rhs())
+        default_start, default_end = self._default_range(float(rhs[constraint_index]), rhs)
+        start = default_start if start is None else start
+        end = default_end if end is None else end
+
+        curve = parametric_rhs(self._parametric_arrays(), constraint_index, start * row, end * row, self._parametric_basis())
+        return self._curve_to_dict(curve, 1.0 / row, "shadow_price")
+
+    def get_parametric_objective(self, variable_index: int, start: float | None = None, end: float | None = None):
+        """
+        Get the optimal value as a piecewise-linear function of one variable's objective coefficient.
+
+        :param variable_index: Index of the variable.
+        :param start: One end of the range; defaults to 0, or to minus the largest coefficient when the
+            current one is 0.
+        :param end: The other end; defaults to twice the current coefficient, or to the largest
+            coefficient when the current one is 0.
+        :return: A dictionary like get_parametric_rhs, whose segments hold the value of the variable
+            instead of a shadow price.
+        """
+        col = self._scaling.col[variable_index]
+        default_start, default_end = self._default_range(float(self._arrays.c[variable_index]), self._arrays.c)
+        start = default_start if start is None else start
+        end = default_end if end is None else end
+
+        curve = parametric_objective(self._parametric_arrays(), variable_index, start * col, end * col, self._parametric_basis())
+        return self._curve_to_dict(curve, 1.0 / col, "variable_value")
+
+    def get_rhs_heatmap(
+        self,
+        first_index: int,
+        second_index: int,
+        first_values: np.ndarray | None = None,
+        second_values: np.ndarray | None = None,
+        resolution: int = 15,
+        workers: int = 1,
+    ):
+        """
+        Get the optimal value over a grid of right-hand sides of two constraints.
+
+        The grid is split into regions where one basis stays optimal; the values of a region come from
+        its affine formula, so only the points that no region covers are solved again.
+
+        :param first_index: Index of the first constraint.
+        :param second_index: Index of the second constraint.
+        :param first_values: Right-hand side values of the first constraint; defaults to ``resolution``
+            values over the default range of get_parametric_rhs.
+        :param second_values: Right-hand side values of the second constraint, with the same default.
+        :param resolution: Number of values per axis when they are not given.
+        :param workers: Number of processes solving the region boundaries.
+        :return: A dictionary with both axes, the grid of optimal values (None where there is no optimal
+            solution), statuses and region indices, and the number of regions and solves.
+        """
+        rows = self._scaling.row[[first_index, second_index]]
+        rhs = self._scaling.unscale_rhs(self._current_rhs())
+        current = rhs[[first_index, second_index]]
+        if first_values is None:
+            first_values = np.linspace(*self._default_range(float(current[0]), rhs), resolution)
+        if second_values is None:
+            second_values = np.linspace(*self._default_range(float(current[1]), rhs), resolution)
+        first_values = np.asarray(first_values, dtype=float)
+        second_values = np.asarray(second_values, dtype=float)
+
+        def compute():
+            grid = sweep_rhs(
+                self._parametric_arrays(),
+                (first_index, second_index),
+                first_values * rows[0],
+                second_values * rows[1],
+                basis=self._parametric_basis(),
+                workers=workers,
+                verification=self._verification,
+            )
+            self._save_bases(region.basis for region in grid.regions)
+            return {
+                "first_values": [float(value) for value in first_values],
+                "second_values": [float(value) for value in second_values],
+                "current": [float(current[0]), float(current[1])],
+                "objective": [[None if np.isnan(value) else float(value) for value in row] for row in grid.objective],
+                "status": grid.status.tolist(),
+                "region": grid.region.tolist(),
+                "regions": len(grid.regions),
+                "solves": grid.solves,
+                "flagged": int(grid.flagged.sum()),
+            }
+
+        parameters = {"rows": [first_index, second_index], "first_values": first_values, "second_values": second_values}
+        return self._stored_scenario("rhs_heatmap", parameters, compute)
+
+    def get_monte_carlo(
+        self,
+        uncertainties: list[Uncertainty],
+        samples: int = 1000,
+        seed: int | None = None,
+        quantiles: tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95),
+        workers: int = 1,
+    ):
+        """
+        Get the distribution of the optimal value when some coefficients are uncertain.
+
+        :param uncertainties: Distributions of the uncertain coefficients, in the original units.
+        :param samples: Number of samples.
+        :param seed: Seed of the random generator, for reproducible results.
+        :param quantiles: Probabilities of the reported quantiles of the optimal value.
+        :param workers: Number of processes solving the samples that no known basis fits.
+        :return: A dictionary with the status counts, quantiles, mean and standard deviation of the
+            optimal value, how often each basis was optimal and how often each constraint was binding
+            (both as fractions of the optimal samples), and how many samples needed a solve.
+        """
+        if self._arrays.is_mixed_integer:
+            raise ValueError("Monte Carlo analysis is only available for linear programs.")
+        arrays = self._exact_arrays()
+
+        def compute():
+            result = monte_carlo(arrays, uncertainties, samples=samples, seed=seed, workers=workers, verification=self._verification)
+            self._save_bases(result.basis_counts)
+
+            m, n = arrays.shape
+            form = StandardForm.from_arrays(arrays)
+            column_names = list(arrays.variable_names) + [""] * (form.shape[1] - n) + [f"a{i + 1}" for i in range(m)]
+            for i, column in enumerate(form.slack_columns):
+                if column >= 0:
+                    column_names[column] = f"s{i + 1}"
+
+            values = result.objective_values[np.isfinite(result.objective_values)]
+            optimal = max(result.optimal, 1)
+            return {
+                "samples": samples,
+                "seed": seed,
+                "statuses": dict(result.statuses),
+                "quantiles": {float(p): float(q) for p, q in zip(quantiles, result.quantiles(quantiles))},
+                "mean": float(values.mean()) if values.size else None,
+                "std": float(values.std()) if values.size else None,
+                "bases": [
+                    {"basic_variables": [column_names[column] for column in basis], "frequency": count / optimal}
+                    for basis, count in result.basis_counts.most_common()
+                ],
+                "binding": {
+                    name: float(count / optimal) for name, count in zip(arrays.constraint_names, result.binding_counts)
+                },
+                "fast_path": result.fast_path,
+                "solves": result.solves,
+                "flagged": result.flagged,
+            }
+
+        # Unseeded runs are not reproducible, so only seeded ones are reloaded.
+        parameters = {"uncertainties": uncertainties, "samples": samples, "seed": seed, "quantiles": quantiles}
+        summary = self._stored_scenario("monte_carlo", parameters, compute, reusable=seed is not None)
+        # JSON turns the quantile probabilities into strings.
+        summary["quantiles"] = {float(p): q for p, q in summary["quantiles"].items()}
+        return summary
+
+    def get_tornado(self, change: float = 0.1):
+        """
+        Get the ranging of the optimal basis and a tornado ranking of every parameter.
+
+        Each right-hand side and objective coefficient is moved by ``±change`` (relative) on its own.
+        Moves inside the range of the optimal basis are evaluated from the shadow prices and variable
+        values; only moves past it are solved, warm-started from the basis. PuLP does not expose its
+        basis, so after a PuLP solve the basis is recovered with one native solve.
+
+        :param change: Relative move of each parameter.
+        :return: A dictionary with the optimal value, the ranges of every constraint and variable, and
+            the tornado bars (largest swing first) with the optimal value at both ends of each move.
+        """
+        return self._stored_scenario("tornado", {"change": change}, lambda: self._compute_tornado(change))
+
+    def _compute_tornado(self, change: float):
+        arrays = self._parametric_arrays()
+        result = self._optimal_result()
+        if not result.is_optimal:
+            raise ValueError("The tornado analysis needs an optimal solution.")
+
+        ranges = ranging(arrays, result)
+        bars = tornado(arrays, result, change, verification=self._verification)
+        rhs = self._scaling.unscale_rhs
+        costs = self._scaling.unscale_costs
+
+        def unscale(kind: ParametricKind, index: int, value: float) -> float:
+            factor = self._scaling.row[index] if kind == ParametricKind.RHS else self._scaling.col[index]
+            return float(value / factor)
+
+        return {
+            "objective_value": float(result.objective_value),
+            "constraints": [
+                {
+                    "name": name,
+                    "rhs": float(value),
+                    "lower": float(lower),
+                    "upper": float(upper),
+                    "shadow_price": float(price),
+                }
+                for name, value, lower, upper, price in zip(
+                    arrays.constraint_names,
+                    rhs(ranges.rhs),
+                    rhs(ranges.rhs_lower),
+                    rhs(ranges.rhs_upper),
+                    self._scaling.unscale_duals(ranges.shadow_prices),
+                )
+            ],
+            "variables": [
+                {
+                    "name": name,
+                    "cost": float(value),
+                    "lower": float(lower),
+                    "upper": float(upper),
+                    "value": float(x),
+                }
+                for name, value, lower, upper, x in zip(
+                    arrays.variable_names,
+                    costs(ranges.cost),
+                    costs(ranges.cost_lower),
+                    costs(ranges.cost_upper),
+                    self._scaling.unscale_primal(ranges.values),
+                )
+            ],
+            "bars": [
+                {
+                    "kind": bar.kind.value,
+                    "index": bar.index,
+                    "name": arrays.constraint_names[bar.index] if bar.kind == ParametricKind.RHS else arrays.variable_names[bar.index],
+                    "nominal": unscale(bar.kind, bar.index, bar.nominal),
+                    "low": unscale(bar.kind, bar.index, bar.low),
+                    "high": unscale(bar.kind, bar.index, bar.high),
+                    "objective_low": bar.objective_low,
+                    "objective_high": bar.objective_high,
+                    "status_low": bar.status_low,
+                    "status_high": bar.status_high,
+                    "swing": float(bar.swing),
+                    "resolved": bar.resolved,
+                    "flagged": bar.flagged,
+                }
+                for bar in bars
+            ],
+        }
+
+    def _parametric_arrays(self) -> LpArrays:
+        if self._arrays.is_mixed_integer:
+            raise ValueError("Parametric analysis is only available for linear programs.")
+        return self._scaled.with_rhs(self._current_rhs())
+
+    def _parametric_basis(self):
+        result = self._optimal_result()
+        return result.basis if result.is_optimal else None
+
+    @staticmethod
+    def _default_range(current: float, values: np.ndarray) -> tuple[float, float]:
+        """
+        Default range of a parameter: from 0 to twice its current value. A parameter at 0 would give an
+        empty range, so it spans the largest of ``values`` (or 1) on both sides of 0 instead.
+        """
+        if current != 0.0:
+            return 0.0, 2.0 * current
+        span = float(np.abs(values).max(initial=0.0)) or 1.0
+        return -span, span
+
+    @staticmethod
+    def _curve_to_dict(curve: ParametricCurve, unit: float, slope_name: str):
+        """Curve of the scaled problem in original units; ``unit`` converts the parameter back."""
+        return {
+            "current": float(curve.current * unit),
+            "start": float(curve.start * unit),
+            "end": float(curve.end * unit),
+            "breakpoints": [float(value * unit) for value in curve.breakpoints],
+            "status_below": curve.status_below,
+            "status_above": curve.status_above,
+            "segments": [
+                {
+                    "start": float(segment.start * unit),
+                    "end": float(segment.end * unit),
+                    "objective_start": float(segment.objective_start),
+                    "objective_end": float(segment.objective_end),
+                    slope_name: float(segment.slope / unit),
+                }
+                for segment in curve.segments
+            ],
+        }
+
+    def get_branch_and_bound_statistics(self):
+        """
+        Get the statistics of the last branch-and-bound search of a native engine.
+
+        :return: A dictionary with node count, throughput, bound and gap, or None if no search ran.
+        """
+        statistics = self._branch_and_bound_statistics
+        if statistics is None:
+            return None
+        return {
+            "nodes": statistics.nodes,
+            "pruned": statistics.pruned,
+            "lp_iterations": statistics.lp_iterations,
+            "elapsed": statistics.elapsed,
+            "nodes_per_second": statistics.nodes_per_second,
+            "best_bound": statistics.best_bound,
+            "incumbent": statistics.incumbent,
+            "gap": statistics.gap,
+            "node_limit_reached": statistics.node_limit_reached,
+        }
+
+    def get_decomposition_statistics(self):
+        """
+        Get the statistics of the last Dantzig–Wolfe solve.
+
+        :return: A dictionary with the blocks, the linking constraints, the rounds of column generation,
+            the columns generated, the bound and the gap, or None if no decomposed solve ran.
+        """
+        statistics = self._decomposition_statistics
+        if statistics is None:
+            return None
+        return {
+            "blocks": statistics.blocks,
+            "linking_constraints": [self._scaled.constraint_names[i] for i in statistics.linking_rows],
+            "rounds": statistics.rounds,
+            "columns": statistics.columns,
+            "master_iterations": statistics.master_iterations,
+            "pricing_iterations": statistics.pricing_iterations,
+            "elapsed": statistics.elapsed,
+            "best_bound": statistics.best_bound,
+            "objective": statistics.objective,
+            "gap": statistics.gap,
+            "round_limit_reached": statistics.round_limit_reached,
+        }
+
+    def get_structure(self):
+        """
+        Get the structure detected by the last native simplex solve.
+
+        :return: A dictionary with the structure ("general", "network", "transportation" or "assignment")
+            and the pivots of the network solver, or None when no detection ran (other engines, or a reloaded run).
+        """
+        if self._structure is None:
+            return None
+        return {
+            "structure": self._structure.value,
+            "pivots": self._result.iterations if self._result is not None and self._structure != ProblemStructure.GENERAL else None,
+        }
+
+    def get_infeasibility_diagnosis(self):
+        """
+        Explain an infeasible problem with an irreducible infeasible subsystem (IIS): constraints and bounds
+        that cannot hold together, although they can once any one of them is removed.
+
+        The phase-one duals of the last native solve are reused; otherwise (PuLP, or a solve that did not
+        end in phase one) the problem is solved natively once to get them.
+
+        :return: A dictionary with the constraints (name, symbol, right-hand side) and the variable bounds
+            (name, side, value) of the subsystem, the deletion filter tests and the time taken, or None when
+            the linear relaxation is feasible.
+        """
+        farkas = self._result.farkas if self._result is not None else None
+        iis = find_iis(self._scaled.with_rhs(self._current_rhs()), farkas)
+        if iis is None:
+            return None
+        arrays = self._exact_arrays()
+        return {
+            "constraints": [
+                {"name": arrays.constraint_names[i], "symbol": arrays.senses[i].value, "rhs": float(arrays.b[i])}
+                for i in iis.rows
+            ],
+            "bounds": [
+                {
+                    "name": arrays.variable_names[j],
+                    "side": side.value,
+                    "value": float(arrays.lower[j] if side == BoundSide.LOWER else arrays.upper[j]),
+                }
+                for j, side in iis.bounds
+            ],
+            "tests": iis.tests,
+            "elapsed": iis.elapsed,
+        }
+
+    def get_unbounded_ray(self):
+        """
+        Explain an unbounded problem with a ray: a direction along which every constraint keeps holding
+        and the objective improves without limit.
+
+        The ray of the last native solve is reused; otherwise the problem is solved natively once to get one.
+
+        :return: A dictionary with the direction of each variable (largest entry 1 in absolute value) and
+            the change of the objective per unit step, or None when the linear relaxation is not unbounded.
+        """
+        ray = find_unbounded_ray(self._scaled.with_rhs(self._current_rhs()), self._result.ray if self._result is not None else None)
+        if ray is None:
+            return None
+        direction = self._scaling.unscale_primal(ray)
+        direction /= np.abs(direction).max()
+        arrays = self._exact_arrays()
+        return {
+            "direction": dict(zip(arrays.variable_names, direction.tolist())),
+            "objective_rate": float(arrays.c @ direction),
         }
 
     def get_objective_value(self):
@@ -76,27 +984,34 @@ class SimplexTableau:
         
         :return: A dictionary of constraint names and their shadow prices.
         """
-        shadow_prices = {}
-        for name, constraint in self._model.constraints.items():
-            shadow_prices[name] = constraint.pi
-        return shadow_prices
+        names = list(self._model.constraints.keys())
+        duals = [self._model.constraints[name].pi or 0.0 for name in names]
+        return dict(zip(names, self._scaling.unscale_duals(duals).tolist()))
 
     def get_detailed_shadow_price_analysis(self):
         """
         Get detailed shadow price analysis.
+
+        Float shadow prices below 1e-6 are reported as zero. After an exact solve the exact values are
+        used instead, without that cut-off, and ``shadow_price_exact`` holds them as fractions.
         
         :return: A dictionary with detailed analysis for each constraint.
         """
         try:
             constraint_names = list(self._model.constraints.keys())
             analysis_results = {}
+            shadow_prices = self.get_shadow_prices()
+            exact = self._exact_result if self._exact_result is not None and self._exact_result.is_optimal else None
             
             for i, name in enumerate(constraint_names):
                 constraint = self._model.constraints[name]
-                original_rhs = -constraint.constant if constraint.constant is not None else 0
-                shadow_price_raw = constraint.pi if constraint.pi is not None else 0
+                scaled_rhs = -constraint.constant if constraint.constant is not None else 0
+                original_rhs = float(scaled_rhs / self._scaling.row[i])
+                shadow_price_raw = shadow_prices[name]
                 
-                if abs(shadow_price_raw) < 1e-6:
+                if exact is not None:
+                    shadow_price = float(exact.duals[i])
+                elif abs(shadow_price_raw) < 1e-6:
                     shadow_price = 0.0
                 else:
                     shadow_price = shadow_price_raw
@@ -106,22 +1021,66 @@ class SimplexTableau:
                     "original_rhs": original_rhs,
                     "shadow_price": shadow_price
                 }
+                if exact is not None:
+                    analysis_results[name]["shadow_price_exact"] = str(exact.duals[i])
             
             return analysis_results
         except Exception as e:
             print(f"Erro na análise de preços-sombra: {e}")
             return {}
 
+    def get_alternative_optima(self, max_vertices: int = 20, time_limit: float = 2.0):
+        """
+        Detect alternative optimal solutions and enumerate the vertices of the optimal face.
+
+        Nonbasic variables with a zero reduced cost (and slacks with a zero shadow price) can enter the
+        optimal basis without changing the optimal value; pivoting on them from the final basis reaches
+        the other optimal vertices, without solving anything. PuLP does not expose its basis, so after a
+        PuLP solve the basis is recovered with one native solve, shared with the tornado and parametric
+        analyses.
+
+        :param max_vertices: Stop after this many optimal vertices.
+        :param time_limit: Stop after this many seconds.
+        :return: A dictionary with the optimal value, whether the optimum is unique and whether the
+            enumeration is complete, the variables and constraints with a zero reduced cost, and the
+            values of the variables at each optimal vertex (the current solution first) and along each
+            unbounded optimal direction; None when there is no optimal solution.
+        """
+        if self._arrays.is_mixed_integer:
+            raise ValueError("Alternative optima are only available for linear programs.")
+        arrays = self._scaled.with_rhs(self._current_rhs())
+        result = self._optimal_result()
+        if not result.is_optimal:
+            return None
+
+        optima = enumerate_optimal_vertices(arrays, result, AlternativeOptimaOptions(max_vertices, time_limit))
+        exact = self._exact_arrays()
+        vertices = [self._scaling.unscale_primal(vertex) for vertex in optima.vertices]
+        rays = [self._scaling.unscale_primal(ray) for ray in optima.rays]
+        return {
+            "objective_value": float(exact.c @ vertices[0]),
+            "unique": optima.unique,
+            "complete": optima.complete,
+            "zero_reduced_costs": [exact.variable_names[j] for j in optima.zero_reduced_costs],
+            "zero_shadow_prices": [exact.constraint_names[i] for i in optima.zero_slacks],
+            "variables": list(exact.variable_names),
+            "vertices": [vertex.tolist() for vertex in vertices],
+            "rays": [(ray / np.abs(ray).max()).tolist() for ray in rays],
+            "bases": optima.bases,
+            "elapsed": optima.elapsed,
+        }
+
     def get_reduced_costs(self):
         """
         Get the reduced costs for each variable.
         
         :return: A dictionary of variable names and their reduced costs.
         """
-        reduced_costs = {}
-        for v in self._model.variables():
-            reduced_costs[v.name] = v.rc
-        return reduced_costs
+        reduced_costs = [v.dj or 0.0 for v in self._variables]
+        return dict(zip(
+            (v.name for v in self._variables),
+            self._scaling.unscale_reduced_costs(reduced_costs).tolist(),
+        ))
 
     def analyze_change_viability(self, changed_problem: ObjectiveFunctionState):
         """
@@ -134,7 +1093,7 @@ class SimplexTableau:
         original_objective_value = plp.value(self._model.objective)
         
         # Create a new SimplexTableau instance for the changed problem
-        changed_tableau = SimplexTableau()
+        changed_tableau = SimplexTableau(scaling=self._scaling_enabled, engine=self._engine)
         changed_tableau.build(changed_problem)
         changed_tableau.solve()
 
@@ -179,13 +1138,13 @@ class SimplexTableau:
                     # Update the constraint's RHS value
                     constraint = self._model.constraints[name]
                     # For PuLP, we need to modify the constraint expression
-                    constraint.constant = -new_constraint_values[i]
+                    constraint.constant = -new_constraint_values[i] * self._scaling.row[i]
             
             # Solve with new values
-            solve_status = self._model.solve()
+            solve_status = self.solve()
             
             # Check if the problem has a feasible solution
-            has_feasible_solution = solve_status == plp.LpStatusOptimal
+            has_feasible_solution = solve_status == "Optimal"
             
             if has_feasible_solution:
                 new_objective = plp.value(self._model.objective)
@@ -213,17 +1172,34 @@ class SimplexTableau:
                     )
                 }
             else:
-                # Problem became infeasible or unbounded
+                # Problem became infeasible or unbounded: explain why with an IIS or a ray
+                status = plp.LpStatus[self._model.status]
+                conflict = self.get_infeasibility_diagnosis() if status == "Infeasible" else None
+                ray = self.get_unbounded_ray() if status == "Unbounded" else None
+                if conflict is not None:
+                    members = [f"{c['name']} ({c['symbol']} {c['rhs']:g})" for c in conflict["constraints"]]
+                    members += [
+                        f"{b['name']} {'>=' if b['side'] == BoundSide.LOWER.value else '<='} {b['value']:g}"
+                        for b in conflict["bounds"]
+                    ]
+                    reason = "Problema inviável: conflito entre " + ", ".join(members)
+                elif ray is not None:
+                    reason = (
+                        "Problema ilimitado: o objetivo varia sem limite na direção "
+                        + ", ".join(f"{name} = {value:+.3g}" for name, value in ray["direction"].items() if value != 0)
+                    )
+                else:
+                    reason = "Problema se tornou inviável com os novos valores de recursos"
                 result = {
                     "is_viable": False,
                     "new_optimal_value": None,
                     "original_optimal_value": original_objective,
                     "profit_difference": None,
                     "has_feasible_solution": False,
-                    "status": f"Infeasible - {plp.LpStatus[self._model.status]}",
-                    "viability_reason": (
-                        "Problema se tornou inviável com os novos valores de recursos"
-                    )
+                    "status": f"Infeasible - {status}",
+                    "viability_reason": reason,
+                    "conflict": conflict,
+                    "unbounded_ray": ray,
                 }
             
             return result
@@ -245,6 +1221,6 @@ class SimplexTableau:
                 for i, name in enumerate(constraint_names):
                     self._model.constraints[name].constant = original_constraints[i]
                 # Re-solve to restore original state
-                self._model.solve()
+                self.solve()
             except Exception as restore_error:
                 print(f"Erro ao restaurar valores originais: {restore_error}")
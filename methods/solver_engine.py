@@ -0,0 +1,15 @@
+"""
+The solver engines, kept apart from ``methods.simplex_tableu`` so the interface can list them without
+importing the solvers (and NumPy and PuLP) at start-up.
+"""
+
+from enum import Enum
+
+
+class SolverEngine(Enum):
+    """Available solver engines."""
+    PULP = "pulp"
+    SIMPLEX = "simplex"
+    INTERIOR_POINT = "interior_point"
+    EXACT = "exact"
+    DANTZIG_WOLFE = "dantzig_wolfe"
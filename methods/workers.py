@@ -0,0 +1,61 @@
+"""
+Shared pool of solver worker processes.
+
+Creating a ``ProcessPoolExecutor`` for every analysis starts the processes (and imports NumPy and the solvers
+in each of them) every time. The RHS heatmap and the Monte Carlo analysis take their workers from this pool
+instead, which is created once and can be warmed up in the background (``prewarm``) so the first analysis
+does not pay the start-up either.
+
+The pool is never replaced: an analysis may still be submitting to it, and a pool that was shut down under
+it would make its next ``submit`` fail. Its size is set by the first call that asks for workers, and
+later calls asking for more share it at that size; their batches just queue a little.
+"""
+
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+
+_lock = threading.Lock()
+_executor: ProcessPoolExecutor | None = None
+_workers = 0
+
+
+def _warm_up() -> None:
+    """Runs in a worker: imports what the solves need."""
+    import methods.certificate  # noqa: F401
+    import methods.native_simplex  # noqa: F401
+
+
+def solver_pool(workers: int) -> ProcessPoolExecutor | None:
+    """
+    The shared pool, created with ``workers`` processes by the first call and capped at that size after.
+
+    :param workers: Number of processes wanted; 1 or less means solving in the calling process.
+    :return: The pool, or None when ``workers`` is 1 or less. It must not be shut down by the caller.
+    """
+    global _executor, _workers
+    if workers <= 1:
+        return None
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _workers = workers
+        return _executor
+
+
+def prewarm(workers: int) -> None:
+    """Starts the pool processes and imports the solvers in them; blocks until they are ready."""
+    executor = solver_pool(workers)
+    if executor is not None:
+        wait([executor.submit(_warm_up) for _ in range(_workers)])
+
+
+@atexit.register
+def shutdown() -> None:
+    """Stops the pool (also run at exit)."""
+    global _executor, _workers
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor, _workers = None, 0
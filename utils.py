@@ -5,21 +5,84 @@ This module provides functions to generate a blurred background image with a gra
 TODO: Implement blurred background generation and integrate with the main application.
 """
 
+import os
+import shutil
+import threading
+from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image, ImageFilter
 import numpy as np
 
-def generate_blur_background(width=800, height=600, color1=(245,245,255), color2=(230,240,255), blur_radius=16, output_path="blurred_bg.png"):
-    # Cria imagem com gradiente
-    base = Image.new("RGB", (width, height), color1)
-    draw = ImageDraw.Draw(base)
-    for y in range(height):
-        ratio = y / height
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+
+# Raio mínimo do blur na imagem reduzida; abaixo disso a redução deixaria de ser imperceptível
+MIN_SCALED_RADIUS = 4
+
+_lock = threading.Lock()
+_generated: dict[tuple[Path, tuple], Path] = {}
+
+
+def default_cache_dir() -> Path:
+    """Cache directory of the backgrounds: ``$SIMPLEX_BACKGROUND_CACHE``, or ``backgrounds`` in ``~/.simplex_tableau``."""
+    configured = os.environ.get("SIMPLEX_BACKGROUND_CACHE")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".simplex_tableau" / "backgrounds"
+
+
+def _render(width: int, height: int, color1: tuple, color2: tuple, blur_radius: float) -> Image.Image:
+    """
+    Draws the blurred vertical gradient.
+
+    The gradient is the same along each row, and so is its blur, so only one column is computed and then
+    repeated across the width. The column is also blurred at a reduced height (keeping the blur radius at
+    least ``MIN_SCALED_RADIUS`` pixels) and stretched back, which is indistinguishable for a gradient.
+    """
+    scale = max(int(blur_radius // MIN_SCALED_RADIUS), 1)
+
+    # Cria o gradiente: a mesma interpolação por linha, truncada como antes
+    ratio = (np.arange(height) / height)[:, np.newaxis]
+    column = (np.asarray(color1, dtype=float) * (1 - ratio) + np.asarray(color2, dtype=float) * ratio).astype(np.uint8)
+    small = Image.fromarray(np.ascontiguousarray(column[::scale, np.newaxis]), "RGB")
+
     # Adiciona um blur generoso
-    blurred = base.filter(ImageFilter.GaussianBlur(radius=blur_radius))
-    blurred.save(output_path)
+    blurred = small.filter(ImageFilter.GaussianBlur(radius=blur_radius / scale))
+    blurred = blurred.resize((1, height), Image.Resampling.BILINEAR)
+    return Image.fromarray(np.ascontiguousarray(np.broadcast_to(np.asarray(blurred), (height, width, 3))), "RGB")
+
+
+def generate_blur_background(
+    width=800,
+    height=600,
+    color1=(245, 245, 255),
+    color2=(230, 240, 255),
+    blur_radius=16,
+    output_path=None,
+    cache_dir=None,
+):
+    """
+    Generates (or reuses) a PNG with a blurred vertical gradient from ``color1`` to ``color2``.
+
+    Images are cached by size, colors and radius, in memory and in ``cache_dir``, so asking again for the
+    same background (e.g. when the window goes back to a previous size) only returns the saved file.
+
+    :param output_path: Where to copy the image; None returns the file in the cache.
+    :param cache_dir: Directory of the cached images; defaults to ``default_cache_dir()``.
+    :return: Path of the image.
+    """
+    key = (int(width), int(height), tuple(color1), tuple(color2), float(blur_radius))
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    with _lock:
+        cached = _generated.get((directory, key))
+        if cached is None or not cached.exists():
+            cached = directory / "blur_{}x{}_{}_{}_r{:g}.png".format(
+                key[0], key[1], "".join(f"{c:02x}" for c in key[2]), "".join(f"{c:02x}" for c in key[3]), key[4]
+            )
+            if not cached.exists():
+                directory.mkdir(parents=True, exist_ok=True)
+                _render(*key).save(cached)
+            _generated[directory, key] = cached
+
+    if output_path is None:
+        return str(cached)
+    shutil.copyfile(cached, output_path)
     return output_path